@@ -1,16 +1,38 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from services.openai_service import transcribe_audio, summarize_and_extract
 from services.blob_service import upload_to_blob
-from services.search_service import index_document
-from db.cosmos_db import (
+from services.search_service import get_search_client_stats, reset_search_clients
+from services.vector_service import get_vector_stats
+from services.search_indexer import (
+    enqueue_document,
+    get_search_indexer,
+    stop_search_indexer,
+)
+from services.transcript_service import load_transcript, get_transcript_cache_stats
+from db.storage import (
+    MEETING_COMMITTED_TYPE,
     init_cosmos,
+    get_client_pool_stats,
+    get_staff_cache_stats,
+    ingestion_meeting_id,
+    parse_summary,
+)
+from db.cosmos_telemetry import cosmos_telemetry_scope, get_cosmos_telemetry_stats
+
+# 엔드포인트의 저장소 호출은 이벤트 루프를 막지 않도록 비동기 모듈 사용 (STORAGE_BACKEND에 따라 선택)
+from db.storage_async import (
+    close_client,
     save_meeting,
-    get_meetings,
+    get_meeting_summaries_page,
     get_meeting,
     get_action_items,
     approve_action_item,
     update_action_item_status,
+    get_dashboard_stats,
+    get_recent_meetings,
 )
+import asyncio
 import json, os, uuid
 from datetime import datetime
 
@@ -37,6 +59,33 @@ app = FastAPI(
 )
 
 
+@app.middleware("http")
+async def cosmos_request_telemetry(request: Request, call_next):
+    """
+    요청 하나 동안의 Cosmos DB 호출 RU를 집계하고 X-Cosmos-Request-Charge 헤더로 반환합니다.
+    """
+    with cosmos_telemetry_scope("request") as scope:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        scope.label = f"{request.method} {getattr(route, 'path', request.url.path)}"
+        totals = scope.snapshot()
+        response.headers["X-Cosmos-Request-Charge"] = f"{totals['request_charge']:.2f}"
+        response.headers["X-Cosmos-Request-Count"] = str(totals["calls"])
+        return response
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """
+    애플리케이션 종료 시 공유 Cosmos DB 비동기 클라이언트와 Search 클라이언트를 닫습니다.
+    """
+    await close_client()
+    logger.info("Cosmos DB 비동기 클라이언트 종료")
+    # 대기 중인 인덱싱 문서를 전송한 뒤 Search 클라이언트 종료
+    await run_in_threadpool(stop_search_indexer)
+    reset_search_clients()
+
+
 @app.get("/")
 async def root():
     """
@@ -61,13 +110,54 @@ async def health_check():
     """
     헬스체크 엔드포인트
     """
-    return {"status": "healthy", "timestamp": str(datetime.now())}
+    return {
+        "status": "healthy",
+        "timestamp": str(datetime.now()),
+        "cosmos_client_pool": get_client_pool_stats(),
+        "staff_cache": get_staff_cache_stats(),
+        "transcript_cache": get_transcript_cache_stats(),
+        "search_clients": get_search_client_stats(),
+        "search_indexer": get_search_indexer().stats(),
+        "vector_indexes": get_vector_stats(),
+    }
+
+
+@app.get("/metrics/cosmos")
+async def cosmos_metrics(top: int = 20):
+    """
+    프로세스 시작 이후 논리 작업별 Cosmos DB RU 누적치 (RU 합계 내림차순)
+    """
+    return {
+        "timestamp": str(datetime.now()),
+        "operations": get_cosmos_telemetry_stats(top),
+    }
+
+
+async def _existing_meeting_response(meeting_id):
+    """이미 저장이 끝난 회의면 저장된 결과 응답을, 아니면 None을 반환합니다."""
+    existing = await get_meeting(meeting_id)
+    if not existing or existing.get("type") != MEETING_COMMITTED_TYPE:
+        return None
+    summary = parse_summary(existing.get("summary")) or {}
+    logger.info(f"이미 저장된 회의 재요청: {meeting_id}")
+    print(f"♻️ 이미 저장된 회의 재요청: {meeting_id}")
+    return {
+        "meeting_id": meeting_id,
+        "summary": summary.get("summary"),
+        "actionItems": summary.get("actionItems"),
+    }
 
 
 @app.post("/upload")
-async def upload_meeting(file: UploadFile = File(None), text: str = Form(None)):
+async def upload_meeting(
+    file: UploadFile = File(None),
+    text: str = Form(None),
+    idempotency_key: str = Header(None, alias="Idempotency-Key"),
+):
     """
     회의 파일(음성/문서) 또는 텍스트를 업로드하여 요약 및 액션 아이템을 추출합니다.
+    회의 ID는 업로드 파일 바이트(텍스트 입력은 원문)와 Idempotency-Key 헤더로 정해지므로
+    같은 요청을 재시도/동시 전송해도 한 번만 저장되고, 이미 저장된 파일은 STT/AI 분석 없이 반환합니다.
     """
     import time
 
@@ -95,20 +185,29 @@ async def upload_meeting(file: UploadFile = File(None), text: str = Form(None)):
         raw_text = None
         file_path = None
         blob_path = None
+        meeting_id = None
 
         # 파일 또는 텍스트 처리
         if file:
             logger.info(f"파일 처리 시작: {file.filename}")
             print(f"🔄 파일 처리 시작: {file.filename}")
             file_path = f"/tmp/{file.filename}"
+            content = await file.read()
             with open(file_path, "wb") as f_out:
-                f_out.write(await file.read())
+                f_out.write(content)
+
+            # 이미 저장이 끝난 파일이면 STT/AI 분석 없이 저장된 결과 반환
+            meeting_id = ingestion_meeting_id(content, idempotency_key)
+            existing_response = await _existing_meeting_response(meeting_id)
+            if existing_response:
+                os.remove(file_path)
+                return existing_response
 
             # 음성 파일 처리
             if file.filename.lower().endswith((".wav", ".mp3")):
                 logger.info("음성 파일 전사 시작")
                 print("🎵 음성 파일 전사 시작")
-                raw_text = transcribe_audio(file_path)
+                raw_text = await run_in_threadpool(transcribe_audio, file_path)
                 blob_path = f"audio/{file.filename}"
 
                 # STT 결과 텍스트를 별도 파일로 저장
@@ -122,7 +221,9 @@ async def upload_meeting(file: UploadFile = File(None), text: str = Form(None)):
                     text_blob_path = f"transcribed/{text_filename}"
                     logger.info("STT 텍스트 Blob 업로드 시작")
                     print("📝 STT 텍스트 Blob 업로드 시작")
-                    upload_to_blob(text_file_path, text_blob_path)
+                    await run_in_threadpool(
+                        upload_to_blob, text_file_path, text_blob_path
+                    )
                     os.remove(text_file_path)
                     logger.info("✅ STT 텍스트 Blob 업로드 완료")
                     print("✅ STT 텍스트 Blob 업로드 완료")
@@ -138,7 +239,7 @@ async def upload_meeting(file: UploadFile = File(None), text: str = Form(None)):
             # 원본 파일을 Blob 저장소에 업로드
             logger.info("원본 파일 Blob Storage 업로드 시작")
             print("☁️ 원본 파일 Blob Storage 업로드 시작")
-            upload_to_blob(file_path, blob_path)
+            await run_in_threadpool(upload_to_blob, file_path, blob_path)
             os.remove(file_path)
             logger.info("파일 처리 및 Blob 업로드 완료")
             print("✅ 파일 처리 및 Blob 업로드 완료")
@@ -155,18 +256,27 @@ async def upload_meeting(file: UploadFile = File(None), text: str = Form(None)):
             print("⚠️ 빈 입력 - 파일 또는 텍스트가 없음")
             return {"error": "파일 또는 텍스트를 입력하세요."}
 
+        # 직접 입력한 텍스트는 원문으로 회의 ID를 정하고, 이미 저장이 끝난 회의면 AI 분석 없이 반환
+        if meeting_id is None:
+            meeting_id = ingestion_meeting_id(raw_text, idempotency_key)
+            existing_response = await _existing_meeting_response(meeting_id)
+            if existing_response:
+                return existing_response
+
         # 요약 및 액션 아이템 추출
         logger.info("AI 분석 시작")
         print("🤖 AI 분석 시작")
-        result = summarize_and_extract(raw_text)
+        result = await run_in_threadpool(summarize_and_extract, raw_text)
 
         # Cosmos DB에 먼저 저장 (회의 ID 생성)
         logger.info("Cosmos DB 저장 시작")
         print("💾 Cosmos DB 저장 시작")
-        meeting_id = save_meeting(
+        meeting_id = await save_meeting(
             meeting_title=result.get("meetingTitle", "제목 없음"),
             raw_text=raw_text,
             summary_json=result,
+            idempotency_key=idempotency_key,
+            meeting_id=meeting_id,
         )
 
         # Azure Search에 인덱싱 (Blob 업로드 후)
@@ -188,18 +298,13 @@ async def upload_meeting(file: UploadFile = File(None), text: str = Form(None)):
             logger.info(f"인덱싱 준비 완료 - doc_id: {doc_id}, blob_path: {blob_path}")
             print(f"📋 인덱싱 준비 완료 - doc_id: {doc_id}")
 
-            # search_service 모듈 임포트 확인
-            from services.search_service import index_document
-
-            logger.info("search_service 모듈 임포트 완료")
-
-            index_document(doc_id, raw_text, metadata, blob_path)
-            logger.info("✅ 검색 인덱스 등록 완료")
-            print("✅ 검색 인덱스 등록 완료")
+            # 배치 인덱서 대기열에 넣고 응답은 인덱싱을 기다리지 않음 (대기열이 가득 차면 대기)
+            await run_in_threadpool(
+                enqueue_document, doc_id, raw_text, metadata, blob_path
+            )
+            logger.info("✅ 검색 인덱스 대기열 등록 완료")
+            print("✅ 검색 인덱스 대기열 등록 완료")
 
-        except ImportError as import_error:
-            logger.error(f"❌ search_service 모듈 임포트 실패: {str(import_error)}")
-            print(f"❌ search_service 모듈 임포트 실패: {str(import_error)}")
         except Exception as index_error:
             logger.error(f"❌ 검색 인덱스 등록 실패: {str(index_error)}", exc_info=True)
             print(f"❌ 검색 인덱스 등록 실패: {str(index_error)}")
@@ -274,7 +379,7 @@ async def assign_action_item(
         )
         print(f"📋 액션 아이템 할당: {item_id} -> 담당자 {assignee_id}")
 
-        approve_action_item(item_id, meeting_id, assignee_id, reviewer_name)
+        await approve_action_item(item_id, meeting_id, assignee_id, reviewer_name)
         logger.info(f"✅ 액션 아이템 할당 완료: {item_id} -> 담당자 {assignee_id}")
         print(f"✅ 액션 아이템 할당 완료: {item_id}")
         return {"result": "success", "message": "액션 아이템 담당자 할당 및 승인 완료"}
@@ -314,7 +419,7 @@ async def update_item_status(meeting_id: str, item_id: str, status: str):
         )
         print(f"🔄 액션 아이템 상태 업데이트: {item_id} -> {status}")
 
-        result = update_action_item_status(item_id, meeting_id, status)
+        result = await update_action_item_status(item_id, meeting_id, status)
         logger.info(f"✅ 액션 아이템 상태 업데이트 완료: {item_id} -> {status}")
         print(f"✅ 액션 아이템 상태 업데이트 완료: {item_id}")
         return {
@@ -345,17 +450,27 @@ async def update_item_status(meeting_id: str, item_id: str, status: str):
 
 
 @app.get("/meetings")
-async def list_meetings():
+async def list_meetings(limit: int = 20, cursor: str = None):
     """
-    모든 회의 목록을 반환합니다.
+    회의 목록(요약 필드와 액션 아이템 개수)을 최신순으로 페이지 단위로 반환합니다.
+    원문과 전체 요약은 /meetings/{meeting_id}에서 조회합니다.
+    다음 페이지는 응답의 next_cursor를 cursor 파라미터로 전달해 조회합니다.
     """
     try:
-        logger.info("회의 목록 조회 요청")
+        if limit < 1 or limit > 100:
+            raise HTTPException(
+                status_code=400, detail="limit은 1 이상 100 이하여야 합니다."
+            )
+
+        logger.info(f"회의 목록 조회 요청: limit={limit}, cursor={bool(cursor)}")
         print("📋 회의 목록 조회 요청")
-        meetings = get_meetings()
+        meetings, next_cursor = await get_meeting_summaries_page(limit, cursor)
         logger.info(f"✅ 회의 목록 조회 완료: {len(meetings)}개 회의")
         print(f"✅ 회의 목록 조회 완료: {len(meetings)}개 회의")
-        return {"meetings": meetings}
+        return {"meetings": meetings, "next_cursor": next_cursor}
+
+    except HTTPException as he:
+        raise he
 
     except Exception as e:
         logger.log_error_with_context("list meetings failed", e, {})
@@ -375,7 +490,7 @@ async def get_meeting_detail(meeting_id: str):
     try:
         logger.info(f"회의 상세 조회 요청: {meeting_id}")
         print(f"📖 회의 상세 조회: {meeting_id}")
-        meeting = get_meeting(meeting_id)
+        meeting = await get_meeting(meeting_id)
         if not meeting:
             logger.warning(f"회의 찾을 수 없음: {meeting_id}")
             print(f"⚠️ 회의 찾을 수 없음: {meeting_id}")
@@ -384,7 +499,7 @@ async def get_meeting_detail(meeting_id: str):
                 detail=f"ID가 '{meeting_id}'인 회의를 찾을 수 없습니다.",
             )
 
-        action_items = get_action_items(meeting_id)
+        action_items = await get_action_items(meeting_id)
         logger.info(
             f"✅ 회의 상세 조회 완료: {meeting_id}, 액션 아이템 {len(action_items)}개"
         )
@@ -404,6 +519,36 @@ async def get_meeting_detail(meeting_id: str):
         )
 
 
+@app.get("/meetings/{meeting_id}/transcript")
+async def get_meeting_transcript(meeting_id: str):
+    """
+    회의 원문을 반환합니다. 상세 조회 응답에는 원문 대신 Blob 참조만 포함됩니다.
+    """
+    try:
+        logger.info(f"회의 원문 조회 요청: {meeting_id}")
+        meeting = await get_meeting(meeting_id)
+        if not meeting:
+            raise HTTPException(
+                status_code=404,
+                detail=f"ID가 '{meeting_id}'인 회의를 찾을 수 없습니다.",
+            )
+
+        transcript = await run_in_threadpool(load_transcript, meeting)
+        return {"meeting_id": meeting_id, "transcript": transcript}
+
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        error_details = {"meeting_id": meeting_id, "error_type": type(e).__name__}
+        logger.log_error_with_context("get meeting transcript failed", e, error_details)
+        print(f"❌ 회의 원문 조회 실패: {meeting_id} - {type(e).__name__}: {str(e)}")
+
+        logger.error(f"❌ 회의 원문 조회 오류: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"회의 원문 조회 중 오류 발생: {str(e)}"
+        )
+
+
 @app.get("/dashboard")
 async def dashboard():
     """
@@ -412,33 +557,19 @@ async def dashboard():
     try:
         logger.info("대시보드 정보 조회 요청")
         print("📊 대시보드 정보 조회")
-        meetings = get_meetings()
+        # 통계 문서 포인트 읽기 + 최근 회의 TOP 5 쿼리를 동시에 실행
+        stats, recent_meetings = await asyncio.gather(
+            get_dashboard_stats(), get_recent_meetings(5)
+        )
 
-        # 통계 정보 생성
-        total_meetings = len(meetings)
+        total_meetings = stats.get("total_meetings", 0)
         action_items_by_status = {"미시작": 0, "진행중": 0, "완료": 0, "지연": 0}
-        action_items_by_assignee = {}
-
-        for meeting in meetings:
-            meeting_id = meeting["id"]
-            items = get_action_items(meeting_id)
-
-            for item in items:
-                # 상태별 통계
-                status = item.get("status", "미시작")
-                action_items_by_status[status] = (
-                    action_items_by_status.get(status, 0) + 1
-                )
-
-                # 담당자별 통계
-                assignee_id = item.get("finalAssigneeId") or item.get(
-                    "recommendedAssigneeId"
-                )
-                if assignee_id:
-                    assignee_id = str(assignee_id)
-                    action_items_by_assignee[assignee_id] = (
-                        action_items_by_assignee.get(assignee_id, 0) + 1
-                    )
+        action_items_by_status.update(stats.get("action_items_by_status", {}))
+        action_items_by_assignee = {
+            assignee: count
+            for assignee, count in stats.get("action_items_by_assignee", {}).items()
+            if count > 0
+        }
 
         logger.info(f"✅ 대시보드 정보 조회 완료: 회의 {total_meetings}개")
         print(f"✅ 대시보드 정보 조회 완료: 회의 {total_meetings}개")
@@ -446,7 +577,7 @@ async def dashboard():
             "total_meetings": total_meetings,
             "action_items_by_status": action_items_by_status,
             "action_items_by_assignee": action_items_by_assignee,
-            "recent_meetings": meetings[:5],  # 최근 5개 회의만 반환
+            "recent_meetings": recent_meetings,  # 최근 5개 회의만 반환
         }
 
     except Exception as e:
@@ -18,6 +18,7 @@ from datetime import datetime
 # 환경 설정 및 로깅 시스템
 from config.environment import get_config
 from config.logging_config import setup_logger, get_logger
+from db.cosmos_telemetry import cosmos_telemetry_scope
 
 # 통합 서비스 매니저 사용 (일관성 개선)
 from services.service_manager import ServiceManager
@@ -31,6 +32,7 @@ from components.staff_management_page import render_staff_management
 from utils.chat_utils import (
     initialize_chat_session,
     load_chat_history_from_db,
+    persist_chat_messages,
 )
 
 # 환경 설정 및 로깅 초기화
@@ -277,8 +279,8 @@ def main():
                 print("🗑️ 기존 인덱스에서 직원 데이터 제거 중...")
                 clean_legacy_staff_data_from_meetings_index()
 
-                # 3. 직원 전용 인덱스에 데이터 추가
-                print("📝 직원 전용 인덱스에 데이터 추가 중...")
+                # 3. 직원 전용 인덱스 증분 동기화 (바뀐 직원만 반영)
+                print("📝 직원 전용 인덱스 동기화 중...")
                 if service_manager.index_staff_data_for_search():
                     st.session_state.staff_indexed = True
                     logger.info("직원 전용 인덱스 구성 완료")
@@ -301,7 +303,6 @@ def main():
                 != len(st.session_state.chat_messages)
             ):
                 try:
-                    session_id = st.session_state.get("session_id", "unknown")
                     messages = st.session_state.chat_messages
 
                     # 첫 번째 사용자 메시지를 요약으로 사용
@@ -314,9 +315,8 @@ def main():
                         else "New Chat"
                     )
 
-                    chat_id = service_manager.save_chat_history(
-                        session_id, messages, summary
-                    )
+                    # 아직 저장되지 않은 메시지만 추가 저장
+                    chat_id = persist_chat_messages(service_manager, summary)
                     if chat_id:
                         st.session_state.last_saved_count = len(
                             st.session_state.chat_messages
@@ -360,4 +360,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # 재실행 한 번 동안의 Cosmos DB 호출 RU를 세션 단위로 집계
+    with cosmos_telemetry_scope(
+        "session",
+        st.session_state.get("session_id"),
+        label=st.session_state.get("current_page"),
+    ):
+        main()
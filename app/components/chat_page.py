@@ -47,6 +47,18 @@ def render_chatbot(service_manager, fullwidth=False):
                     f"이전 메시지 {len(st.session_state.chat_messages) - 5}개가 더 있습니다. Chat 탭에서 전체 대화를 확인하세요."
                 )
 
+        # 불러온 채팅에 이전 메시지가 남아 있으면 필요할 때만 추가 로드
+        if fullwidth and st.session_state.get("chat_oldest_segment"):
+            if st.button("⬆️ 이전 메시지 불러오기", key="load_older_chat_messages"):
+                import sys
+                from pathlib import Path
+
+                sys.path.append(str(Path(__file__).parent.parent))
+                from utils.chat_utils import load_older_chat_messages
+
+                if load_older_chat_messages(service_manager):
+                    st.rerun()
+
         for message in display_messages:
             with st.chat_message(message["role"]):
                 st.markdown(message["content"])
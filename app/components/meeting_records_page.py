@@ -4,6 +4,8 @@ Meeting AI Assistant - Meeting Records 페이지 렌더링
 
 import streamlit as st
 
+MEETINGS_PAGE_SIZE = 10
+
 
 def render_meeting_records(service_manager):
     """회의록 페이지 렌더링"""
@@ -18,39 +20,40 @@ def render_meeting_records(service_manager):
 
         # 회의록 목록 조회
         try:
-            meetings = service_manager.get_meetings()
-
-            if not meetings:
-                st.info("🔍 저장된 회의록이 없습니다. 새로운 회의를 분석해보세요!")
-            else:
-                # 필터 옵션
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    search_term = st.text_input(
-                        "🔍 회의 제목 검색", placeholder="검색어를 입력하세요..."
-                    )
-                with col2:
-                    st.write("")  # 여백
-                    if st.button("🔄 새로고침", use_container_width=True):
-                        st.rerun()
-
-                # 회의록 목록 표시
-                filtered_meetings = meetings
-                if search_term:
-                    filtered_meetings = [
-                        m
-                        for m in meetings
-                        if search_term.lower() in m.get("title", "").lower()
-                    ]
-
-                # 안전한 슬라이싱을 위해 리스트 확인
-                display_meetings = (
-                    filtered_meetings[:10]
-                    if isinstance(filtered_meetings, list)
-                    else []
+            # 필터 옵션
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                search_term = st.text_input(
+                    "🔍 회의 제목 검색", placeholder="검색어를 입력하세요..."
                 )
+            with col2:
+                st.write("")  # 여백
+                if st.button("🔄 새로고침", use_container_width=True):
+                    st.session_state.meeting_page_cursors = []
+                    st.rerun()
+
+            # 검색어가 바뀌면 첫 페이지부터 다시 조회
+            if st.session_state.get("meeting_search_term") != search_term:
+                st.session_state.meeting_search_term = search_term
+                st.session_state.meeting_page_cursors = []
+
+            # 지나온 페이지의 커서 스택 (마지막 값이 현재 페이지 커서)
+            cursors = st.session_state.setdefault("meeting_page_cursors", [])
+            current_cursor = cursors[-1] if cursors else None
+
+            display_meetings, next_cursor = service_manager.get_meeting_summaries_page(
+                limit=MEETINGS_PAGE_SIZE,
+                continuation_token=current_cursor,
+                title_contains=search_term or None,
+            )
 
-                for meeting in display_meetings:  # 최근 10개만 표시
+            if not display_meetings and not cursors:
+                if search_term:
+                    st.info(f"🔍 '{search_term}' 검색 결과가 없습니다.")
+                else:
+                    st.info("🔍 저장된 회의록이 없습니다. 새로운 회의를 분석해보세요!")
+            else:
+                for meeting in display_meetings:
                     # 날짜 형식 개선
                     created_at = meeting.get("created_at", "N/A")
                     try:
@@ -71,90 +74,68 @@ def render_meeting_records(service_manager):
                     ):
                         col1, col2 = st.columns([3, 1])
                         with col1:
-                            # 회의 요약 JSON 파싱
-                            summary_json = meeting.get("summary", "{}")
-                            try:
-                                if isinstance(summary_json, str):
-                                    import json
-
-                                    summary_data = json.loads(summary_json)
-                                else:
-                                    summary_data = summary_json
-                            except:
-                                summary_data = {}
-
-                            # 참석자 정보 처리
-                            participants = summary_data.get("participants", [])
-                            if not participants and "participants" in str(summary_data):
-                                # 원본 텍스트에서 참석자 정보 추출 시도
-                                raw_text = meeting.get("raw_text", "")
-                                if "참석자:" in raw_text:
-                                    lines = raw_text.split("\n")
-                                    for line in lines:
-                                        if "참석자:" in line:
-                                            participant_info = line.split("참석자:")[
-                                                1
-                                            ].strip()
-                                            st.write(f"**참석자:** {participant_info}")
-                                            break
-                                else:
-                                    st.write("**참석자:** 정보 없음")
+                            # 참석자 정보 처리 (목록용 필드, 기존 회의는 상세보기에서 확인)
+                            participants = meeting.get("participants") or []
+                            if isinstance(participants, list) and participants:
+                                participants_str = ", ".join(participants)
+                                st.write(f"**참석자:** {participants_str}")
                             else:
-                                if isinstance(participants, list) and participants:
-                                    participants_str = ", ".join(participants)
-                                    st.write(f"**참석자:** {participants_str}")
-                                else:
-                                    st.write("**참석자:** 정보 없음")
-
-                            # 요약 정보 처리 (JSON 대신 실제 요약 표시)
-                            if summary_data and summary_data.get("summary"):
-                                summary_text = summary_data.get("summary")
-                                if len(summary_text) > 100:
+                                st.write("**참석자:** 정보 없음")
+
+                            # 요약 미리보기
+                            summary_text = meeting.get("summary_preview")
+                            if summary_text:
+                                if len(summary_text) >= 100:
                                     summary_text = summary_text[:100] + "..."
                                 st.write(f"**요약:** {summary_text}")
                             else:
-                                st.write("**요약:** 요약 정보 없음")
-
-                            # 액션 아이템 개수 표시 (실제 DB에서 조회)
-                            try:
-                                meeting_id = meeting.get("id")
-                                if meeting_id:
-                                    action_items = service_manager.get_action_items(
-                                        meeting_id
-                                    )
-                                    if action_items:
-                                        completed = len(
-                                            [
-                                                item
-                                                for item in action_items
-                                                if item.get("status") == "완료"
-                                            ]
-                                        )
-                                        total = len(action_items)
-                                        st.write(
-                                            f"**액션 아이템:** {total}개 (완료: {completed}개)"
-                                        )
-                                    else:
-                                        st.write("**액션 아이템:** 없음")
-                                else:
-                                    st.write("**액션 아이템:** 정보 없음")
-                            except:
-                                st.write("**액션 아이템:** 조회 실패")
+                                st.write("**요약:** 상세보기에서 확인하세요")
+
+                            # 액션 아이템 개수 표시 (페이지 단위 일괄 집계)
+                            total = meeting.get("action_items_count", 0)
+                            completed = meeting.get("completed_action_items_count", 0)
+                            if total:
+                                st.write(
+                                    f"**액션 아이템:** {total}개 (완료: {completed}개)"
+                                )
+                            else:
+                                st.write("**액션 아이템:** 없음")
 
                         with col2:
                             if st.button(
                                 "📖 상세보기", key=f"detail_{meeting.get('id', '')}"
                             ):
-                                st.session_state.selected_meeting = meeting
+                                st.session_state.selected_meeting = meeting.get("id")
                                 st.rerun()
 
+                # 페이지 이동
+                col_prev, col_page, col_next = st.columns([1, 2, 1])
+                with col_prev:
+                    if cursors and st.button("◀ 이전", use_container_width=True):
+                        cursors.pop()
+                        st.rerun()
+                with col_page:
+                    st.caption(f"{len(cursors) + 1} 페이지")
+                with col_next:
+                    if next_cursor and st.button("다음 ▶", use_container_width=True):
+                        cursors.append(next_cursor)
+                        st.rerun()
+
         except Exception as e:
             st.error(f"❌ 회의록을 불러오는 중 오류가 발생했습니다: {str(e)}")
 
 
 def render_meeting_detail(service_manager):
     """회의록 상세보기 렌더링"""
-    meeting = st.session_state.selected_meeting
+    # 원문과 전체 요약은 상세보기에서만 조회
+    meeting_id = st.session_state.selected_meeting
+    meeting = service_manager.get_meeting(meeting_id)
+    if not meeting:
+        st.error(f"❌ 회의를 찾을 수 없습니다: {meeting_id}")
+        if st.button("← 뒤로가기"):
+            st.session_state.selected_meeting = None
+            st.rerun()
+        return
 
     # 뒤로가기 버튼
     col1, col2 = st.columns([1, 4])
@@ -203,7 +184,7 @@ def render_meeting_detail(service_manager):
             participants = summary_data.get("participants", [])
             if not participants and "participants" in str(summary_data):
                 # 원본 텍스트에서 참석자 정보 추출 시도
-                raw_text = meeting.get("raw_text", "")
+                raw_text = service_manager.get_meeting_transcript(meeting)
                 if "참석자:" in raw_text:
                     lines = raw_text.split("\n")
                     for line in lines:
@@ -312,7 +293,7 @@ def render_meeting_detail(service_manager):
                                 try:
                                     item_id = item.get("id")
                                     success = service_manager.update_action_item_status(
-                                        item_id, meeting_id, new_status
+                                        item_id, meeting_id, new_status, current=item
                                     )
                                     if success:
                                         st.success(
@@ -329,14 +310,14 @@ def render_meeting_detail(service_manager):
         st.error(f"액션 아이템 조회 중 오류 발생: {str(e)}")
         st.info("액션 아이템이 없습니다.")
 
-    # 원본 텍스트 (있는 경우)
-    if meeting.get("raw_text"):
+    # 원본 텍스트 (있는 경우, 펼칠 때만 Blob에서 로드)
+    if meeting.get("transcript") or meeting.get("raw_text"):
         st.markdown("---")
         st.markdown("### 📄 원본 텍스트")
-        with st.expander("원본 회의 내용 보기"):
+        if st.toggle("원본 회의 내용 보기", key=f"show_transcript_{meeting.get('id')}"):
             st.text_area(
                 "원본 텍스트",
-                value=meeting.get("raw_text", ""),
+                value=service_manager.get_meeting_transcript(meeting),
                 height=300,
                 disabled=True,
             )
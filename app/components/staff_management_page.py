@@ -87,6 +87,61 @@ def render_staff_management(service_manager):
                         else:
                             st.error("❌ 필수 항목을 모두 입력해주세요.")
 
+        # 일괄 가져오기/내보내기 (CSV, JSONL)
+        with st.expander("📦 일괄 가져오기 / 내보내기"):
+            uploaded_file = st.file_uploader(
+                "CSV 또는 JSONL 파일", type=["csv", "jsonl"], key="staff_import_file"
+            )
+            if uploaded_file is not None and st.button("📥 가져오기"):
+                import io
+
+                from db.staff_io import detect_staff_format
+
+                progress_bar = st.progress(0.0)
+                total_bytes = max(uploaded_file.size, 1)
+
+                def on_progress(progress):
+                    # 업로드 파일에서 읽은 위치로 진행률을 추정
+                    progress_bar.progress(
+                        min(uploaded_file.tell() / total_bytes, 1.0),
+                        text=f"{progress['processed']}건 처리 (실패 {progress['failed']}건)",
+                    )
+
+                try:
+                    stream = io.TextIOWrapper(uploaded_file, encoding="utf-8-sig", newline="")
+                    result = service_manager.import_staff(
+                        stream, detect_staff_format(uploaded_file.name), on_progress
+                    )
+                    progress_bar.progress(1.0)
+                    st.success(
+                        f"✅ {result['succeeded']}명 가져오기 완료 "
+                        f"(실패 {result['failed']}명, 형식 오류 {len(result['invalid'])}줄)"
+                    )
+                    for message in (result["invalid"] + result["errors"])[:10]:
+                        st.caption(f"❌ {message}")
+                except Exception as e:
+                    st.error(f"❌ 가져오기 오류: {str(e)}")
+
+            export_format = st.radio(
+                "내보내기 형식", ["csv", "jsonl"], horizontal=True, key="staff_export_format"
+            )
+            if st.button("📤 내보내기 파일 만들기"):
+                try:
+                    st.session_state.staff_export = (
+                        export_format,
+                        "".join(service_manager.export_staff(export_format)),
+                    )
+                except Exception as e:
+                    st.error(f"❌ 내보내기 오류: {str(e)}")
+            if st.session_state.get("staff_export"):
+                fmt, content = st.session_state.staff_export
+                st.download_button(
+                    "💾 다운로드",
+                    data=content.encode("utf-8"),
+                    file_name=f"staff.{fmt}",
+                    mime="text/csv" if fmt == "csv" else "application/x-ndjson",
+                )
+
         # 기존 직원 목록 표시
         try:
             staff_list = service_manager.get_all_staff()
@@ -3,6 +3,26 @@ Meeting AI Assistant - Task Management 페이지 렌더링
 """
 import streamlit as st
 
+# 업무 목록 한 번에 조회할 개수 (더 보기마다 다음 페이지를 이어 붙임)
+TASK_PAGE_SIZE = 50
+
+
+def _reset_task_pages():
+    """세션에 쌓아 둔 업무 목록 페이지를 비웁니다 (다음 렌더링에서 첫 페이지부터 조회)."""
+    for key in ('task_items', 'task_next_token', 'task_meeting_titles'):
+        st.session_state.pop(key, None)
+
+
+def _replace_cached_task(updated):
+    """수정된 업무 문서로 세션에 쌓아 둔 목록의 같은 항목을 교체합니다."""
+    items = st.session_state.get('task_items')
+    if not updated or not items:
+        return
+    for index, item in enumerate(items):
+        if item.get('id') == updated.get('id'):
+            items[index] = updated
+            break
+
 def render_task_management(service_manager):
     """작업 관리 페이지 렌더링"""
     with st.container():
@@ -13,6 +33,7 @@ def render_task_management(service_manager):
         col1, col2, col3 = st.columns([1, 1, 2])
         with col1:
             if st.button("🔄 새로고침"):
+                _reset_task_pages()
                 st.rerun()
         with col2:
             if st.button("📊 통계 보기"):
@@ -20,21 +41,122 @@ def render_task_management(service_manager):
         
         # 작업 목록 조회
         try:
-            # 모든 액션 아이템을 한 번에 조회 (성능 개선)
-            all_action_items = service_manager.get_all_action_items()
+            # 작업 현황 요약은 상태별 개수 뷰(없으면 대시보드 통계 문서)와 개수 쿼리로 계산 (전체 작업을 읽지 않음)
+            stats = service_manager.get_dashboard_stats() or {}
+            counters = service_manager.get_task_status_counters()
+            status_counts = (counters or stats).get('action_items_by_status', {})
+            total_tasks = sum(status_counts.values())
             
-            # 회의 제목을 액션 아이템에 추가
-            meetings = service_manager.get_meetings()
-            meeting_titles = {meeting.get('id'): meeting.get('title', 'Unknown') for meeting in meetings}
+            if not total_tasks:
+                st.info("📋 등록된 작업이 없습니다. 회의를 분석하여 자동으로 작업을 생성해보세요!")
+                return
             
-            # 직원 정보 추가 (담당자 이름 매핑)
+            # 직원 정보 (담당자 이름 매핑)
             staff_list = service_manager.get_all_staff()
             # ID 기반 매핑
             staff_by_id = {str(staff.get('user_id', '')): staff.get('name') for staff in staff_list}
             
-            for item in all_action_items:
+            completed_tasks = status_counts.get('완료', 0)
+            pending_tasks = total_tasks - completed_tasks
+            approved_tasks = service_manager.count_action_items({'approved': True})
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("전체 작업", total_tasks)
+            with col2:
+                st.metric("완료", completed_tasks, f"{(completed_tasks/total_tasks*100):.1f}%" if total_tasks > 0 else "0%")
+            with col3:
+                st.metric("대기중", pending_tasks)
+            with col4:
+                st.metric("승인됨", approved_tasks)
+            
+            # 통계 상세 보기
+            if st.session_state.get('show_task_stats', False):
+                with st.expander("📊 상세 통계", expanded=True):
+                    # 담당자별 작업 현황
+                    st.markdown("**👥 담당자별 현황**")
+                    for assignee, count in sorted(stats.get('action_items_by_assignee', {}).items(), key=lambda x: -x[1]):
+                        assignee_name = staff_by_id.get(assignee, assignee) if str(assignee).isdigit() else assignee
+                        st.write(f"• {assignee_name}: {count}건")
+            
+            st.markdown("---")
+            
+            # 작업 필터 (선택한 조건만 서버에서 조회)
+            col_filter1, col_filter2 = st.columns([2, 1])
+            with col_filter1:
+                view = st.radio("보기", ["📋 전체", "⏳ 대기중", "✅ 완료", "📌 독립 작업"], horizontal=True, key="task_view")
+            with col_filter2:
+                assignee_filter = st.selectbox("👤 담당자", ["전체"] + [staff.get('name', 'N/A') for staff in staff_list], key="task_assignee_filter")
+            search_term = st.text_input("🔍 작업 검색", placeholder="작업 설명으로 검색...")
+            
+            filters = {}
+            task_type = "all"
+            if view == "⏳ 대기중":
+                filters['exclude_status'] = '완료'
+                task_type = "pending"
+            elif view == "✅ 완료":
+                filters['status'] = '완료'
+                task_type = "completed"
+            elif view == "📌 독립 작업":
+                task_type = "standalone"
+            if assignee_filter != "전체":
+                filters['assignee'] = assignee_filter
+            if search_term:
+                filters['text'] = search_term
+                task_type = "search"
+            
+            # 조건이 바뀌면 처음 페이지부터 다시 표시
+            filter_key = repr((task_type, sorted(filters.items())))
+            if st.session_state.get('task_filter_key') != filter_key:
+                st.session_state.task_filter_key = filter_key
+                _reset_task_pages()
+            
+            # 담당자별 대기중 업무는 change feed로 유지되는 담당자 뷰 포인트 읽기로 조회 (뷰가 없으면 쿼리)
+            action_items = None
+            next_token = None
+            if view == "⏳ 대기중" and assignee_filter != "전체" and not search_term:
+                action_items = service_manager.get_assignee_open_tasks(assignee_filter)
+            
+            if action_items is not None:
+                st.caption("담당자 뷰 기준 (반영까지 몇 초 걸릴 수 있습니다)")
+            elif view == "📌 독립 작업":
+                # 독립 작업은 최근 월 샤드 파티션만 조회하고 담당자/검색 조건은 화면에서 적용
+                action_items = service_manager.get_standalone_action_items()
+                if assignee_filter != "전체":
+                    action_items = [
+                        item for item in action_items
+                        if (item.get('finalAssigneeId') or item.get('recommendedAssigneeId')) == assignee_filter
+                    ]
+                if search_term:
+                    action_items = [
+                        item for item in action_items
+                        if search_term.lower() in str(item.get('description', '')).lower()
+                    ]
+            else:
+                # 조회한 페이지와 다음 페이지 커서를 세션에 두고 더 보기마다 이어 붙임
+                if 'task_items' not in st.session_state:
+                    items, token = service_manager.query_action_items(filters, limit=TASK_PAGE_SIZE)
+                    st.session_state.task_items = items
+                    st.session_state.task_next_token = token
+                action_items = st.session_state.task_items
+                next_token = st.session_state.get('task_next_token')
+            
+            # 표시할 업무의 회의 제목만 회의 ID로 조회 (이미 조회한 제목은 세션에 보관)
+            meeting_titles = st.session_state.setdefault('task_meeting_titles', {})
+            missing_ids = {
+                item.get('meetingId') for item in action_items
+                if item.get('meetingId') not in meeting_titles
+                and not service_manager.is_standalone_task(item.get('meetingId'))
+            }
+            if missing_ids:
+                meeting_titles.update(service_manager.get_meeting_titles(missing_ids))
+            
+            for item in action_items:
                 meeting_id = item.get('meetingId')
-                item['meeting_title'] = meeting_titles.get(meeting_id, 'Unknown')
+                if service_manager.is_standalone_task(meeting_id):
+                    item['meeting_title'] = '📌 독립 작업'
+                else:
+                    item['meeting_title'] = meeting_titles.get(meeting_id, 'Unknown')
                 
                 # 담당자 이름 매핑 개선
                 assignee_id = item.get('finalAssigneeId') or item.get('recommendedAssigneeId', '')
@@ -47,73 +169,17 @@ def render_task_management(service_manager):
                 else:
                     item['assignee_name'] = '미할당'
             
-            if not all_action_items:
-                st.info("📋 등록된 작업이 없습니다. 회의를 분석하여 자동으로 작업을 생성해보세요!")
-            else:
-                # 작업 현황 요약
-                total_tasks = len(all_action_items)
-                completed_tasks = len([item for item in all_action_items if item.get('status') == '완료'])
-                pending_tasks = total_tasks - completed_tasks
-                approved_tasks = len([item for item in all_action_items if item.get('approved', False)])
-                
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("전체 작업", total_tasks)
-                with col2:
-                    st.metric("완료", completed_tasks, f"{(completed_tasks/total_tasks*100):.1f}%" if total_tasks > 0 else "0%")
-                with col3:
-                    st.metric("대기중", pending_tasks)
-                with col4:
-                    st.metric("승인됨", approved_tasks)
-                
-                # 통계 상세 보기
-                if st.session_state.get('show_task_stats', False):
-                    with st.expander("📊 상세 통계", expanded=True):
-                        # 담당자별 작업 현황
-                        assignee_stats = {}
-                        for item in all_action_items:
-                            assignee = item.get('assignee_name', '미할당')
-                            if assignee not in assignee_stats:
-                                assignee_stats[assignee] = {'total': 0, 'completed': 0}
-                            assignee_stats[assignee]['total'] += 1
-                            if item.get('status') == '완료':
-                                assignee_stats[assignee]['completed'] += 1
-                        
-                        st.markdown("**👥 담당자별 현황**")
-                        for assignee, stats in assignee_stats.items():
-                            completion_rate = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-                            st.write(f"• {assignee}: {stats['completed']}/{stats['total']} ({completion_rate:.1f}%)")
-                
-                st.markdown("---")
-                
-                # 작업 필터
-                tab1, tab2, tab3, tab4 = st.tabs(["📋 전체", "⏳ 대기중", "✅ 완료", "🔍 검색"])
-                
-                with tab1:
-                    render_task_list(all_action_items, "all", service_manager)
-                
-                with tab2:
-                    pending_items = [item for item in all_action_items if item.get('status') != '완료']
-                    render_task_list(pending_items, "pending", service_manager)
-                
-                with tab3:
-                    completed_items = [item for item in all_action_items if item.get('status') == '완료']
-                    render_task_list(completed_items, "completed", service_manager)
-                
-                with tab4:
-                    # 검색 기능
-                    search_term = st.text_input("🔍 작업 검색", placeholder="작업 설명, 담당자, 회의 제목으로 검색...")
-                    if search_term:
-                        filtered_items = [
-                            item for item in all_action_items
-                            if search_term.lower() in item.get('description', '').lower() or
-                               search_term.lower() in item.get('assignee_name', '').lower() or
-                               search_term.lower() in item.get('meeting_title', '').lower()
-                        ]
-                        st.caption(f"검색 결과: {len(filtered_items)}개")
-                        render_task_list(filtered_items, "search", service_manager)
-                    else:
-                        st.info("검색어를 입력하세요.")
+            if search_term:
+                st.caption(f"검색 결과: {len(action_items)}개{' 이상' if next_token else ''}")
+            render_task_list(action_items, task_type, service_manager)
+            
+            if next_token and st.button("⬇️ 더 보기", key="task_list_more"):
+                items, token = service_manager.query_action_items(
+                    filters, limit=TASK_PAGE_SIZE, continuation_token=next_token
+                )
+                st.session_state.task_items.extend(items)
+                st.session_state.task_next_token = token
+                st.rerun()
         
         except Exception as e:
             st.error(f"❌ 작업 목록을 불러오는 중 오류가 발생했습니다: {str(e)}")
@@ -125,6 +191,8 @@ def render_task_list(tasks, task_type, service_manager):
             st.info("🎉 모든 작업이 완료되었습니다!")
         elif task_type == "completed":
             st.info("📋 완료된 작업이 없습니다.")
+        elif task_type == "standalone":
+            st.info("📌 최근 3개월 동안 직접 추가한 작업이 없습니다.")
         elif task_type == "search":
             st.info("� 검색 결과가 없습니다.")
         else:
@@ -205,7 +273,7 @@ def render_task_list(tasks, task_type, service_manager):
                         if st.button("상태 변경", key=f"update_status_{unique_key_base}"):
                             try:
                                 if meeting_id:
-                                    service_manager.update_action_item_status(task_id, meeting_id, new_status)
+                                    _replace_cached_task(service_manager.update_action_item_status(task_id, meeting_id, new_status, current=task))
                                     st.success(f"✅ 상태가 '{new_status}'로 변경되었습니다!")
                                     st.rerun()
                                 else:
@@ -238,7 +306,7 @@ def render_task_list(tasks, task_type, service_manager):
                                 if meeting_id:
                                     # 담당자 정보 업데이트
                                     updates = {'finalAssigneeId': new_assignee if new_assignee != '미할당' else None}
-                                    service_manager.update_action_item(task_id, meeting_id, updates)
+                                    _replace_cached_task(service_manager.update_action_item(task_id, meeting_id, updates, current=task))
                                     st.success(f"✅ 담당자가 '{new_assignee}'로 변경되었습니다!")
                                     del st.session_state[f"show_assign_{unique_key_base}"]
                                     st.rerun()
@@ -252,6 +320,21 @@ def render_task_list(tasks, task_type, service_manager):
                             del st.session_state[f"show_assign_{unique_key_base}"]
                             st.rerun()
                 
+                # 삭제 버튼
+                if st.button("🗑️ 삭제", key=f"delete_{unique_key_base}"):
+                    try:
+                        if meeting_id:
+                            service_manager.delete_action_item(task_id, meeting_id)
+                            items = st.session_state.get('task_items')
+                            if items:
+                                st.session_state.task_items = [item for item in items if item.get('id') != task_id]
+                            st.success("🗑️ 작업이 삭제되었습니다!")
+                            st.rerun()
+                        else:
+                            st.error("❌ 회의 ID가 없어 삭제할 수 없습니다.")
+                    except Exception as e:
+                        st.error(f"❌ 삭제 오류: {str(e)}")
+                
                 # 승인 버튼 (승인되지 않은 작업에만 표시)
                 if not task.get('approved', False):
                     if st.button("✅ 승인", key=f"approve_{unique_key_base}"):
@@ -259,7 +342,7 @@ def render_task_list(tasks, task_type, service_manager):
                             if meeting_id:
                                 # 승인 처리
                                 assignee = task.get('finalAssigneeId') or task.get('recommendedAssigneeId')
-                                service_manager.approve_action_item(task_id, meeting_id, assignee, "시스템 관리자")
+                                _replace_cached_task(service_manager.approve_action_item(task_id, meeting_id, assignee, "시스템 관리자", current=task))
                                 st.success("✅ 작업이 승인되었습니다!")
                                 st.rerun()
                             else:
@@ -7,6 +7,9 @@ import json
 import re
 from datetime import datetime
 
+# 미할당 작업 답변에 나열할 최대 개수 (넘으면 전체 개수와 함께 잘렸음을 알림)
+UNASSIGNED_TASKS_LIMIT = 50
+
 
 def process_chat_message(user_input, service_manager):
     """채팅 메시지 처리"""
@@ -100,19 +103,23 @@ def process_chat_message(user_input, service_manager):
 
 def _handle_meeting_query(user_input, service_manager):
     """회의 관련 질문 처리"""
-    meetings = service_manager.get_meetings()
+    # 최근 3개 회의는 요약 필드만 조회하고, 전체 개수는 대시보드 통계 문서에서 가져옴
+    meetings = service_manager.get_meeting_summaries(top=3)
     if meetings:
+        total_meetings = service_manager.get_dashboard_stats().get(
+            "total_meetings", len(meetings)
+        )
         response = f"""📝 **회의록 관련 정보**
 
-현재 저장된 회의록: {len(meetings)}개
+현재 저장된 회의록: {total_meetings}개
 
 최근 회의록:
 """
         for i, meeting in enumerate(meetings[:3], 1):
             response += f"\n{i}. {meeting.get('title', 'N/A')} ({meeting.get('created_at', 'N/A')})"
 
-        if len(meetings) > 3:
-            response += f"\n... 외 {len(meetings) - 3}개"
+        if total_meetings > 3:
+            response += f"\n... 외 {total_meetings - 3}개"
 
         response += "\n\n📋 Meeting Records 페이지에서 자세한 내용을 확인하세요."
     else:
@@ -124,8 +131,15 @@ def _handle_meeting_query(user_input, service_manager):
 def _handle_task_query(user_input, service_manager):
     """작업 관련 질문 처리"""
     try:
-        # 새로운 작업 추가 요청 인식
+        # 독립 작업 조회 요청 인식 ("직접 추가한 작업"은 추가 요청보다 먼저 확인)
         if any(
+            keyword in user_input.lower()
+            for keyword in ["독립 작업", "직접 추가", "채팅으로 추가", "standalone"]
+        ):
+            return _handle_standalone_tasks_query(user_input, service_manager)
+
+        # 새로운 작업 추가 요청 인식
+        elif any(
             keyword in user_input.lower()
             for keyword in ["추가", "새로운", "만들", "생성", "add", "create", "new"]
         ):
@@ -146,46 +160,28 @@ def _handle_task_query(user_input, service_manager):
         ):
             return _handle_task_status_update(user_input, service_manager)
 
-        # 기존 작업 조회 기능
+        # 기존 작업 조회 기능 (개수는 집계 쿼리, 목록은 최근 5개만 조회)
         else:
-            meetings = service_manager.get_meetings()
-            all_action_items = []
-            unassigned_count = 0
-
-            for meeting in meetings:
-                meeting_id = meeting.get("id")
-                if meeting_id:
-                    action_items = service_manager.get_action_items(meeting_id)
-                    for item in action_items:
-                        # 미할당 카운트
-                        assignee = item.get("recommendedAssigneeId") or item.get(
-                            "assignee"
-                        )
-                        if not assignee or assignee.lower() in [
-                            "미할당",
-                            "unassigned",
-                            "",
-                            "없음",
-                        ]:
-                            unassigned_count += 1
-                        all_action_items.append(item)
-
-            if all_action_items:
-                completed = len(
-                    [item for item in all_action_items if item.get("status") == "완료"]
+            total_count = service_manager.count_action_items()
+            recent_items, _ = service_manager.query_action_items(limit=5)
+
+            if total_count:
+                completed = service_manager.count_action_items({"status": "완료"})
+                pending = total_count - completed
+                unassigned_count = service_manager.count_action_items(
+                    {"unassigned": True}
                 )
-                pending = len(all_action_items) - completed
 
                 response = f"""✅ **작업 현황**
 
-전체 작업: {len(all_action_items)}개
+전체 작업: {total_count}개
 완료: {completed}개
 대기중: {pending}개
 미할당: {unassigned_count}개
 
 최근 작업:
 """
-                for i, task in enumerate(all_action_items[:5], 1):
+                for i, task in enumerate(recent_items, 1):
                     status = "✅" if task.get("status") == "완료" else "⏳"
                     assignee = (
                         task.get("recommendedAssigneeId")
@@ -208,6 +204,35 @@ def _handle_task_query(user_input, service_manager):
     return response
 
 
+def _handle_standalone_tasks_query(user_input, service_manager):
+    """독립 작업(회의 없이 직접 추가한 작업) 조회 처리"""
+    try:
+        # 최근 월 샤드 파티션만 단일 파티션 쿼리로 조회 (교차 파티션 조회 없음)
+        tasks = service_manager.get_standalone_action_items()
+        if not tasks:
+            return "📋 최근 3개월 동안 직접 추가한 작업이 없습니다.\n💡 '새로운 작업 추가해줘: 작업 내용' 명령으로 작업을 추가할 수 있습니다."
+
+        response = f"📌 **직접 추가한 작업** (최근 3개월, {len(tasks)}개)\n\n"
+        for i, task in enumerate(tasks, 1):
+            status_icon = "✅" if task.get("status") == "완료" else "⏳"
+            assignee = (
+                task.get("finalAssigneeId")
+                or task.get("recommendedAssigneeId")
+                or "미할당"
+            )
+            response += f"{i}. {status_icon} **{task.get('description', 'N/A')}**\n"
+            response += f"   └ 담당자: {assignee}\n"
+            if task.get("dueDate"):
+                response += f"   └ 마감일: {task.get('dueDate')}\n"
+            response += "\n"
+
+        response += "📋 Task Management 페이지의 '📌 독립 작업' 보기에서 관리할 수 있습니다."
+        return response
+
+    except Exception as e:
+        return f"❌ 독립 작업 조회 중 오류가 발생했습니다: {str(e)}"
+
+
 def _handle_task_creation(user_input, service_manager):
     """새로운 작업 추가 처리"""
     try:
@@ -322,38 +347,35 @@ def _handle_task_creation(user_input, service_manager):
 def _handle_task_status_update(user_input, service_manager):
     """작업 상태 업데이트 처리"""
     try:
-        # 모든 액션 아이템 조회
-        all_action_items = service_manager.get_all_action_items()
-
-        if not all_action_items:
-            return "❌ 업데이트할 작업이 없습니다."
-
-        # 간단한 키워드 매칭으로 작업 찾기
         user_input_lower = user_input.lower()
-        matched_items = []
 
-        for item in all_action_items:
-            description = item.get("description", "").lower()
-            assignee = item.get("recommendedAssigneeId", "").lower()
+        # 입력 단어가 설명에 포함된 작업을 서버에서 조회
+        words = [word for word in user_input_lower.split() if len(word) > 2]
+        matched_items = []
+        if words:
+            matched_items, _ = service_manager.query_action_items(
+                {"text": words}, limit=1
+            )
 
-            # 작업 설명이나 담당자가 사용자 입력에 포함되어 있으면 매칭
-            if any(
-                word in description
-                for word in user_input_lower.split()
-                if len(word) > 2
-            ):
-                matched_items.append(item)
-            elif assignee and assignee in user_input_lower:
-                matched_items.append(item)
+        # 없으면 입력에 이름이 포함된 담당자의 작업 조회
+        if not matched_items:
+            for staff in service_manager.get_all_staff():
+                name = staff.get("name", "")
+                if name and name.lower() in user_input_lower:
+                    matched_items, _ = service_manager.query_action_items(
+                        {"assignee": name}, limit=1
+                    )
+                    if matched_items:
+                        break
 
         if not matched_items:
+            recent_items, _ = service_manager.query_action_items(limit=5)
+            if not recent_items:
+                return "❌ 업데이트할 작업이 없습니다."
             return (
                 f"❌ 해당하는 작업을 찾을 수 없습니다.\n\n현재 작업 목록:\n"
                 + "\n".join(
-                    [
-                        f"- {item.get('description', 'N/A')}"
-                        for item in all_action_items[:5]
-                    ]
+                    [f"- {item.get('description', 'N/A')}" for item in recent_items]
                 )
             )
 
@@ -367,7 +389,7 @@ def _handle_task_status_update(user_input, service_manager):
 
         # 상태 업데이트
         try:
-            service_manager.update_action_item_status(item_id, meeting_id, new_status)
+            service_manager.update_action_item_status(item_id, meeting_id, new_status, current=item)
 
             response = f"""✅ **작업 상태가 업데이트되었습니다!**
 
@@ -412,7 +434,7 @@ def _handle_search_query(user_input):
 def _handle_modification_query(user_input, service_manager):
     """자연어 수정 기능 처리"""
     try:
-        meetings = service_manager.get_meetings()
+        meetings = service_manager.get_meetings(top=1)
 
         if not meetings:
             return "❌ 수정할 회의록이 없습니다. 먼저 회의록을 생성해주세요."
@@ -609,9 +631,8 @@ def add_to_chat_history(user_message, ai_response, service_manager):
     if len(st.session_state.chat_history) > 50:
         st.session_state.chat_history = st.session_state.chat_history[-50:]
 
-    # DB에 저장/업데이트 (save_chat_history가 이미 내장 업데이트 로직 포함)
+    # DB에 새 메시지만 추가 저장
     try:
-        session_id = st.session_state.get("session_id", "unknown")
         all_messages = st.session_state.get("chat_messages", [])
 
         # 대화가 있을 때만 저장 (최소 2개 이상의 메시지)
@@ -623,18 +644,31 @@ def add_to_chat_history(user_message, ai_response, service_manager):
             )
             summary = summary + "..." if len(summary) >= 50 else summary
 
-            # save_chat_history 함수가 내부적으로 업데이트/생성을 처리
-            chat_id = service_manager.save_chat_history(
-                session_id, all_messages, summary
-            )
+            chat_id = persist_chat_messages(service_manager, summary)
             if chat_id:
-                # 현재 채팅의 DB ID를 세션에 저장 (세션 기반 고정 ID이므로 항상 같음)
-                st.session_state.current_chat_db_id = chat_id
                 print(f"✅ 채팅 히스토리 저장/업데이트 완료: {chat_id}")
     except Exception as e:
         print(f"❌ 채팅 히스토리 저장/업데이트 오류: {str(e)}")
 
 
+def persist_chat_messages(service_manager, summary=None):
+    """아직 DB에 저장되지 않은 메시지만 채팅 세그먼트에 추가합니다."""
+    session_id = st.session_state.get("session_id", "unknown")
+    messages = st.session_state.get("chat_messages", [])
+    persisted_count = st.session_state.get("chat_persisted_count", 0)
+
+    new_messages = messages[persisted_count:]
+    if not new_messages:
+        return st.session_state.get("current_chat_db_id")
+
+    chat_id = service_manager.append_chat_messages(session_id, new_messages, summary)
+    if chat_id:
+        st.session_state.chat_persisted_count = persisted_count + len(new_messages)
+        # 현재 채팅의 DB ID를 세션에 저장 (세션 기반 고정 ID이므로 항상 같음)
+        st.session_state.current_chat_db_id = chat_id
+    return chat_id
+
+
 def initialize_chat_session():
     """새로운 채팅 세션 초기화"""
     import uuid
@@ -654,39 +688,56 @@ def initialize_chat_session():
     # 현재 채팅의 DB ID 초기화 (새 채팅이므로 None)
     st.session_state.current_chat_db_id = None
 
+    # DB에 저장된 메시지 수와 불러온 가장 오래된 세그먼트 번호
+    st.session_state.chat_persisted_count = 0
+    st.session_state.chat_oldest_segment = None
+
     print(f"✅ 새로운 채팅 세션 초기화: {st.session_state.session_id}")
 
 
+def _chat_history_entries(messages, timestamp):
+    """메시지 목록을 UI용 히스토리 항목(사용자/AI 쌍)으로 변환합니다."""
+    entries = []
+    for i in range(0, len(messages), 2):
+        if i + 1 < len(messages):
+            user_msg = messages[i]
+            ai_msg = messages[i + 1]
+            entries.append(
+                {
+                    "timestamp": timestamp,
+                    "preview": user_msg.get("content", "")[:50],
+                    "messages": [user_msg, ai_msg],
+                }
+            )
+    return entries
+
+
 def load_chat_history_from_db(chat_id, service_manager):
-    """DB에서 특정 채팅 히스토리 로드"""
+    """DB에서 특정 채팅 히스토리 로드 (가장 최근 메시지 페이지만)"""
     try:
         chat_data = service_manager.get_chat_history_by_id(chat_id)
-        if chat_data and "messages" in chat_data:
-            # 채팅 메시지 복원
-            st.session_state.chat_messages = chat_data["messages"]
+        if chat_data and chat_data.get("session_id"):
+            session_id = chat_data["session_id"]
+            messages, segment_index = service_manager.get_chat_messages_page(
+                session_id
+            )
+
+            # 채팅 메시지 복원 (이전 메시지는 load_older_chat_messages로 추가 로드)
+            st.session_state.chat_messages = list(messages)
+            st.session_state.chat_persisted_count = len(messages)
+            st.session_state.chat_oldest_segment = segment_index
 
             # 현재 채팅의 DB ID를 설정 (이후 업데이트용)
             st.session_state.current_chat_db_id = chat_id
 
-            # 세션 ID도 원래 채팅의 세션 ID로 복원 (선택적)
-            if chat_data.get("session_id"):
-                st.session_state.session_id = chat_data["session_id"]
+            # 세션 ID도 원래 채팅의 세션 ID로 복원
+            st.session_state.session_id = session_id
 
             # UI용 히스토리도 업데이트
-            st.session_state.chat_history = []
-            for i in range(0, len(chat_data["messages"]), 2):
-                if i + 1 < len(chat_data["messages"]):
-                    user_msg = chat_data["messages"][i]
-                    ai_msg = chat_data["messages"][i + 1]
-
-                    entry = {
-                        "timestamp": chat_data.get(
-                            "created_at", datetime.now().strftime("%Y-%m-%d %H:%M")
-                        ),
-                        "preview": user_msg.get("content", "")[:50],
-                        "messages": [user_msg, ai_msg],
-                    }
-                    st.session_state.chat_history.append(entry)
+            st.session_state.chat_history = _chat_history_entries(
+                messages,
+                chat_data.get("created_at", datetime.now().strftime("%Y-%m-%d %H:%M")),
+            )
 
             print(f"✅ 채팅 히스토리 로드 완료: {chat_id} (DB ID 설정됨)")
             return True
@@ -695,36 +746,78 @@ def load_chat_history_from_db(chat_id, service_manager):
     return False
 
 
+def load_older_chat_messages(service_manager):
+    """불러온 채팅의 이전 메시지 페이지를 앞쪽에 추가합니다."""
+    oldest_segment = st.session_state.get("chat_oldest_segment")
+    if not oldest_segment:
+        return False
+
+    try:
+        messages, segment_index = service_manager.get_chat_messages_page(
+            st.session_state.session_id, before_segment=oldest_segment
+        )
+        if not messages:
+            return False
+
+        st.session_state.chat_messages = list(messages) + st.session_state.chat_messages
+        st.session_state.chat_persisted_count = (
+            st.session_state.get("chat_persisted_count", 0) + len(messages)
+        )
+        st.session_state.chat_oldest_segment = segment_index
+        st.session_state.chat_history = (
+            _chat_history_entries(messages, datetime.now().strftime("%Y-%m-%d %H:%M"))
+            + st.session_state.chat_history
+        )[-50:]
+
+        print(f"✅ 이전 채팅 메시지 로드 완료: 세그먼트 {segment_index}")
+        return True
+    except Exception as e:
+        print(f"❌ 이전 채팅 메시지 로드 오류: {str(e)}")
+    return False
+
+
 def _handle_unassigned_tasks_query(user_input, service_manager):
     """미할당 작업 조회 처리"""
     try:
-        # 모든 회의에서 액션 아이템 수집
-        meetings = service_manager.get_meetings()
-        unassigned_tasks = []
-
-        for meeting in meetings:
-            meeting_id = meeting.get("id")
-            if meeting_id:
-                action_items = service_manager.get_action_items(meeting_id)
-                for item in action_items:
-                    assignee = item.get("recommendedAssigneeId") or item.get("assignee")
-                    if not assignee or assignee.lower() in [
-                        "미할당",
-                        "unassigned",
-                        "",
-                        "없음",
-                    ]:
-                        unassigned_tasks.append(
-                            {
-                                **item,
-                                "meeting_title": meeting.get(
-                                    "title", "Unknown Meeting"
-                                ),
-                            }
-                        )
+        # change feed로 유지되는 미할당 업무 샤드 뷰를 우선 사용 (샤드별 포인트 읽기)
+        items = service_manager.get_unassigned_tasks()
+
+        # 뷰가 없으면 미할당 조건 쿼리로 한 페이지만 조회
+        total_count = None
+        if items is None:
+            items, next_token = service_manager.query_action_items(
+                {"unassigned": True}, limit=UNASSIGNED_TASKS_LIMIT
+            )
+            if next_token:
+                total_count = service_manager.count_action_items({"unassigned": True})
+        elif len(items) > UNASSIGNED_TASKS_LIMIT:
+            total_count = len(items)
+            items = items[:UNASSIGNED_TASKS_LIMIT]
+
+        # 회의 제목은 표시할 업무의 회의 ID로만 조회
+        meeting_titles = service_manager.get_meeting_titles(
+            item.get("meetingId") for item in items
+        )
+        unassigned_tasks = [
+            {
+                **item,
+                "meeting_title": (
+                    "독립 작업"
+                    if service_manager.is_standalone_task(item.get("meetingId"))
+                    else meeting_titles.get(item.get("meetingId"), "Unknown Meeting")
+                ),
+            }
+            for item in items
+        ]
 
         if unassigned_tasks:
-            response = f"📋 **미할당 작업** ({len(unassigned_tasks)}개)\n\n"
+            if total_count and total_count > len(unassigned_tasks):
+                response = (
+                    f"📋 **미할당 작업** (전체 {total_count}개 중 "
+                    f"{len(unassigned_tasks)}개만 표시)\n\n"
+                )
+            else:
+                response = f"📋 **미할당 작업** ({len(unassigned_tasks)}개)\n\n"
             for i, task in enumerate(unassigned_tasks, 1):
                 status_icon = "⏳" if task.get("status") != "완료" else "✅"
                 response += f"{i}. {status_icon} **{task.get('description', 'N/A')}**\n"
@@ -733,6 +826,11 @@ def _handle_unassigned_tasks_query(user_input, service_manager):
                     response += f"   └ 마감일: {task.get('dueDate')}\n"
                 response += "\n"
 
+            if total_count and total_count > len(unassigned_tasks):
+                response += (
+                    f"⚠️ 나머지 {total_count - len(unassigned_tasks)}개는 Task Management "
+                    "페이지에서 확인하세요.\n"
+                )
             response += "💡 '작업명 담당자를 이름으로 지정해줘' 명령으로 담당자를 지정할 수 있습니다."
             return response
         else:
@@ -797,26 +895,10 @@ def _handle_assignee_assignment(user_input, service_manager):
 
             return f"❌ '{assignee_name}' 직원을 찾을 수 없습니다.{suggestion}"
 
-        # 해당 작업 찾기
-        meetings = service_manager.get_meetings()
-        matched_tasks = []
-
-        for meeting in meetings:
-            meeting_id = meeting.get("id")
-            if meeting_id:
-                action_items = service_manager.get_action_items(meeting_id)
-                for item in action_items:
-                    item_desc = item.get("description", "").lower()
-                    if task_name.lower() in item_desc:
-                        matched_tasks.append(
-                            {
-                                **item,
-                                "meeting_id": meeting_id,
-                                "meeting_title": meeting.get(
-                                    "title", "Unknown Meeting"
-                                ),
-                            }
-                        )
+        # 해당 작업 찾기 (설명 검색 쿼리)
+        matched_tasks, _ = service_manager.query_action_items(
+            {"text": task_name}, limit=1
+        )
 
         if not matched_tasks:
             return f"❌ '{task_name}' 작업을 찾을 수 없습니다.\n\n💡 '미할당 작업 보여줘' 명령으로 전체 작업 목록을 확인해보세요."
@@ -824,7 +906,7 @@ def _handle_assignee_assignment(user_input, service_manager):
         # 첫 번째 매칭된 작업에 담당자 지정
         task = matched_tasks[0]
         task_id = task.get("id")
-        meeting_id = task.get("meeting_id")
+        meeting_id = task.get("meetingId")
 
         # 담당자 업데이트
         success = service_manager.update_action_item_assignee(
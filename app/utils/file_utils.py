@@ -8,37 +8,33 @@ import os
 import time
 from datetime import datetime
 import base64
-import hashlib
 
 
-def _create_safe_doc_id(original_filename, timestamp):
-    """파일명을 Azure AI Search 호환 문서 ID로 변환합니다."""
-    try:
-        # 파일명에서 확장자 분리
-        name_without_ext = os.path.splitext(original_filename)[0]
-        extension = os.path.splitext(original_filename)[1]
-
-        # 한글이나 특수문자가 포함된 경우 해시로 변환
-        safe_name = ""
-        for char in name_without_ext:
-            if char.isalnum() or char in ["_", "-"]:
-                safe_name += char
-            else:
-                # 한글이나 특수문자는 해시로 변환
-                if not safe_name.endswith("_"):
-                    safe_name += "_"
-
-        # 빈 문자열이거나 너무 긴 경우 해시 사용
-        if not safe_name or len(safe_name) > 50:
-            # 원본 파일명의 MD5 해시 생성
-            hash_name = hashlib.md5(original_filename.encode("utf-8")).hexdigest()[:12]
-            safe_name = f"file_{hash_name}"
-
-        return f"meeting_files_{safe_name}_{timestamp}"
-
-    except Exception as e:
-        # 최후의 수단: 타임스탬프만 사용
-        return f"meeting_files_doc_{timestamp}"
+def _enqueue_meeting_document(
+    service_manager, meeting_id, content, analysis_result, blob_path, metadata
+):
+    """저장된 회의의 원문을 회의 ID와 함께 AI Search 인덱싱 대기열에 넣습니다."""
+    metadata = {
+        **metadata,
+        "meeting_id": meeting_id,
+        "meeting_title": analysis_result.get("meetingTitle", ""),
+        "participants": ", ".join(analysis_result.get("participants", [])),
+        "summary": analysis_result.get("summary", ""),
+        "action_items_count": len(analysis_result.get("actionItems", [])),
+        "created_at": datetime.now().isoformat(),
+        "document_type": "meeting",
+    }
+    # /upload, 재인덱싱 스크립트와 같은 문서 ID를 써서 같은 회의는 같은 문서로 덮어씀
+    doc_id = f"meeting_{meeting_id}"
+    service_manager.enqueue_document(
+        doc_id=doc_id, content=content, metadata=metadata, blob_path=blob_path
+    )
+    return doc_id
+
+
+def _upload_idempotency_key(uploaded_file):
+    """같은 세션에서 같은 파일을 다시 처리해도 회의가 중복 저장되지 않도록 멱등 키를 만듭니다."""
+    return f"{st.session_state.get('session_id', '')}:{uploaded_file.name}"
 
 
 def process_uploaded_file_from_chat(uploaded_file, service_manager, is_last_file=True):
@@ -78,7 +74,7 @@ def process_uploaded_file_from_chat(uploaded_file, service_manager, is_last_file
                 response = f"❌ 지원하지 않는 파일 형식입니다: {file_extension}"
 
             # BlobStorage 업로드 (성공적으로 처리된 경우)
-            if not response.startswith("❌"):
+            if not response.startswith(("❌", "♻️")):
                 try:
                     # 안전한 파일명 생성
                     timestamp = int(time.time())
@@ -142,6 +138,20 @@ def process_uploaded_file_from_chat(uploaded_file, service_manager, is_last_file
 def _process_audio_file(uploaded_file, temp_file_path, service_manager):
     """음성 파일 처리"""
     try:
+        # 회의 ID는 업로드 파일 바이트와 멱등 키로 정해 STT 전에 이미 저장된 파일인지 확인
+        idempotency_key = _upload_idempotency_key(uploaded_file)
+        meeting_id = service_manager.ingestion_meeting_id(
+            uploaded_file.getvalue(), idempotency_key
+        )
+        existing = service_manager.get_meeting(meeting_id)
+        if existing and existing.get("type") == "meeting":
+            return f"""♻️ **이미 분석된 음성 파일입니다**
+
+**파일명:** {uploaded_file.name}
+**회의 제목:** {existing.get('title', 'N/A')}
+
+📋 Meeting Records 페이지에서 저장된 결과를 확인하세요."""
+
         transcribed_text = service_manager.transcribe_audio(temp_file_path)
 
         if transcribed_text:
@@ -149,6 +159,7 @@ def _process_audio_file(uploaded_file, temp_file_path, service_manager):
             analysis_result = service_manager.summarize_and_extract(transcribed_text)
 
             # STT 텍스트를 별도 파일로 Blob Storage에 저장
+            stt_blob_name = None
             try:
                 # STT 텍스트 파일 이름 생성
                 stt_blob_name = (
@@ -167,38 +178,6 @@ def _process_audio_file(uploaded_file, temp_file_path, service_manager):
                 # STT 텍스트를 Blob Storage에 업로드
                 service_manager.upload_to_blob(stt_temp_path, stt_blob_name)
 
-                # STT 텍스트를 AI Search에도 인덱싱 (AI 분석 결과 포함)
-                try:
-                    # 안전한 문서 ID 생성
-                    timestamp = int(time.time())
-                    safe_doc_id = _create_safe_doc_id(
-                        f"{uploaded_file.name}_stt", timestamp
-                    )
-
-                    # AI 분석 결과를 포함한 메타데이터
-                    metadata = {
-                        "filename": f"{uploaded_file.name} (STT)",
-                        "upload_time": datetime.now().isoformat(),
-                        "file_type": "stt_audio",
-                        "original_file": uploaded_file.name,
-                        "meeting_title": analysis_result.get("meetingTitle", ""),
-                        "participants": ", ".join(
-                            analysis_result.get("participants", [])
-                        ),
-                        "summary": analysis_result.get("summary", ""),
-                    }
-                    service_manager.index_document(
-                        doc_id=safe_doc_id,
-                        content=transcribed_text,
-                        metadata=metadata,
-                        blob_path=stt_blob_name,
-                    )
-                    print(
-                        f"✅ STT 텍스트 AI Search 인덱싱 완료 (참석자 정보 포함): {safe_doc_id}"
-                    )
-                except Exception as index_error:
-                    print(f"⚠️ STT 텍스트 AI Search 인덱싱 실패: {str(index_error)}")
-
                 # 임시 파일 삭제
                 import os
 
@@ -207,6 +186,7 @@ def _process_audio_file(uploaded_file, temp_file_path, service_manager):
                 print(f"✅ STT 텍스트 Blob Storage 저장 완료: {stt_blob_name}")
 
             except Exception as stt_blob_error:
+                stt_blob_name = None
                 print(f"⚠️ STT 텍스트 Blob Storage 저장 실패: {str(stt_blob_error)}")
 
             # 액션 아이템에 담당자 추천 추가
@@ -241,8 +221,32 @@ def _process_audio_file(uploaded_file, temp_file_path, service_manager):
                 meeting_title=analysis_result.get("meetingTitle", uploaded_file.name),
                 raw_text=transcribed_text,
                 summary_json=analysis_result,
+                idempotency_key=idempotency_key,
+                meeting_id=meeting_id,
             )
 
+            # 저장된 회의 ID와 함께 STT 텍스트를 AI Search에 인덱싱 (AI 분석 결과 포함)
+            if meeting_id:
+                try:
+                    doc_id = _enqueue_meeting_document(
+                        service_manager,
+                        meeting_id,
+                        transcribed_text,
+                        analysis_result,
+                        stt_blob_name,
+                        {
+                            "filename": f"{uploaded_file.name} (STT)",
+                            "upload_time": datetime.now().isoformat(),
+                            "file_type": "stt_audio",
+                            "original_file": uploaded_file.name,
+                        },
+                    )
+                    print(
+                        f"✅ STT 텍스트 AI Search 인덱싱 대기열 등록 (참석자 정보 포함): {doc_id}"
+                    )
+                except Exception as index_error:
+                    print(f"⚠️ STT 텍스트 AI Search 인덱싱 실패: {str(index_error)}")
+
             # 응답 메시지 생성
             response = f"""✅ **음성 파일 분석 완료**
 
@@ -325,34 +329,6 @@ def _process_text_file(uploaded_file, temp_file_path, file_extension, service_ma
             # AI 분석
             analysis_result = service_manager.summarize_and_extract(file_content)
 
-            # AI Search에 인덱싱 (AI 분석 결과 포함)
-            try:
-                # 안전한 문서 ID 생성
-                timestamp = int(time.time())
-                safe_doc_id = _create_safe_doc_id(uploaded_file.name, timestamp)
-                blob_name = f"meeting_files/{uploaded_file.name}_{timestamp}"
-
-                # AI 분석 결과를 포함한 메타데이터
-                metadata = {
-                    "filename": uploaded_file.name,
-                    "upload_time": datetime.now().isoformat(),
-                    "file_type": file_extension,
-                    "meeting_title": analysis_result.get("meetingTitle", ""),
-                    "participants": ", ".join(analysis_result.get("participants", [])),
-                    "summary": analysis_result.get("summary", ""),
-                }
-                service_manager.index_document(
-                    doc_id=safe_doc_id,
-                    content=file_content,
-                    metadata=metadata,
-                    blob_path=blob_name,
-                )
-                print(
-                    f"✅ 문서 AI Search 인덱싱 완료 (참석자 정보 포함): {safe_doc_id}"
-                )
-            except Exception as index_error:
-                print(f"⚠️ 문서 AI Search 인덱싱 실패: {str(index_error)}")
-
             # 액션 아이템에 담당자 추천 추가
             if analysis_result.get("actionItems"):
                 for action_item in analysis_result["actionItems"]:
@@ -385,8 +361,30 @@ def _process_text_file(uploaded_file, temp_file_path, file_extension, service_ma
                 meeting_title=analysis_result.get("meetingTitle", uploaded_file.name),
                 raw_text=file_content,
                 summary_json=analysis_result,
+                idempotency_key=_upload_idempotency_key(uploaded_file),
             )
 
+            # 저장된 회의 ID와 함께 AI Search에 인덱싱 (AI 분석 결과 포함)
+            if meeting_id:
+                try:
+                    doc_id = _enqueue_meeting_document(
+                        service_manager,
+                        meeting_id,
+                        file_content,
+                        analysis_result,
+                        f"meeting_files/{uploaded_file.name}_{int(time.time())}",
+                        {
+                            "filename": uploaded_file.name,
+                            "upload_time": datetime.now().isoformat(),
+                            "file_type": file_extension,
+                        },
+                    )
+                    print(
+                        f"✅ 문서 AI Search 인덱싱 대기열 등록 (참석자 정보 포함): {doc_id}"
+                    )
+                except Exception as index_error:
+                    print(f"⚠️ 문서 AI Search 인덱싱 실패: {str(index_error)}")
+
             response = f"""✅ **문서 분석 완료**
 
 **파일명:** {uploaded_file.name}
@@ -35,3 +35,78 @@ COSMOS_HISTORY_CONTAINER = os.getenv("COSMOS_HISTORY_CONTAINER")
 COSMOS_AUDIT_CONTAINER = os.getenv("COSMOS_AUDIT_CONTAINER")
 COSMOS_STAFF_CONTAINER = os.getenv("COSMOS_STAFF_CONTAINER")
 COSMOS_CHAT_HISTORY_CONTAINER = os.getenv("COSMOS_CHAT_HISTORY_CONTAINER")
+
+# Change feed 기반 구체화 뷰
+COSMOS_VIEWS_CONTAINER = os.getenv("COSMOS_VIEWS_CONTAINER", "task-views")
+COSMOS_LEASES_CONTAINER = os.getenv("COSMOS_LEASES_CONTAINER", "leases")
+CHANGE_FEED_ENABLED = os.getenv("CHANGE_FEED_ENABLED", "false").lower() == "true"
+CHANGE_FEED_POLL_INTERVAL_SECONDS = float(
+    os.getenv("CHANGE_FEED_POLL_INTERVAL_SECONDS", "5")
+)
+
+# 인사정보 디렉터리 캐시 TTL (다른 프로세스에서의 변경 반영 주기)
+STAFF_CACHE_TTL_SECONDS = float(os.getenv("STAFF_CACHE_TTL_SECONDS", "300"))
+
+# 독립 작업 파티션 샤드 수 (기존 작업 조회가 누락되지 않도록 늘리기만 해야 함)
+STANDALONE_TASK_SHARD_COUNT = int(os.getenv("STANDALONE_TASK_SHARD_COUNT", "8"))
+
+# 회의 원문 로컬 LRU 캐시 한도 (압축 해제된 바이트 기준)
+TRANSCRIPT_CACHE_MAX_BYTES = int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# 채팅 메시지 세그먼트 문서당 메시지 수 (기존 채팅은 생성 시 값을 유지)
+CHAT_SEGMENT_SIZE = int(os.getenv("CHAT_SEGMENT_SIZE", "20"))
+
+# 시작 시 선언된 인덱싱 정책과 다른 기존 컨테이너의 정책을 교체할지 여부
+COSMOS_APPLY_INDEXING_POLICIES = (
+    os.getenv("COSMOS_APPLY_INDEXING_POLICIES", "true").lower() == "true"
+)
+
+# Cosmos DB 호출별 RU/쿼리 메트릭 기록 (logs/*_cosmos_metrics_*.jsonl)
+COSMOS_TELEMETRY_ENABLED = os.getenv("COSMOS_TELEMETRY_ENABLED", "true").lower() == "true"
+COSMOS_POPULATE_QUERY_METRICS = (
+    os.getenv("COSMOS_POPULATE_QUERY_METRICS", "true").lower() == "true"
+)
+
+# 감사 로그/승인 이력 보존 기간(일, 0이면 만료 없음) - 보관 작업이 Blob 보관 후 컨테이너 TTL로 적용
+COSMOS_AUDIT_TTL_DAYS = int(os.getenv("COSMOS_AUDIT_TTL_DAYS", "180"))
+COSMOS_HISTORY_TTL_DAYS = int(os.getenv("COSMOS_HISTORY_TTL_DAYS", "365"))
+# 이 기간(일)이 지난 이벤트를 요약 문서로 압축하고 Blob에 JSONL.gz로 보관 (TTL보다 짧아야 함)
+RETENTION_COMPACT_AFTER_DAYS = int(os.getenv("RETENTION_COMPACT_AFTER_DAYS", "30"))
+RETENTION_ARCHIVE_PREFIX = os.getenv("RETENTION_ARCHIVE_PREFIX", "retention")
+
+# AI Search 인프라 확인 캐시 (성공 결과 재확인 주기, 실패 결과 재시도 간격)
+SEARCH_BOOTSTRAP_REVALIDATE_SECONDS = float(
+    os.getenv("SEARCH_BOOTSTRAP_REVALIDATE_SECONDS", "3600")
+)
+SEARCH_BOOTSTRAP_RETRY_SECONDS = float(os.getenv("SEARCH_BOOTSTRAP_RETRY_SECONDS", "30"))
+
+# AI Search 배치 인덱서 (배치 문서 수/바이트, 최대 대기 시간, 대기열 크기, 재시도 횟수)
+SEARCH_INDEX_BATCH_SIZE = int(os.getenv("SEARCH_INDEX_BATCH_SIZE", "1000"))
+SEARCH_INDEX_BATCH_MAX_BYTES = int(
+    os.getenv("SEARCH_INDEX_BATCH_MAX_BYTES", str(8 * 1024 * 1024))
+)
+SEARCH_INDEX_FLUSH_SECONDS = float(os.getenv("SEARCH_INDEX_FLUSH_SECONDS", "2"))
+SEARCH_INDEX_QUEUE_SIZE = int(os.getenv("SEARCH_INDEX_QUEUE_SIZE", "5000"))
+SEARCH_INDEX_MAX_RETRIES = int(os.getenv("SEARCH_INDEX_MAX_RETRIES", "5"))
+
+# 회의 원문 청크 분할 (청크 최대 글자 수, 이전 청크와 겹치는 글자 수, RAG에 넣을 청크 수)
+SEARCH_CHUNK_MAX_CHARS = int(os.getenv("SEARCH_CHUNK_MAX_CHARS", "800"))
+SEARCH_CHUNK_OVERLAP_CHARS = int(os.getenv("SEARCH_CHUNK_OVERLAP_CHARS", "150"))
+SEARCH_RAG_TOP_CHUNKS = int(os.getenv("SEARCH_RAG_TOP_CHUNKS", "6"))
+
+# 오프라인 벡터 검색 (해싱 n-gram 임베딩 차원, 인덱스 저장 경로) - BM25 결과와 RRF로 결합
+VECTOR_SEARCH_ENABLED = os.getenv("VECTOR_SEARCH_ENABLED", "true").lower() == "true"
+VECTOR_DIM = int(os.getenv("VECTOR_DIM", "256"))
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR", "data/vector_index")
+
+
+def _default_storage_backend():
+    """개발 환경에서 azure_services.mock_services가 켜져 있으면 SQLite를 기본 저장소로 사용합니다."""
+    from config.environment import get_config
+
+    return "sqlite" if get_config().get("azure_services.mock_services", False) else "cosmos"
+
+
+# 저장소 백엔드 (cosmos | sqlite) - sqlite는 단일 노드/오프라인용 로컬 파일 DB
+STORAGE_BACKEND = (os.getenv("STORAGE_BACKEND") or _default_storage_backend()).lower()
+SQLITE_DB_PATH = os.getenv("SQLITE_DB_PATH", "data/meeting_ai.sqlite3")
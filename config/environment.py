@@ -89,7 +89,8 @@ class Config:
                 "use_local_auth": True,
                 "connection_timeout": 30,
                 "retry_attempts": 3,
-                "mock_services": False  # 개발 중 Azure 서비스 모킹 여부
+                # 개발 중 Azure 서비스 모킹 여부 (true면 저장소를 로컬 SQLite로 사용)
+                "mock_services": os.getenv("MOCK_AZURE_SERVICES", "false").lower() == "true"
             },
             
             "streamlit": {
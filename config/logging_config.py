@@ -167,6 +167,18 @@ def setup_logger(app_name: str = "mvp_meeting_ai"):
     json_handler.setFormatter(json_formatter)
     root_logger.addHandler(json_handler)
     
+    # 5. Cosmos DB 호출 메트릭 로그 (INFO 이상, 전용 파일에만 기록 - 콘솔 출력 없음)
+    cosmos_metrics_log_file = log_dir / f"{app_name}_cosmos_metrics_{today}.jsonl"
+    metrics_logger = logging.getLogger("cosmos_telemetry")
+    metrics_logger.setLevel(logging.INFO)
+    metrics_logger.propagate = False
+    for handler in metrics_logger.handlers[:]:
+        metrics_logger.removeHandler(handler)
+    metrics_handler = logging.FileHandler(cosmos_metrics_log_file, encoding='utf-8')
+    metrics_handler.setLevel(logging.INFO)
+    metrics_handler.setFormatter(json_formatter)
+    metrics_logger.addHandler(metrics_handler)
+    
     logger = logging.getLogger(app_name)
     logger.info(f"로깅 시스템 초기화 완료 - 로그 파일: {log_file}")
     
@@ -0,0 +1,643 @@
+"""
+Cosmos DB change feed 처리기 - 업무/대시보드용 구체화 뷰 유지
+
+meetings, action-items 컨테이너의 change feed를 읽어 views 컨테이너(파티션 키 /id)의
+뷰 문서를 갱신합니다. 읽기 경로는 원본 컨테이너를 다시 집계하지 않고
+뷰 문서 포인트 읽기로 끝납니다.
+
+뷰 문서
+- assignee_open_tasks::<담당자>: 담당자별 미완료 업무 요약
+- unassigned_tasks::<샤드>: 담당자가 없는 업무 요약 (액션 아이템 ID 해시로
+  UNASSIGNED_VIEW_SHARDS개 문서에 나눠 한 문서가 무한정 커지지 않게 함)
+- task_status_counters: 상태별 업무 수와 전체 회의 수 (개수만 저장)
+- task_state::<샤드>: 액션 아이템 ID → [상태, 담당자], 반영한 회의 ID
+  (이전 담당자 뷰에서 빼고 개수를 옮기는 데 쓰는 내부 문서, ID 해시로 샤딩)
+- view_status: 재구성 필요 여부와 처리기의 마지막 처리 시각
+
+회의 제목은 읽을 때 get_meeting_titles로 조회합니다.
+뷰는 문서 ID를 키로 하는 덮어쓰기 방식이라 같은 변경을 다시 처리해도
+결과가 같습니다(change feed의 at-least-once 전달에 안전). 진행 위치(continuation)는
+leases 컨테이너에 피드 범위(read_feed_ranges)별 임대 문서로 페이지마다 저장되어
+재시작 시 마지막으로 반영한 페이지 다음부터 이어서 처리합니다.
+
+change feed(최신 버전 모드)에는 삭제가 나타나지 않으므로 액션 아이템 삭제 경로가
+remove_deleted_action_items로 뷰에서 직접 뺍니다. 처리기가 꺼져 있을 때의 삭제는
+view_status에 재구성 필요로 표시하고, 처리기가 다음 실행에서 뷰와 임대를 지운 뒤
+처음부터 다시 만듭니다. 읽기 함수는 재구성 중이거나 처리기가 멈춘 뷰를 None으로 돌려
+호출 측이 원본 쿼리로 대신 조회하게 합니다.
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from azure.core import MatchConditions
+from azure.cosmos import exceptions
+
+import config.config as config
+from config.logging_config import log_error_with_context, log_performance
+from db.documents import UNASSIGNED_MARKERS
+
+logger = logging.getLogger("change_feed")
+
+LEASE_DURATION_SECONDS = 60
+CHANGE_FEED_PAGE_SIZE = 100
+VIEW_CONFLICT_MAX_RETRIES = 3
+# 마지막 처리 시각이 폴링 주기의 이 배수보다 오래되면 뷰를 오래된 것으로 봄
+VIEW_STALE_AFTER_POLLS = 12
+
+ASSIGNEE_VIEW_PREFIX = "assignee_open_tasks::"
+UNASSIGNED_VIEW_PREFIX = "unassigned_tasks::"
+UNASSIGNED_VIEW_SHARDS = 16
+TASK_STATE_PREFIX = "task_state::"
+TASK_STATE_SHARDS = 32
+TASK_STATUS_VIEW_ID = "task_status_counters"
+VIEW_STATUS_ID = "view_status"
+
+COMPLETED_STATUS = "완료"
+
+
+# 뷰 문서 구성
+def _shard_of(key, shards):
+    return zlib.crc32(str(key).encode("utf-8")) % shards
+
+
+def assignee_view_id(assignee):
+    """담당자별 미완료 업무 뷰 문서 ID (Cosmos ID에 쓸 수 없는 문자는 치환)"""
+    safe = "".join("_" if ch in '/\\?#' else ch for ch in str(assignee))
+    return f"{ASSIGNEE_VIEW_PREFIX}{safe}"
+
+
+def unassigned_view_id(item_id):
+    """액션 아이템이 속한 미할당 업무 샤드 문서 ID (ID 해시라 담당자/상태가 바뀌어도 고정)"""
+    return f"{UNASSIGNED_VIEW_PREFIX}{_shard_of(item_id, UNASSIGNED_VIEW_SHARDS)}"
+
+
+def task_state_id(key):
+    """액션 아이템/회의 상태를 보관하는 샤드 문서 ID"""
+    return f"{TASK_STATE_PREFIX}{_shard_of(key, TASK_STATE_SHARDS)}"
+
+
+def _assignee_key(item):
+    """액션 아이템의 담당자 키를 반환합니다 (미할당이면 None)."""
+    assignee = item.get("finalAssigneeId") or item.get("recommendedAssigneeId")
+    if assignee is None or str(assignee).strip().lower() in UNASSIGNED_MARKERS:
+        return None
+    return str(assignee)
+
+
+def _task_summary(item):
+    """뷰에 저장할 업무 요약을 만듭니다 (회의 제목은 읽을 때 회의 ID로 조회)."""
+    return {
+        "id": item["id"],
+        "meetingId": item.get("meetingId"),
+        "description": item.get("description", ""),
+        "status": item.get("status") or "미시작",
+        "dueDate": item.get("dueDate"),
+        "assignee": _assignee_key(item),
+        "finalAssigneeId": item.get("finalAssigneeId"),
+        "recommendedAssigneeId": item.get("recommendedAssigneeId"),
+        "approved": item.get("approved", False),
+    }
+
+
+def _new_view(view_id, view_type, **fields):
+    return {"id": view_id, "type": "task_view", "view": view_type, **fields}
+
+
+class _ViewWriter:
+    """한 번의 배치에서 건드린 뷰 문서를 모아 ETag 조건부로 저장합니다."""
+
+    def __init__(self, views_container):
+        self.container = views_container
+        self.docs = {}
+        self.etags = {}
+        self.dirty = set()
+
+    def get(self, view_id, view_type, write=True, **defaults):
+        if view_id not in self.docs:
+            try:
+                doc = self.container.read_item(item=view_id, partition_key=view_id)
+                self.etags[view_id] = doc.get("_etag")
+            except exceptions.CosmosResourceNotFoundError:
+                doc = _new_view(view_id, view_type, **defaults)
+                self.etags[view_id] = None
+            self.docs[view_id] = doc
+        if write:
+            self.dirty.add(view_id)
+        return self.docs[view_id]
+
+    def flush(self):
+        updated_at = datetime.utcnow().isoformat()
+        for view_id in sorted(self.dirty):
+            doc = self.docs[view_id]
+            doc["updated_at"] = updated_at
+            if self.etags[view_id] is None:
+                self.container.create_item(body=doc)
+            else:
+                self.container.replace_item(
+                    item=view_id,
+                    body=doc,
+                    etag=self.etags[view_id],
+                    match_condition=MatchConditions.IfNotModified,
+                )
+        return len(self.dirty)
+
+
+def _counters(writer):
+    return writer.get(TASK_STATUS_VIEW_ID, "task_status_counters", counts={}, total_meetings=0)
+
+
+def _adjust_count(counts, status, delta):
+    counts[status] = counts.get(status, 0) + delta
+    if counts[status] <= 0:
+        counts.pop(status)
+
+
+def _remove_from_task_views(writer, item_id, assignee):
+    """담당자 뷰(있으면)와 미할당 샤드에서 업무를 뺍니다 (바뀐 문서만 다시 씀)."""
+    view_ids = [unassigned_view_id(item_id)]
+    if assignee:
+        view_ids.append(assignee_view_id(assignee))
+    for view_id in view_ids:
+        view = writer.get(view_id, "task_list", write=False, tasks={})
+        if view["tasks"].pop(item_id, None) is not None:
+            writer.dirty.add(view_id)
+
+
+def _apply_meeting_changes(writer, meetings):
+    """새로 커밋된 회의를 전체 회의 수에 반영합니다."""
+    for meeting in meetings:
+        if meeting.get("type") != "meeting":
+            continue
+        state_id = task_state_id(meeting["id"])
+        state = writer.get(state_id, "task_state", write=False, items={}, meetings={})
+        if meeting["id"] in state["meetings"]:
+            continue
+        state["meetings"][meeting["id"]] = True
+        writer.dirty.add(state_id)
+        _counters(writer)["total_meetings"] += 1
+
+
+def _apply_action_item_changes(writer, items):
+    """액션 아이템 변경을 담당자별/미할당/상태별 뷰에 반영합니다."""
+    for item in items:
+        # 커밋 전 회의의 아이템은 pending이 풀린 뒤의 변경으로 반영
+        if item.get("pending"):
+            continue
+        item_id = item["id"]
+        status = item.get("status") or "미시작"
+        assignee = _assignee_key(item)
+
+        state_id = task_state_id(item_id)
+        state = writer.get(state_id, "task_state", write=False, items={}, meetings={})
+        previous = state["items"].get(item_id)
+        if previous != [status, assignee]:
+            counts = _counters(writer)["counts"]
+            if previous:
+                _adjust_count(counts, previous[0], -1)
+            _adjust_count(counts, status, 1)
+            state["items"][item_id] = [status, assignee]
+            writer.dirty.add(state_id)
+
+        # 담당자가 바뀌었으면 이전 담당자 뷰에서 제거
+        if previous and previous[1] and previous[1] != assignee:
+            _remove_from_task_views(writer, item_id, previous[1])
+
+        if assignee:
+            assignee_tasks = writer.get(
+                assignee_view_id(assignee),
+                "assignee_open_tasks",
+                assignee=assignee,
+                tasks={},
+            )["tasks"]
+            if status == COMPLETED_STATUS:
+                assignee_tasks.pop(item_id, None)
+            else:
+                assignee_tasks[item_id] = _task_summary(item)
+            unassigned = writer.get(
+                unassigned_view_id(item_id), "unassigned_tasks", write=False, tasks={}
+            )
+            if unassigned["tasks"].pop(item_id, None) is not None:
+                writer.dirty.add(unassigned["id"])
+        else:
+            writer.get(unassigned_view_id(item_id), "unassigned_tasks", tasks={})["tasks"][
+                item_id
+            ] = _task_summary(item)
+
+
+def _apply_action_item_deletes(writer, items):
+    """삭제된 액션 아이템을 모든 업무 뷰와 상태별 개수에서 뺍니다."""
+    for item in items:
+        item_id = item["id"]
+        state_id = task_state_id(item_id)
+        state = writer.get(state_id, "task_state", write=False, items={}, meetings={})
+        previous = state["items"].pop(item_id, None)
+        if previous:
+            writer.dirty.add(state_id)
+            _adjust_count(_counters(writer)["counts"], previous[0], -1)
+        _remove_from_task_views(writer, item_id, previous[1] if previous else _assignee_key(item))
+
+
+def apply_changes(views_container, handler, changes):
+    """변경 묶음을 뷰에 반영합니다 (다른 처리기와의 ETag 충돌 시 다시 읽어 재적용)."""
+    for attempt in range(VIEW_CONFLICT_MAX_RETRIES + 1):
+        writer = _ViewWriter(views_container)
+        handler(writer, changes)
+        try:
+            return writer.flush()
+        except (
+            exceptions.CosmosAccessConditionFailedError,
+            exceptions.CosmosResourceExistsError,
+        ):
+            if attempt == VIEW_CONFLICT_MAX_RETRIES:
+                raise
+            logger.warning(
+                f"뷰 문서 충돌로 재적용합니다 ({attempt + 1}/{VIEW_CONFLICT_MAX_RETRIES})"
+            )
+
+
+# 뷰 상태 (재구성 필요 표시, 처리기 마지막 처리 시각)
+def _patch_view_status(container, operations, defaults):
+    """view_status 문서에 필드만 patch합니다 (문서가 없으면 만듦)."""
+    try:
+        return container.patch_item(
+            item=VIEW_STATUS_ID, partition_key=VIEW_STATUS_ID, patch_operations=operations
+        )
+    except exceptions.CosmosResourceNotFoundError:
+        body = {"id": VIEW_STATUS_ID, "type": "task_view", "view": "view_status", **defaults}
+        try:
+            return container.create_item(body=body)
+        except exceptions.CosmosResourceExistsError:
+            return container.patch_item(
+                item=VIEW_STATUS_ID, partition_key=VIEW_STATUS_ID, patch_operations=operations
+            )
+
+
+def mark_views_stale(views_container=None):
+    """처리기가 반영하지 못한 변경(삭제)이 있어 뷰를 다시 만들어야 함을 표시합니다."""
+    from db.cosmos_db import get_container
+
+    container = views_container or get_container(config.COSMOS_VIEWS_CONTAINER)
+    marked_at = datetime.utcnow().isoformat()
+    _patch_view_status(
+        container,
+        [
+            {"op": "set", "path": "/needs_rebuild", "value": True},
+            {"op": "set", "path": "/marked_stale_at", "value": marked_at},
+        ],
+        {"needs_rebuild": True, "marked_stale_at": marked_at, "heartbeat_at": 0},
+    )
+    logger.info("업무 뷰를 재구성 필요로 표시했습니다")
+
+
+def remove_deleted_action_items(items, views_container=None):
+    """삭제한 액션 아이템을 뷰에서 뺍니다 (처리기가 꺼져 있거나 실패하면 재구성 필요로 표시)."""
+    from db.cosmos_db import get_container
+
+    container = views_container or get_container(config.COSMOS_VIEWS_CONTAINER)
+    if config.CHANGE_FEED_ENABLED:
+        try:
+            apply_changes(container, _apply_action_item_deletes, items)
+            return
+        except Exception as e:
+            logger.warning(f"삭제한 업무를 뷰에서 빼지 못했습니다: {e}")
+    mark_views_stale(container)
+
+
+def _lease_key(feed_range):
+    """피드 범위(불투명 dict)를 임대 문서 ID에 쓸 짧은 키로 바꿉니다."""
+    encoded = json.dumps(feed_range, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+class ChangeFeedProcessor:
+    """임대/체크포인트 기반 change feed 처리기"""
+
+    def __init__(
+        self,
+        monitored,
+        views_container,
+        leases_container,
+        owner=None,
+        lease_duration=LEASE_DURATION_SECONDS,
+        page_size=CHANGE_FEED_PAGE_SIZE,
+    ):
+        # monitored: [(이름, 컨테이너, 뷰 반영 함수)] - 나열 순서대로 처리
+        self.monitored = monitored
+        self.views_container = views_container
+        self.leases_container = leases_container
+        self.owner = owner or f"processor-{uuid.uuid4().hex[:8]}"
+        self.lease_duration = lease_duration
+        self.page_size = page_size
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    # 임대/체크포인트
+    def _acquire_lease(self, name, feed_range):
+        """피드 범위 임대를 획득하거나 갱신합니다 (다른 처리기가 보유 중이면 None)."""
+        lease_id = f"{name}::{_lease_key(feed_range)}"
+        now = time.time()
+        try:
+            lease = self.leases_container.read_item(item=lease_id, partition_key=lease_id)
+        except exceptions.CosmosResourceNotFoundError:
+            lease = None
+
+        if lease and lease.get("owner") not in (None, self.owner):
+            if lease.get("expires_at", 0) > now:
+                return None
+
+        body = {
+            "id": lease_id,
+            "type": "change_feed_lease",
+            "container": name,
+            "feed_range": feed_range,
+            "continuation": lease.get("continuation") if lease else None,
+            "owner": self.owner,
+            "expires_at": now + self.lease_duration,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        try:
+            if lease is None:
+                return self.leases_container.create_item(body=body)
+            return self.leases_container.replace_item(
+                item=lease_id,
+                body=body,
+                etag=lease["_etag"],
+                match_condition=MatchConditions.IfNotModified,
+            )
+        except (
+            exceptions.CosmosAccessConditionFailedError,
+            exceptions.CosmosResourceExistsError,
+        ):
+            # 동시에 다른 처리기가 임대를 가져감
+            return None
+
+    def _checkpoint(self, lease, continuation):
+        """처리한 위치를 임대 문서에 저장합니다 (임대를 잃었으면 예외)."""
+        body = {
+            **{k: v for k, v in lease.items() if not k.startswith("_")},
+            "continuation": continuation,
+            "expires_at": time.time() + self.lease_duration,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        return self.leases_container.replace_item(
+            item=lease["id"],
+            body=body,
+            etag=lease["_etag"],
+            match_condition=MatchConditions.IfNotModified,
+        )
+
+    # 처리
+    def _process_range(self, name, container, handler, feed_range):
+        lease = self._acquire_lease(name, feed_range)
+        if lease is None:
+            return 0
+
+        # continuation에는 피드 범위가 들어 있어 범위가 분할돼도 그대로 이어서 읽음
+        continuation = lease.get("continuation")
+        if continuation:
+            feed = container.query_items_change_feed(
+                continuation=continuation, max_item_count=self.page_size
+            )
+        else:
+            feed = container.query_items_change_feed(
+                feed_range=feed_range,
+                start_time="Beginning",
+                max_item_count=self.page_size,
+            )
+
+        # 페이지마다 뷰 반영 후 체크포인트 (중간에 실패해도 반영한 페이지는 다시 읽지 않음)
+        processed = 0
+        pages = feed.by_page()
+        for page in pages:
+            changes = list(page)
+            if changes:
+                apply_changes(self.views_container, handler, changes)
+                processed += len(changes)
+            if pages.continuation_token and pages.continuation_token != continuation:
+                continuation = pages.continuation_token
+                lease = self._checkpoint(lease, continuation)
+        return processed
+
+    def _rebuild_if_stale(self):
+        """재구성 필요로 표시돼 있으면 뷰 문서와 임대를 지워 처음부터 다시 읽게 합니다."""
+        try:
+            status = self.views_container.read_item(
+                item=VIEW_STATUS_ID, partition_key=VIEW_STATUS_ID
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            return False
+        if not status.get("needs_rebuild"):
+            return False
+
+        # 표시를 먼저 조건부로 지워 한 처리기만 재구성 (그 사이 새 표시가 오면 다음 실행에서 다시 재구성)
+        try:
+            self.views_container.replace_item(
+                item=VIEW_STATUS_ID,
+                body={
+                    **{k: v for k, v in status.items() if not k.startswith("_")},
+                    "needs_rebuild": False,
+                    "rebuilt_by": self.owner,
+                    "rebuilt_at": datetime.utcnow().isoformat(),
+                },
+                etag=status["_etag"],
+                match_condition=MatchConditions.IfNotModified,
+            )
+        except exceptions.CosmosAccessConditionFailedError:
+            return False
+
+        names = {name for name, _, _ in self.monitored}
+        for container, keep in (
+            (self.views_container, lambda doc: doc.get("type") == "task_view"),
+            (self.leases_container, lambda doc: doc.get("container") in names),
+        ):
+            for doc in container.read_all_items():
+                if doc["id"] != VIEW_STATUS_ID and keep(doc):
+                    try:
+                        container.delete_item(item=doc["id"], partition_key=doc["id"])
+                    except exceptions.CosmosResourceNotFoundError:
+                        pass
+        logger.info("업무 뷰를 처음부터 다시 만듭니다")
+        return True
+
+    def run_once(self):
+        """모든 감시 컨테이너의 밀린 변경을 한 번 처리하고 처리한 문서 수를 반환합니다."""
+        start_time = time.time()
+        processed = 0
+        self._rebuild_if_stale()
+        for name, container, handler in self.monitored:
+            for feed_range in container.read_feed_ranges():
+                try:
+                    processed += self._process_range(name, container, handler, feed_range)
+                except (
+                    exceptions.CosmosAccessConditionFailedError,
+                    exceptions.CosmosResourceNotFoundError,
+                ):
+                    # 다른 처리기가 임대를 가져갔거나 재구성으로 임대가 지워짐
+                    logger.warning(
+                        f"임대를 잃어 처리를 건너뜁니다: {name}::{_lease_key(feed_range)}"
+                    )
+
+        # 읽기 함수가 처리기 동작 여부를 판단하도록 마지막 처리 시각 기록
+        now = time.time()
+        _patch_view_status(
+            self.views_container,
+            [{"op": "set", "path": "/heartbeat_at", "value": now}],
+            {"needs_rebuild": False, "heartbeat_at": now},
+        )
+
+        if processed:
+            log_performance(
+                logger,
+                "change_feed_batch",
+                time.time() - start_time,
+                f"Changes: {processed}",
+            )
+        return processed
+
+    def _run_loop(self, interval):
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                log_error_with_context(logger, e, "Change feed processing failed")
+                logger.error(f"change feed 처리 실패: {e}")
+            self._stop_event.wait(interval)
+
+    def start(self, interval=None):
+        """백그라운드 스레드에서 주기적으로 change feed를 처리합니다."""
+        if self._thread and self._thread.is_alive():
+            return
+        interval = interval or config.CHANGE_FEED_POLL_INTERVAL_SECONDS
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(interval,), daemon=True, name="change-feed"
+        )
+        self._thread.start()
+        logger.info(f"change feed 처리기 시작: {self.owner} ({interval}초 주기)")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+def create_task_view_processor(
+    meetings_container=None,
+    action_items_container=None,
+    views_container=None,
+    leases_container=None,
+):
+    """회의/액션 아이템 컨테이너를 감시하는 처리기를 만듭니다 (미지정 시 Cosmos 컨테이너 사용)."""
+    from db.cosmos_db import get_container
+
+    return ChangeFeedProcessor(
+        monitored=[
+            (
+                config.COSMOS_MEETINGS_CONTAINER,
+                meetings_container
+                or get_container(config.COSMOS_MEETINGS_CONTAINER),
+                _apply_meeting_changes,
+            ),
+            (
+                config.COSMOS_ACTION_ITEMS_CONTAINER,
+                action_items_container
+                or get_container(config.COSMOS_ACTION_ITEMS_CONTAINER),
+                _apply_action_item_changes,
+            ),
+        ],
+        views_container=views_container or get_container(config.COSMOS_VIEWS_CONTAINER),
+        leases_container=leases_container
+        or get_container(config.COSMOS_LEASES_CONTAINER),
+    )
+
+
+_processor = None
+_processor_lock = threading.Lock()
+
+
+def start_change_feed_processor():
+    """프로세스당 하나의 뷰 처리기를 시작합니다 (CHANGE_FEED_ENABLED=true일 때만)."""
+    global _processor
+
+    if not config.CHANGE_FEED_ENABLED:
+        return None
+
+    with _processor_lock:
+        if _processor is None:
+            _processor = create_task_view_processor()
+            _processor.start()
+        return _processor
+
+
+# 뷰 읽기 (포인트 읽기, 여러 문서는 동시에)
+def _read_views(view_ids, views_container=None):
+    """view_status와 뷰 문서들을 동시에 포인트 읽기합니다.
+
+    뷰가 재구성 중이거나 처리기가 멈춰 오래됐으면 None, 아니면 [문서 또는 None]을 반환합니다.
+    """
+    from db.cosmos_db import get_container
+
+    container = views_container or get_container(config.COSMOS_VIEWS_CONTAINER)
+
+    def read(view_id):
+        try:
+            return container.read_item(item=view_id, partition_key=view_id)
+        except exceptions.CosmosResourceNotFoundError:
+            return None
+
+    ids = [VIEW_STATUS_ID, *view_ids]
+    with ThreadPoolExecutor(max_workers=len(ids)) as executor:
+        # 작업자 스레드에서도 요청/세션 RU 범위가 이어지도록 컨텍스트 복사
+        futures = [
+            executor.submit(contextvars.copy_context().run, read, view_id) for view_id in ids
+        ]
+        status, *views = [future.result() for future in futures]
+
+    stale_after = VIEW_STALE_AFTER_POLLS * config.CHANGE_FEED_POLL_INTERVAL_SECONDS
+    if (
+        status is None
+        or status.get("needs_rebuild")
+        or time.time() - status.get("heartbeat_at", 0) > stale_after
+    ):
+        return None
+    return views
+
+
+def get_unassigned_tasks(views_container=None):
+    """미할당 업무 목록 (뷰가 오래됐으면 None)"""
+    views = _read_views(
+        [f"{UNASSIGNED_VIEW_PREFIX}{shard}" for shard in range(UNASSIGNED_VIEW_SHARDS)],
+        views_container,
+    )
+    if views is None:
+        return None
+    return [task for view in views if view for task in view["tasks"].values()]
+
+
+def get_assignee_open_tasks(assignee, views_container=None):
+    """담당자별 미완료 업무 목록 (뷰가 오래됐으면 None)"""
+    views = _read_views([assignee_view_id(assignee)], views_container)
+    if views is None:
+        return None
+    return list(views[0]["tasks"].values()) if views[0] else []
+
+
+def get_task_status_counters(views_container=None):
+    """상태별 업무 수와 전체 회의 수 (뷰가 오래됐거나 아직 없으면 None)"""
+    views = _read_views([TASK_STATUS_VIEW_ID], views_container)
+    if not views or not views[0]:
+        return None
+    return {
+        "total_meetings": views[0].get("total_meetings", 0),
+        "action_items_by_status": views[0].get("counts", {}),
+        "updated_at": views[0].get("updated_at"),
+    }
@@ -1,10 +1,44 @@
 from azure.cosmos import CosmosClient, PartitionKey, exceptions
+from azure.core import MatchConditions
 import config.config as config
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 from datetime import datetime
+import itertools
 import json
 import uuid
 import logging
+import threading
 import time
+from db.indexing_policies import get_indexing_policies, policy_differences
+from db.cosmos_telemetry import instrument_container
+from db.documents import (
+    DASHBOARD_STATS_ID,
+    DASHBOARD_STATUSES,
+    DUMMY_STAFF_DATA,
+    LEGACY_STANDALONE_PARTITION_KEY,
+    MEETING_COMMITTED_TYPE,
+    MEETING_PENDING_TYPE,
+    STAFF_EXPORT_PAGE_SIZE,
+    STAFF_IMPORT_CHUNK_SIZE,
+    STANDALONE_TASK_PREFIX,
+    UNASSIGNED_MARKERS,
+    _as_list,
+    _default_chat_summary,
+    _meeting_list_fields,
+    build_action_item_documents,
+    build_dashboard_stats_document,
+    build_staff_document,
+    chat_id_for_session,
+    ingestion_meeting_id,
+    is_standalone_partition_key,  # noqa: F401 - db.storage를 통해 백엔드 공통으로 노출
+    normalize_staff_name,
+    normalize_task_filters,
+    parse_summary,
+    rank_assignee_for_task,
+    standalone_task_partition_key,
+    standalone_task_partition_keys,
+)
 from config.logging_config import (
     log_error_with_context,
     log_performance,
@@ -15,20 +49,97 @@ from config.logging_config import (
 # 로깅 설정
 logger = logging.getLogger("cosmos_db")
 
+# 프로세스 전역 클라이언트 풀
+# Streamlit 재실행과 FastAPI 워커 스레드가 하나의 CosmosClient(연결 풀)를 공유하고,
+# 데이터베이스/컨테이너 프록시는 이름별로 캐시합니다.
+_pool_lock = threading.RLock()
+_client = None
+_database_proxies = {}
+_container_proxies = {}
+_pool_stats = {
+    "client_creations": 0,
+    "client_reuses": 0,
+    "container_creations": 0,
+    "container_reuses": 0,
+}
+
 
 def get_client():
-    """Cosmos DB 클라이언트를 반환합니다."""
-    try:
-        client = CosmosClient(config.COSMOS_ENDPOINT, config.COSMOS_KEY)
-        log_azure_service_call(logger, "Azure Cosmos DB", "create_client", None, True)
-        return client
-    except Exception as e:
-        log_error_with_context(logger, e, "Failed to create Cosmos DB client")
-        log_azure_service_call(
-            logger, "Azure Cosmos DB", "create_client", None, False, None, str(e)
+    """프로세스 전역에서 공유되는 Cosmos DB 클라이언트를 반환합니다."""
+    global _client
+
+    with _pool_lock:
+        if _client is not None:
+            _pool_stats["client_reuses"] += 1
+            return _client
+
+        try:
+            _client = CosmosClient(config.COSMOS_ENDPOINT, config.COSMOS_KEY)
+            _pool_stats["client_creations"] += 1
+            log_azure_service_call(
+                logger, "Azure Cosmos DB", "create_client", None, True
+            )
+            return _client
+        except Exception as e:
+            log_error_with_context(logger, e, "Failed to create Cosmos DB client")
+            log_azure_service_call(
+                logger, "Azure Cosmos DB", "create_client", None, False, None, str(e)
+            )
+            logger.error(f"Cosmos DB 클라이언트 생성 실패: {e}")
+            raise
+
+
+def get_database(database_name=None):
+    """캐시된 데이터베이스 프록시를 반환합니다."""
+    database_name = database_name or config.COSMOS_DB_NAME
+
+    with _pool_lock:
+        db = _database_proxies.get(database_name)
+        if db is None:
+            db = get_client().get_database_client(database_name)
+            _database_proxies[database_name] = db
+        return db
+
+
+def get_container(container_name, database_name=None):
+    """캐시된 컨테이너 프록시를 반환합니다."""
+    database_name = database_name or config.COSMOS_DB_NAME
+    key = (database_name, container_name)
+
+    with _pool_lock:
+        container = _container_proxies.get(key)
+        if container is not None:
+            _pool_stats["container_reuses"] += 1
+            return container
+
+        container = instrument_container(
+            get_database(database_name).get_container_client(container_name),
+            container_name,
         )
-        logger.error(f"Cosmos DB 클라이언트 생성 실패: {e}")
-        raise
+        _container_proxies[key] = container
+        _pool_stats["container_creations"] += 1
+        return container
+
+
+def get_client_pool_stats():
+    """클라이언트 풀 사용 현황(생성/재사용 횟수)을 반환합니다."""
+    with _pool_lock:
+        stats = dict(_pool_stats)
+        stats["cached_databases"] = len(_database_proxies)
+        stats["cached_containers"] = len(_container_proxies)
+        return stats
+
+
+def reset_client_pool():
+    """클라이언트와 캐시된 프록시를 폐기합니다 (키 교체, 테스트용)."""
+    global _client
+
+    with _pool_lock:
+        _client = None
+        _database_proxies.clear()
+        _container_proxies.clear()
+        for key in _pool_stats:
+            _pool_stats[key] = 0
 
 
 def init_cosmos():
@@ -47,7 +158,7 @@ def init_cosmos():
             )
             logger.info(f"Cosmos DB '{config.COSMOS_DB_NAME}' 생성됨")
         except exceptions.CosmosResourceExistsError:
-            db = client.get_database_client(config.COSMOS_DB_NAME)
+            db = get_database()
             logger.info(
                 f"Cosmos DB '{config.COSMOS_DB_NAME}' 이미 존재함"
             )  # 필요한 컨테이너 생성 (없는 경우)
@@ -58,23 +169,31 @@ def init_cosmos():
             (config.COSMOS_AUDIT_CONTAINER, "/resourceId"),
             (config.COSMOS_STAFF_CONTAINER, "/id"),
             (config.COSMOS_CHAT_HISTORY_CONTAINER, "/session_id"),
+            (config.COSMOS_VIEWS_CONTAINER, "/id"),
+            (config.COSMOS_LEASES_CONTAINER, "/id"),
         ]
 
         created_containers = []
         existing_containers = []
+        indexing_policies = get_indexing_policies()
 
         for container_name, partition_key in containers:
+            indexing_policy = indexing_policies.get(container_name)
             try:
                 # 먼저 컨테이너 존재 여부 확인
-                container_client = db.get_container_client(container_name)
-                container_client.read()  # 컨테이너가 존재하는지 확인
+                container_client = get_container(container_name)
+                properties = container_client.read()  # 컨테이너가 존재하는지 확인
                 existing_containers.append(container_name)
+                ensure_indexing_policy(
+                    db, container_name, partition_key, properties, indexing_policy
+                )
             except exceptions.CosmosResourceNotFoundError:
-                # 컨테이너가 없으면 생성
+                # 컨테이너가 없으면 선언된 인덱싱 정책으로 생성
                 try:
                     db.create_container(
                         id=container_name,
                         partition_key=PartitionKey(path=partition_key),
+                        indexing_policy=indexing_policy,
                     )
                     created_containers.append(container_name)
                     logger.info(f"컨테이너 '{container_name}' 생성됨")
@@ -130,42 +249,368 @@ def init_cosmos():
         return False
 
 
-def save_meeting(meeting_title, raw_text, summary_json):
-    """회의 정보를 저장합니다."""
-    start_time = time.time()
+def ensure_indexing_policy(db, container_name, partition_key, properties, indexing_policy):
+    """기존 컨테이너의 인덱싱 정책을 선언된 정책과 비교하고, 다르면 교체합니다."""
+    if not indexing_policy:
+        return False
+
+    differences = policy_differences(properties.get("indexingPolicy"), indexing_policy)
+    if not differences:
+        return False
+
+    if not config.COSMOS_APPLY_INDEXING_POLICIES:
+        logger.warning(
+            f"컨테이너 '{container_name}' 인덱싱 정책이 선언과 다릅니다 ({', '.join(differences)}), "
+            "COSMOS_APPLY_INDEXING_POLICIES=false라 적용하지 않습니다"
+        )
+        return False
+
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_MEETINGS_CONTAINER)
+        # 인덱스 변환은 온라인으로 진행되며 쓰기를 막지 않음
+        db.replace_container(
+            container_name,
+            partition_key=PartitionKey(path=partition_key),
+            indexing_policy=indexing_policy,
+            # replace는 지정하지 않은 속성을 초기화하므로 기존 TTL 유지
+            default_ttl=properties.get("defaultTtl"),
+        )
+        log_business_event(
+            logger,
+            "indexing_policy_updated",
+            f"Container '{container_name}' indexing policy updated: {', '.join(differences)}",
+        )
+        logger.info(f"컨테이너 '{container_name}' 인덱싱 정책 갱신: {', '.join(differences)}")
+        return True
+    except Exception as e:
+        logger.warning(f"컨테이너 '{container_name}' 인덱싱 정책 갱신 실패: {e}")
+        return False
 
-        meeting_id = f"meeting_{uuid.uuid4().hex[:8]}"
-        created_at = datetime.utcnow().isoformat()
 
-        # summary_json이 문자열인 경우 파싱
-        if isinstance(summary_json, str):
-            try:
-                summary_dict = json.loads(summary_json)
-            except (json.JSONDecodeError, TypeError):
-                summary_dict = {"error": "Failed to parse summary", "raw": summary_json}
-        else:
-            summary_dict = summary_json
+def ensure_default_ttl(db, container_name, partition_key, properties, default_ttl):
+    """기존 컨테이너의 기본 TTL(초, None이면 만료 없음)이 다르면 교체합니다."""
+    if properties.get("defaultTtl") == default_ttl:
+        return False
 
-        meeting_item = {
-            "id": meeting_id,
-            "title": meeting_title,
-            "raw_text": raw_text,
-            "summary": summary_json,  # 원본 저장
-            "created_at": created_at,
-            "type": "meeting",
+    try:
+        db.replace_container(
+            container_name,
+            partition_key=PartitionKey(path=partition_key),
+            # replace는 지정하지 않은 속성을 초기화하므로 기존 인덱싱 정책 유지
+            indexing_policy=properties.get("indexingPolicy"),
+            default_ttl=default_ttl,
+        )
+        properties["defaultTtl"] = default_ttl
+        log_business_event(
+            logger,
+            "container_ttl_updated",
+            f"Container '{container_name}' default TTL set to {default_ttl}",
+        )
+        logger.info(f"컨테이너 '{container_name}' 기본 TTL 갱신: {default_ttl}")
+        return True
+    except Exception as e:
+        logger.warning(f"컨테이너 '{container_name}' 기본 TTL 갱신 실패: {e}")
+        return False
+
+
+# 대량 쓰기 (파티션별 트랜잭션 배치)
+BATCH_MAX_OPERATIONS = 100  # Cosmos 트랜잭션 배치 1회당 최대 작업 수
+
+
+def _to_batch_operation(operation_type, body):
+    """(작업 유형, 문서) 쌍을 SDK 트랜잭션 배치 작업 형식으로 변환합니다."""
+    operation_type = operation_type.lower()
+    if operation_type in ("create", "upsert"):
+        return (operation_type, (body,))
+    if operation_type == "replace":
+        return ("replace", (body["id"], body))
+    if operation_type == "delete":
+        return ("delete", (body["id"],))
+    if operation_type == "patch":
+        return ("patch", (body["id"], body["operations"]))
+    raise ValueError(f"지원하지 않는 배치 작업 유형입니다: {operation_type}")
+
+
+def bulk_write_items(container_name, operations, partition_key_field, max_concurrency=1):
+    """문서 쓰기 작업을 파티션 키별로 묶어 트랜잭션 배치로 실행합니다.
+
+    operations: [(작업 유형, 문서), ...] - 작업 유형은 create/upsert/replace/delete/patch
+    partition_key_field: 문서에서 파티션 키 값을 꺼낼 필드명 (예: "meetingId")
+    max_concurrency: 서로 다른 파티션의 배치를 동시에 실행할 스레드 수
+
+    같은 파티션의 작업은 BATCH_MAX_OPERATIONS개씩 한 번의 왕복으로 커밋되며,
+    배치 하나가 실패하면 해당 배치의 작업만 모두 실패로 기록됩니다.
+    반환값: {"results": [항목별 결과], "request_charge": 총 RU, "succeeded": n, "failed": n}
+    """
+    start_time = time.time()
+    container = get_container(container_name)
+
+    results = [None] * len(operations)
+    total_charge = 0.0
+    chunks = list(_batch_chunks(operations, partition_key_field))
+
+    if max_concurrency > 1 and len(chunks) > 1:
+        # 같은 파티션의 배치는 순서대로 커밋되도록 파티션 단위로 작업자에 나눔
+        by_partition = {}
+        for partition_key, chunk in chunks:
+            by_partition.setdefault(partition_key, []).append(chunk)
+
+        def run_partition(partition_key, partition_chunks):
+            return [
+                (partition_key, chunk, *_execute_batch(container, partition_key, chunk))
+                for chunk in partition_chunks
+            ]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(by_partition))
+        ) as executor:
+            # 작업자 스레드에서도 요청/세션 RU 범위가 이어지도록 컨텍스트 복사
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, run_partition, partition_key, group
+                )
+                for partition_key, group in by_partition.items()
+            ]
+            outcomes = [outcome for future in futures for outcome in future.result()]
+    else:
+        outcomes = [
+            (partition_key, chunk, *_execute_batch(container, partition_key, chunk))
+            for partition_key, chunk in chunks
+        ]
+
+    for partition_key, chunk, responses, error in outcomes:
+        total_charge += _record_batch_results(
+            results, partition_key, chunk, responses, error
+        )
+    batch_count = len(chunks)
+
+    return _bulk_write_summary(
+        container_name, results, total_charge, batch_count, start_time
+    )
+
+
+def _execute_batch(container, partition_key, chunk):
+    """배치 하나를 실행하고 (응답 목록, 오류)를 반환합니다."""
+    try:
+        responses = container.execute_item_batch(
+            batch_operations=[
+                _to_batch_operation(operation_type, body)
+                for _, operation_type, body in chunk
+            ],
+            partition_key=partition_key,
+        )
+        return responses, None
+    except exceptions.CosmosBatchOperationError as e:
+        return e.operation_responses or [], e
+    except Exception as e:
+        return [], e
+
+
+def _batch_chunks(operations, partition_key_field):
+    """작업을 파티션 키별로 묶고(입력 순서 유지) 배치 크기 단위로 나눕니다."""
+    groups = {}
+    for index, (operation_type, body) in enumerate(operations):
+        partition_key = body.get(partition_key_field)
+        groups.setdefault(partition_key, []).append((index, operation_type, body))
+
+    for partition_key, group in groups.items():
+        for chunk_start in range(0, len(group), BATCH_MAX_OPERATIONS):
+            yield partition_key, group[chunk_start : chunk_start + BATCH_MAX_OPERATIONS]
+
+
+def _record_batch_results(results, partition_key, chunk, responses, error):
+    """배치 응답을 항목별 결과로 기록하고 소비한 RU를 반환합니다."""
+    charge_total = 0.0
+    for position, (index, operation_type, body) in enumerate(chunk):
+        response = responses[position] if position < len(responses) else {}
+        status_code = int(response.get("statusCode", 0) or 0)
+        charge = float(response.get("requestCharge", 0) or 0)
+        charge_total += charge
+        succeeded = error is None and status_code < 400
+        results[index] = {
+            "id": body.get("id"),
+            "partition_key": partition_key,
+            "operation": operation_type,
+            "status_code": status_code or None,
+            "request_charge": charge,
+            "success": succeeded,
+            "error": None if succeeded else str(error),
         }
 
-        container.create_item(body=meeting_item)
+    if error is not None:
+        logger.error(
+            f"트랜잭션 배치 실패 (partition_key: {partition_key}, {len(chunk)}건): {error}"
+        )
+    return charge_total
+
+
+def _bulk_write_summary(container_name, results, total_charge, batch_count, start_time):
+    """대량 쓰기 결과를 로깅하고 요약을 반환합니다."""
+    succeeded_count = len([r for r in results if r and r["success"]])
+    failed_count = len(results) - succeeded_count
+    duration = time.time() - start_time
+
+    log_azure_service_call(
+        logger,
+        "Azure Cosmos DB",
+        "execute_item_batch",
+        duration,
+        failed_count == 0,
+        None,
+        f"Container: {container_name}, Batches: {batch_count}, "
+        f"Items: {len(results)}, Failed: {failed_count}, RU: {total_charge:.2f}",
+    )
 
-        # 액션 아이템 저장 (딕셔너리 버전 사용)
-        action_items_count = 0
-        if "actionItems" in summary_dict:
-            save_action_items(meeting_id, summary_dict["actionItems"])
-            action_items_count = len(summary_dict["actionItems"])
+    return {
+        "results": results,
+        "request_charge": total_charge,
+        "succeeded": succeeded_count,
+        "failed": failed_count,
+    }
+
+
+# 멱등 저장
+# 회의 ID는 원문(음성은 업로드 파일 바이트) 해시와 클라이언트 멱등 키로 정해지므로
+# 같은 업로드의 재시도/중복 요청은 같은 문서를 가리킵니다.
+# 회의 문서는 type "meeting_pending"으로 먼저 만들고, 액션 아이템(결정적 ID, upsert, pending = true)을 쓴 뒤
+# 조건부 patch로 "meeting"으로 바꾸고 아이템의 pending을 false로 바꿉니다. 목록/통계 쿼리는
+# type = 'meeting'인 회의와 pending이 아닌 아이템만 보므로 미완료 저장은 보이지 않고,
+# 중간에 실패한 저장은 같은 키로 다시 호출하면 저장된 요약 기준으로 이어서 완료됩니다.
+COMMIT_MEETING_PREDICATE = f"FROM c WHERE c.type = '{MEETING_PENDING_TYPE}'"
+ACTION_ITEM_VISIBLE_CONDITION = "(NOT IS_DEFINED(c.pending) OR c.pending = false)"
+PENDING_ACTION_ITEM_IDS_QUERY = (
+    "SELECT VALUE c.id FROM c WHERE c.meetingId = @meeting_id AND c.pending = true"
+)
+
+
+def build_meeting_document(meeting_title, raw_text, summary_json, meeting_id=None):
+    """저장할 회의 문서와 파싱된 요약 딕셔너리를 만듭니다 (원문은 Blob에 저장하고 참조만 포함)."""
+    from services.transcript_service import transcript_fields
+
+    summary_dict = parse_summary(summary_json)
+
+    meeting_item = {
+        "id": meeting_id or f"meeting_{uuid.uuid4().hex[:8]}",
+        "title": meeting_title,
+        **transcript_fields(raw_text),
+        "summary": summary_json,  # 원본 저장
+        "created_at": datetime.utcnow().isoformat(),
+        "type": "meeting",
+        **_meeting_list_fields(summary_dict),
+    }
+    return meeting_item, summary_dict
+
+
+def commit_meeting_operations():
+    """pending 회의를 커밋하는 patch 작업 목록을 만듭니다."""
+    return [
+        {"op": "set", "path": "/type", "value": MEETING_COMMITTED_TYPE},
+        {"op": "set", "path": "/committed_at", "value": datetime.utcnow().isoformat()},
+    ]
+
+
+def _commit_meeting(container, meeting_id):
+    """pending 회의를 커밋합니다. 커밋에 성공한 시도 하나만 통계에 반영합니다."""
+    try:
+        container.patch_item(
+            item=meeting_id,
+            partition_key=meeting_id,
+            patch_operations=commit_meeting_operations(),
+            filter_predicate=COMMIT_MEETING_PREDICATE,
+        )
+    except exceptions.CosmosAccessConditionFailedError:
+        # 동시에 진행된 다른 시도가 이미 커밋함
+        return False
+
+    update_dashboard_stats(
+        added_items=get_action_items(meeting_id, include_pending=True),
+        meetings_delta=1,
+    )
+    return True
+
+
+def release_action_items_operations(meeting_id, item_ids):
+    """커밋된 회의의 pending 아이템을 조회 대상으로 바꾸는 배치 patch 작업 목록을 만듭니다."""
+    return [
+        (
+            "patch",
+            {
+                "id": item_id,
+                "meetingId": meeting_id,
+                "operations": [{"op": "set", "path": "/pending", "value": False}],
+            },
+        )
+        for item_id in item_ids
+    ]
+
+
+def _release_action_items(meeting_id):
+    """커밋된 회의에 남은 pending 아이템을 같은 파티션 배치 patch로 조회 대상에 넣습니다."""
+    container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+    item_ids = list(
+        container.query_items(
+            query=PENDING_ACTION_ITEM_IDS_QUERY,
+            parameters=[{"name": "@meeting_id", "value": meeting_id}],
+            partition_key=meeting_id,
+        )
+    )
+    if not item_ids:
+        return 0
+
+    result = bulk_write_items(
+        config.COSMOS_ACTION_ITEMS_CONTAINER,
+        release_action_items_operations(meeting_id, item_ids),
+        "meetingId",
+    )
+    if result["failed"]:
+        raise Exception(f"{result['failed']}/{len(item_ids)}개 액션 아이템 커밋 실패")
+    return len(item_ids)
+
+
+def save_meeting(meeting_title, raw_text, summary_json, idempotency_key=None, meeting_id=None):
+    """회의 정보를 멱등하게 저장합니다 (같은 원문/키의 재시도는 같은 회의 ID를 반환).
+
+    meeting_id를 주면 그 ID를 사용합니다 (음성 업로드는 STT 전에 파일 바이트로 정한 ID).
+    """
+    start_time = time.time()
+    try:
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        meeting_item, summary_dict = build_meeting_document(
+            meeting_title,
+            raw_text,
+            summary_json,
+            meeting_id=meeting_id or ingestion_meeting_id(raw_text, idempotency_key),
+        )
+        meeting_id = meeting_item["id"]
+        meeting_item["type"] = MEETING_PENDING_TYPE
+
+        try:
+            container.create_item(body=meeting_item)
+        except exceptions.CosmosResourceExistsError:
+            existing = container.read_item(item=meeting_id, partition_key=meeting_id)
+            if existing.get("type") != MEETING_PENDING_TYPE:
+                # 이전 시도가 커밋 직후 실패했으면 남은 pending 아이템을 마저 공개
+                _release_action_items(meeting_id)
+                log_business_event(
+                    logger,
+                    "meeting_save_deduplicated",
+                    f"이미 저장된 회의 재요청: {meeting_id}",
+                    meeting_id=meeting_id,
+                )
+                return meeting_id
+            # 이전 시도가 중간에 실패했거나 동시에 진행 중: 먼저 저장된 요약 기준으로 이어서 처리
+            summary_dict = parse_summary(existing.get("summary"))
+
+        # 액션 아이템 저장 (결정적 ID로 upsert하므로 재시도해도 중복되지 않고, 커밋 전까지 pending)
+        action_items = summary_dict.get("actionItems") or []
+        if action_items:
+            save_action_items(meeting_id, action_items, pending=True)
+        action_items_count = len(action_items)
+
+        # 커밋에 실패한(다른 시도가 먼저 커밋한) 경우에도 이 시도가 쓴 아이템은 공개
+        _commit_meeting(container, meeting_id)
+        if action_items:
+            _release_action_items(meeting_id)
 
         duration = time.time() - start_time
         log_azure_service_call(
@@ -219,82 +664,88 @@ def save_meeting(meeting_title, raw_text, summary_json):
         raise
 
 
-def save_action_items(meeting_id, action_items):
-    """액션 아이템을 저장합니다."""
-    try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_ACTION_ITEMS_CONTAINER)
+def save_action_items(meeting_id, action_items, pending=False):
+    """액션 아이템을 저장합니다 (회의 단위 트랜잭션 배치).
 
-        for idx, item in enumerate(action_items):
-            item_id = f"item_{meeting_id}_{idx}"
+    아이템 ID는 회의 ID와 순번으로 정해지고 upsert로 쓰므로 재시도해도 중복되지 않습니다.
+    통계는 save_meeting이 회의를 커밋할 때 한 번만 반영합니다.
+    pending이면 회의 커밋 전까지 업무 조회/통계에서 제외되도록 pending = true로 씁니다.
+    """
+    try:
+        operations = [
+            ("upsert", {**action_item, "pending": True} if pending else action_item)
+            for action_item in build_action_item_documents(meeting_id, action_items)
+        ]
 
-            # 담당자 추천 (RAG 기반)
-            recommended_assignee = None
-            recommended_assignee_name = item.get(
-                "recommendedAssigneeId", item.get("assignee", "")
+        # 모든 아이템이 같은 meetingId 파티션이므로 배치 한 번(100건 단위)으로 커밋
+        result = bulk_write_items(
+            config.COSMOS_ACTION_ITEMS_CONTAINER, operations, "meetingId"
+        )
+        if result["failed"]:
+            raise Exception(
+                f"{result['failed']}/{len(operations)}개 액션 아이템 저장 실패"
             )
+        return result
 
-            # 액션 아이템 설명을 기반으로 RAG 담당자 추천
-            description = item.get("description", "")
-            if description:
-                try:
-                    # RAG 기반 추천 시도
-                    from services.service_manager import service_manager
+    except Exception as e:
+        logger.error(f"액션 아이템 저장 실패: {e}")
+        raise
 
-                    rag_result = service_manager.recommend_assignee_with_rag(
-                        task_description=description,
-                        meeting_context=f"회의 ID: {meeting_id}",
-                    )
 
-                    if rag_result and rag_result.get("recommended_user_id"):
-                        recommended_assignee = rag_result.get("recommended_user_id")
-                        recommended_assignee_name = rag_result.get(
-                            "recommended_name", recommended_assignee_name
-                        )
-                        logger.info(
-                            f"RAG 추천 성공: {recommended_assignee_name} (확신도: {rag_result.get('confidence_score', 0):.2f})"
-                        )
-                    else:
-                        # RAG 추천 실패 시 미할당으로 처리
-                        logger.info("RAG 추천 실패, 미할당으로 설정")
-                        recommended_assignee_name = "미할당"
-
-                except Exception as e:
-                    logger.warning(f"담당자 추천 실패 (RAG/기존): {e}")
-                    # 마지막 폴백: OpenAI가 추천한 이름 그대로 사용
-                    pass
-
-            action_item = {
-                "id": item_id,
-                "meetingId": meeting_id,
-                "description": description,
-                "recommendedAssigneeId": recommended_assignee_name,
-                "dueDate": item.get("dueDate", ""),
-                "finalAssigneeId": None,
-                "approved": False,
-                "status": "미시작",
-                "created_at": datetime.utcnow().isoformat(),
-            }
+# 커서 기반 페이지 조회
+def query_page(container, query, parameters=None, limit=20, continuation_token=None):
+    """쿼리 결과의 한 페이지와 다음 페이지 커서를 (items, continuation_token)로 반환합니다.
+
+    max_item_count는 페이지 크기일 뿐이므로 list()로 전체를 읽지 않고 by_page로
+    한 페이지만 가져옵니다. 마지막 페이지면 continuation_token은 None입니다.
+    """
+    pages = container.query_items(
+        query=query,
+        parameters=parameters or [],
+        enable_cross_partition_query=True,
+        max_item_count=limit,
+    ).by_page(continuation_token)
+
+    items = []
+    # 필터 조건에 맞는 문서가 없는 파티션에서는 빈 페이지가 올 수 있으므로 건너뜁니다
+    for page in pages:
+        items = list(page)
+        if items:
+            break
+    return items, pages.continuation_token
 
-            container.create_item(body=action_item)
 
+def get_meetings_page(limit=20, continuation_token=None, title_contains=None):
+    """회의 전체 문서를 최신순으로 한 페이지씩 조회합니다 (재인덱싱용, 목록 화면은 get_meeting_summaries_page)."""
+    try:
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        query = "SELECT * FROM c WHERE c.type = 'meeting'"
+        parameters = []
+        if title_contains:
+            query += " AND CONTAINS(c.title, @title, true)"
+            parameters.append({"name": "@title", "value": title_contains})
+        query += " ORDER BY c.type ASC, c.created_at DESC"
+
+        return query_page(container, query, parameters, limit, continuation_token)
     except Exception as e:
-        logger.error(f"액션 아이템 저장 실패: {e}")
-        raise
+        logger.error(f"회의 목록 페이지 조회 실패: {e}")
+        return [], None
 
 
 def get_meetings(top=100):
-    """모든 회의 목록을 조회합니다."""
+    """최근 회의 목록을 최대 top개 조회합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_MEETINGS_CONTAINER)
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
 
-        query = "SELECT * FROM c WHERE c.type = 'meeting' ORDER BY c.created_at DESC"
+        query = "SELECT TOP @top * FROM c WHERE c.type = 'meeting' ORDER BY c.type ASC, c.created_at DESC"
+        parameters = [{"name": "@top", "value": top}]
         items = list(
             container.query_items(
-                query=query, enable_cross_partition_query=True, max_item_count=top
+                query=query,
+                parameters=parameters,
+                enable_cross_partition_query=True,
+                max_item_count=top,
             )
         )
 
@@ -304,12 +755,132 @@ def get_meetings(top=100):
         return []
 
 
+# 목록 화면용 투영 조회
+# 목록에서는 raw_text(원문)와 summary(전체 요약 JSON)를 읽지 않고,
+# 전체 문서는 상세 화면에서 get_meeting으로만 조회합니다.
+MEETING_SUMMARY_PROJECTION = (
+    "c.id, c.title, c.created_at, c.participants, c.summary_preview"
+)
+
+
+def get_action_item_counts(meeting_ids):
+    """회의별 액션 아이템 개수(전체/완료)를 한 번의 쿼리로 조회합니다."""
+    counts = {
+        meeting_id: {"total": 0, "completed": 0} for meeting_id in meeting_ids
+    }
+    if not counts:
+        return counts
+
+    try:
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+        query = (
+            "SELECT c.meetingId, c.status FROM c "
+            f"WHERE ARRAY_CONTAINS(@meeting_ids, c.meetingId) AND {ACTION_ITEM_VISIBLE_CONDITION}"
+        )
+        parameters = [{"name": "@meeting_ids", "value": list(counts)}]
+        for row in container.query_items(
+            query=query, parameters=parameters, enable_cross_partition_query=True
+        ):
+            meeting_counts = counts.get(row.get("meetingId"))
+            if meeting_counts is None:
+                continue
+            meeting_counts["total"] += 1
+            if row.get("status") == "완료":
+                meeting_counts["completed"] += 1
+    except Exception as e:
+        logger.error(f"회의별 액션 아이템 개수 조회 실패: {e}")
+
+    return counts
+
+
+def get_meeting_titles(meeting_ids):
+    """회의 ID 목록의 제목을 한 번의 쿼리로 조회합니다 ({회의 ID: 제목}, 없는 회의는 제외)."""
+    meeting_ids = sorted({meeting_id for meeting_id in meeting_ids if meeting_id})
+    if not meeting_ids:
+        return {}
+
+    try:
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        query = "SELECT c.id, c.title FROM c WHERE ARRAY_CONTAINS(@meeting_ids, c.id)"
+        parameters = [{"name": "@meeting_ids", "value": meeting_ids}]
+        return {
+            row["id"]: row.get("title") or "Unknown"
+            for row in container.query_items(
+                query=query, parameters=parameters, enable_cross_partition_query=True
+            )
+        }
+    except Exception as e:
+        logger.error(f"회의 제목 조회 실패: {e}")
+        return {}
+
+
+def _with_action_item_counts(meetings):
+    """투영된 회의 목록에 액션 아이템 개수 필드를 채워 반환합니다."""
+    counts = get_action_item_counts([m["id"] for m in meetings if m.get("id")])
+    for meeting in meetings:
+        meeting_counts = counts.get(meeting.get("id"), {"total": 0, "completed": 0})
+        meeting["action_items_count"] = meeting_counts["total"]
+        meeting["completed_action_items_count"] = meeting_counts["completed"]
+    return meetings
+
+
+def get_meeting_summaries_page(limit=20, continuation_token=None, title_contains=None):
+    """회의 목록(id, 제목, 생성일, 참석자, 요약 미리보기, 액션 아이템 개수)을 한 페이지씩 조회합니다."""
+    try:
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        query = f"SELECT {MEETING_SUMMARY_PROJECTION} FROM c WHERE c.type = 'meeting'"
+        parameters = []
+        if title_contains:
+            query += " AND CONTAINS(c.title, @title, true)"
+            parameters.append({"name": "@title", "value": title_contains})
+        query += " ORDER BY c.type ASC, c.created_at DESC"
+
+        items, next_token = query_page(
+            container, query, parameters, limit, continuation_token
+        )
+        return _with_action_item_counts(items), next_token
+    except Exception as e:
+        logger.error(f"회의 요약 목록 페이지 조회 실패: {e}")
+        return [], None
+
+
+def get_meeting_summaries(top=100, with_counts=False):
+    """최근 회의 요약 목록을 최대 top개 조회합니다."""
+    try:
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        query = (
+            f"SELECT TOP @top {MEETING_SUMMARY_PROJECTION} FROM c "
+            "WHERE c.type = 'meeting' ORDER BY c.type ASC, c.created_at DESC"
+        )
+        parameters = [{"name": "@top", "value": top}]
+        items = list(
+            container.query_items(
+                query=query,
+                parameters=parameters,
+                enable_cross_partition_query=True,
+                max_item_count=top,
+            )
+        )
+
+        return _with_action_item_counts(items) if with_counts else items
+    except Exception as e:
+        logger.error(f"회의 요약 목록 조회 실패: {e}")
+        return []
+
+
+def get_recent_meetings(limit=5):
+    """최근 회의 요약 목록을 액션 아이템 개수와 함께 limit개만 조회합니다."""
+    return get_meeting_summaries(top=limit, with_counts=True)
+
+
 def get_meeting(meeting_id):
     """특정 회의 정보를 조회합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_MEETINGS_CONTAINER)
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
 
         return container.read_item(item=meeting_id, partition_key=meeting_id)
     except exceptions.CosmosResourceNotFoundError:
@@ -320,19 +891,21 @@ def get_meeting(meeting_id):
         raise
 
 
-def get_action_items(meeting_id):
-    """특정 회의의 액션 아이템을 조회합니다."""
+def get_action_items(meeting_id, include_pending=False):
+    """특정 회의의 액션 아이템을 조회합니다 (include_pending이면 커밋 전 pending 항목 포함)."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_ACTION_ITEMS_CONTAINER)
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
 
-        query = f"SELECT * FROM c WHERE c.meetingId = '{meeting_id}'"
-        items = list(
-            container.query_items(query=query, enable_cross_partition_query=True)
+        query = "SELECT * FROM c WHERE c.meetingId = @meeting_id"
+        if not include_pending:
+            query += f" AND {ACTION_ITEM_VISIBLE_CONDITION}"
+        return list(
+            container.query_items(
+                query=query,
+                parameters=[{"name": "@meeting_id", "value": meeting_id}],
+                partition_key=meeting_id,
+            )
         )
-
-        return items
     except Exception as e:
         logger.error(f"액션 아이템 조회 실패: {e}")
         return []
@@ -341,11 +914,9 @@ def get_action_items(meeting_id):
 def get_all_action_items():
     """모든 액션 아이템을 조회합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_ACTION_ITEMS_CONTAINER)
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
 
-        query = "SELECT * FROM c ORDER BY c.created_at DESC"
+        query = f"SELECT * FROM c WHERE {ACTION_ITEM_VISIBLE_CONDITION} ORDER BY c.created_at DESC"
         items = list(
             container.query_items(query=query, enable_cross_partition_query=True)
         )
@@ -356,36 +927,214 @@ def get_all_action_items():
         return []
 
 
-def update_action_item(item_id, meeting_id, updates):
-    """액션 아이템을 수정합니다."""
+def get_action_items_page(limit=50, continuation_token=None):
+    """모든 액션 아이템을 최신순으로 한 페이지씩 조회합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_ACTION_ITEMS_CONTAINER)
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
 
-        # 아이템 조회
-        query = (
-            f"SELECT * FROM c WHERE c.id = '{item_id}' AND c.meetingId = '{meeting_id}'"
+        query = f"SELECT * FROM c WHERE {ACTION_ITEM_VISIBLE_CONDITION} ORDER BY c.created_at DESC"
+        return query_page(container, query, None, limit, continuation_token)
+    except Exception as e:
+        logger.error(f"액션 아이템 페이지 조회 실패: {e}")
+        return [], None
+
+
+# 업무 조건 조회
+# 상태/담당자/마감일/승인 여부/회의/설명 조건을 매개변수화된 쿼리 하나로 만들어 서버에서 거릅니다.
+# 필터 키:
+#   status, exclude_status: 상태 값 또는 목록
+#   assignee: 담당자 (finalAssigneeId, 없으면 recommendedAssigneeId 기준)
+#   unassigned: True면 담당자가 없거나 미할당 표시인 업무만
+#   due_from, due_to: 마감일 범위 (YYYY-MM-DD, 양 끝 포함)
+#   approved: 승인 여부
+#   meeting_id: 회의 ID (파티션 키라 단일 파티션 쿼리가 됨)
+#   text: 설명에 포함된 문자열 (대소문자 무시, 목록이면 하나라도 포함)
+TASK_ASSIGNEE_EXPRESSION = (
+    "((IS_DEFINED(c.finalAssigneeId) AND NOT IS_NULL(c.finalAssigneeId) "
+    "AND c.finalAssigneeId != '') ? c.finalAssigneeId : c.recommendedAssigneeId)"
+)
+
+
+def build_action_item_query(filters=None, select="*"):
+    """업무 필터를 (쿼리, 파라미터)로 변환합니다. 값은 모두 @파라미터로 전달됩니다."""
+    filters = normalize_task_filters(filters)
+    # 커밋 전 회의의 액션 아이템은 항상 제외
+    conditions = [ACTION_ITEM_VISIBLE_CONDITION]
+    parameters = []
+
+    def param(name, value):
+        parameters.append({"name": f"@{name}", "value": value})
+        return f"@{name}"
+
+    def param_list(name, values):
+        # IN 목록은 인덱스를 타도록 값마다 파라미터 하나씩 전달
+        return ", ".join(
+            param(f"{name}{index}", value) for index, value in enumerate(_as_list(values))
         )
-        items = list(container.query_items(query=query, partition_key=meeting_id))
 
-        if not items:
-            raise ValueError(f"액션 아이템 ID {item_id}를 찾을 수 없습니다.")
+    if "status" in filters:
+        conditions.append(f"c.status IN ({param_list('status', filters['status'])})")
+    if "exclude_status" in filters:
+        conditions.append(
+            f"NOT (c.status IN ({param_list('exclude_status', filters['exclude_status'])}))"
+        )
+    if "assignee" in filters:
+        conditions.append(
+            f"{TASK_ASSIGNEE_EXPRESSION} = {param('assignee', filters['assignee'])}"
+        )
+    if filters.get("unassigned"):
+        markers = param("unassigned_markers", sorted(UNASSIGNED_MARKERS))
+        conditions.append(
+            f"(NOT IS_DEFINED({TASK_ASSIGNEE_EXPRESSION}) OR IS_NULL({TASK_ASSIGNEE_EXPRESSION}) "
+            f"OR ARRAY_CONTAINS({markers}, LOWER(TRIM({TASK_ASSIGNEE_EXPRESSION}))))"
+        )
+    if "due_from" in filters or "due_to" in filters:
+        conditions.append("IS_STRING(c.dueDate) AND c.dueDate != ''")
+        if "due_from" in filters:
+            conditions.append(f"c.dueDate >= {param('due_from', filters['due_from'])}")
+        if "due_to" in filters:
+            conditions.append(f"c.dueDate <= {param('due_to', filters['due_to'])}")
+    if "approved" in filters:
+        conditions.append(f"c.approved = {param('approved', filters['approved'])}")
+    if "meeting_id" in filters:
+        conditions.append(f"c.meetingId = {param('meeting_id', filters['meeting_id'])}")
+    if "text" in filters:
+        matches = [
+            f"CONTAINS(c.description, {param(f'text{index}', word)}, true)"
+            for index, word in enumerate(filters["text"])
+        ]
+        conditions.append(f"({' OR '.join(matches)})")
 
-        item = items[0]
+    query = f"SELECT {select} FROM c WHERE " + " AND ".join(conditions)
+    return query, parameters
 
-        # 항목 업데이트
-        for key, value in updates.items():
-            item[key] = value
 
-        # 항목 저장
-        return container.replace_item(item=item["id"], body=item)
+def query_action_items(filters=None, limit=50, continuation_token=None):
+    """조건에 맞는 업무를 최신순으로 한 페이지씩 조회합니다 (반환: (items, continuation_token))."""
+    query, parameters = build_action_item_query(filters)
+    try:
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+        return query_page(
+            container,
+            query + " ORDER BY c.created_at DESC",
+            parameters,
+            limit,
+            continuation_token,
+        )
+    except Exception as e:
+        logger.error(f"업무 조건 조회 실패: {e}")
+        return [], None
+
+
+def count_action_items(filters=None):
+    """조건에 맞는 업무 개수를 집계 쿼리 한 번으로 셉니다."""
+    query, parameters = build_action_item_query(filters, select="VALUE COUNT(1)")
+    try:
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+        counts = list(
+            container.query_items(
+                query=query, parameters=parameters, enable_cross_partition_query=True
+            )
+        )
+        return counts[0] if counts else 0
+    except Exception as e:
+        logger.error(f"업무 개수 조회 실패: {e}")
+        return 0
+
+
+# 부분 업데이트 (patch + ETag 낙관적 동시성)
+PATCH_MAX_OPERATIONS = 10  # Cosmos patch 요청 1회당 최대 작업 수
+ETAG_CONFLICT_MAX_RETRIES = 3
+ETAG_CONFLICT_BACKOFF_SECONDS = 0.05
+
+
+def _json_pointer_segment(value):
+    """JSON Pointer 경로 세그먼트를 이스케이프합니다 (~ → ~0, / → ~1)."""
+    return str(value).replace("~", "~0").replace("/", "~1")
+
+
+def _set_operations(updates):
+    """필드 업데이트 딕셔너리를 patch set 작업 목록으로 변환합니다."""
+    return [
+        {"op": "set", "path": f"/{_json_pointer_segment(key)}", "value": value}
+        for key, value in updates.items()
+    ]
+
+
+def patch_item_with_etag(container, item_id, partition_key, updates, current=None):
+    """ETag 기준 문서에 If-Match 조건부 patch로 필드만 갱신합니다.
+
+    current(호출 측이 이미 읽은 문서, _etag 포함)가 있으면 첫 시도는 읽지 않고 그 ETag로
+    patch 한 번만 보냅니다. 없거나 다른 요청이 먼저 문서를 바꿔 412(조건 불일치)가 나면
+    포인트 읽기로 다시 읽어 최대 ETAG_CONFLICT_MAX_RETRIES번 재시도합니다.
+    (변경 전 문서, 변경 후 문서)를 반환합니다.
+    """
+    operations = _set_operations(updates)
+
+    for attempt in range(ETAG_CONFLICT_MAX_RETRIES + 1):
+        # 전체 교체는 화면용 필드가 섞일 수 있는 current 대신 저장된 문서를 기준으로 함
+        if (
+            attempt == 0
+            and current
+            and current.get("_etag")
+            and len(operations) <= PATCH_MAX_OPERATIONS
+        ):
+            before = current
+        else:
+            before = container.read_item(item=item_id, partition_key=partition_key)
+        try:
+            if len(operations) <= PATCH_MAX_OPERATIONS:
+                after = container.patch_item(
+                    item=item_id,
+                    partition_key=partition_key,
+                    patch_operations=operations,
+                    etag=before["_etag"],
+                    match_condition=MatchConditions.IfNotModified,
+                )
+            else:
+                # patch 작업 수 제한을 넘으면 같은 ETag 조건으로 전체 교체
+                after = container.replace_item(
+                    item=item_id,
+                    body={**before, **updates},
+                    etag=before["_etag"],
+                    match_condition=MatchConditions.IfNotModified,
+                )
+            return before, after
+        except exceptions.CosmosAccessConditionFailedError:
+            if attempt == ETAG_CONFLICT_MAX_RETRIES:
+                raise
+            logger.warning(
+                f"ETag 충돌로 재시도합니다: {item_id} ({attempt + 1}/{ETAG_CONFLICT_MAX_RETRIES})"
+            )
+            time.sleep(ETAG_CONFLICT_BACKOFF_SECONDS * (2**attempt))
+
+
+def update_action_item(item_id, meeting_id, updates, current=None):
+    """액션 아이템을 수정합니다 (ETag 조건부 patch, current가 있으면 포인트 읽기 생략)."""
+    try:
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+        try:
+            before, result = patch_item_with_etag(
+                container,
+                item_id,
+                meeting_id,
+                {**updates, "updated_at": datetime.utcnow().isoformat()},
+                current=current,
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            raise ValueError(f"액션 아이템 ID {item_id}를 찾을 수 없습니다.")
+
+        update_dashboard_stats(removed_items=[before], added_items=[result])
+        return result
     except Exception as e:
         logger.error(f"액션 아이템 수정 실패: {e}")
         raise
 
 
-def approve_action_item(item_id, meeting_id, final_assignee_id, reviewer_name=None):
+def approve_action_item(item_id, meeting_id, final_assignee_id, reviewer_name=None, current=None):
     """액션 아이템을 승인하고 담당자를 할당합니다."""
     try:
         # 액션 아이템 업데이트
@@ -397,6 +1146,7 @@ def approve_action_item(item_id, meeting_id, final_assignee_id, reviewer_name=No
                 "approved": True,
                 "status": "진행중",
             },
+            current=current,
         )
 
         # 승인 이력 저장
@@ -414,17 +1164,184 @@ def approve_action_item(item_id, meeting_id, final_assignee_id, reviewer_name=No
         raise
 
 
-def update_action_item_status(item_id, meeting_id, status):
-    """액션 아이템의 상태를 업데이트합니다."""
-    return update_action_item(item_id, meeting_id, {"status": status})
+def update_action_item_status(item_id, meeting_id, status, current=None):
+    """액션 아이템의 상태를 업데이트합니다."""
+    return update_action_item(item_id, meeting_id, {"status": status}, current=current)
+
+
+def delete_action_item(item_id, meeting_id):
+    """액션 아이템을 삭제하고 대시보드 통계와 업무 뷰에서 뺍니다.
+
+    change feed에는 삭제가 나타나지 않으므로 뷰는 여기서 직접 갱신합니다.
+    """
+    from db.change_feed import remove_deleted_action_items
+
+    container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+    try:
+        item = container.read_item(item=item_id, partition_key=meeting_id)
+        container.delete_item(
+            item=item_id,
+            partition_key=meeting_id,
+            etag=item["_etag"],
+            match_condition=MatchConditions.IfNotModified,
+        )
+    except exceptions.CosmosResourceNotFoundError:
+        raise ValueError(f"액션 아이템 ID {item_id}를 찾을 수 없습니다.")
+
+    update_dashboard_stats(removed_items=[item])
+    remove_deleted_action_items([item])
+    logger.info(f"액션 아이템 삭제: {item_id}")
+    return item
+
+
+# 대시보드 통계
+# 통계 문서는 meetings 컨테이너(파티션 키 /id)에 type "dashboard_stats"로 저장되며,
+# 액션 아이템 쓰기마다 patch incr로 증분 갱신되어 조회는 포인트 읽기 1회로 끝납니다.
+MEETING_COUNT_QUERY = "SELECT VALUE COUNT(1) FROM c WHERE c.type = 'meeting'"
+DASHBOARD_STATS_ROWS_QUERY = (
+    "SELECT c.status, c.finalAssigneeId, c.recommendedAssigneeId FROM c "
+    f"WHERE {ACTION_ITEM_VISIBLE_CONDITION}"
+)
+
+
+def _action_item_stats_keys(item):
+    """통계 집계에 사용할 (상태, 담당자) 키를 반환합니다."""
+    status = item.get("status") or "미시작"
+    assignee = item.get("finalAssigneeId") or item.get("recommendedAssigneeId")
+    return status, (str(assignee) if assignee else None)
+
+
+def compute_dashboard_stats():
+    """집계 쿼리로 대시보드 통계를 한 번에 계산합니다 (통계 문서 재구성용)."""
+    start_time = time.time()
+    meetings_container = get_container(config.COSMOS_MEETINGS_CONTAINER)
+    items_container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+    total_meetings = list(
+        meetings_container.query_items(
+            query=MEETING_COUNT_QUERY, enable_cross_partition_query=True
+        )
+    )
+
+    # Python SDK는 파티션 간 GROUP BY를 지원하지 않으므로
+    # 집계에 필요한 세 필드만 투영해 한 번의 스캔으로 상태/담당자별 개수를 셉니다.
+    rows = items_container.query_items(
+        query=DASHBOARD_STATS_ROWS_QUERY, enable_cross_partition_query=True
+    )
+    stats = summarize_dashboard_rows(total_meetings[0] if total_meetings else 0, rows)
+
+    log_performance(
+        logger,
+        "compute_dashboard_stats",
+        time.time() - start_time,
+        f"Items: {sum(stats['action_items_by_status'].values())}",
+    )
+    return stats
+
+
+def summarize_dashboard_rows(total_meetings, rows):
+    """(상태, 담당자) 투영 행을 상태별/담당자별 개수로 집계합니다."""
+    action_items_by_status = {status: 0 for status in DASHBOARD_STATUSES}
+    action_items_by_assignee = {}
+    for row in rows:
+        status, assignee = _action_item_stats_keys(row)
+        action_items_by_status[status] = action_items_by_status.get(status, 0) + 1
+        if assignee:
+            action_items_by_assignee[assignee] = (
+                action_items_by_assignee.get(assignee, 0) + 1
+            )
+
+    return {
+        "total_meetings": total_meetings,
+        "action_items_by_status": action_items_by_status,
+        "action_items_by_assignee": action_items_by_assignee,
+    }
+
+
+def rebuild_dashboard_stats():
+    """통계를 다시 계산해 통계 문서를 덮어씁니다."""
+    stats_doc = build_dashboard_stats_document(compute_dashboard_stats())
+    get_container(config.COSMOS_MEETINGS_CONTAINER).upsert_item(body=stats_doc)
+    logger.info("대시보드 통계 문서 재구성 완료")
+    return stats_doc
+
+
+def get_dashboard_stats(refresh=False):
+    """대시보드 통계를 반환합니다 (통계 문서 포인트 읽기, 없으면 재구성)."""
+    if not refresh:
+        try:
+            return get_container(config.COSMOS_MEETINGS_CONTAINER).read_item(
+                item=DASHBOARD_STATS_ID, partition_key=DASHBOARD_STATS_ID
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            logger.info("대시보드 통계 문서 없음, 집계 쿼리로 생성합니다")
+    return rebuild_dashboard_stats()
+
+
+def update_dashboard_stats(removed_items=None, added_items=None, meetings_delta=0):
+    """액션 아이템 쓰기 결과를 통계 문서에 증분 반영합니다.
+
+    removed_items에는 변경 전 문서, added_items에는 변경 후 문서를 전달합니다.
+    통계 갱신 실패는 원래 쓰기를 실패시키지 않으며, 문서가 없으면 재구성합니다.
+    """
+    operations = dashboard_stats_patch_operations(
+        removed_items, added_items, meetings_delta
+    )
+    if not operations:
+        return
+
+    try:
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
+        for start in range(0, len(operations), PATCH_MAX_OPERATIONS):
+            container.patch_item(
+                item=DASHBOARD_STATS_ID,
+                partition_key=DASHBOARD_STATS_ID,
+                patch_operations=operations[start : start + PATCH_MAX_OPERATIONS],
+            )
+    except exceptions.CosmosResourceNotFoundError:
+        # 통계 문서가 없으면 현재 데이터(이번 변경 포함)로 재구성
+        try:
+            rebuild_dashboard_stats()
+        except Exception as e:
+            logger.warning(f"대시보드 통계 재구성 실패: {e}")
+    except Exception as e:
+        logger.warning(f"대시보드 통계 증분 갱신 실패: {e}")
+
+
+def dashboard_stats_patch_operations(removed_items=None, added_items=None, meetings_delta=0):
+    """변경 전/후 문서로부터 통계 문서에 적용할 patch 작업 목록을 만듭니다."""
+    deltas = {}
+
+    def add_delta(path, amount):
+        deltas[path] = deltas.get(path, 0) + amount
+
+    for items, sign in ((removed_items or [], -1), (added_items or [], 1)):
+        for item in items:
+            status, assignee = _action_item_stats_keys(item)
+            add_delta(f"/action_items_by_status/{_json_pointer_segment(status)}", sign)
+            if assignee:
+                add_delta(
+                    f"/action_items_by_assignee/{_json_pointer_segment(assignee)}", sign
+                )
+    if meetings_delta:
+        add_delta("/total_meetings", meetings_delta)
+
+    operations = [
+        {"op": "incr", "path": path, "value": amount}
+        for path, amount in deltas.items()
+        if amount
+    ]
+    if operations:
+        operations.append(
+            {"op": "set", "path": "/updated_at", "value": datetime.utcnow().isoformat()}
+        )
+    return operations
 
 
 def save_approval_history(meeting_id, action_item_id, reviewer, changes):
     """승인 이력을 저장합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_HISTORY_CONTAINER)
+        container = get_container(config.COSMOS_HISTORY_CONTAINER)
 
         timestamp = datetime.utcnow().isoformat()
         history_id = f"history_{action_item_id}_{timestamp.replace(':', '-')}"
@@ -450,9 +1367,7 @@ def save_audit_log(
 ):
     """감사 로그를 저장합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_AUDIT_CONTAINER)
+        container = get_container(config.COSMOS_AUDIT_CONTAINER)
 
         timestamp = datetime.utcnow().isoformat()
         log_id = f"audit_{resource_type}_{resource_id}_{timestamp.replace(':', '-')}"
@@ -520,9 +1435,7 @@ def apply_json_modification(
 def update_meeting(meeting_id, updates):
     """회의 정보를 업데이트합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_MEETINGS_CONTAINER)
+        container = get_container(config.COSMOS_MEETINGS_CONTAINER)
 
         # 회의 조회
         meeting = container.read_item(item=meeting_id, partition_key=meeting_id)
@@ -531,6 +1444,24 @@ def update_meeting(meeting_id, updates):
         for key, value in updates.items():
             meeting[key] = value
 
+        # 원문이 바뀌면 인라인 대신 Blob 참조로 저장
+        if "raw_text" in updates:
+            from services.transcript_service import transcript_fields
+
+            meeting.pop("raw_text", None)
+            meeting.pop("transcript", None)
+            meeting.update(transcript_fields(updates["raw_text"]))
+
+        # 요약이 바뀌면 목록용 필드도 갱신
+        if "summary" in updates:
+            summary = updates["summary"]
+            if isinstance(summary, str):
+                try:
+                    summary = json.loads(summary)
+                except (json.JSONDecodeError, TypeError):
+                    summary = {}
+            meeting.update(_meeting_list_fields(summary))
+
         # 수정 시간 업데이트
         meeting["updated_at"] = datetime.utcnow().isoformat()
 
@@ -547,163 +1478,30 @@ def update_meeting(meeting_id, updates):
         raise
 
 
-# 인사정보 관리 함수들
+# 인사정보 관리 함수들 (더미 데이터와 문서 형식은 db.documents)
 def init_staff_data():
     """더미 인사정보 초기화"""
     try:
-        staff_data = [
-            {
-                "id": "staff_1",
-                "user_id": 1,
-                "name": "김민수",
-                "department": "기획팀",
-                "position": "기획팀장",
-                "email": "kimminsu@company.com",
-                "skills": ["Project Management", "Strategy Planning", "Communication"],
-            },
-            {
-                "id": "staff_2",
-                "user_id": 2,
-                "name": "이영희",
-                "department": "마케팅팀",
-                "position": "마케터",
-                "email": "leeyh@company.com",
-                "skills": ["Digital Marketing", "Campaign Management", "Analytics"],
-            },
-            {
-                "id": "staff_3",
-                "user_id": 3,
-                "name": "박철수",
-                "department": "개발팀",
-                "position": "개발자",
-                "email": "parkcs@company.com",
-                "skills": ["JavaScript", "Python", "Backend", "Frontend"],
-            },
-            {
-                "id": "staff_4",
-                "user_id": 4,
-                "name": "최지은",
-                "department": "QA팀",
-                "position": "QA 엔지니어",
-                "email": "choije@company.com",
-                "skills": ["Quality Assurance", "Test Automation", "Bug Tracking"],
-            },
-            {
-                "id": "staff_5",
-                "user_id": 5,
-                "name": "정하늘",
-                "department": "데이터팀",
-                "position": "데이터 분석가",
-                "email": "junghn@company.com",
-                "skills": ["Data Analysis", "Statistics", "Visualization", "SQL"],
-            },
-            {
-                "id": "staff_6",
-                "user_id": 6,
-                "name": "장윤서",
-                "department": "디자인팀",
-                "position": "UI/UX 디자이너",
-                "email": "jangyun@company.com",
-                "skills": [
-                    "UI Design",
-                    "UX Research",
-                    "Figma",
-                    "User Interface",
-                    "Prototyping",
-                ],
-            },
-            {
-                "id": "staff_7",
-                "user_id": 7,
-                "name": "한성민",
-                "department": "인프라팀",
-                "position": "DevOps 엔지니어",
-                "email": "hansm@company.com",
-                "skills": ["DevOps", "Azure", "CI/CD", "Infrastructure", "Monitoring"],
-            },
-            {
-                "id": "staff_8",
-                "user_id": 8,
-                "name": "오현준",
-                "department": "개발팀",
-                "position": "프론트엔드 개발자",
-                "email": "ohhj@company.com",
-                "skills": ["React", "TypeScript", "JavaScript", "Frontend", "CSS"],
-            },
-            {
-                "id": "staff_9",
-                "user_id": 9,
-                "name": "신예린",
-                "department": "마케팅팀",
-                "position": "디지털 마케터",
-                "email": "shinyr@company.com",
-                "skills": [
-                    "Digital Marketing",
-                    "SEO",
-                    "Social Media",
-                    "Google Analytics",
-                    "Content Marketing",
-                ],
-            },
-            {
-                "id": "staff_10",
-                "user_id": 10,
-                "name": "강태우",
-                "department": "기획팀",
-                "position": "서비스 기획자",
-                "email": "kangtw@company.com",
-                "skills": [
-                    "Service Planning",
-                    "Product Management",
-                    "User Story",
-                    "Roadmap",
-                    "Requirements",
-                ],
-            },
-            {
-                "id": "staff_11",
-                "user_id": 11,
-                "name": "윤지혜",
-                "department": "데이터팀",
-                "position": "데이터 엔지니어",
-                "email": "yoonjh@company.com",
-                "skills": [
-                    "Data Engineering",
-                    "ETL",
-                    "Big Data",
-                    "Python",
-                    "Apache Spark",
-                ],
-            },
-            {
-                "id": "staff_12",
-                "user_id": 12,
-                "name": "임도현",
-                "department": "QA팀",
-                "position": "자동화 테스트 엔지니어",
-                "email": "imdh@company.com",
-                "skills": [
-                    "Test Automation",
-                    "Selenium",
-                    "API Testing",
-                    "Performance Testing",
-                    "CI/CD Testing",
-                ],
-            },
-        ]
+        staff_data = [dict(staff) for staff in DUMMY_STAFF_DATA]
         # 기존 데이터가 있는지 확인
         existing_staff = get_all_staff()
         if not existing_staff:
-            client = get_client()
-            db = client.get_database_client(config.COSMOS_DB_NAME)
-            container = db.get_container_client(config.COSMOS_STAFF_CONTAINER)
-
             for staff in staff_data:
                 staff["created_at"] = datetime.now().isoformat()
                 staff["updated_at"] = datetime.now().isoformat()
                 staff["type"] = "staff"
-                container.create_item(staff)
-            print("✅ 더미 인사정보 초기화 완료")
+
+            result = bulk_write_items(
+                config.COSMOS_STAFF_CONTAINER,
+                [("create", staff) for staff in staff_data],
+                "id",
+            )
+            reserve_staff_user_id(max(staff["user_id"] for staff in staff_data))
+            invalidate_staff_cache()
+            print(
+                f"✅ 더미 인사정보 초기화 완료: {result['succeeded']}명 "
+                f"(실패 {result['failed']}명, {result['request_charge']:.2f} RU)"
+            )
         else:
             print("📋 인사정보가 이미 존재합니다.")
 
@@ -711,18 +1509,97 @@ def init_staff_data():
         print(f"❌ 인사정보 초기화 오류: {str(e)}")
 
 
+# 인사정보 디렉터리 캐시
+# 전체 직원 목록을 한 번 읽어 id/user_id/정규화 이름 인덱스를 만들고 프로세스에서 공유합니다.
+# update_staff/add_staff/delete_staff가 버전을 올리면 다음 조회 때 다시 읽고,
+# 다른 프로세스에서의 변경은 TTL이 지나면 반영됩니다.
+_staff_cache_lock = threading.RLock()
+_staff_cache_version = 0
+_staff_directory = None
+_staff_cache_stats = {"hits": 0, "misses": 0, "loads": 0, "invalidations": 0}
+
+
+def _load_staff_directory(version):
+    """Cosmos DB에서 전체 직원을 읽어 인덱스를 만듭니다."""
+    container = get_container(config.COSMOS_STAFF_CONTAINER)
+
+    query = "SELECT * FROM c ORDER BY c.name"
+    staff_list = list(
+        container.query_items(query=query, enable_cross_partition_query=True)
+    )
+
+    by_name = {}
+    for staff in staff_list:
+        # 동명이인은 먼저 나온(이름순) 직원을 사용
+        by_name.setdefault(normalize_staff_name(staff.get("name")), staff)
+
+    return {
+        "version": version,
+        "loaded_at": time.time(),
+        "staff": staff_list,
+        "by_id": {staff["id"]: staff for staff in staff_list},
+        "by_user_id": {
+            str(staff["user_id"]): staff
+            for staff in staff_list
+            if staff.get("user_id") is not None
+        },
+        "by_name": by_name,
+    }
+
+
+def _get_staff_directory():
+    """유효한 캐시가 있으면 재사용하고, 없거나 만료되었으면 다시 읽습니다."""
+    global _staff_directory
+
+    with _staff_cache_lock:
+        directory = _staff_directory
+        if (
+            directory is not None
+            and directory["version"] == _staff_cache_version
+            and time.time() - directory["loaded_at"] < config.STAFF_CACHE_TTL_SECONDS
+        ):
+            _staff_cache_stats["hits"] += 1
+            return directory
+
+        _staff_cache_stats["misses"] += 1
+        directory = _load_staff_directory(_staff_cache_version)
+        _staff_cache_stats["loads"] += 1
+        _staff_directory = directory
+        return directory
+
+
+def invalidate_staff_cache():
+    """인사정보 캐시 버전을 올려 다음 조회 때 다시 읽게 합니다."""
+    global _staff_cache_version
+
+    with _staff_cache_lock:
+        _staff_cache_version += 1
+        _staff_cache_stats["invalidations"] += 1
+
+
+def get_staff_cache_stats():
+    """인사정보 캐시 적중/미스 현황을 반환합니다."""
+    with _staff_cache_lock:
+        stats = dict(_staff_cache_stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["version"] = _staff_cache_version
+        stats["cached_staff"] = (
+            len(_staff_directory["staff"]) if _staff_directory else 0
+        )
+        stats["age_seconds"] = (
+            round(time.time() - _staff_directory["loaded_at"], 1)
+            if _staff_directory
+            else None
+        )
+        return stats
+
+
 def get_all_staff():
     """모든 인사정보 조회"""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_STAFF_CONTAINER)
-
-        query = "SELECT * FROM c ORDER BY c.name"
-        items = list(
-            container.query_items(query=query, enable_cross_partition_query=True)
-        )
-        return items
+        # 호출 측에서 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return [dict(staff) for staff in _get_staff_directory()["staff"]]
     except Exception as e:
         print(f"❌ 인사정보 조회 오류: {str(e)}")
         return []
@@ -731,20 +1608,18 @@ def get_all_staff():
 def get_staff_by_id(staff_id):
     """ID로 특정 인사정보 조회"""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_STAFF_CONTAINER)
-
-        query = "SELECT * FROM c WHERE c.id = @staff_id"
-        parameters = [{"name": "@staff_id", "value": staff_id}]
+        staff = _get_staff_directory()["by_id"].get(staff_id)
+        return dict(staff) if staff else None
+    except Exception as e:
+        print(f"❌ 인사정보 조회 오류: {str(e)}")
+        return None
 
-        items = list(
-            container.query_items(
-                query=query, parameters=parameters, enable_cross_partition_query=True
-            )
-        )
 
-        return items[0] if items else None
+def get_staff_by_user_id(user_id):
+    """user_id로 특정 인사정보 조회"""
+    try:
+        staff = _get_staff_directory()["by_user_id"].get(str(user_id))
+        return dict(staff) if staff else None
     except Exception as e:
         print(f"❌ 인사정보 조회 오류: {str(e)}")
         return None
@@ -753,9 +1628,7 @@ def get_staff_by_id(staff_id):
 def update_staff(staff_id, updates):
     """인사정보 업데이트"""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_STAFF_CONTAINER)
+        container = get_container(config.COSMOS_STAFF_CONTAINER)
 
         staff = get_staff_by_id(staff_id)
         if not staff:
@@ -768,6 +1641,7 @@ def update_staff(staff_id, updates):
 
         # 저장
         container.upsert_item(staff)
+        invalidate_staff_cache()
         print(f"✅ 인사정보 {staff_id} 업데이트 완료")
         return True
 
@@ -776,30 +1650,97 @@ def update_staff(staff_id, updates):
         return False
 
 
+# user_id 발급 카운터 (views 컨테이너, 파티션 키 /id)
+# 문서 하나의 value를 patch incr로 원자적으로 올려 번호를 발급하므로 전체 직원을 읽지 않고,
+# 동시에 추가해도 번호가 겹치지 않습니다.
+STAFF_USER_ID_COUNTER_ID = "counter::staff_user_id"
+STAFF_ADD_MAX_RETRIES = 3
+STAFF_IMPORT_CONCURRENCY = 8
+
+
+def _max_staff_user_id():
+    """저장된 직원의 최대 user_id (카운터 최초 생성 시 한 번만 사용)"""
+    container = get_container(config.COSMOS_STAFF_CONTAINER)
+    values = list(
+        container.query_items(
+            query="SELECT VALUE MAX(c.user_id) FROM c WHERE IS_NUMBER(c.user_id)",
+            enable_cross_partition_query=True,
+        )
+    )
+    return int(values[0]) if values and values[0] is not None else 0
+
+
+def _create_user_id_counter(container):
+    """카운터 문서가 없으면 현재 최대 user_id로 만듭니다 (동시 생성 시 먼저 만든 쪽 유지)."""
+    try:
+        container.create_item(
+            body={
+                "id": STAFF_USER_ID_COUNTER_ID,
+                "type": "counter",
+                "value": _max_staff_user_id(),
+            }
+        )
+    except exceptions.CosmosResourceExistsError:
+        pass
+
+
+def allocate_staff_user_ids(count=1):
+    """카운터를 count만큼 올려 연속된 user_id를 발급하고 첫 번호를 반환합니다."""
+    container = get_container(config.COSMOS_VIEWS_CONTAINER)
+    for _ in range(2):
+        try:
+            counter = container.patch_item(
+                item=STAFF_USER_ID_COUNTER_ID,
+                partition_key=STAFF_USER_ID_COUNTER_ID,
+                patch_operations=[{"op": "incr", "path": "/value", "value": count}],
+            )
+            return counter["value"] - count + 1
+        except exceptions.CosmosResourceNotFoundError:
+            _create_user_id_counter(container)
+    raise RuntimeError("user_id 카운터를 초기화하지 못했습니다")
+
+
+def reserve_staff_user_id(minimum):
+    """직접 지정된 user_id가 이후 발급 번호와 겹치지 않도록 카운터를 minimum 이상으로 올립니다."""
+    container = get_container(config.COSMOS_VIEWS_CONTAINER)
+    for _ in range(2):
+        try:
+            # 카운터가 더 작을 때만 올리는 조건부 patch (이미 크면 412로 그대로 둠)
+            container.patch_item(
+                item=STAFF_USER_ID_COUNTER_ID,
+                partition_key=STAFF_USER_ID_COUNTER_ID,
+                patch_operations=[{"op": "set", "path": "/value", "value": int(minimum)}],
+                filter_predicate=f'FROM c WHERE c["value"] < {int(minimum)}',
+            )
+            return True
+        except exceptions.CosmosAccessConditionFailedError:
+            return False
+        except exceptions.CosmosResourceNotFoundError:
+            _create_user_id_counter(container)
+    raise RuntimeError("user_id 카운터를 초기화하지 못했습니다")
+
+
 def add_staff(staff_data):
     """새로운 인사정보 추가"""
     try:
-        # 새로운 ID 생성
-        existing_staff = get_all_staff()
-        max_user_id = max([s.get("user_id", 0) for s in existing_staff], default=0)
-
-        new_staff = {
-            "id": f"staff_{max_user_id + 1}",
-            "user_id": max_user_id + 1,
-            "name": staff_data.get("name", ""),
-            "department": staff_data.get("department", ""),
-            "position": staff_data.get("position", ""),
-            "email": staff_data.get("email", ""),
-            "skills": staff_data.get("skills", []),
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "type": "staff",
-        }
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_STAFF_CONTAINER)
-
-        container.create_item(new_staff)
+        container = get_container(config.COSMOS_STAFF_CONTAINER)
+
+        for _ in range(STAFF_ADD_MAX_RETRIES):
+            user_id = allocate_staff_user_ids()
+            new_staff = build_staff_document(
+                {key: value for key, value in staff_data.items() if key != "id"},
+                user_id,
+                datetime.now().isoformat(),
+            )
+            try:
+                container.create_item(new_staff)
+                break
+            except exceptions.CosmosResourceExistsError:
+                # 카운터 도입 전에 같은 번호로 만들어진 직원이 있으면 다음 번호로 재시도
+                logger.warning(f"인사정보 ID 충돌, 다음 번호로 재시도: {new_staff['id']}")
+        else:
+            raise RuntimeError("user_id 충돌이 반복됩니다")
+        invalidate_staff_cache()
         print(f"✅ 새로운 인사정보 추가 완료: {new_staff['name']}")
         return new_staff["id"]
 
@@ -808,6 +1749,83 @@ def add_staff(staff_data):
         return None
 
 
+def import_staff(records, chunk_size=STAFF_IMPORT_CHUNK_SIZE, max_concurrency=STAFF_IMPORT_CONCURRENCY, on_progress=None):
+    """직원 레코드를 청크 단위로 읽어 upsert합니다 (청크마다 on_progress(진행 현황) 호출).
+
+    records는 db.staff_io.normalize_staff_record 형식의 직원 정보 이터러블입니다.
+    user_id가 없는 레코드는 청크마다 카운터 patch 한 번으로 번호를 한꺼번에 발급받고,
+    id가 없으면 staff_<user_id>를 사용합니다. 같은 id의 직원은 덮어씁니다.
+    """
+    start_time = time.time()
+    progress = {"processed": 0, "succeeded": 0, "failed": 0, "request_charge": 0.0, "errors": []}
+    records = iter(records)
+
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            break
+
+        # 발급 전에 청크의 직접 지정 user_id 최댓값을 예약해 발급 번호와 겹치지 않게 함
+        explicit = [staff["user_id"] for staff in chunk if staff.get("user_id") is not None]
+        if explicit:
+            reserve_staff_user_id(max(explicit))
+        missing = [staff for staff in chunk if staff.get("user_id") is None]
+        next_user_id = allocate_staff_user_ids(len(missing)) if missing else None
+        now = datetime.now().isoformat()
+        documents = []
+        for staff in chunk:
+            user_id = staff.get("user_id")
+            if user_id is None:
+                user_id, next_user_id = next_user_id, next_user_id + 1
+            documents.append(build_staff_document(staff, user_id, now))
+
+        result = bulk_write_items(
+            config.COSMOS_STAFF_CONTAINER,
+            [("upsert", document) for document in documents],
+            "id",
+            max_concurrency=max_concurrency,
+        )
+        progress["processed"] += len(documents)
+        progress["succeeded"] += result["succeeded"]
+        progress["failed"] += result["failed"]
+        progress["request_charge"] += result["request_charge"]
+        progress["errors"].extend(
+            f"{r['id']}: {r['error']}" for r in result["results"] if not r["success"]
+        )
+        if on_progress:
+            on_progress(dict(progress))
+
+    invalidate_staff_cache()
+
+    duration = time.time() - start_time
+    log_performance(
+        logger,
+        "import_staff",
+        duration,
+        f"{progress['succeeded']} succeeded, {progress['failed']} failed, "
+        f"{progress['request_charge']:.2f} RU",
+    )
+    log_business_event(
+        logger,
+        "staff_imported",
+        f"{progress['succeeded']} staff imported ({progress['failed']} failed)",
+    )
+    return progress
+
+
+def iter_staff(page_size=STAFF_EXPORT_PAGE_SIZE):
+    """전체 직원을 이름순으로 페이지 단위로 읽어 하나씩 반환합니다 (내보내기용, 캐시 미사용)."""
+    container = get_container(config.COSMOS_STAFF_CONTAINER)
+    pages = container.query_items(
+        query="SELECT * FROM c ORDER BY c.name",
+        enable_cross_partition_query=True,
+        max_item_count=page_size,
+    ).by_page()
+    for page in pages:
+        for staff in page:
+            yield {key: value for key, value in staff.items() if not key.startswith("_")}
+
+
 def delete_staff(staff_id):
     """인사정보 삭제"""
     try:
@@ -816,11 +1834,10 @@ def delete_staff(staff_id):
             print(f"❌ 인사정보 ID {staff_id}를 찾을 수 없습니다.")
             return False
 
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_STAFF_CONTAINER)
+        container = get_container(config.COSMOS_STAFF_CONTAINER)
 
         container.delete_item(item=staff_id, partition_key=staff_id)
+        invalidate_staff_cache()
         print(f"✅ 인사정보 {staff_id} 삭제 완료")
         return True
 
@@ -832,177 +1849,431 @@ def delete_staff(staff_id):
 def recommend_assignee_for_task(task_description, task_skills=None):
     """작업 내용에 따른 담당자 추천"""
     try:
-        all_staff = get_all_staff()
-        if not all_staff:
-            return None
-
-        # 간단한 키워드 기반 매칭
-        task_lower = task_description.lower()
-
-        # 스킬 기반 점수 계산
-        scored_staff = []
-        for staff in all_staff:
-            score = 0
-            staff_skills = [skill.lower() for skill in staff.get("skills", [])]
-
-            # 작업 설명에서 스킬 키워드 매칭
-            for skill in staff_skills:
-                if skill in task_lower:
-                    score += 3
-
-            # 부서별 가중치
-            department = staff.get("department", "").lower()
-            if (
-                "development" in task_lower
-                or "code" in task_lower
-                or "programming" in task_lower
-                or "개발" in task_lower
-            ):
-                if "개발" in department:
-                    score += 2
-            elif (
-                "design" in task_lower
-                or "ui" in task_lower
-                or "ux" in task_lower
-                or "디자인" in task_lower
-            ):
-                if "디자인" in department:
-                    score += 2
-            elif (
-                "marketing" in task_lower
-                or "promotion" in task_lower
-                or "마케팅" in task_lower
-            ):
-                if "마케팅" in department:
-                    score += 2
-            elif "plan" in task_lower or "manage" in task_lower or "기획" in task_lower:
-                if "기획" in department:
-                    score += 2
-
-            scored_staff.append((staff, score))
-
-        # 점수순으로 정렬하여 최고 점수 반환
-        scored_staff.sort(key=lambda x: x[1], reverse=True)
-
-        if scored_staff and scored_staff[0][1] > 0:
-            return scored_staff[0][0]
-        else:
-            # 매칭되는 스킬이 없으면 첫 번째 직원 반환
-            return all_staff[0]
-
+        return rank_assignee_for_task(get_all_staff(), task_description)
     except Exception as e:
         print(f"❌ 담당자 추천 오류: {str(e)}")
         return None
 
 
 # 채팅 히스토리 관리 함수들
-def save_chat_history(session_id, messages, summary=None):
-    """채팅 히스토리를 저장합니다. 세션당 하나의 채팅 ID를 사용하여 중복 생성을 방지합니다."""
-    try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_CHAT_HISTORY_CONTAINER)
-
-        # 세션 기반 고정 채팅 ID 사용 (타임스탬프 제거)
-        chat_id = f"chat_{session_id}"
-
-        # 대화 요약 생성 (첫 번째 사용자 메시지 활용)
-        if not summary and messages:
-            user_messages = [msg for msg in messages if msg.get("role") == "user"]
-            if user_messages:
-                first_message = user_messages[0].get("content", "")
-                summary = (
-                    first_message[:50] + "..."
-                    if len(first_message) > 50
-                    else first_message
-                )
-            else:
-                summary = "새로운 채팅"
+# 채팅 히스토리 저장 (헤더 문서 + 고정 크기 메시지 세그먼트, 추가 전용)
+# 헤더(chat_<session_id>)에는 요약과 메시지 개수만 두고, 메시지는 CHAT_SEGMENT_SIZE개씩
+# chat_<session_id>_seg_<n> 문서에 순서대로 추가합니다. 모두 session_id 파티션에 있으므로
+# 한 턴 저장은 트랜잭션 배치 1회(마지막 세그먼트에 patch 추가 + 새 세그먼트 + 헤더 갱신)이고,
+# 대화 전체를 다시 쓰지 않습니다.
+CHAT_SEGMENT_DOC_TYPE = "chat_segment"
+
+# 사이드바용 채팅 인덱스
+# 채팅마다 (id, session_id, 요약, 시각, 메시지 수)만 담은 인덱스 레코드를 전용 파티션에 두어,
+# 목록은 교차 파티션 팬아웃 없이 단일 파티션 투영 쿼리 1회로 조회합니다.
+# 파티션 키 필드(session_id)는 인덱스 파티션 값이므로 실제 세션 ID는 chat_session_id에 저장합니다.
+CHAT_INDEX_DOC_TYPE = "chat_index"
+CHAT_INDEX_PARTITION_KEY = "__chat_index__"
+CHAT_INDEX_PROJECTION = (
+    "c.id, c.chat_session_id AS session_id, c.summary, c.timestamp, c.message_count"
+)
 
-        timestamp = datetime.now()
 
-        # 기존 채팅 조회 (업데이트용)
-        existing_chat = None
-        try:
-            existing_chat = container.read_item(item=chat_id, partition_key=chat_id)
-        except exceptions.CosmosResourceNotFoundError:
-            pass  # 새로운 채팅이므로 계속 진행
+def _chat_index_record(header):
+    """채팅 헤더에서 사이드바용 인덱스 레코드를 만듭니다."""
+    return {
+        "id": header["id"],
+        "type": CHAT_INDEX_DOC_TYPE,
+        "session_id": CHAT_INDEX_PARTITION_KEY,
+        "chat_session_id": header["session_id"],
+        "summary": header.get("summary", "새로운 채팅"),
+        "timestamp": header.get("timestamp") or header.get("created_at"),
+        "message_count": header.get("message_count", 0),
+    }
 
-        # 채팅 히스토리 데이터 구성
-        if existing_chat:
-            # 기존 채팅 업데이트
-            chat_history = existing_chat.copy()
-            chat_history.update(
-                {
-                    "messages": messages,
-                    "summary": summary or existing_chat.get("summary", "새로운 채팅"),
-                    "timestamp": timestamp.isoformat(),
-                    "updated_at": timestamp.isoformat(),
-                    "message_count": len(messages),
-                }
+
+def chat_segment_id(chat_id, segment_index):
+    """채팅 메시지 세그먼트 문서 ID를 반환합니다."""
+    return f"{chat_id}_seg_{segment_index:05d}"
+
+
+def _read_chat_header(container, session_id):
+    """채팅 헤더 문서를 포인트 읽기로 조회합니다 (없으면 None)."""
+    try:
+        return container.read_item(
+            item=chat_id_for_session(session_id), partition_key=session_id
+        )
+    except exceptions.CosmosResourceNotFoundError:
+        return None
+
+
+def _chat_segment_operations(chat_id, session_id, start_index, messages, segment_size):
+    """start_index부터 이어지는 메시지를 세그먼트에 추가하는 배치 작업 목록을 만듭니다."""
+    operations = []
+    position = start_index
+    remaining = list(messages)
+
+    while remaining:
+        segment_index, offset = divmod(position, segment_size)
+        chunk = remaining[: segment_size - offset]
+        remaining = remaining[len(chunk) :]
+        segment_id = chat_segment_id(chat_id, segment_index)
+
+        if offset == 0:
+            operations.append(
+                (
+                    "upsert",
+                    {
+                        "id": segment_id,
+                        "type": CHAT_SEGMENT_DOC_TYPE,
+                        "session_id": session_id,
+                        "chat_id": chat_id,
+                        "segment_index": segment_index,
+                        "start_index": position,
+                        "messages": chunk,
+                    },
+                )
             )
-            print(f"✅ 기존 채팅 히스토리 업데이트: {chat_id}")
         else:
-            # 새로운 채팅 생성
-            chat_history = {
-                "id": chat_id,
-                "type": "chat_history",
-                "session_id": session_id,
-                "messages": messages,
-                "summary": summary or "새로운 채팅",
-                "timestamp": timestamp.isoformat(),
-                "created_at": timestamp.isoformat(),
-                "message_count": len(messages),
+            # 채워지는 중인 세그먼트는 배열 끝에 추가만 (기존 메시지는 다시 쓰지 않음)
+            for op_start in range(0, len(chunk), PATCH_MAX_OPERATIONS):
+                operations.append(
+                    (
+                        "patch",
+                        {
+                            "id": segment_id,
+                            "session_id": session_id,
+                            "operations": [
+                                {"op": "add", "path": "/messages/-", "value": message}
+                                for message in chunk[op_start : op_start + PATCH_MAX_OPERATIONS]
+                            ],
+                        },
+                    )
+                )
+        position += len(chunk)
+
+    return operations
+
+
+class _ChatHeaderConflict(Exception):
+    """다른 요청이 먼저 채팅 헤더를 바꿔 배치가 통째로 실패함 (412/409)"""
+
+
+def _execute_chat_batch(container, session_id, operations, header, etag):
+    """세그먼트 작업과 헤더 쓰기를 한 트랜잭션 배치로 실행하고 새 헤더 ETag를 반환합니다.
+
+    헤더는 읽은 ETag 조건(없으면 create)으로 써서, 같은 message_count를 읽은 다른
+    추가 요청이 먼저 커밋했으면 세그먼트 작업까지 모두 실패합니다.
+    """
+    if etag is None:
+        header_operation = ("create", (header,))
+    else:
+        header_operation = ("replace", (header["id"], header), {"if_match_etag": etag})
+    batch_operations = [
+        _to_batch_operation(operation_type, body) for operation_type, body in operations
+    ] + [header_operation]
+
+    try:
+        responses = container.execute_item_batch(
+            batch_operations=batch_operations, partition_key=session_id
+        )
+    except exceptions.CosmosBatchOperationError as e:
+        failed = (e.operation_responses or [{}])[e.error_index]
+        if e.error_index == len(batch_operations) - 1 and int(
+            failed.get("statusCode", 0) or 0
+        ) in (409, 412):
+            raise _ChatHeaderConflict() from e
+        raise
+    return responses[-1].get("eTag")
+
+
+def _append_chat_messages(container, session_id, header, new_messages, summary=None):
+    """헤더 기준으로 새 메시지를 세그먼트에 추가하고 헤더를 갱신합니다.
+
+    세그먼트 작업과 헤더 갱신은 session_id 파티션의 한 트랜잭션 배치로 커밋되며,
+    헤더를 읽은 뒤 다른 요청이 먼저 추가했으면 _ChatHeaderConflict가 발생합니다.
+    메시지가 한 배치에 담기지 않을 만큼 많으면 배치마다 직전 헤더 ETag로 이어 씁니다.
+    """
+    chat_id = chat_id_for_session(session_id)
+    timestamp = datetime.now().isoformat()
+    etag = header.get("_etag") if header else None
+
+    if header is None:
+        header = {
+            "id": chat_id,
+            "type": "chat_history",
+            "session_id": session_id,
+            "summary": summary or _default_chat_summary(new_messages),
+            "created_at": timestamp,
+            "message_count": 0,
+        }
+        print(f"✅ 새 채팅 히스토리 생성: {chat_id}")
+
+    header = {k: v for k, v in header.items() if not k.startswith("_")}
+
+    # 이전 형식(메시지 인라인) 문서는 첫 추가 시 세그먼트 형식으로 전환
+    legacy_messages = header.pop("messages", None)
+    if legacy_messages is not None:
+        new_messages = list(legacy_messages) + list(new_messages)
+        header["message_count"] = 0
+
+    segment_size = header.setdefault("segment_size", config.CHAT_SEGMENT_SIZE)
+    # 한 배치 작업 수(헤더 포함)가 BATCH_MAX_OPERATIONS를 넘지 않도록 메시지를 나눔
+    slice_size = segment_size * (BATCH_MAX_OPERATIONS // 2)
+    new_messages = list(new_messages)
+    for slice_start in range(0, max(len(new_messages), 1), slice_size):
+        chunk = new_messages[slice_start : slice_start + slice_size]
+        operations = _chat_segment_operations(
+            chat_id, session_id, header.get("message_count", 0), chunk, segment_size
+        )
+        header.update(
+            {
+                "summary": summary or header.get("summary", "새로운 채팅"),
+                "timestamp": timestamp,
+                "updated_at": timestamp,
+                "message_count": header.get("message_count", 0) + len(chunk),
             }
-            print(f"✅ 새 채팅 히스토리 생성: {chat_id}")
+        )
+        etag = _execute_chat_batch(container, session_id, operations, header, etag)
+
+    # 인덱스 레코드는 다른 파티션이라 별도로 기록됨
+    try:
+        container.upsert_item(body=_chat_index_record(header))
+    except Exception as e:
+        # 메시지는 저장되었으므로 다음 저장 때 인덱스가 다시 갱신됨
+        logger.warning(f"채팅 인덱스 갱신 실패: {e}")
+
+    return chat_id
+
+
+def _write_chat_with_retry(container, session_id, write):
+    """헤더를 읽어 write(header)를 실행하고, 헤더 충돌 시 다시 읽어 재시도합니다."""
+    for attempt in range(ETAG_CONFLICT_MAX_RETRIES + 1):
+        header = _read_chat_header(container, session_id)
+        try:
+            return write(header)
+        except _ChatHeaderConflict:
+            if attempt == ETAG_CONFLICT_MAX_RETRIES:
+                raise Exception("다른 요청과 충돌해 채팅 메시지를 추가하지 못했습니다")
+            logger.warning(
+                f"채팅 헤더 충돌로 재시도합니다: {session_id} ({attempt + 1}/{ETAG_CONFLICT_MAX_RETRIES})"
+            )
+            time.sleep(ETAG_CONFLICT_BACKOFF_SECONDS * (2**attempt))
+
+
+def append_chat_messages(session_id, new_messages, summary=None):
+    """새 메시지만 채팅 세그먼트에 추가합니다 (기존 메시지는 다시 쓰지 않음)."""
+    try:
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
+
+        return _write_chat_with_retry(
+            container,
+            session_id,
+            lambda header: _append_chat_messages(
+                container, session_id, header, new_messages, summary
+            ),
+        )
+
+    except Exception as e:
+        print(f"❌ 채팅 메시지 추가 오류: {str(e)}")
+        return None
+
+
+def save_chat_history(session_id, messages, summary=None):
+    """전체 메시지 목록을 받아 아직 저장되지 않은 뒷부분만 추가합니다. 세션당 하나의 채팅 ID를 사용합니다."""
+
+    def write(header):
+        stored_count = 0
+        if header is not None and "messages" not in header:
+            stored_count = header.get("message_count", 0)
+        elif header is not None:
+            # 이전 형식(메시지 인라인) 문서는 전달받은 전체 목록으로 세그먼트를 새로 구성
+            header = {**header, "messages": []}
+
+        # 재시도 때는 다시 읽은 헤더의 개수 기준으로 남은 뒷부분만 추가
+        new_messages = messages[stored_count:]
+        if header is not None and not new_messages and (
+            not summary or summary == header.get("summary")
+        ):
+            return header["id"]
+
+        return _append_chat_messages(
+            container, session_id, header, new_messages, summary
+        )
 
-        # upsert로 안전하게 저장/업데이트
-        container.upsert_item(body=chat_history)
-        return chat_id
+    try:
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
+        return _write_chat_with_retry(container, session_id, write)
 
     except Exception as e:
         print(f"❌ 채팅 히스토리 저장 오류: {str(e)}")
         return None
 
 
-def get_chat_histories(session_id=None, limit=20):
-    """채팅 히스토리 목록을 조회합니다."""
+def get_chat_messages_page(session_id, before_segment=None):
+    """채팅 메시지를 세그먼트 단위로 최신부터 조회합니다.
+
+    before_segment가 없으면 가장 최근 세그먼트, 있으면 그 바로 이전 세그먼트를 읽습니다.
+    반환값: (메시지 목록, 세그먼트 번호) - 세그먼트 번호가 0보다 크면 이전 페이지가 더 있습니다.
+    """
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_CHAT_HISTORY_CONTAINER)
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
+        chat_id = chat_id_for_session(session_id)
+
+        if before_segment is None:
+            header = _read_chat_header(container, session_id)
+            if header is None:
+                return [], 0
+            if "messages" in header:
+                # 이전 형식: 헤더에 전체 메시지가 인라인으로 저장됨
+                return header["messages"], 0
+
+            message_count = header.get("message_count", 0)
+            if message_count == 0:
+                return [], 0
+            segment_index = (message_count - 1) // header.get(
+                "segment_size", config.CHAT_SEGMENT_SIZE
+            )
+        else:
+            segment_index = before_segment - 1
+            if segment_index < 0:
+                return [], 0
+
+        segment = container.read_item(
+            item=chat_segment_id(chat_id, segment_index), partition_key=session_id
+        )
+        return segment.get("messages", []), segment_index
+
+    except exceptions.CosmosResourceNotFoundError:
+        print(f"❌ 채팅 메시지 세그먼트를 찾을 수 없습니다: {session_id}")
+        return [], 0
+    except Exception as e:
+        print(f"❌ 채팅 메시지 조회 오류: {str(e)}")
+        return [], 0
+
+
+def _delete_chat_documents(container, chat_id, session_id):
+    """채팅 헤더와 메시지 세그먼트를 한 번의 배치로 삭제합니다."""
+    header = container.read_item(item=chat_id, partition_key=session_id)
+
+    segment_count = 0
+    if "messages" not in header and header.get("message_count", 0) > 0:
+        segment_size = header.get("segment_size", config.CHAT_SEGMENT_SIZE)
+        segment_count = (header["message_count"] - 1) // segment_size + 1
+
+    operations = [
+        ("delete", {"id": chat_segment_id(chat_id, index), "session_id": session_id})
+        for index in range(segment_count)
+    ]
+    operations.append(("delete", {"id": chat_id, "session_id": session_id}))
+    operations.append(
+        ("delete", {"id": chat_id, "session_id": CHAT_INDEX_PARTITION_KEY})
+    )
+
+    result = bulk_write_items(
+        config.COSMOS_CHAT_HISTORY_CONTAINER, operations, "session_id"
+    )
+    errors = [r["error"] for r in result["results"][:-1] if not r["success"]]
+    if errors:
+        raise Exception(f"채팅 히스토리 삭제 실패: {errors[0]}")
+    if not result["results"][-1]["success"]:
+        logger.warning(f"채팅 인덱스 삭제 실패 (인덱스 재구성 시 정리됨): {chat_id}")
+
+
+def get_chat_histories_page(session_id=None, limit=20, continuation_token=None):
+    """채팅 목록(id, session_id, 요약, 시각, 메시지 수)을 최신순으로 한 페이지씩 조회합니다."""
+    try:
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
 
         if session_id:
-            query = "SELECT * FROM c WHERE c.type = 'chat_history' AND c.session_id = @session_id ORDER BY c.timestamp DESC"
+            # 특정 세션: 해당 파티션의 헤더만 조회
+            query = (
+                "SELECT c.id, c.session_id, c.summary, c.timestamp, c.message_count "
+                "FROM c WHERE c.type = 'chat_history' AND c.session_id = @session_id "
+                "ORDER BY c.timestamp DESC"
+            )
             parameters = [{"name": "@session_id", "value": session_id}]
         else:
-            query = "SELECT * FROM c WHERE c.type = 'chat_history' ORDER BY c.timestamp DESC"
-            parameters = []
-
-        items = list(
-            container.query_items(
-                query=query,
-                parameters=parameters,
-                enable_cross_partition_query=True,
-                max_item_count=limit,
+            # 전체 목록: 인덱스 파티션 단일 쿼리
+            query = (
+                f"SELECT {CHAT_INDEX_PROJECTION} FROM c "
+                "WHERE c.session_id = @index_partition "
+                "ORDER BY c.session_id ASC, c.timestamp DESC"
             )
+            parameters = [
+                {"name": "@index_partition", "value": CHAT_INDEX_PARTITION_KEY}
+            ]
+
+        items, next_token = query_page(
+            container, query, parameters, limit, continuation_token
         )
 
         print(f"✅ 채팅 히스토리 조회 완료: {len(items)}개")
-        return items
+        return items, next_token
 
     except Exception as e:
         print(f"❌ 채팅 히스토리 조회 오류: {str(e)}")
-        return []
+        return [], None
+
+
+def get_chat_histories(session_id=None, limit=20):
+    """채팅 목록을 최대 limit개 조회합니다."""
+    items, _ = get_chat_histories_page(session_id, limit)
+    return items
+
+
+def rebuild_chat_index():
+    """모든 채팅 헤더로 사이드바 인덱스를 다시 만듭니다 (이전 데이터 이관용, 교차 파티션 1회)."""
+    start_time = time.time()
+    container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
+
+    headers = list(
+        container.query_items(
+            query=(
+                "SELECT c.id, c.session_id, c.summary, c.timestamp, c.created_at, "
+                "c.message_count FROM c WHERE c.type = 'chat_history'"
+            ),
+            enable_cross_partition_query=True,
+        )
+    )
+    result = bulk_write_items(
+        config.COSMOS_CHAT_HISTORY_CONTAINER,
+        [("upsert", _chat_index_record(header)) for header in headers],
+        "session_id",
+    )
+
+    # 헤더가 없어진 인덱스 레코드 정리
+    header_ids = {header["id"] for header in headers}
+    stale_ids = [
+        item["id"]
+        for item in container.query_items(
+            query="SELECT c.id FROM c WHERE c.session_id = @index_partition",
+            parameters=[{"name": "@index_partition", "value": CHAT_INDEX_PARTITION_KEY}],
+            partition_key=CHAT_INDEX_PARTITION_KEY,
+        )
+        if item["id"] not in header_ids
+    ]
+    if stale_ids:
+        bulk_write_items(
+            config.COSMOS_CHAT_HISTORY_CONTAINER,
+            [
+                ("delete", {"id": item_id, "session_id": CHAT_INDEX_PARTITION_KEY})
+                for item_id in stale_ids
+            ],
+            "session_id",
+        )
+
+    log_performance(
+        logger,
+        "rebuild_chat_index",
+        time.time() - start_time,
+        f"Chats: {len(headers)}, Failed: {result['failed']}, Stale: {len(stale_ids)}",
+    )
+    return {"indexed": result["succeeded"], "failed": result["failed"], "removed": len(stale_ids)}
 
 
 def extract_session_id_from_chat_id(chat_id):
-    """chat_id에서 session_id를 추출합니다.
+    """chat_id에서 session_id(파티션 키)를 추출합니다.
 
-    chat_id 형식: chat_SESSION_ID_TIMESTAMP
+    chat_id 형식: chat_SESSION_ID (이전 형식: chat_SESSION_ID_TIMESTAMP)
     예: chat_a5e0d458-3f40-457d-8a51-e62a796d5d79_20250723_180807
     """
-    if not chat_id.startswith("chat_"):
+    if not chat_id or not chat_id.startswith("chat_"):
         return None
 
     # "chat_" 제거
@@ -1020,16 +2291,13 @@ def extract_session_id_from_chat_id(chat_id):
 
 
 def get_chat_history_by_id(chat_id):
-    """특정 채팅 히스토리를 조회합니다."""
+    """특정 채팅 히스토리(헤더)를 조회합니다. ID에서 파티션 키를 계산해 포인트 읽기합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_CHAT_HISTORY_CONTAINER)
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
 
-        # chat_id에서 session_id 추출 (chat_SESSION_ID_TIMESTAMP 형식)
         session_id = extract_session_id_from_chat_id(chat_id)
         if not session_id:
-            # 예외 상황: 쿼리로 찾기
+            # 형식을 알 수 없는 ID만 쿼리로 찾기
             return get_chat_history_by_query(chat_id)
 
         chat_history = container.read_item(item=chat_id, partition_key=session_id)
@@ -1038,22 +2306,18 @@ def get_chat_history_by_id(chat_id):
 
     except exceptions.CosmosResourceNotFoundError:
         print(f"❌ 채팅 히스토리를 찾을 수 없습니다: {chat_id}")
-        # 쿼리로 다시 시도
-        return get_chat_history_by_query(chat_id)
+        return None
     except Exception as e:
         print(f"❌ 채팅 히스토리 조회 오류: {str(e)}")
-        # 쿼리로 다시 시도
-        return get_chat_history_by_query(chat_id)
+        return None
 
 
 def get_chat_history_by_query(chat_id):
-    """쿼리를 사용해 채팅 히스토리를 조회합니다 (파티션 키를 모를 때)."""
+    """쿼리를 사용해 채팅 히스토리를 조회합니다 (ID 형식으로 파티션 키를 알 수 없을 때)."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_CHAT_HISTORY_CONTAINER)
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
 
-        query = "SELECT * FROM c WHERE c.id = @chat_id"
+        query = "SELECT * FROM c WHERE c.id = @chat_id AND c.type = 'chat_history'"
         parameters = [{"name": "@chat_id", "value": chat_id}]
 
         items = list(
@@ -1078,24 +2342,16 @@ def get_chat_history_by_query(chat_id):
 
 
 def delete_chat_history(chat_id):
-    """채팅 히스토리를 삭제합니다."""
+    """채팅 히스토리(헤더, 세그먼트, 인덱스)를 삭제합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_CHAT_HISTORY_CONTAINER)
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
 
-        # chat_id에서 session_id 추출
         session_id = extract_session_id_from_chat_id(chat_id)
         if not session_id:
-            # 쿼리로 찾아서 삭제
-            chat_history = get_chat_history_by_query(chat_id)
-            if chat_history:
-                session_id = chat_history.get("session_id")
-            else:
-                print(f"❌ 삭제할 채팅 히스토리를 찾을 수 없습니다: {chat_id}")
-                return False
+            # 형식을 알 수 없는 ID만 쿼리로 찾아서 삭제
+            return delete_chat_history_by_query(chat_id)
 
-        container.delete_item(item=chat_id, partition_key=session_id)
+        _delete_chat_documents(container, chat_id, session_id)
         print(f"✅ 채팅 히스토리 삭제 완료: {chat_id}")
         return True
 
@@ -1113,14 +2369,13 @@ def delete_chat_history_by_query(chat_id):
         # 먼저 문서를 찾아서 session_id 확인
         chat_history = get_chat_history_by_query(chat_id)
         if not chat_history:
+            print(f"❌ 삭제할 채팅 히스토리를 찾을 수 없습니다: {chat_id}")
             return False
 
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_CHAT_HISTORY_CONTAINER)
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
 
         session_id = chat_history.get("session_id")
-        container.delete_item(item=chat_id, partition_key=session_id)
+        _delete_chat_documents(container, chat_id, session_id)
         print(f"✅ 채팅 히스토리 쿼리 삭제 완료: {chat_id}")
         return True
 
@@ -1130,63 +2385,88 @@ def delete_chat_history_by_query(chat_id):
 
 
 def update_chat_history_summary(chat_id, new_summary):
-    """채팅 히스토리 요약을 업데이트합니다."""
+    """채팅 히스토리 요약을 업데이트합니다 (헤더와 인덱스 레코드)."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_CHAT_HISTORY_CONTAINER)
+        container = get_container(config.COSMOS_CHAT_HISTORY_CONTAINER)
 
-        # chat_id에서 session_id 추출
         session_id = extract_session_id_from_chat_id(chat_id)
         if not session_id:
-            # 쿼리로 먼저 찾기
+            # 형식을 알 수 없는 ID만 쿼리로 먼저 찾기
             chat_history = get_chat_history_by_query(chat_id)
             if not chat_history:
                 return False
             session_id = chat_history.get("session_id")
 
-        chat_history = container.read_item(item=chat_id, partition_key=session_id)
-        chat_history["summary"] = new_summary
-        chat_history["updated_at"] = datetime.now().isoformat()
-
-        container.replace_item(item=chat_id, body=chat_history)
+        # 동시에 추가된 메시지 개수를 덮어쓰지 않도록 요약 필드만 patch
+        chat_history = container.patch_item(
+            item=chat_id,
+            partition_key=session_id,
+            patch_operations=_set_operations(
+                {"summary": new_summary, "updated_at": datetime.now().isoformat()}
+            ),
+        )
+        container.upsert_item(body=_chat_index_record(chat_history))
         print(f"✅ 채팅 히스토리 요약 업데이트 완료: {chat_id}")
         return True
 
     except exceptions.CosmosResourceNotFoundError:
         print(f"❌ 채팅 히스토리를 찾을 수 없습니다: {chat_id}")
-        # 쿼리로 다시 시도
-        chat_history = get_chat_history_by_query(chat_id)
-        if chat_history:
-            chat_history["summary"] = new_summary
-            chat_history["updated_at"] = datetime.now().isoformat()
-            session_id = chat_history.get("session_id")
-            container.replace_item(item=chat_id, body=chat_history)
-            print(f"✅ 채팅 히스토리 요약 업데이트 완료 (쿼리): {chat_id}")
-            return True
         return False
     except Exception as e:
         print(f"❌ 채팅 히스토리 요약 업데이트 오류: {str(e)}")
         return False
 
 
+# 독립 작업 파티션 샤딩 (파티션 키 계산은 db.documents)
+def get_standalone_action_items(months=3, until=None, include_legacy=True):
+    """최근 months개월의 독립 작업을 해당 샤드들만 단일 파티션 쿼리로 조회합니다."""
+    start_time = time.time()
+    try:
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+        partition_keys = standalone_task_partition_keys(months, until)
+        if include_legacy:
+            # 마이그레이션이 끝나기 전까지는 기존 단일 파티션도 함께 조회
+            partition_keys.append(LEGACY_STANDALONE_PARTITION_KEY)
+
+        items = []
+        for partition_key in partition_keys:
+            items.extend(
+                container.query_items(
+                    query="SELECT * FROM c WHERE c.meetingId = @meeting_id",
+                    parameters=[{"name": "@meeting_id", "value": partition_key}],
+                    partition_key=partition_key,
+                )
+            )
+        items.sort(key=lambda item: item.get("created_at", ""), reverse=True)
+
+        log_performance(
+            logger,
+            "get_standalone_action_items",
+            time.time() - start_time,
+            f"Partitions: {len(partition_keys)}, Items: {len(items)}",
+        )
+        return items
+    except Exception as e:
+        logger.error(f"독립 작업 조회 실패: {e}")
+        return []
+
+
 def add_new_action_item(
     task_description, assignee_name=None, due_date=None, meeting_id=None
 ):
     """새로운 액션 아이템을 추가합니다."""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client(config.COSMOS_ACTION_ITEMS_CONTAINER)
-
-        # 기본 회의 ID 설정 (독립 작업용)
-        if not meeting_id:
-            meeting_id = "standalone_task"
-
         # 고유한 아이템 ID 생성
         import uuid
 
-        item_id = f"item_{meeting_id}_{uuid.uuid4().hex[:8]}"
+        created_at = datetime.utcnow().isoformat()
+        if meeting_id:
+            item_id = f"item_{meeting_id}_{uuid.uuid4().hex[:8]}"
+        else:
+            # 독립 작업: ID에는 '#'을 쓸 수 없으므로 접두어만 두고 파티션 키는 샤드로 분산
+            item_id = f"item_{STANDALONE_TASK_PREFIX}_{uuid.uuid4().hex[:8]}"
+            meeting_id = standalone_task_partition_key(item_id, created_at)
 
         # 담당자 추천 (이름이 제공되지 않은 경우)
         if not assignee_name and task_description:
@@ -1203,7 +2483,7 @@ def add_new_action_item(
 
         # 마감일 기본값 설정
         if not due_date:
-            from datetime import datetime, timedelta
+            from datetime import timedelta
 
             due_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
 
@@ -1217,12 +2497,17 @@ def add_new_action_item(
             "finalAssigneeId": assignee_name,  # 바로 할당
             "approved": True,  # 직접 추가된 것은 바로 승인
             "status": "미시작",
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": created_at,
             "priority": "보통",
             "type": "standalone",  # 독립 작업 표시
         }
 
-        container.create_item(body=action_item)
+        result = bulk_write_items(
+            config.COSMOS_ACTION_ITEMS_CONTAINER, [("create", action_item)], "meetingId"
+        )
+        if result["failed"]:
+            raise Exception(result["results"][0]["error"])
+        update_dashboard_stats(added_items=[action_item])
 
         log_business_event(
             logger,
@@ -1242,11 +2527,8 @@ def add_new_action_item(
 def find_staff_by_name(name):
     """이름으로 직원 찾기"""
     try:
-        all_staff = get_all_staff()
-        for staff in all_staff:
-            if staff.get("name", "").lower() == name.lower():
-                return staff
-        return None
+        staff = _get_staff_directory()["by_name"].get(normalize_staff_name(name))
+        return dict(staff) if staff else None
     except Exception as e:
         print(f"❌ 직원 검색 오류: {str(e)}")
         return None
@@ -1257,25 +2539,26 @@ def update_action_item_assignee(
 ) -> bool:
     """액션 아이템의 담당자 업데이트"""
     try:
-        client = get_client()
-        db = client.get_database_client(config.COSMOS_DB_NAME)
-        container = db.get_container_client("action-items")
+        container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
 
-        # 기존 항목 조회
+        # 담당자 정보 업데이트 (ETag 조건부 patch)
         try:
-            existing_item = container.read_item(item=item_id, partition_key=meeting_id)
+            before, existing_item = patch_item_with_etag(
+                container,
+                item_id,
+                meeting_id,
+                {
+                    "recommendedAssigneeId": assignee_name,
+                    "finalAssigneeId": assignee_name,
+                    "approved": True,
+                    "updated_at": datetime.utcnow().isoformat(),
+                },
+            )
         except exceptions.CosmosResourceNotFoundError:
             print(f"❌ 액션 아이템을 찾을 수 없습니다: {item_id}")
             return False
 
-        # 담당자 정보 업데이트
-        existing_item["recommendedAssigneeId"] = assignee_name
-        existing_item["finalAssigneeId"] = assignee_name
-        existing_item["approved"] = True
-        existing_item["updated_at"] = datetime.utcnow().isoformat()
-
-        # 업데이트 실행
-        container.replace_item(item=item_id, body=existing_item)
+        update_dashboard_stats(removed_items=[before], added_items=[existing_item])
 
         log_business_event(
             logger,
@@ -0,0 +1,625 @@
+"""
+Cosmos DB 비동기 데이터 접근 계층 (FastAPI용)
+
+db/cosmos_db.py의 함수 중 API 엔드포인트가 쓰는 것들을 azure.cosmos.aio 기반
+코루틴으로 제공합니다. 이벤트 루프를 막지 않으므로 동시 요청이 직렬화되지 않습니다.
+문서 구성, 통계 patch 작업 계산 같은 순수 로직은 동기 모듈의 함수를 그대로 재사용합니다.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from azure.core import MatchConditions
+from azure.cosmos import exceptions
+from azure.cosmos.aio import CosmosClient
+
+import config.config as config
+from config.logging_config import (
+    log_error_with_context,
+    log_performance,
+    log_azure_service_call,
+    log_business_event,
+)
+from db.cosmos_telemetry import instrument_container
+from db.cosmos_db import (
+    ACTION_ITEM_VISIBLE_CONDITION,
+    COMMIT_MEETING_PREDICATE,
+    DASHBOARD_STATS_ID,
+    DASHBOARD_STATS_ROWS_QUERY,
+    ETAG_CONFLICT_BACKOFF_SECONDS,
+    ETAG_CONFLICT_MAX_RETRIES,
+    MEETING_COUNT_QUERY,
+    MEETING_PENDING_TYPE,
+    MEETING_SUMMARY_PROJECTION,
+    PATCH_MAX_OPERATIONS,
+    PENDING_ACTION_ITEM_IDS_QUERY,
+    _batch_chunks,
+    _bulk_write_summary,
+    _record_batch_results,
+    _set_operations,
+    _to_batch_operation,
+    build_action_item_documents,
+    build_dashboard_stats_document,
+    build_meeting_document,
+    commit_meeting_operations,
+    dashboard_stats_patch_operations,
+    ingestion_meeting_id,
+    parse_summary,
+    release_action_items_operations,
+    summarize_dashboard_rows,
+)
+
+# 로깅 설정
+logger = logging.getLogger("cosmos_db_async")
+
+# 이벤트 루프 전역 클라이언트 (aiohttp 연결 풀 공유)
+_client = None
+_client_lock = None
+_container_proxies = {}
+
+
+def _get_client_lock():
+    global _client_lock
+    if _client_lock is None:
+        _client_lock = asyncio.Lock()
+    return _client_lock
+
+
+async def get_client():
+    """공유 비동기 Cosmos DB 클라이언트를 반환합니다."""
+    global _client
+
+    if _client is not None:
+        return _client
+
+    async with _get_client_lock():
+        if _client is None:
+            try:
+                _client = CosmosClient(config.COSMOS_ENDPOINT, config.COSMOS_KEY)
+                log_azure_service_call(
+                    logger, "Azure Cosmos DB", "create_async_client", None, True
+                )
+            except Exception as e:
+                log_error_with_context(logger, e, "Failed to create async Cosmos DB client")
+                logger.error(f"비동기 Cosmos DB 클라이언트 생성 실패: {e}")
+                raise
+        return _client
+
+
+async def get_container(container_name):
+    """캐시된 비동기 컨테이너 프록시를 반환합니다."""
+    container = _container_proxies.get(container_name)
+    if container is None:
+        client = await get_client()
+        container = instrument_container(
+            client.get_database_client(config.COSMOS_DB_NAME).get_container_client(
+                container_name
+            ),
+            container_name,
+        )
+        _container_proxies[container_name] = container
+    return container
+
+
+async def close_client():
+    """애플리케이션 종료 시 클라이언트 연결을 닫습니다."""
+    global _client
+
+    if _client is not None:
+        await _client.close()
+        _client = None
+        _container_proxies.clear()
+
+
+async def _collect(query_iterable):
+    """비동기 쿼리 결과를 리스트로 모읍니다."""
+    return [item async for item in query_iterable]
+
+
+async def query_page(container, query, parameters=None, limit=20, continuation_token=None):
+    """쿼리 결과 한 페이지와 다음 페이지 커서를 (items, continuation_token)로 반환합니다."""
+    pages = container.query_items(
+        query=query, parameters=parameters or [], max_item_count=limit
+    ).by_page(continuation_token)
+
+    items = []
+    async for page in pages:
+        items = [item async for item in page]
+        if items:
+            break
+    return items, pages.continuation_token
+
+
+# 대량 쓰기
+async def bulk_write_items(container_name, operations, partition_key_field):
+    """db.cosmos_db.bulk_write_items의 비동기 버전 (파티션별 트랜잭션 배치)."""
+    start_time = time.time()
+    container = await get_container(container_name)
+
+    results = [None] * len(operations)
+    total_charge = 0.0
+    batch_count = 0
+
+    for partition_key, chunk in _batch_chunks(operations, partition_key_field):
+        batch_count += 1
+        try:
+            responses = await container.execute_item_batch(
+                batch_operations=[
+                    _to_batch_operation(operation_type, body)
+                    for _, operation_type, body in chunk
+                ],
+                partition_key=partition_key,
+            )
+            error = None
+        except exceptions.CosmosBatchOperationError as e:
+            responses = e.operation_responses or []
+            error = e
+        except Exception as e:
+            responses = []
+            error = e
+
+        total_charge += _record_batch_results(
+            results, partition_key, chunk, responses, error
+        )
+
+    return _bulk_write_summary(
+        container_name, results, total_charge, batch_count, start_time
+    )
+
+
+# 회의
+async def _commit_meeting(container, meeting_id):
+    """pending 회의를 커밋합니다. 커밋에 성공한 시도 하나만 통계에 반영합니다."""
+    try:
+        await container.patch_item(
+            item=meeting_id,
+            partition_key=meeting_id,
+            patch_operations=commit_meeting_operations(),
+            filter_predicate=COMMIT_MEETING_PREDICATE,
+        )
+    except exceptions.CosmosAccessConditionFailedError:
+        # 동시에 진행된 다른 시도가 이미 커밋함
+        return False
+
+    await update_dashboard_stats(
+        added_items=await get_action_items(meeting_id, include_pending=True),
+        meetings_delta=1,
+    )
+    return True
+
+
+async def _release_action_items(meeting_id):
+    """커밋된 회의에 남은 pending 아이템을 같은 파티션 배치 patch로 조회 대상에 넣습니다."""
+    container = await get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+    item_ids = await _collect(
+        container.query_items(
+            query=PENDING_ACTION_ITEM_IDS_QUERY,
+            parameters=[{"name": "@meeting_id", "value": meeting_id}],
+            partition_key=meeting_id,
+        )
+    )
+    if not item_ids:
+        return 0
+
+    result = await bulk_write_items(
+        config.COSMOS_ACTION_ITEMS_CONTAINER,
+        release_action_items_operations(meeting_id, item_ids),
+        "meetingId",
+    )
+    if result["failed"]:
+        raise Exception(f"{result['failed']}/{len(item_ids)}개 액션 아이템 커밋 실패")
+    return len(item_ids)
+
+
+async def save_meeting(meeting_title, raw_text, summary_json, idempotency_key=None, meeting_id=None):
+    """회의 정보를 멱등하게 저장합니다 (같은 원문/키의 재시도는 같은 회의 ID를 반환).
+
+    meeting_id를 주면 그 ID를 사용합니다 (음성 업로드는 STT 전에 파일 바이트로 정한 ID).
+    """
+    start_time = time.time()
+    try:
+        container = await get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        # 원문 Blob 업로드가 포함되므로 스레드에서 실행
+        meeting_item, summary_dict = await asyncio.to_thread(
+            build_meeting_document,
+            meeting_title,
+            raw_text,
+            summary_json,
+            meeting_id or ingestion_meeting_id(raw_text, idempotency_key),
+        )
+        meeting_id = meeting_item["id"]
+        meeting_item["type"] = MEETING_PENDING_TYPE
+
+        try:
+            await container.create_item(body=meeting_item)
+        except exceptions.CosmosResourceExistsError:
+            existing = await container.read_item(item=meeting_id, partition_key=meeting_id)
+            if existing.get("type") != MEETING_PENDING_TYPE:
+                # 이전 시도가 커밋 직후 실패했으면 남은 pending 아이템을 마저 공개
+                await _release_action_items(meeting_id)
+                log_business_event(
+                    logger,
+                    "meeting_save_deduplicated",
+                    f"이미 저장된 회의 재요청: {meeting_id}",
+                    meeting_id=meeting_id,
+                )
+                return meeting_id
+            # 이전 시도가 중간에 실패했거나 동시에 진행 중: 먼저 저장된 요약 기준으로 이어서 처리
+            summary_dict = parse_summary(existing.get("summary"))
+
+        action_items = summary_dict.get("actionItems") or []
+        if action_items:
+            await save_action_items(meeting_id, action_items, pending=True)
+        action_items_count = len(action_items)
+
+        # 커밋에 실패한(다른 시도가 먼저 커밋한) 경우에도 이 시도가 쓴 아이템은 공개
+        await _commit_meeting(container, meeting_id)
+        if action_items:
+            await _release_action_items(meeting_id)
+
+        duration = time.time() - start_time
+        log_azure_service_call(
+            logger,
+            "Azure Cosmos DB",
+            "create_meeting",
+            duration,
+            True,
+            None,
+            f"Meeting ID: {meeting_id}",
+        )
+        log_performance(
+            logger,
+            "save_meeting_async",
+            duration,
+            f"Meeting: {meeting_id}, Actions: {action_items_count}",
+        )
+        log_business_event(
+            logger,
+            "meeting_saved",
+            f"Meeting '{meeting_title}' saved with {action_items_count} action items",
+            meeting_id=meeting_id,
+        )
+        return meeting_id
+
+    except Exception as e:
+        duration = time.time() - start_time
+        log_error_with_context(logger, e, f"Failed to save meeting: {meeting_title}")
+        log_azure_service_call(
+            logger, "Azure Cosmos DB", "create_meeting", duration, False, None, str(e)
+        )
+        logger.error(f"회의 저장 실패: {e}")
+        raise
+
+
+async def save_action_items(meeting_id, action_items, pending=False):
+    """액션 아이템을 저장합니다 (담당자 추천은 스레드에서, 쓰기는 비동기 배치로).
+
+    결정적 ID로 upsert하므로 재시도해도 중복되지 않으며, 통계는 회의 커밋 시 반영합니다.
+    pending이면 회의 커밋 전까지 조회/통계에서 제외되도록 pending = true로 씁니다.
+    """
+    try:
+        # RAG 담당자 추천은 동기 OpenAI/Search 호출이므로 이벤트 루프 밖에서 실행
+        documents = await asyncio.to_thread(
+            build_action_item_documents, meeting_id, action_items
+        )
+        operations = [
+            ("upsert", {**document, "pending": True} if pending else document)
+            for document in documents
+        ]
+
+        result = await bulk_write_items(
+            config.COSMOS_ACTION_ITEMS_CONTAINER, operations, "meetingId"
+        )
+        if result["failed"]:
+            raise Exception(
+                f"{result['failed']}/{len(operations)}개 액션 아이템 저장 실패"
+            )
+        return result
+
+    except Exception as e:
+        logger.error(f"액션 아이템 저장 실패: {e}")
+        raise
+
+
+async def get_meetings_page(limit=20, continuation_token=None, title_contains=None):
+    """회의 전체 문서를 최신순으로 한 페이지씩 조회합니다 (재인덱싱용, 목록 화면은 get_meeting_summaries_page)."""
+    try:
+        container = await get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        query = "SELECT * FROM c WHERE c.type = 'meeting'"
+        parameters = []
+        if title_contains:
+            query += " AND CONTAINS(c.title, @title, true)"
+            parameters.append({"name": "@title", "value": title_contains})
+        query += " ORDER BY c.type ASC, c.created_at DESC"
+
+        return await query_page(container, query, parameters, limit, continuation_token)
+    except Exception as e:
+        logger.error(f"회의 목록 페이지 조회 실패: {e}")
+        return [], None
+
+
+async def get_action_item_counts(meeting_ids):
+    """회의별 액션 아이템 개수(전체/완료)를 한 번의 쿼리로 조회합니다."""
+    counts = {
+        meeting_id: {"total": 0, "completed": 0} for meeting_id in meeting_ids
+    }
+    if not counts:
+        return counts
+
+    try:
+        container = await get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+        query = (
+            "SELECT c.meetingId, c.status FROM c "
+            f"WHERE ARRAY_CONTAINS(@meeting_ids, c.meetingId) AND {ACTION_ITEM_VISIBLE_CONDITION}"
+        )
+        parameters = [{"name": "@meeting_ids", "value": list(counts)}]
+        async for row in container.query_items(query=query, parameters=parameters):
+            meeting_counts = counts.get(row.get("meetingId"))
+            if meeting_counts is None:
+                continue
+            meeting_counts["total"] += 1
+            if row.get("status") == "완료":
+                meeting_counts["completed"] += 1
+    except Exception as e:
+        logger.error(f"회의별 액션 아이템 개수 조회 실패: {e}")
+
+    return counts
+
+
+async def _with_action_item_counts(meetings):
+    """투영된 회의 목록에 액션 아이템 개수 필드를 채워 반환합니다."""
+    counts = await get_action_item_counts([m["id"] for m in meetings if m.get("id")])
+    for meeting in meetings:
+        meeting_counts = counts.get(meeting.get("id"), {"total": 0, "completed": 0})
+        meeting["action_items_count"] = meeting_counts["total"]
+        meeting["completed_action_items_count"] = meeting_counts["completed"]
+    return meetings
+
+
+async def get_meeting_summaries_page(limit=20, continuation_token=None, title_contains=None):
+    """회의 목록(id, 제목, 생성일, 참석자, 요약 미리보기, 액션 아이템 개수)을 한 페이지씩 조회합니다."""
+    try:
+        container = await get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        query = f"SELECT {MEETING_SUMMARY_PROJECTION} FROM c WHERE c.type = 'meeting'"
+        parameters = []
+        if title_contains:
+            query += " AND CONTAINS(c.title, @title, true)"
+            parameters.append({"name": "@title", "value": title_contains})
+        query += " ORDER BY c.type ASC, c.created_at DESC"
+
+        items, next_token = await query_page(
+            container, query, parameters, limit, continuation_token
+        )
+        return await _with_action_item_counts(items), next_token
+    except Exception as e:
+        logger.error(f"회의 요약 목록 페이지 조회 실패: {e}")
+        return [], None
+
+
+async def get_recent_meetings(limit=5):
+    """최근 회의 요약 목록을 액션 아이템 개수와 함께 limit개만 조회합니다."""
+    try:
+        container = await get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        query = (
+            f"SELECT TOP @top {MEETING_SUMMARY_PROJECTION} FROM c "
+            "WHERE c.type = 'meeting' ORDER BY c.type ASC, c.created_at DESC"
+        )
+        parameters = [{"name": "@top", "value": limit}]
+        meetings = await _collect(
+            container.query_items(query=query, parameters=parameters)
+        )
+        return await _with_action_item_counts(meetings)
+    except Exception as e:
+        logger.error(f"최근 회의 목록 조회 실패: {e}")
+        return []
+
+
+async def get_meeting(meeting_id):
+    """특정 회의 정보를 조회합니다."""
+    try:
+        container = await get_container(config.COSMOS_MEETINGS_CONTAINER)
+
+        return await container.read_item(item=meeting_id, partition_key=meeting_id)
+    except exceptions.CosmosResourceNotFoundError:
+        logger.warning(f"회의 ID {meeting_id} 조회 실패: 문서 없음")
+        return None
+    except Exception as e:
+        logger.error(f"회의 조회 실패: {e}")
+        raise
+
+
+# 액션 아이템
+async def get_action_items(meeting_id, include_pending=False):
+    """특정 회의의 액션 아이템을 조회합니다 (단일 파티션 쿼리, include_pending이면 pending 항목 포함)."""
+    try:
+        container = await get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+        query = "SELECT * FROM c WHERE c.meetingId = @meeting_id"
+        if not include_pending:
+            query += f" AND {ACTION_ITEM_VISIBLE_CONDITION}"
+        return await _collect(
+            container.query_items(
+                query=query,
+                parameters=[{"name": "@meeting_id", "value": meeting_id}],
+                partition_key=meeting_id,
+            )
+        )
+    except Exception as e:
+        logger.error(f"액션 아이템 조회 실패: {e}")
+        return []
+
+
+async def patch_item_with_etag(container, item_id, partition_key, updates):
+    """db.cosmos_db.patch_item_with_etag의 비동기 버전 (412 충돌 시 제한 재시도)."""
+    operations = _set_operations(updates)
+
+    for attempt in range(ETAG_CONFLICT_MAX_RETRIES + 1):
+        before = await container.read_item(item=item_id, partition_key=partition_key)
+        try:
+            if len(operations) <= PATCH_MAX_OPERATIONS:
+                after = await container.patch_item(
+                    item=item_id,
+                    partition_key=partition_key,
+                    patch_operations=operations,
+                    etag=before["_etag"],
+                    match_condition=MatchConditions.IfNotModified,
+                )
+            else:
+                after = await container.replace_item(
+                    item=item_id,
+                    body={**before, **updates},
+                    etag=before["_etag"],
+                    match_condition=MatchConditions.IfNotModified,
+                )
+            return before, after
+        except exceptions.CosmosAccessConditionFailedError:
+            if attempt == ETAG_CONFLICT_MAX_RETRIES:
+                raise
+            logger.warning(
+                f"ETag 충돌로 재시도합니다: {item_id} ({attempt + 1}/{ETAG_CONFLICT_MAX_RETRIES})"
+            )
+            await asyncio.sleep(ETAG_CONFLICT_BACKOFF_SECONDS * (2**attempt))
+
+
+async def update_action_item(item_id, meeting_id, updates):
+    """액션 아이템을 수정합니다 (포인트 읽기 + ETag 조건부 patch)."""
+    try:
+        container = await get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+        try:
+            before, result = await patch_item_with_etag(
+                container,
+                item_id,
+                meeting_id,
+                {**updates, "updated_at": datetime.utcnow().isoformat()},
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            raise ValueError(f"액션 아이템 ID {item_id}를 찾을 수 없습니다.")
+
+        await update_dashboard_stats(removed_items=[before], added_items=[result])
+        return result
+    except Exception as e:
+        logger.error(f"액션 아이템 수정 실패: {e}")
+        raise
+
+
+async def save_approval_history(meeting_id, action_item_id, reviewer, changes):
+    """승인 이력을 저장합니다."""
+    try:
+        container = await get_container(config.COSMOS_HISTORY_CONTAINER)
+
+        timestamp = datetime.utcnow().isoformat()
+        history_id = f"history_{action_item_id}_{timestamp.replace(':', '-')}"
+
+        await container.create_item(
+            body={
+                "id": history_id,
+                "meetingId": meeting_id,
+                "actionItemId": action_item_id,
+                "reviewer": reviewer,
+                "changes": changes,
+                "timestamp": timestamp,
+            }
+        )
+        return history_id
+    except Exception as e:
+        logger.error(f"승인 이력 저장 실패: {e}")
+        raise
+
+
+async def approve_action_item(item_id, meeting_id, final_assignee_id, reviewer_name=None):
+    """액션 아이템을 승인하고 담당자를 할당합니다."""
+    try:
+        update_result = await update_action_item(
+            item_id,
+            meeting_id,
+            {
+                "finalAssigneeId": final_assignee_id,
+                "approved": True,
+                "status": "진행중",
+            },
+        )
+
+        if reviewer_name:
+            await save_approval_history(
+                meeting_id=meeting_id,
+                action_item_id=item_id,
+                reviewer=reviewer_name,
+                changes={"finalAssigneeId": final_assignee_id, "approved": True},
+            )
+
+        return update_result
+    except Exception as e:
+        logger.error(f"액션 아이템 승인 실패: {e}")
+        raise
+
+
+async def update_action_item_status(item_id, meeting_id, status):
+    """액션 아이템의 상태를 업데이트합니다."""
+    return await update_action_item(item_id, meeting_id, {"status": status})
+
+
+# 대시보드 통계
+async def rebuild_dashboard_stats():
+    """통계를 다시 계산해 통계 문서를 덮어씁니다."""
+    start_time = time.time()
+    meetings_container = await get_container(config.COSMOS_MEETINGS_CONTAINER)
+    items_container = await get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+
+    total_meetings, rows = await asyncio.gather(
+        _collect(meetings_container.query_items(query=MEETING_COUNT_QUERY)),
+        _collect(items_container.query_items(query=DASHBOARD_STATS_ROWS_QUERY)),
+    )
+    stats = summarize_dashboard_rows(total_meetings[0] if total_meetings else 0, rows)
+    stats_doc = build_dashboard_stats_document(stats)
+    await meetings_container.upsert_item(body=stats_doc)
+
+    log_performance(
+        logger, "rebuild_dashboard_stats_async", time.time() - start_time, f"Items: {len(rows)}"
+    )
+    return stats_doc
+
+
+async def get_dashboard_stats(refresh=False):
+    """대시보드 통계를 반환합니다 (통계 문서 포인트 읽기, 없으면 재구성)."""
+    if not refresh:
+        try:
+            container = await get_container(config.COSMOS_MEETINGS_CONTAINER)
+            return await container.read_item(
+                item=DASHBOARD_STATS_ID, partition_key=DASHBOARD_STATS_ID
+            )
+        except exceptions.CosmosResourceNotFoundError:
+            logger.info("대시보드 통계 문서 없음, 집계 쿼리로 생성합니다")
+    return await rebuild_dashboard_stats()
+
+
+async def update_dashboard_stats(removed_items=None, added_items=None, meetings_delta=0):
+    """액션 아이템 쓰기 결과를 통계 문서에 증분 반영합니다 (실패해도 예외 없음)."""
+    operations = dashboard_stats_patch_operations(
+        removed_items, added_items, meetings_delta
+    )
+    if not operations:
+        return
+
+    try:
+        container = await get_container(config.COSMOS_MEETINGS_CONTAINER)
+        for start in range(0, len(operations), PATCH_MAX_OPERATIONS):
+            await container.patch_item(
+                item=DASHBOARD_STATS_ID,
+                partition_key=DASHBOARD_STATS_ID,
+                patch_operations=operations[start : start + PATCH_MAX_OPERATIONS],
+            )
+    except exceptions.CosmosResourceNotFoundError:
+        try:
+            await rebuild_dashboard_stats()
+        except Exception as e:
+            logger.warning(f"대시보드 통계 재구성 실패: {e}")
+    except Exception as e:
+        logger.warning(f"대시보드 통계 증분 갱신 실패: {e}")
@@ -0,0 +1,375 @@
+"""
+Cosmos DB 요청 단위(RU) 및 쿼리 메트릭 수집
+
+get_container가 돌려주는 컨테이너 프록시를 감싸, 모든 데이터 호출의 응답 헤더에서
+요청 RU(x-ms-request-charge), 활동 ID, 스로틀 재시도/retry-after, 쿼리 실행 메트릭을 읽습니다.
+호출마다 cosmos_telemetry 로거로 구조화된 레코드(metric_type = "cosmos_request")를 남기고,
+논리 작업(호출한 db 모듈 함수 이름)별 누적치와 요청/세션 범위별 합계를 집계합니다.
+쿼리는 페이지마다 레코드가 남으며 같은 query_id로 묶입니다.
+
+상위 RU 쿼리 리포트: python scripts/cosmos_ru_report.py --top 20
+"""
+
+import contextvars
+import inspect
+import logging
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from azure.cosmos import exceptions
+
+import config.config as config
+
+# 호출 레코드는 콘솔에 섞이지 않도록 전용 로거/파일로만 기록 (setup_logger에서 핸들러 연결)
+logger = logging.getLogger("cosmos_telemetry")
+
+# 논리 작업 이름을 찾을 호출 모듈 (가장 가까운 프레임의 함수 이름을 사용)
+OPERATION_MODULES = ("db.cosmos_db", "db.cosmos_db_async", "db.retention")
+
+# 계측할 컨테이너 메서드 (쿼리 계열은 페이지마다 응답 훅이 호출됨)
+POINT_METHODS = (
+    "read_item",
+    "create_item",
+    "upsert_item",
+    "replace_item",
+    "patch_item",
+    "delete_item",
+    "execute_item_batch",
+    "delete_all_items_by_partition_key",
+)
+QUERY_METHODS = ("query_items", "read_all_items")
+
+# 레코드에 남길 쿼리 메트릭 항목 (x-ms-documentdb-query-metrics)
+QUERY_METRIC_KEYS = (
+    "totalExecutionTimeInMs",
+    "retrievedDocumentCount",
+    "retrievedDocumentSize",
+    "outputDocumentCount",
+    "outputDocumentSize",
+    "indexLookupTimeInMs",
+    "documentLoadTimeInMs",
+    "indexUtilizationRatio",
+)
+
+_stats_lock = threading.Lock()
+_operation_stats = {}
+
+# 현재 요청/세션 범위 (FastAPI 요청, Streamlit 재실행 단위)
+_current_scope = contextvars.ContextVar("cosmos_telemetry_scope", default=None)
+
+
+def _new_totals():
+    return {
+        "calls": 0,
+        "request_charge": 0.0,
+        "max_request_charge": 0.0,
+        "throttle_retries": 0,
+        "throttle_wait_ms": 0.0,
+        "errors": 0,
+        "duration_seconds": 0.0,
+    }
+
+
+def _add_to_totals(totals, record):
+    charge = record["request_charge"]
+    totals["calls"] += 1
+    totals["request_charge"] += charge
+    totals["max_request_charge"] = max(totals["max_request_charge"], charge)
+    totals["throttle_retries"] += record["throttle_retry_count"]
+    totals["throttle_wait_ms"] += record["throttle_wait_ms"]
+    totals["duration_seconds"] += record["duration_seconds"] or 0.0
+    if record["status_code"] and record["status_code"] >= 400:
+        totals["errors"] += 1
+
+
+class _ScopeTotals:
+    """요청/세션 범위 안에서 발생한 호출의 합계 (스레드풀/gather로 나뉜 호출도 같은 객체에 누적)."""
+
+    def __init__(self, scope_type, scope_id, label=None):
+        self.scope_type = scope_type
+        self.scope_id = scope_id
+        self.label = label
+        self.lock = threading.Lock()
+        self.totals = _new_totals()
+        self.operations = {}
+
+    def add(self, record):
+        with self.lock:
+            _add_to_totals(self.totals, record)
+            _add_to_totals(
+                self.operations.setdefault(record["operation"], _new_totals()), record
+            )
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "scope_type": self.scope_type,
+                "scope_id": self.scope_id,
+                "label": self.label,
+                **self.totals,
+                "operations": {name: dict(t) for name, t in self.operations.items()},
+            }
+
+
+def _header(headers, name, default=None):
+    """대소문자 구분 없이 헤더 값을 읽습니다."""
+    if not headers:
+        return default
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return default if value is None else value
+
+
+def _to_float(value, default=0.0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_query_metrics(value):
+    """'key=value;key=value' 형식의 쿼리 메트릭 헤더를 딕셔너리로 변환합니다."""
+    metrics = {}
+    for part in (value or "").split(";"):
+        key, _, raw = part.partition("=")
+        if key.strip() in QUERY_METRIC_KEYS:
+            metrics[key.strip()] = _to_float(raw)
+    return metrics
+
+
+def _logical_operation(default):
+    """호출 스택에서 db 모듈 함수 이름을 찾아 논리 작업 이름으로 사용합니다."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_globals.get("__name__") in OPERATION_MODULES:
+            return frame.f_code.co_name
+        frame = frame.f_back
+    return default
+
+
+def _normalize_query(query):
+    if isinstance(query, dict):
+        query = query.get("query")
+    return " ".join(str(query).split()) if query else None
+
+
+def record_response(
+    headers,
+    operation,
+    method,
+    container_name,
+    status_code=None,
+    duration=None,
+    query=None,
+    query_id=None,
+    page=None,
+):
+    """응답 헤더 하나를 레코드로 기록하고 작업/범위별 합계에 더합니다."""
+    if not config.COSMOS_TELEMETRY_ENABLED:
+        return None
+
+    scope = _current_scope.get()
+    record = {
+        "metric_type": "cosmos_request",
+        "operation": operation,
+        "sdk_method": method,
+        "container": container_name,
+        "status_code": status_code,
+        "request_charge": _to_float(_header(headers, "x-ms-request-charge")),
+        "activity_id": _header(headers, "x-ms-activity-id"),
+        "retry_after_ms": _to_float(_header(headers, "x-ms-retry-after-ms"), None),
+        "throttle_retry_count": int(
+            _to_float(_header(headers, "x-ms-throttle-retry-count"))
+        ),
+        "throttle_wait_ms": _to_float(_header(headers, "x-ms-throttle-retry-wait-time-ms")),
+        "duration_seconds": duration,
+        "scope_type": scope.scope_type if scope else None,
+        "scope_id": scope.scope_id if scope else None,
+    }
+    if query is not None:
+        record["query"] = query
+        record["query_id"] = query_id
+        record["page"] = page
+        record["item_count"] = _to_float(_header(headers, "x-ms-item-count"), None)
+        record["query_metrics"] = parse_query_metrics(
+            _header(headers, "x-ms-documentdb-query-metrics")
+        )
+
+    with _stats_lock:
+        _add_to_totals(_operation_stats.setdefault(operation, _new_totals()), record)
+    if scope is not None:
+        scope.add(record)
+
+    logger.info(
+        f"COSMOS {operation} [{method}] {record['request_charge']:.2f} RU", extra=record
+    )
+    return record
+
+
+def _record_error(error, operation, method, container_name, duration):
+    """Cosmos 오류 응답(429 등)의 헤더도 기록합니다."""
+    record_response(
+        getattr(error, "headers", None) or {},
+        operation,
+        method,
+        container_name,
+        status_code=getattr(error, "status_code", None),
+        duration=duration,
+    )
+
+
+class InstrumentedContainer:
+    """컨테이너 프록시를 감싸 데이터 호출마다 응답 헤더를 기록합니다 (그 외 속성은 그대로 위임)."""
+
+    def __init__(self, container, container_name):
+        self._container = container
+        self._container_name = container_name
+
+    def __getattr__(self, name):
+        attribute = getattr(self._container, name)
+        if name in POINT_METHODS:
+            return self._wrap_point(name, attribute)
+        if name in QUERY_METHODS:
+            return self._wrap_query(name, attribute)
+        return attribute
+
+    def _wrap_point(self, method, call):
+        container_name = self._container_name
+
+        def hook_for(operation, started, user_hook):
+            def hook(headers, result):
+                record_response(
+                    headers,
+                    operation,
+                    method,
+                    container_name,
+                    duration=time.perf_counter() - started,
+                )
+                if user_hook:
+                    user_hook(headers, result)
+
+            return hook
+
+        if inspect.iscoroutinefunction(call):
+
+            async def async_wrapper(*args, **kwargs):
+                operation = _logical_operation(f"{container_name}.{method}")
+                started = time.perf_counter()
+                kwargs["response_hook"] = hook_for(
+                    operation, started, kwargs.get("response_hook")
+                )
+                try:
+                    return await call(*args, **kwargs)
+                except exceptions.CosmosHttpResponseError as e:
+                    _record_error(
+                        e, operation, method, container_name, time.perf_counter() - started
+                    )
+                    raise
+
+            return async_wrapper
+
+        def wrapper(*args, **kwargs):
+            operation = _logical_operation(f"{container_name}.{method}")
+            started = time.perf_counter()
+            kwargs["response_hook"] = hook_for(
+                operation, started, kwargs.get("response_hook")
+            )
+            try:
+                return call(*args, **kwargs)
+            except exceptions.CosmosHttpResponseError as e:
+                _record_error(
+                    e, operation, method, container_name, time.perf_counter() - started
+                )
+                raise
+
+        return wrapper
+
+    def _wrap_query(self, method, call):
+        container_name = self._container_name
+
+        def wrapper(*args, **kwargs):
+            operation = _logical_operation(f"{container_name}.{method}")
+            query = _normalize_query(kwargs.get("query", args[0] if args else None))
+            query_id = uuid.uuid4().hex[:12]
+            user_hook = kwargs.get("response_hook")
+            state = {"page": 0, "started": time.perf_counter()}
+
+            def hook(headers, result):
+                # SDK가 반복자 생성 시점에도 훅을 호출하므로 실제 페이지 응답만 기록
+                if not hasattr(result, "by_page"):
+                    now = time.perf_counter()
+                    state["page"] += 1
+                    record_response(
+                        headers,
+                        operation,
+                        method,
+                        container_name,
+                        duration=now - state["started"],
+                        query=query or method,
+                        query_id=query_id,
+                        page=state["page"],
+                    )
+                    state["started"] = now
+                if user_hook:
+                    user_hook(headers, result)
+
+            kwargs["response_hook"] = hook
+            if config.COSMOS_POPULATE_QUERY_METRICS and method == "query_items":
+                kwargs.setdefault("populate_query_metrics", True)
+            return call(*args, **kwargs)
+
+        return wrapper
+
+
+def instrument_container(container, container_name):
+    """설정에 따라 컨테이너 프록시를 계측 래퍼로 감쌉니다."""
+    if not config.COSMOS_TELEMETRY_ENABLED:
+        return container
+    return InstrumentedContainer(container, container_name)
+
+
+@contextmanager
+def cosmos_telemetry_scope(scope_type, scope_id=None, label=None):
+    """블록 안의 Cosmos 호출 RU를 요청/세션 단위로 집계하고, 끝나면 합계 레코드를 남깁니다.
+
+    label은 리포트에서 범위를 묶을 이름(API 경로 템플릿, 페이지 이름 등)이며 블록 안에서 바꿀 수 있습니다.
+    """
+    scope = _ScopeTotals(scope_type, scope_id or uuid.uuid4().hex[:12], label)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        summary = scope.snapshot()
+        if summary["calls"]:
+            logger.info(
+                f"COSMOS SCOPE {scope_type}:{summary['label'] or summary['scope_id']} - "
+                f"{summary['calls']} calls, {summary['request_charge']:.2f} RU",
+                extra={"metric_type": "cosmos_scope", **summary},
+            )
+
+
+def get_current_scope_totals():
+    """현재 요청/세션 범위의 합계를 반환합니다 (범위 밖이면 None)."""
+    scope = _current_scope.get()
+    return scope.snapshot() if scope else None
+
+
+def get_cosmos_telemetry_stats(top=None):
+    """프로세스 시작 이후 논리 작업별 누적 RU를 RU 합계 내림차순으로 반환합니다."""
+    with _stats_lock:
+        rows = [
+            {"operation": name, **totals} for name, totals in _operation_stats.items()
+        ]
+    rows.sort(key=lambda row: row["request_charge"], reverse=True)
+    return rows[:top] if top else rows
+
+
+def reset_cosmos_telemetry_stats():
+    """누적 통계를 초기화합니다 (테스트, 측정 구간 분리용)."""
+    with _stats_lock:
+        _operation_stats.clear()
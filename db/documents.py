@@ -0,0 +1,474 @@
+"""
+저장소 공통 문서 로직
+
+db/cosmos_db.py와 db/sqlite_db.py가 함께 쓰는 문서 ID/형식 생성, 요약 파싱, 업무 필터 정규화,
+독립 작업 파티션 키 계산 같은 순수 함수와 상수를 둡니다. Azure SDK를 import하지 않으므로
+SQLite 백엔드는 azure 패키지 없이도 불러올 수 있고, 두 백엔드의 데이터 형식이 같게 유지됩니다.
+"""
+
+import hashlib
+import json
+import logging
+import unicodedata
+from datetime import datetime
+
+import config.config as config
+
+# 로깅 설정
+logger = logging.getLogger("documents")
+
+
+# 회의 문서
+MEETING_PENDING_TYPE = "meeting_pending"
+MEETING_COMMITTED_TYPE = "meeting"
+MEETING_SUMMARY_PREVIEW_LENGTH = 100
+
+
+def ingestion_meeting_id(raw_text, idempotency_key=None):
+    """원문(문자열 또는 업로드 파일 바이트) 해시와 멱등 키로 회의 ID를 만듭니다 (키가 없으면 원문만으로 결정)."""
+    digest = hashlib.sha256()
+    digest.update((idempotency_key or "").encode("utf-8"))
+    digest.update(b"\0")
+    if isinstance(raw_text, bytes):
+        digest.update(raw_text)
+    else:
+        digest.update((raw_text or "").encode("utf-8"))
+    return f"meeting_{digest.hexdigest()[:16]}"
+
+
+def parse_summary(summary_json):
+    """저장된 요약(JSON 문자열 또는 딕셔너리)을 딕셔너리로 변환합니다."""
+    if isinstance(summary_json, str):
+        try:
+            return json.loads(summary_json)
+        except (json.JSONDecodeError, TypeError):
+            return {"error": "Failed to parse summary", "raw": summary_json}
+    return summary_json
+
+
+def _meeting_list_fields(summary_dict):
+    """목록 화면용 경량 필드(참석자, 요약 미리보기)를 요약 정보에서 추출합니다."""
+    if not isinstance(summary_dict, dict):
+        return {"participants": [], "summary_preview": ""}
+
+    participants = summary_dict.get("participants")
+    summary_text = summary_dict.get("summary") or ""
+    if not isinstance(summary_text, str):
+        summary_text = json.dumps(summary_text, ensure_ascii=False)
+    return {
+        "participants": participants if isinstance(participants, list) else [],
+        "summary_preview": summary_text[:MEETING_SUMMARY_PREVIEW_LENGTH],
+    }
+
+
+def build_action_item_documents(meeting_id, action_items):
+    """추출된 액션 아이템마다 담당자를 추천해 저장할 문서 목록을 만듭니다."""
+    documents = []
+
+    for idx, item in enumerate(action_items):
+        item_id = f"item_{meeting_id}_{idx}"
+
+        # 담당자 추천 (RAG 기반)
+        recommended_assignee = None
+        recommended_assignee_name = item.get(
+            "recommendedAssigneeId", item.get("assignee", "")
+        )
+
+        # 액션 아이템 설명을 기반으로 RAG 담당자 추천
+        description = item.get("description", "")
+        if description:
+            try:
+                # RAG 기반 추천 시도
+                from services.service_manager import service_manager
+
+                rag_result = service_manager.recommend_assignee_with_rag(
+                    task_description=description,
+                    meeting_context=f"회의 ID: {meeting_id}",
+                )
+
+                if rag_result and rag_result.get("recommended_user_id"):
+                    recommended_assignee = rag_result.get("recommended_user_id")
+                    recommended_assignee_name = rag_result.get(
+                        "recommended_name", recommended_assignee_name
+                    )
+                    logger.info(
+                        f"RAG 추천 성공: {recommended_assignee_name} (확신도: {rag_result.get('confidence_score', 0):.2f})"
+                    )
+                else:
+                    # RAG 추천 실패 시 미할당으로 처리
+                    logger.info("RAG 추천 실패, 미할당으로 설정")
+                    recommended_assignee_name = "미할당"
+
+            except Exception as e:
+                logger.warning(f"담당자 추천 실패 (RAG/기존): {e}")
+                # 마지막 폴백: OpenAI가 추천한 이름 그대로 사용
+                pass
+
+        action_item = {
+            "id": item_id,
+            "meetingId": meeting_id,
+            "description": description,
+            "recommendedAssigneeId": recommended_assignee_name,
+            "dueDate": item.get("dueDate", ""),
+            "finalAssigneeId": None,
+            "approved": False,
+            "status": "미시작",
+            "created_at": datetime.utcnow().isoformat(),
+        }
+
+        documents.append(action_item)
+
+    return documents
+
+
+# 업무 필터 (키 설명은 cosmos_db.build_action_item_query)
+TASK_FILTER_KEYS = (
+    "status",
+    "exclude_status",
+    "assignee",
+    "unassigned",
+    "due_from",
+    "due_to",
+    "approved",
+    "meeting_id",
+    "text",
+)
+UNASSIGNED_MARKERS = {"", "none", "미할당", "unassigned", "없음"}
+
+
+def _as_list(value):
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def normalize_task_filters(filters):
+    """업무 필터에서 빈 조건을 제거하고 알 수 없는 키를 거부합니다."""
+    filters = dict(filters or {})
+    unknown = set(filters) - set(TASK_FILTER_KEYS)
+    if unknown:
+        raise ValueError(f"지원하지 않는 업무 필터: {', '.join(sorted(unknown))}")
+
+    normalized = {}
+    for key, value in filters.items():
+        if key == "approved":
+            if value is not None:
+                normalized[key] = bool(value)
+        elif key == "unassigned":
+            if value:
+                normalized[key] = True
+        elif key == "text":
+            words = [w for w in _as_list(value) if w] if value else []
+            if words:
+                normalized[key] = words
+        elif value not in (None, "", [], ()):
+            normalized[key] = value
+    return normalized
+
+
+# 대시보드 통계
+DASHBOARD_STATS_ID = "dashboard_stats"
+DASHBOARD_STATUSES = ["미시작", "진행중", "완료", "지연"]
+
+
+def build_dashboard_stats_document(stats):
+    """통계 문서 본문을 만듭니다."""
+    return {
+        "id": DASHBOARD_STATS_ID,
+        "type": "dashboard_stats",
+        **stats,
+        "updated_at": datetime.utcnow().isoformat(),
+    }
+
+
+# 인사정보
+# 더미 인사정보 (저장소 백엔드 공통)
+DUMMY_STAFF_DATA = [
+    {
+        "id": "staff_1",
+        "user_id": 1,
+        "name": "김민수",
+        "department": "기획팀",
+        "position": "기획팀장",
+        "email": "kimminsu@company.com",
+        "skills": ["Project Management", "Strategy Planning", "Communication"],
+    },
+    {
+        "id": "staff_2",
+        "user_id": 2,
+        "name": "이영희",
+        "department": "마케팅팀",
+        "position": "마케터",
+        "email": "leeyh@company.com",
+        "skills": ["Digital Marketing", "Campaign Management", "Analytics"],
+    },
+    {
+        "id": "staff_3",
+        "user_id": 3,
+        "name": "박철수",
+        "department": "개발팀",
+        "position": "개발자",
+        "email": "parkcs@company.com",
+        "skills": ["JavaScript", "Python", "Backend", "Frontend"],
+    },
+    {
+        "id": "staff_4",
+        "user_id": 4,
+        "name": "최지은",
+        "department": "QA팀",
+        "position": "QA 엔지니어",
+        "email": "choije@company.com",
+        "skills": ["Quality Assurance", "Test Automation", "Bug Tracking"],
+    },
+    {
+        "id": "staff_5",
+        "user_id": 5,
+        "name": "정하늘",
+        "department": "데이터팀",
+        "position": "데이터 분석가",
+        "email": "junghn@company.com",
+        "skills": ["Data Analysis", "Statistics", "Visualization", "SQL"],
+    },
+    {
+        "id": "staff_6",
+        "user_id": 6,
+        "name": "장윤서",
+        "department": "디자인팀",
+        "position": "UI/UX 디자이너",
+        "email": "jangyun@company.com",
+        "skills": [
+            "UI Design",
+            "UX Research",
+            "Figma",
+            "User Interface",
+            "Prototyping",
+        ],
+    },
+    {
+        "id": "staff_7",
+        "user_id": 7,
+        "name": "한성민",
+        "department": "인프라팀",
+        "position": "DevOps 엔지니어",
+        "email": "hansm@company.com",
+        "skills": ["DevOps", "Azure", "CI/CD", "Infrastructure", "Monitoring"],
+    },
+    {
+        "id": "staff_8",
+        "user_id": 8,
+        "name": "오현준",
+        "department": "개발팀",
+        "position": "프론트엔드 개발자",
+        "email": "ohhj@company.com",
+        "skills": ["React", "TypeScript", "JavaScript", "Frontend", "CSS"],
+    },
+    {
+        "id": "staff_9",
+        "user_id": 9,
+        "name": "신예린",
+        "department": "마케팅팀",
+        "position": "디지털 마케터",
+        "email": "shinyr@company.com",
+        "skills": [
+            "Digital Marketing",
+            "SEO",
+            "Social Media",
+            "Google Analytics",
+            "Content Marketing",
+        ],
+    },
+    {
+        "id": "staff_10",
+        "user_id": 10,
+        "name": "강태우",
+        "department": "기획팀",
+        "position": "서비스 기획자",
+        "email": "kangtw@company.com",
+        "skills": [
+            "Service Planning",
+            "Product Management",
+            "User Story",
+            "Roadmap",
+            "Requirements",
+        ],
+    },
+    {
+        "id": "staff_11",
+        "user_id": 11,
+        "name": "윤지혜",
+        "department": "데이터팀",
+        "position": "데이터 엔지니어",
+        "email": "yoonjh@company.com",
+        "skills": [
+            "Data Engineering",
+            "ETL",
+            "Big Data",
+            "Python",
+            "Apache Spark",
+        ],
+    },
+    {
+        "id": "staff_12",
+        "user_id": 12,
+        "name": "임도현",
+        "department": "QA팀",
+        "position": "자동화 테스트 엔지니어",
+        "email": "imdh@company.com",
+        "skills": [
+            "Test Automation",
+            "Selenium",
+            "API Testing",
+            "Performance Testing",
+            "CI/CD Testing",
+        ],
+    },
+]
+STAFF_IMPORT_CHUNK_SIZE = 500
+STAFF_EXPORT_PAGE_SIZE = 200
+
+
+def normalize_staff_name(name):
+    """이름 비교용 정규화 (유니코드 NFKC, 공백 제거, 대소문자 무시)"""
+    normalized = unicodedata.normalize("NFKC", str(name or ""))
+    return "".join(normalized.split()).casefold()
+
+
+def build_staff_document(staff_data, user_id, now):
+    return {
+        "id": staff_data.get("id") or f"staff_{user_id}",
+        "user_id": user_id,
+        "name": staff_data.get("name", ""),
+        "department": staff_data.get("department", ""),
+        "position": staff_data.get("position", ""),
+        "email": staff_data.get("email", ""),
+        "skills": staff_data.get("skills", []),
+        "created_at": staff_data.get("created_at") or now,
+        "updated_at": now,
+        "type": "staff",
+    }
+
+
+def rank_assignee_for_task(all_staff, task_description):
+    """직원 목록에서 작업 설명과 스킬/부서가 가장 잘 맞는 직원을 고릅니다 (키워드 점수)."""
+    if not all_staff:
+        return None
+
+    # 간단한 키워드 기반 매칭
+    task_lower = task_description.lower()
+
+    # 스킬 기반 점수 계산
+    scored_staff = []
+    for staff in all_staff:
+        score = 0
+        staff_skills = [skill.lower() for skill in staff.get("skills", [])]
+
+        # 작업 설명에서 스킬 키워드 매칭
+        for skill in staff_skills:
+            if skill in task_lower:
+                score += 3
+
+        # 부서별 가중치
+        department = staff.get("department", "").lower()
+        if (
+            "development" in task_lower
+            or "code" in task_lower
+            or "programming" in task_lower
+            or "개발" in task_lower
+        ):
+            if "개발" in department:
+                score += 2
+        elif (
+            "design" in task_lower
+            or "ui" in task_lower
+            or "ux" in task_lower
+            or "디자인" in task_lower
+        ):
+            if "디자인" in department:
+                score += 2
+        elif (
+            "marketing" in task_lower
+            or "promotion" in task_lower
+            or "마케팅" in task_lower
+        ):
+            if "마케팅" in department:
+                score += 2
+        elif "plan" in task_lower or "manage" in task_lower or "기획" in task_lower:
+            if "기획" in department:
+                score += 2
+
+        scored_staff.append((staff, score))
+
+    # 점수순으로 정렬하여 최고 점수 반환
+    scored_staff.sort(key=lambda x: x[1], reverse=True)
+
+    if scored_staff and scored_staff[0][1] > 0:
+        return scored_staff[0][0]
+    else:
+        # 매칭되는 스킬이 없으면 첫 번째 직원 반환
+        return all_staff[0]
+
+
+# 채팅 히스토리
+def chat_id_for_session(session_id):
+    """세션의 채팅 헤더 문서 ID를 반환합니다."""
+    return f"chat_{session_id}"
+
+
+def _default_chat_summary(messages):
+    """첫 번째 사용자 메시지로 대화 요약을 만듭니다."""
+    user_messages = [msg for msg in messages if msg.get("role") == "user"]
+    if not user_messages:
+        return "새로운 채팅"
+    first_message = user_messages[0].get("content", "")
+    return first_message[:50] + "..." if len(first_message) > 50 else first_message
+
+
+# 독립 작업 파티션 샤딩
+# 채팅에서 만든 독립 작업은 회의가 없어 meetingId 하나("standalone_task")에 몰리므로,
+# standalone_task#<yyyymm>#<shard> 형태의 합성 파티션 키로 월·샤드별로 분산합니다.
+# 샤드 번호는 아이템 ID 해시로 정해지므로 (ID, 생성 월)만 알면 파티션을 계산할 수 있습니다.
+STANDALONE_TASK_PREFIX = "standalone_task"
+LEGACY_STANDALONE_PARTITION_KEY = STANDALONE_TASK_PREFIX  # 샤딩 이전 단일 파티션
+
+
+def _standalone_task_month(created_at=None):
+    """생성 시각(ISO 문자열 또는 datetime)을 yyyymm 문자열로 변환합니다."""
+    if isinstance(created_at, str) and created_at:
+        return created_at[:7].replace("-", "")
+    return (created_at or datetime.utcnow()).strftime("%Y%m")
+
+
+def standalone_task_shard(item_id):
+    """아이템 ID를 샤드 번호로 변환합니다 (프로세스와 무관하게 결정적)."""
+    digest = hashlib.md5(item_id.encode("utf-8")).hexdigest()
+    return int(digest[:8], 16) % config.STANDALONE_TASK_SHARD_COUNT
+
+
+def standalone_task_partition_key(item_id, created_at=None):
+    """독립 작업의 합성 파티션 키(standalone_task#yyyymm#shard)를 반환합니다."""
+    return (
+        f"{STANDALONE_TASK_PREFIX}#{_standalone_task_month(created_at)}"
+        f"#{standalone_task_shard(item_id):02d}"
+    )
+
+
+def is_standalone_partition_key(meeting_id):
+    """meetingId가 독립 작업 파티션(샤딩 이전 포함)인지 확인합니다."""
+    return isinstance(meeting_id, str) and (
+        meeting_id == LEGACY_STANDALONE_PARTITION_KEY
+        or meeting_id.startswith(f"{STANDALONE_TASK_PREFIX}#")
+    )
+
+
+def standalone_task_partition_keys(months=3, until=None):
+    """최근 months개월(until 포함)의 독립 작업 파티션 키 목록을 반환합니다."""
+    until = until or datetime.utcnow()
+    year, month = until.year, until.month
+
+    partition_keys = []
+    for _ in range(months):
+        month_key = f"{year:04d}{month:02d}"
+        partition_keys.extend(
+            f"{STANDALONE_TASK_PREFIX}#{month_key}#{shard:02d}"
+            for shard in range(config.STANDALONE_TASK_SHARD_COUNT)
+        )
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    return partition_keys
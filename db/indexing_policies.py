@@ -0,0 +1,104 @@
+"""
+Cosmos DB 컨테이너별 인덱싱 정책 정의
+
+기본 정책(모든 경로 인덱싱)은 원문, 요약 JSON, 채팅 메시지 같은 큰 필드까지 인덱싱해
+쓰기 RU를 키웁니다. 여기서는 조회 조건에 쓰이지 않는 큰 필드를 제외하고,
+실제 쿼리 형태(필터 + ORDER BY)에 맞는 복합 인덱스를 선언합니다.
+init_cosmos가 컨테이너 생성 시 적용하고, 기존 컨테이너는 시작 시 비교해 다르면 교체합니다.
+
+복합 인덱스를 쓰려면 쿼리의 ORDER BY에 필터 속성도 같은 순서로 포함해야 합니다.
+(예: WHERE c.type = 'meeting' ORDER BY c.type ASC, c.created_at DESC)
+"""
+
+import config.config as config
+
+# Cosmos가 항상 제외하는 시스템 경로
+_SYSTEM_EXCLUDED_PATHS = ['/"_etag"/?']
+
+
+def _policy(excluded_paths=(), composite_indexes=(), included_paths=("/*",)):
+    """인덱싱 정책 딕셔너리를 만듭니다. composite_indexes: [[(경로, 순서), ...], ...]"""
+    return {
+        "indexingMode": "consistent",
+        "automatic": True,
+        "includedPaths": [{"path": path} for path in included_paths],
+        "excludedPaths": [
+            {"path": path} for path in list(excluded_paths) + _SYSTEM_EXCLUDED_PATHS
+        ],
+        "compositeIndexes": [
+            [{"path": path, "order": order} for path, order in composite]
+            for composite in composite_indexes
+        ],
+    }
+
+
+# 포인트 읽기만 하는 컨테이너 (id/파티션 키 조회는 인덱스가 필요 없음)
+_POINT_READ_ONLY_POLICY = _policy(excluded_paths=["/*"], included_paths=())
+
+
+def get_indexing_policies():
+    """컨테이너 이름 → 인덱싱 정책 매핑을 반환합니다."""
+    return {
+        # 회의: 목록은 type 필터 + created_at 정렬, 원문/요약/통계 맵은 조회 조건에 쓰지 않음
+        config.COSMOS_MEETINGS_CONTAINER: _policy(
+            excluded_paths=[
+                "/raw_text/?",
+                "/summary/?",
+                "/summary_preview/?",
+                "/transcript/*",
+                "/participants/*",
+                "/action_items_by_status/*",
+                "/action_items_by_assignee/*",
+            ],
+            composite_indexes=[
+                [("/type", "ascending"), ("/created_at", "descending")],
+            ],
+        ),
+        # 액션 아이템: 필터 + created_at 단일 정렬만 쓰므로 기본 범위 인덱스로 충분
+        # (복합 인덱스는 ORDER BY가 여러 속성일 때만 사용되어 쓰기 RU만 늘림)
+        config.COSMOS_ACTION_ITEMS_CONTAINER: _policy(),
+        # 승인 이력/감사 로그: 변경 내용 본문은 조회 조건에 쓰지 않음
+        config.COSMOS_HISTORY_CONTAINER: _policy(
+            excluded_paths=["/changes/*"],
+        ),
+        config.COSMOS_AUDIT_CONTAINER: _policy(
+            excluded_paths=["/changes/*", "/metadata/*"],
+        ),
+        # 인사정보: 이름 정렬 조회
+        config.COSMOS_STAFF_CONTAINER: _policy(
+            excluded_paths=["/skills/*"],
+        ),
+        # 채팅: 메시지 배열은 세그먼트 포인트 읽기로만 읽고, 인덱스 파티션은 timestamp 정렬
+        config.COSMOS_CHAT_HISTORY_CONTAINER: _policy(
+            excluded_paths=["/messages/*"],
+            composite_indexes=[
+                [("/session_id", "ascending"), ("/timestamp", "descending")],
+            ],
+        ),
+        config.COSMOS_VIEWS_CONTAINER: _POINT_READ_ONLY_POLICY,
+        config.COSMOS_LEASES_CONTAINER: _POINT_READ_ONLY_POLICY,
+    }
+
+
+def _normalize(policy):
+    """비교용으로 정책을 순서와 무관한 형태로 정규화합니다."""
+    policy = policy or {}
+    return {
+        "indexingMode": (policy.get("indexingMode") or "consistent").lower(),
+        "includedPaths": sorted(p["path"] for p in policy.get("includedPaths", [])),
+        "excludedPaths": sorted(
+            set(p["path"] for p in policy.get("excludedPaths", []))
+            | set(_SYSTEM_EXCLUDED_PATHS)
+        ),
+        "compositeIndexes": sorted(
+            tuple((c["path"], c.get("order", "ascending").lower()) for c in composite)
+            for composite in policy.get("compositeIndexes", [])
+        ),
+    }
+
+
+def policy_differences(current_policy, desired_policy):
+    """현재 정책과 선언된 정책의 차이 항목 이름 목록을 반환합니다 (같으면 빈 목록)."""
+    current = _normalize(current_policy)
+    desired = _normalize(desired_policy)
+    return [key for key in desired if current[key] != desired[key]]
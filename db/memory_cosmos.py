@@ -0,0 +1,237 @@
+"""
+인메모리 Cosmos DB 컨테이너 대체 구현
+
+로컬 실행과 테스트에서 Azure 없이 change feed 처리기와 뷰 로직을 돌려볼 수 있도록
+ContainerProxy 중 이 프로젝트가 쓰는 메서드만 같은 시그니처로 흉내 냅니다.
+(read/create/upsert/replace/patch/delete_item, read_feed_ranges, query_items_change_feed)
+"""
+
+import copy
+import json
+import threading
+import time
+import uuid
+
+from azure.core import MatchConditions
+from azure.cosmos import exceptions
+
+
+# 인메모리 컨테이너는 전체 키 범위를 피드 범위 하나로 다룸
+FULL_FEED_RANGE = {
+    "Range": {"isMaxInclusive": False, "isMinInclusive": True, "max": "FF", "min": ""}
+}
+
+
+class InMemoryContainer:
+    """프로세스 메모리에 문서를 저장하는 단일 파티션 키 범위 컨테이너"""
+
+    def __init__(self, container_id, partition_key_path="/id"):
+        self.id = container_id
+        self.partition_key_path = partition_key_path
+        self._items = {}  # (파티션 키, id) → 문서
+        self._lsn = 0
+        self._lock = threading.RLock()
+
+    # 내부 유틸
+    def _partition_key_of(self, body):
+        value = body
+        for segment in self.partition_key_path.strip("/").split("/"):
+            value = value.get(segment) if isinstance(value, dict) else None
+        return value
+
+    def _key(self, item, partition_key):
+        item_id = item["id"] if isinstance(item, dict) else item
+        return (partition_key, item_id)
+
+    def _not_found(self, item_id):
+        return exceptions.CosmosResourceNotFoundError(
+            status_code=404, message=f"Entity with the specified id does not exist: {item_id}"
+        )
+
+    def _check_etag(self, existing, etag, match_condition):
+        if etag and match_condition == MatchConditions.IfNotModified:
+            if existing is None or existing.get("_etag") != etag:
+                raise exceptions.CosmosAccessConditionFailedError(
+                    status_code=412, message="Precondition failed"
+                )
+
+    def _write(self, key, body):
+        self._lsn += 1
+        stored = copy.deepcopy(body)
+        stored["_etag"] = f'"{uuid.uuid4()}"'
+        stored["_lsn"] = self._lsn
+        stored["_ts"] = int(time.time())
+        self._items[key] = stored
+        return copy.deepcopy(stored)
+
+    # ContainerProxy 호환 메서드
+    def read_item(self, item, partition_key, **kwargs):
+        with self._lock:
+            existing = self._items.get(self._key(item, partition_key))
+            if existing is None:
+                raise self._not_found(item)
+            return copy.deepcopy(existing)
+
+    def create_item(self, body, **kwargs):
+        with self._lock:
+            key = (self._partition_key_of(body), body["id"])
+            if key in self._items:
+                raise exceptions.CosmosResourceExistsError(
+                    status_code=409, message=f"Entity with id {body['id']} already exists"
+                )
+            return self._write(key, body)
+
+    def upsert_item(self, body, etag=None, match_condition=None, **kwargs):
+        with self._lock:
+            key = (self._partition_key_of(body), body["id"])
+            existing = self._items.get(key)
+            if existing is not None:
+                self._check_etag(existing, etag, match_condition)
+            return self._write(key, body)
+
+    def replace_item(self, item, body, etag=None, match_condition=None, **kwargs):
+        with self._lock:
+            key = (self._partition_key_of(body), body["id"])
+            existing = self._items.get(key)
+            if existing is None:
+                raise self._not_found(body["id"])
+            self._check_etag(existing, etag, match_condition)
+            return self._write(key, body)
+
+    def patch_item(
+        self,
+        item,
+        partition_key,
+        patch_operations,
+        etag=None,
+        match_condition=None,
+        **kwargs,
+    ):
+        with self._lock:
+            key = self._key(item, partition_key)
+            existing = self._items.get(key)
+            if existing is None:
+                raise self._not_found(item)
+            self._check_etag(existing, etag, match_condition)
+
+            body = copy.deepcopy(existing)
+            for operation in patch_operations:
+                _apply_patch_operation(body, operation)
+            return self._write(key, body)
+
+    def delete_item(self, item, partition_key, **kwargs):
+        with self._lock:
+            key = self._key(item, partition_key)
+            if key not in self._items:
+                raise self._not_found(item)
+            # 실제 change feed(최신 버전 모드)와 같이 삭제는 피드에 나타나지 않습니다
+            del self._items[key]
+
+    def read_all_items(self, **kwargs):
+        with self._lock:
+            return [copy.deepcopy(item) for item in self._items.values()]
+
+    def read_feed_ranges(self, **kwargs):
+        """피드 범위 목록 (인메모리 컨테이너는 범위 하나)"""
+        return [copy.deepcopy(FULL_FEED_RANGE)]
+
+    def query_items_change_feed(
+        self,
+        feed_range=None,
+        start_time=None,
+        continuation=None,
+        max_item_count=None,
+        **kwargs,
+    ):
+        """continuation 이후 변경된 문서의 최신 버전을 LSN 순서로 페이지 단위로 반환합니다.
+
+        continuation은 실제 SDK처럼 피드 범위를 담은 불투명 문자열이며, 없으면
+        start_time="Beginning"일 때 처음부터, 아니면 현재 시점부터 읽습니다.
+        """
+        with self._lock:
+            if continuation is not None:
+                start_lsn = json.loads(continuation)["lsn"]
+            elif start_time == "Beginning":
+                start_lsn = 0
+            else:
+                start_lsn = self._lsn
+        return _ChangeFeedPaged(self, feed_range or FULL_FEED_RANGE, start_lsn, max_item_count)
+
+    def _changes_after(self, lsn, max_item_count):
+        with self._lock:
+            changes = sorted(
+                (item for item in self._items.values() if item["_lsn"] > lsn),
+                key=lambda item: item["_lsn"],
+            )
+            if max_item_count:
+                changes = changes[:max_item_count]
+            return [copy.deepcopy(item) for item in changes]
+
+
+class _ChangeFeedPaged:
+    """ItemPaged처럼 문서 단위 반복과 by_page()를 제공하는 change feed 결과"""
+
+    def __init__(self, container, feed_range, start_lsn, max_item_count):
+        self._container = container
+        self._feed_range = feed_range
+        self._start_lsn = start_lsn
+        self._max_item_count = max_item_count
+
+    def __iter__(self):
+        for page in self.by_page():
+            yield from page
+
+    def by_page(self):
+        return _ChangeFeedPages(self)
+
+
+class _ChangeFeedPages:
+    """페이지 반복자 - 페이지를 읽을 때마다 continuation_token이 그 페이지 다음 위치로 바뀜"""
+
+    def __init__(self, paged):
+        self._paged = paged
+        self._lsn = paged._start_lsn
+        self.continuation_token = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        changes = self._paged._container._changes_after(self._lsn, self._paged._max_item_count)
+        if not changes:
+            raise StopIteration
+        self._lsn = changes[-1]["_lsn"]
+        self.continuation_token = json.dumps(
+            {"feed_range": self._paged._feed_range, "lsn": self._lsn}, sort_keys=True
+        )
+        return iter(changes)
+
+
+def _apply_patch_operation(body, operation):
+    """JSON Pointer 경로에 patch 작업(add/set/replace/remove/incr)을 적용합니다."""
+    segments = [
+        segment.replace("~1", "/").replace("~0", "~")
+        for segment in operation["path"].strip("/").split("/")
+    ]
+    parent = body
+    for segment in segments[:-1]:
+        parent = parent.setdefault(segment, {})
+    leaf = segments[-1]
+
+    op = operation["op"]
+    if op == "add" and leaf == "-" and isinstance(parent, list):
+        parent.append(operation["value"])
+    elif op in ("add", "set"):
+        parent[leaf] = operation["value"]
+    elif op == "replace":
+        if leaf not in parent:
+            raise exceptions.CosmosHttpResponseError(
+                status_code=400, message=f"Path {operation['path']} does not exist"
+            )
+        parent[leaf] = operation["value"]
+    elif op == "remove":
+        parent.pop(leaf, None)
+    elif op == "incr":
+        parent[leaf] = parent.get(leaf, 0) + operation["value"]
+    else:
+        raise ValueError(f"지원하지 않는 patch 작업입니다: {op}")
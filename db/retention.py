@@ -0,0 +1,381 @@
+"""
+감사 로그/승인 이력 보존 관리 - 요약 압축, Blob 보관, 컨테이너 TTL
+
+audit-logs(/resourceId), approval-history(/actionItemId) 컨테이너는 이벤트마다 문서가
+하나씩 쌓입니다. 매일 실행하는 run_retention은 컨테이너별로
+1. 지난 실행 이후 RETENTION_COMPACT_AFTER_DAYS일이 지난 이벤트를 페이지 단위로 읽어
+   JSONL.gz 임시 파일에 스트리밍으로 쓰고 Blob(<접두사>/<컨테이너>/YYYY/MM/DD/...)에 보관한 뒤,
+2. 같은 이벤트를 파티션 키 값별 요약 문서(type = *_summary, ttl = -1)에 누적하고,
+3. 진행 위치(compacted_until)를 views 컨테이너의 retention_state::<컨테이너> 문서에 기록하고,
+4. 만료될 이벤트가 모두 보관된 경우에만 컨테이너 기본 TTL(COSMOS_*_TTL_DAYS)을 적용합니다.
+원본 이벤트는 TTL이 지나면 Cosmos가 삭제하고, 요약 문서와 Blob 보관본만 남습니다.
+
+요약 문서는 compacted_until 이전 범위를 다시 더하지 않고 Blob 이름은 범위로 결정되며
+범위 끝은 UTC 날짜 경계로 내림하므로, 중간에 실패해 같은 날 다시 실행해도 결과가 같습니다. 작업은 한 인스턴스에서만 실행합니다.
+
+일일 실행: python scripts/run_retention.py
+"""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from azure.core import MatchConditions
+from azure.cosmos import exceptions
+
+import config.config as config
+from config.logging_config import log_business_event, log_performance
+from db.cosmos_db import ensure_default_ttl, get_container, get_database
+
+logger = logging.getLogger("retention")
+
+RETENTION_PAGE_SIZE = 200
+SUMMARY_CONFLICT_MAX_RETRIES = 3
+SUMMARY_MAX_ARCHIVES = 30  # 요약 문서에 남길 최근 보관 Blob 이름 수
+STATE_ID_PREFIX = "retention_state::"
+
+# 이벤트 문서에는 type이 없고 요약 문서에만 있으므로 type 유무로 구분
+EVENT_QUERY = (
+    "SELECT * FROM c WHERE NOT IS_DEFINED(c.type) "
+    "AND c.timestamp > @since AND c.timestamp <= @until"
+)
+
+
+def _days_to_ttl(days):
+    """보존 일수를 컨테이너 기본 TTL(초)로 변환합니다 (0 이하면 만료 없음)."""
+    return int(days) * 86400 if days and int(days) > 0 else None
+
+
+def get_retention_targets():
+    """보존 관리 대상 컨테이너 설정을 이름별로 반환합니다."""
+    return {
+        "audit": {
+            "container": config.COSMOS_AUDIT_CONTAINER,
+            "partition_key": "/resourceId",
+            "partition_field": "resourceId",
+            "summary_type": "audit_summary",
+            "count_fields": ("actionType", "resourceType", "userId"),
+            "carry_fields": ("resourceType",),
+            "ttl_days": config.COSMOS_AUDIT_TTL_DAYS,
+        },
+        "history": {
+            "container": config.COSMOS_HISTORY_CONTAINER,
+            "partition_key": "/actionItemId",
+            "partition_field": "actionItemId",
+            "summary_type": "approval_history_summary",
+            "count_fields": ("reviewer",),
+            "carry_fields": ("meetingId",),
+            "ttl_days": config.COSMOS_HISTORY_TTL_DAYS,
+        },
+    }
+
+
+# 요약 문서 구성
+def summary_id(target, partition_value):
+    """파티션 키 값별 요약 문서 ID (Cosmos ID에 쓸 수 없는 문자는 치환)"""
+    safe = "".join("_" if ch in '/\\?#' else ch for ch in str(partition_value))
+    return f"{target['summary_type']}_{safe}"
+
+
+def new_summary(target, partition_value):
+    """빈 요약 문서를 생성합니다 (ttl = -1이라 컨테이너 TTL과 무관하게 유지)."""
+    return {
+        "id": summary_id(target, partition_value),
+        "type": target["summary_type"],
+        target["partition_field"]: partition_value,
+        "event_count": 0,
+        "counts": {field: {} for field in target["count_fields"]},
+        "changed_fields": {},
+        "first_timestamp": None,
+        "last_timestamp": None,
+        "compacted_until": None,
+        "archives": [],
+        "ttl": -1,
+    }
+
+
+def _increment(counter, key, amount=1):
+    counter[key] = counter.get(key, 0) + amount
+
+
+def fold_event(summary, target, event):
+    """이벤트 하나를 요약 문서에 더합니다."""
+    summary["event_count"] += 1
+    for field in target["count_fields"]:
+        value = event.get(field)
+        _increment(summary["counts"].setdefault(field, {}), "-" if value is None else str(value))
+    changes = event.get("changes")
+    if isinstance(changes, dict):
+        for key in changes:
+            _increment(summary["changed_fields"], str(key))
+    for field in target["carry_fields"]:
+        if event.get(field) is not None:
+            summary[field] = event[field]
+
+    timestamp = event.get("timestamp")
+    if timestamp:
+        if not summary["first_timestamp"] or timestamp < summary["first_timestamp"]:
+            summary["first_timestamp"] = timestamp
+        if not summary["last_timestamp"] or timestamp > summary["last_timestamp"]:
+            summary["last_timestamp"] = timestamp
+    return summary
+
+
+def merge_summary(existing, delta, until, archive_blob=None):
+    """기존 요약 문서에 이번 범위의 요약을 더한 새 문서를 반환합니다."""
+    merged = {
+        key: value for key, value in existing.items() if not key.startswith("_")
+    }
+    merged["event_count"] = existing.get("event_count", 0) + delta["event_count"]
+
+    counts = {field: dict(values) for field, values in existing.get("counts", {}).items()}
+    for field, values in delta["counts"].items():
+        for value, count in values.items():
+            _increment(counts.setdefault(field, {}), value, count)
+    merged["counts"] = counts
+
+    changed_fields = dict(existing.get("changed_fields", {}))
+    for key, count in delta["changed_fields"].items():
+        _increment(changed_fields, key, count)
+    merged["changed_fields"] = changed_fields
+
+    for key, value in delta.items():
+        if key not in merged or merged[key] is None:
+            merged[key] = value
+    timestamps = [t for t in (existing.get("first_timestamp"), delta["first_timestamp"]) if t]
+    merged["first_timestamp"] = min(timestamps) if timestamps else None
+    timestamps = [t for t in (existing.get("last_timestamp"), delta["last_timestamp"]) if t]
+    merged["last_timestamp"] = max(timestamps) if timestamps else None
+
+    archives = list(existing.get("archives", []))
+    if archive_blob and archive_blob not in archives:
+        archives.append(archive_blob)
+    merged["archives"] = archives[-SUMMARY_MAX_ARCHIVES:]
+    merged["compacted_until"] = until
+    merged["ttl"] = -1
+    merged["updated_at"] = datetime.utcnow().isoformat()
+    return merged
+
+
+def save_summary(container, target, partition_value, delta, until, archive_blob=None):
+    """요약 문서에 이번 범위를 더합니다 (이미 더한 범위면 건너뛰고 False 반환)."""
+    document_id = summary_id(target, partition_value)
+    for _ in range(SUMMARY_CONFLICT_MAX_RETRIES):
+        try:
+            existing = container.read_item(item=document_id, partition_key=partition_value)
+        except exceptions.CosmosResourceNotFoundError:
+            existing = None
+
+        if existing and (existing.get("compacted_until") or "") >= until:
+            return False
+
+        merged = merge_summary(
+            existing or new_summary(target, partition_value), delta, until, archive_blob
+        )
+        try:
+            if existing:
+                container.replace_item(
+                    item=document_id,
+                    body=merged,
+                    etag=existing["_etag"],
+                    match_condition=MatchConditions.IfNotModified,
+                )
+            else:
+                container.create_item(body=merged)
+            return True
+        except (
+            exceptions.CosmosAccessConditionFailedError,
+            exceptions.CosmosResourceExistsError,
+        ):
+            # 다른 실행이 먼저 갱신함 - 다시 읽고 compacted_until로 중복 여부 판단
+            continue
+    raise RuntimeError(f"요약 문서 갱신 충돌이 반복됩니다: {document_id}")
+
+
+# 진행 위치
+def _state_id(target):
+    return f"{STATE_ID_PREFIX}{target['container']}"
+
+
+def read_state(target, views_container=None):
+    """컨테이너의 보관 진행 위치 문서를 반환합니다 (없으면 빈 문서)."""
+    container = views_container or get_container(config.COSMOS_VIEWS_CONTAINER)
+    try:
+        return container.read_item(item=_state_id(target), partition_key=_state_id(target))
+    except exceptions.CosmosResourceNotFoundError:
+        return {"id": _state_id(target), "type": "retention_state", "compacted_until": None}
+
+
+def _write_state(state, views_container=None):
+    container = views_container or get_container(config.COSMOS_VIEWS_CONTAINER)
+    container.upsert_item(
+        body={key: value for key, value in state.items() if not key.startswith("_")}
+    )
+
+
+# Blob 보관
+def archive_blob_name(target, since, until):
+    """보관 범위로 결정되는 Blob 이름 (같은 범위를 다시 보관하면 덮어씀)"""
+    since_tag = since.replace(":", "-") if since else "start"
+    until_tag = until.replace(":", "-")
+    day = until[:10].replace("-", "/")
+    return (
+        f"{config.RETENTION_ARCHIVE_PREFIX}/{target['container']}/{day}/"
+        f"{since_tag}_{until_tag}.jsonl.gz"
+    )
+
+
+def _archive_record(event):
+    """보관할 이벤트에서 Cosmos 시스템 속성을 제거합니다 (_ts는 유지)."""
+    return {
+        key: value
+        for key, value in event.items()
+        if not key.startswith("_") or key == "_ts"
+    }
+
+
+def compact_container(target, until, container=None, views_container=None, upload=None, dry_run=False):
+    """범위 (compacted_until, until]의 이벤트를 Blob에 보관하고 요약 문서에 누적합니다."""
+    start_time = time.time()
+    container = container or get_container(target["container"])
+    state = read_state(target, views_container)
+    since = state.get("compacted_until") or ""
+    result = {
+        "container": target["container"],
+        "since": since or None,
+        "until": until,
+        "events": 0,
+        "summaries": 0,
+        "archive_blob": None,
+    }
+    if since >= until:
+        return result
+
+    if upload is None:
+        from services.blob_service import upload_to_blob as upload
+
+    deltas = {}
+    handle, path = tempfile.mkstemp(suffix=".jsonl.gz")
+    os.close(handle)
+    try:
+        # 이벤트는 한 페이지씩만 메모리에 두고 바로 압축 파일에 기록
+        with gzip.open(path, "wt", encoding="utf-8") as archive:
+            events = container.query_items(
+                query=EVENT_QUERY,
+                parameters=[
+                    {"name": "@since", "value": since},
+                    {"name": "@until", "value": until},
+                ],
+                enable_cross_partition_query=True,
+                max_item_count=RETENTION_PAGE_SIZE,
+            )
+            for event in events:
+                archive.write(json.dumps(_archive_record(event), ensure_ascii=False) + "\n")
+                result["events"] += 1
+                partition_value = event.get(target["partition_field"])
+                if partition_value is None:
+                    continue
+                delta = deltas.get(partition_value)
+                if delta is None:
+                    delta = deltas[partition_value] = new_summary(target, partition_value)
+                fold_event(delta, target, event)
+
+        if dry_run:
+            result["summaries"] = len(deltas)
+            return result
+
+        # Blob 보관이 끝난 뒤에만 요약/진행 위치를 갱신 (보관 실패 시 다음 실행에서 같은 범위 재시도)
+        if result["events"]:
+            result["archive_blob"] = archive_blob_name(target, since, until)
+            upload(path, result["archive_blob"])
+    finally:
+        os.remove(path)
+
+    for partition_value, delta in deltas.items():
+        if save_summary(
+            container, target, partition_value, delta, until, result["archive_blob"]
+        ):
+            result["summaries"] += 1
+
+    state.update(
+        {
+            "compacted_until": until,
+            "last_run_at": datetime.utcnow().isoformat(),
+            "last_archive_blob": result["archive_blob"] or state.get("last_archive_blob"),
+            "last_event_count": result["events"],
+        }
+    )
+    _write_state(state, views_container)
+
+    duration = time.time() - start_time
+    log_performance(
+        logger,
+        "retention_compaction",
+        duration,
+        f"{target['container']}: {result['events']} events, {result['summaries']} summaries",
+    )
+    log_business_event(
+        logger,
+        "retention_compacted",
+        f"Container '{target['container']}' compacted until {until}: "
+        f"{result['events']} events, archive {result['archive_blob']}",
+    )
+    return result
+
+
+def apply_container_ttl(target, state, now=None):
+    """만료될 이벤트가 모두 보관된 경우에만 컨테이너 기본 TTL을 적용합니다."""
+    default_ttl = _days_to_ttl(target["ttl_days"])
+    if default_ttl is not None:
+        if target["ttl_days"] <= config.RETENTION_COMPACT_AFTER_DAYS:
+            logger.warning(
+                f"컨테이너 '{target['container']}' TTL({target['ttl_days']}일)이 보관 주기"
+                f"({config.RETENTION_COMPACT_AFTER_DAYS}일)보다 짧아 적용하지 않습니다"
+            )
+            return False
+        expires_before = ((now or datetime.utcnow()) - timedelta(days=target["ttl_days"])).isoformat()
+        if (state.get("compacted_until") or "") < expires_before:
+            logger.warning(
+                f"컨테이너 '{target['container']}'에 아직 보관되지 않은 만료 대상 이벤트가 있어 TTL을 적용하지 않습니다"
+            )
+            return False
+
+    container = get_container(target["container"])
+    return ensure_default_ttl(
+        get_database(),
+        target["container"],
+        target["partition_key"],
+        container.read(),
+        default_ttl,
+    )
+
+
+def run_retention(names=None, now=None, dry_run=False):
+    """보존 관리 대상 컨테이너를 압축/보관하고 TTL을 적용합니다 (일일 작업 진입점)."""
+    now = now or datetime.utcnow()
+    # UTC 자정으로 내림해 같은 날 다시 실행해도 같은 범위와 Blob 이름을 사용
+    cutoff = now - timedelta(days=config.RETENTION_COMPACT_AFTER_DAYS)
+    until = datetime.combine(cutoff.date(), datetime.min.time()).isoformat()
+    results = []
+    for name, target in get_retention_targets().items():
+        if names and name not in names:
+            continue
+        if not target["container"]:
+            logger.warning(f"보존 관리 대상 '{name}' 컨테이너가 설정되지 않아 건너뜁니다")
+            continue
+        try:
+            result = compact_container(target, until, dry_run=dry_run)
+            if not dry_run:
+                result["ttl_updated"] = apply_container_ttl(
+                    target, read_state(target), now
+                )
+            result["name"] = name
+            results.append(result)
+        except Exception as e:
+            logger.error(f"'{target['container']}' 보관 작업 실패: {e}")
+            results.append({"name": name, "container": target["container"], "error": str(e)})
+    return results
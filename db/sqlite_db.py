@@ -0,0 +1,1460 @@
+"""
+SQLite 저장소 백엔드
+
+db/cosmos_db.py와 같은 함수 이름/인자/반환 형식을 로컬 SQLite 파일 DB로 구현합니다.
+엣지/단일 노드 배포와 오프라인 성능 작업용이며, STORAGE_BACKEND=sqlite(또는 개발 환경의
+MOCK_AZURE_SERVICES=true)이면 db.storage를 통해 이 모듈이 선택됩니다.
+
+문서는 Cosmos와 같은 JSON 형태로 data 열에 저장하고, 조회 조건에 쓰는 필드
+(meetingId, status, created_at, session_id 등)는 json_extract 생성 열로 꺼내 인덱싱합니다.
+문서 ID/형식을 만드는 순수 로직은 cosmos_db와 같은 db.documents의 함수를 사용하므로 두 백엔드의 데이터 형식이 같고,
+Azure SDK 없이도 이 모듈을 불러올 수 있습니다.
+원문은 Blob 대신 회의 문서에 인라인(raw_text)으로 저장하고, 대시보드 통계는 집계 쿼리로 바로 계산합니다.
+"""
+
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import config.config as config
+from config.logging_config import log_performance, log_business_event
+from db.documents import (
+    DASHBOARD_STATUSES,
+    DUMMY_STAFF_DATA,
+    LEGACY_STANDALONE_PARTITION_KEY,
+    MEETING_COMMITTED_TYPE,
+    MEETING_PENDING_TYPE,
+    STANDALONE_TASK_PREFIX,
+    STAFF_EXPORT_PAGE_SIZE,
+    STAFF_IMPORT_CHUNK_SIZE,
+    UNASSIGNED_MARKERS,
+    _default_chat_summary,
+    _meeting_list_fields,
+    build_action_item_documents,
+    build_dashboard_stats_document,
+    build_staff_document,
+    chat_id_for_session,
+    ingestion_meeting_id,
+    is_standalone_partition_key,  # noqa: F401 - db.storage를 통해 백엔드 공통으로 노출
+    normalize_staff_name,
+    normalize_task_filters,
+    parse_summary,
+    rank_assignee_for_task,
+    standalone_task_partition_key,
+    standalone_task_partition_keys,
+)
+
+# 로깅 설정
+logger = logging.getLogger("sqlite_db")
+
+# 테이블별 생성 열: (열 이름, JSON 경로, 타입)
+_TABLES = {
+    "meetings": [
+        ("type", "$.type", "TEXT"),
+        ("created_at", "$.created_at", "TEXT"),
+    ],
+    "action_items": [
+        ("meeting_id", "$.meetingId", "TEXT"),
+        ("status", "$.status", "TEXT"),
+        ("created_at", "$.created_at", "TEXT"),
+    ],
+    "approval_history": [
+        ("meeting_id", "$.meetingId", "TEXT"),
+        ("action_item_id", "$.actionItemId", "TEXT"),
+        ("timestamp", "$.timestamp", "TEXT"),
+    ],
+    "audit_log": [
+        ("resource_id", "$.resourceId", "TEXT"),
+        ("timestamp", "$.timestamp", "TEXT"),
+    ],
+    "staff": [
+        ("user_id", "$.user_id", "INTEGER"),
+        ("name", "$.name", "TEXT"),
+    ],
+    "chat_history": [
+        ("session_id", "$.session_id", "TEXT"),
+        ("timestamp", "$.timestamp", "TEXT"),
+    ],
+}
+
+# 커밋 전(pending = true) 액션 아이템을 조회/통계에서 제외하는 조건 (cosmos_db.ACTION_ITEM_VISIBLE_CONDITION)
+_ACTION_ITEM_VISIBLE_SQL = "json_extract(data, '$.pending') IS NOT 1"
+
+_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_meetings_type_created ON meetings(type, created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_action_items_meeting ON action_items(meeting_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_action_items_status ON action_items(status)",
+    "CREATE INDEX IF NOT EXISTS ix_action_items_created ON action_items(created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_approval_history_item ON approval_history(action_item_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS ix_audit_log_resource ON audit_log(resource_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS ix_staff_user_id ON staff(user_id)",
+    "CREATE INDEX IF NOT EXISTS ix_staff_name ON staff(name)",
+    "CREATE INDEX IF NOT EXISTS ix_staff_name_key ON staff(name_key)",
+    "CREATE INDEX IF NOT EXISTS ix_chat_history_session ON chat_history(session_id)",
+    "CREATE INDEX IF NOT EXISTS ix_chat_history_timestamp ON chat_history(timestamp DESC, id DESC)",
+]
+
+# 프로세스 전역 연결 하나를 잠금으로 직렬화해 공유 (Streamlit 재실행/FastAPI 스레드풀 공용)
+_lock = threading.RLock()
+_connection = None
+
+
+def get_connection():
+    """공유 SQLite 연결을 반환합니다 (처음 호출 시 파일과 스키마를 만듭니다)."""
+    global _connection
+
+    with _lock:
+        if _connection is not None:
+            return _connection
+
+        directory = os.path.dirname(config.SQLITE_DB_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(
+            config.SQLITE_DB_PATH, check_same_thread=False, isolation_level=None
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=5000")
+        _create_schema(connection)
+        _connection = connection
+        logger.info(f"SQLite 저장소 연결: {config.SQLITE_DB_PATH}")
+        return _connection
+
+
+def close_connection():
+    """공유 연결을 닫습니다 (애플리케이션 종료, 테스트용)."""
+    global _connection
+
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
+
+def _create_schema(connection):
+    for table, columns in _TABLES.items():
+        generated = "".join(
+            f",\n    {name} {kind} GENERATED ALWAYS AS (json_extract(data, '{path}')) VIRTUAL"
+            for name, path, kind in columns
+        )
+        extra = ",\n    name_key TEXT" if table == "staff" else ""
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (\n"
+            f"    id TEXT PRIMARY KEY,\n"
+            f"    data TEXT NOT NULL CHECK (json_valid(data)){extra}{generated}\n)"
+        )
+    # 채팅 메시지는 (세션, 순번) 행으로 저장해 추가 시 기존 메시지를 다시 쓰지 않음
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS chat_messages (\n"
+        "    session_id TEXT NOT NULL,\n"
+        "    seq INTEGER NOT NULL,\n"
+        "    data TEXT NOT NULL,\n"
+        "    PRIMARY KEY (session_id, seq)\n"
+        ") WITHOUT ROWID"
+    )
+    for statement in _INDEXES:
+        connection.execute(statement)
+
+
+@contextmanager
+def _transaction():
+    """쓰기 트랜잭션 (BEGIN IMMEDIATE로 읽기-수정-쓰기를 원자적으로 처리)."""
+    with _lock:
+        connection = get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+
+def _fetch_all(sql, parameters=()):
+    with _lock:
+        return get_connection().execute(sql, parameters).fetchall()
+
+
+def _fetch_one(sql, parameters=()):
+    with _lock:
+        return get_connection().execute(sql, parameters).fetchone()
+
+
+def _dumps(document):
+    return json.dumps(document, ensure_ascii=False, default=str)
+
+
+def _documents(rows):
+    return [json.loads(row["data"]) for row in rows]
+
+
+def _read_document(table, item_id, connection=None):
+    sql = f"SELECT data FROM {table} WHERE id = ?"
+    row = (
+        connection.execute(sql, (item_id,)).fetchone()
+        if connection is not None
+        else _fetch_one(sql, (item_id,))
+    )
+    return json.loads(row["data"]) if row else None
+
+
+def _write_document(connection, table, document, create=False):
+    """문서를 저장합니다 (create=True면 같은 ID가 있을 때 실패)."""
+    verb = "INSERT" if create else "INSERT OR REPLACE"
+    if table == "staff":
+        connection.execute(
+            f"{verb} INTO staff (id, data, name_key) VALUES (?, ?, ?)",
+            (document["id"], _dumps(document), normalize_staff_name(document.get("name"))),
+        )
+    else:
+        connection.execute(
+            f"{verb} INTO {table} (id, data) VALUES (?, ?)",
+            (document["id"], _dumps(document)),
+        )
+
+
+# 커서 기반 페이지 조회
+# 커서는 마지막 행의 (정렬 키, id)를 JSON으로 담은 문자열이며, 다음 페이지는 인덱스 범위 탐색으로 읽습니다.
+def _keyset_page(table, select, where, parameters, sort_column, limit, continuation_token):
+    """sort_column DESC, id DESC 순으로 한 페이지와 다음 페이지 커서를 반환합니다."""
+    conditions = list(where)
+    parameters = list(parameters)
+    if continuation_token:
+        last_sort, last_id = json.loads(continuation_token)
+        conditions.append(f"({sort_column}, id) < (?, ?)")
+        parameters.extend([last_sort, last_id])
+
+    sql = f"SELECT {select}, {sort_column} AS _sort, id AS _id FROM {table}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" ORDER BY {sort_column} DESC, id DESC LIMIT ?"
+    rows = _fetch_all(sql, parameters + [limit + 1])
+
+    next_token = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_token = json.dumps([rows[-1]["_sort"], rows[-1]["_id"]])
+    return rows, next_token
+
+
+def init_cosmos():
+    """저장소를 초기화합니다 (cosmos_db.init_cosmos와 같은 이름, SQLite 파일과 스키마 생성)."""
+    start_time = time.time()
+    get_connection()
+    log_performance(logger, "init_sqlite", time.time() - start_time, config.SQLITE_DB_PATH)
+
+
+def get_client_pool_stats():
+    """저장소 연결 정보를 반환합니다."""
+    with _lock:
+        return {
+            "backend": "sqlite",
+            "path": config.SQLITE_DB_PATH,
+            "connected": _connection is not None,
+        }
+
+
+def get_staff_cache_stats():
+    """인사정보 캐시 현황 (SQLite는 인덱스 조회라 캐시를 쓰지 않음)."""
+    return {"backend": "sqlite", "cached_staff": 0}
+
+
+def invalidate_staff_cache():
+    """cosmos_db와의 호환용 (캐시 없음)."""
+
+
+# 회의
+def _meeting_document(meeting_id, meeting_title, raw_text, summary_json):
+    """저장할 pending 회의 문서와 파싱된 요약을 만듭니다 (원문은 인라인 저장)."""
+    summary_dict = parse_summary(summary_json)
+    meeting_item = {
+        "id": meeting_id,
+        "title": meeting_title,
+        "raw_text": raw_text or "",
+        "summary": summary_json,
+        "created_at": datetime.utcnow().isoformat(),
+        "type": MEETING_PENDING_TYPE,
+        **_meeting_list_fields(summary_dict),
+    }
+    return meeting_item, summary_dict
+
+
+def save_meeting(meeting_title, raw_text, summary_json, idempotency_key=None, meeting_id=None):
+    """회의 정보를 멱등하게 저장합니다 (cosmos_db.save_meeting과 같은 pending → 커밋 순서).
+
+    액션 아이템은 회의 커밋과 같은 트랜잭션으로 써서 커밋 전 회의의 아이템이 조회되지 않습니다.
+    """
+    start_time = time.time()
+    try:
+        meeting_item, summary_dict = _meeting_document(
+            meeting_id or ingestion_meeting_id(raw_text, idempotency_key),
+            meeting_title,
+            raw_text,
+            summary_json,
+        )
+        meeting_id = meeting_item["id"]
+        try:
+            with _transaction() as connection:
+                _write_document(connection, "meetings", meeting_item, create=True)
+        except sqlite3.IntegrityError:
+            existing = _read_document("meetings", meeting_id)
+            if existing.get("type") != MEETING_PENDING_TYPE:
+                log_business_event(
+                    logger,
+                    "meeting_save_deduplicated",
+                    f"이미 저장된 회의 재요청: {meeting_id}",
+                    meeting_id=meeting_id,
+                )
+                return meeting_id
+            # 이전 시도가 중간에 실패했거나 동시에 진행 중: 먼저 저장된 요약 기준으로 이어서 처리
+            summary_dict = parse_summary(existing.get("summary"))
+
+        action_items = summary_dict.get("actionItems") or []
+        action_items_count = len(action_items)
+        # 담당자 추천(외부 호출)은 트랜잭션 밖에서 끝냄
+        documents = build_action_item_documents(meeting_id, action_items)
+
+        with _transaction() as connection:
+            for document in documents:
+                _write_document(connection, "action_items", document)
+            connection.execute(
+                "UPDATE meetings SET data = json_set(data, '$.type', ?, '$.committed_at', ?) "
+                "WHERE id = ? AND type = ?",
+                (
+                    MEETING_COMMITTED_TYPE,
+                    datetime.utcnow().isoformat(),
+                    meeting_id,
+                    MEETING_PENDING_TYPE,
+                ),
+            )
+
+        log_performance(
+            logger,
+            "save_meeting",
+            time.time() - start_time,
+            f"Meeting: {meeting_id}, Actions: {action_items_count}",
+        )
+        log_business_event(
+            logger,
+            "meeting_saved",
+            f"Meeting '{meeting_title}' saved with {action_items_count} action items",
+            meeting_id=meeting_id,
+        )
+        return meeting_id
+
+    except Exception as e:
+        logger.error(f"회의 저장 실패: {e}")
+        raise
+
+
+def save_action_items(meeting_id, action_items, pending=False):
+    """액션 아이템을 한 트랜잭션으로 upsert합니다 (반환 형식은 cosmos_db.bulk_write_items와 같음).
+
+    pending이면 cosmos_db와 같이 pending = true로 써서 업무 조회/통계에서 제외합니다.
+    """
+    try:
+        documents = [
+            {**document, "pending": True} if pending else document
+            for document in build_action_item_documents(meeting_id, action_items)
+        ]
+        with _transaction() as connection:
+            for document in documents:
+                _write_document(connection, "action_items", document)
+
+        return {
+            "results": [
+                {
+                    "id": document["id"],
+                    "partition_key": meeting_id,
+                    "operation": "upsert",
+                    "status_code": 200,
+                    "request_charge": 0.0,
+                    "success": True,
+                    "error": None,
+                }
+                for document in documents
+            ],
+            "request_charge": 0.0,
+            "succeeded": len(documents),
+            "failed": 0,
+        }
+
+    except Exception as e:
+        logger.error(f"액션 아이템 저장 실패: {e}")
+        raise
+
+
+def _title_filter(title_contains):
+    if not title_contains:
+        return [], []
+    return (
+        ["instr(lower(json_extract(data, '$.title')), lower(?)) > 0"],
+        [title_contains],
+    )
+
+
+def get_meetings_page(limit=20, continuation_token=None, title_contains=None):
+    """회의 목록을 최신순으로 한 페이지씩 조회합니다."""
+    try:
+        where, parameters = _title_filter(title_contains)
+        rows, next_token = _keyset_page(
+            "meetings",
+            "data",
+            ["type = 'meeting'"] + where,
+            parameters,
+            "created_at",
+            limit,
+            continuation_token,
+        )
+        return _documents(rows), next_token
+    except Exception as e:
+        logger.error(f"회의 목록 페이지 조회 실패: {e}")
+        return [], None
+
+
+def get_meetings(top=100):
+    """최근 회의 목록을 최대 top개 조회합니다."""
+    items, _ = get_meetings_page(limit=top)
+    return items
+
+
+# 목록 화면용 투영 조회 (원문/전체 요약 JSON은 파싱하지 않음)
+_MEETING_SUMMARY_SELECT = (
+    "id, json_extract(data, '$.title') AS title, created_at, "
+    "json_extract(data, '$.participants') AS participants, "
+    "json_extract(data, '$.summary_preview') AS summary_preview"
+)
+
+
+def _meeting_summary(row):
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "created_at": row["created_at"],
+        "participants": json.loads(row["participants"]) if row["participants"] else [],
+        "summary_preview": row["summary_preview"],
+    }
+
+
+def get_action_item_counts(meeting_ids):
+    """회의별 액션 아이템 개수(전체/완료)를 한 번의 집계 쿼리로 조회합니다."""
+    counts = {
+        meeting_id: {"total": 0, "completed": 0} for meeting_id in meeting_ids
+    }
+    if not counts:
+        return counts
+
+    try:
+        placeholders = ", ".join("?" for _ in counts)
+        rows = _fetch_all(
+            "SELECT meeting_id, COUNT(*) AS total, "
+            "SUM(CASE WHEN status = '완료' THEN 1 ELSE 0 END) AS completed "
+            f"FROM action_items WHERE meeting_id IN ({placeholders}) "
+            f"AND {_ACTION_ITEM_VISIBLE_SQL} GROUP BY meeting_id",
+            list(counts),
+        )
+        for row in rows:
+            counts[row["meeting_id"]] = {
+                "total": row["total"],
+                "completed": row["completed"] or 0,
+            }
+    except Exception as e:
+        logger.error(f"회의별 액션 아이템 개수 조회 실패: {e}")
+
+    return counts
+
+
+def get_meeting_titles(meeting_ids):
+    """회의 ID 목록의 제목을 한 번의 쿼리로 조회합니다 ({회의 ID: 제목}, 없는 회의는 제외)."""
+    meeting_ids = sorted({meeting_id for meeting_id in meeting_ids if meeting_id})
+    if not meeting_ids:
+        return {}
+
+    try:
+        placeholders = ", ".join("?" for _ in meeting_ids)
+        rows = _fetch_all(
+            "SELECT id, json_extract(data, '$.title') AS title FROM meetings "
+            f"WHERE id IN ({placeholders})",
+            meeting_ids,
+        )
+        return {row["id"]: row["title"] or "Unknown" for row in rows}
+    except Exception as e:
+        logger.error(f"회의 제목 조회 실패: {e}")
+        return {}
+
+
+def _with_action_item_counts(meetings):
+    counts = get_action_item_counts([m["id"] for m in meetings if m.get("id")])
+    for meeting in meetings:
+        meeting_counts = counts.get(meeting.get("id"), {"total": 0, "completed": 0})
+        meeting["action_items_count"] = meeting_counts["total"]
+        meeting["completed_action_items_count"] = meeting_counts["completed"]
+    return meetings
+
+
+def get_meeting_summaries_page(limit=20, continuation_token=None, title_contains=None):
+    """회의 요약 목록(액션 아이템 개수 포함)을 한 페이지씩 조회합니다."""
+    try:
+        where, parameters = _title_filter(title_contains)
+        rows, next_token = _keyset_page(
+            "meetings",
+            _MEETING_SUMMARY_SELECT,
+            ["type = 'meeting'"] + where,
+            parameters,
+            "created_at",
+            limit,
+            continuation_token,
+        )
+        return _with_action_item_counts([_meeting_summary(r) for r in rows]), next_token
+    except Exception as e:
+        logger.error(f"회의 요약 목록 페이지 조회 실패: {e}")
+        return [], None
+
+
+def get_meeting_summaries(top=100, with_counts=False):
+    """최근 회의 요약 목록을 최대 top개 조회합니다."""
+    try:
+        rows = _fetch_all(
+            f"SELECT {_MEETING_SUMMARY_SELECT} FROM meetings WHERE type = 'meeting' "
+            "ORDER BY created_at DESC, id DESC LIMIT ?",
+            (top,),
+        )
+        items = [_meeting_summary(row) for row in rows]
+        return _with_action_item_counts(items) if with_counts else items
+    except Exception as e:
+        logger.error(f"회의 요약 목록 조회 실패: {e}")
+        return []
+
+
+def get_recent_meetings(limit=5):
+    """최근 회의 요약 목록을 액션 아이템 개수와 함께 limit개만 조회합니다."""
+    return get_meeting_summaries(top=limit, with_counts=True)
+
+
+def get_meeting(meeting_id):
+    """특정 회의 정보를 조회합니다."""
+    try:
+        meeting = _read_document("meetings", meeting_id)
+        if meeting is None:
+            logger.warning(f"회의 ID {meeting_id} 조회 실패: 문서 없음")
+        return meeting
+    except Exception as e:
+        logger.error(f"회의 조회 실패: {e}")
+        raise
+
+
+def update_meeting(meeting_id, updates):
+    """회의 정보를 업데이트합니다."""
+    try:
+        with _transaction() as connection:
+            meeting = _read_document("meetings", meeting_id, connection)
+            if meeting is None:
+                logger.error(f"회의 ID {meeting_id}를 찾을 수 없습니다.")
+                raise ValueError(f"회의 ID {meeting_id}를 찾을 수 없습니다.")
+
+            meeting.update(updates)
+            if "raw_text" in updates:
+                meeting.pop("transcript", None)
+
+            # 요약이 바뀌면 목록용 필드도 갱신
+            if "summary" in updates:
+                summary = updates["summary"]
+                if isinstance(summary, str):
+                    try:
+                        summary = json.loads(summary)
+                    except (json.JSONDecodeError, TypeError):
+                        summary = {}
+                meeting.update(_meeting_list_fields(summary))
+
+            meeting["updated_at"] = datetime.utcnow().isoformat()
+            _write_document(connection, "meetings", meeting)
+
+        logger.info(f"회의 업데이트 완료: {meeting_id}")
+        return meeting
+
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"회의 업데이트 실패: {e}")
+        raise
+
+
+# 액션 아이템
+def get_action_items(meeting_id, include_pending=False):
+    """특정 회의의 액션 아이템을 조회합니다 (include_pending이면 pending 항목 포함)."""
+    try:
+        visible = "" if include_pending else f" AND {_ACTION_ITEM_VISIBLE_SQL}"
+        return _documents(
+            _fetch_all(
+                f"SELECT data FROM action_items WHERE meeting_id = ?{visible} "
+                "ORDER BY created_at, id",
+                (meeting_id,),
+            )
+        )
+    except Exception as e:
+        logger.error(f"액션 아이템 조회 실패: {e}")
+        return []
+
+
+def get_all_action_items():
+    """모든 액션 아이템을 조회합니다."""
+    try:
+        return _documents(
+            _fetch_all(
+                f"SELECT data FROM action_items WHERE {_ACTION_ITEM_VISIBLE_SQL} "
+                "ORDER BY created_at DESC, id DESC"
+            )
+        )
+    except Exception as e:
+        logger.error(f"모든 액션 아이템 조회 실패: {e}")
+        return []
+
+
+def get_action_items_page(limit=50, continuation_token=None):
+    """모든 액션 아이템을 최신순으로 한 페이지씩 조회합니다."""
+    try:
+        rows, next_token = _keyset_page(
+            "action_items",
+            "data",
+            [_ACTION_ITEM_VISIBLE_SQL],
+            [],
+            "created_at",
+            limit,
+            continuation_token,
+        )
+        return _documents(rows), next_token
+    except Exception as e:
+        logger.error(f"액션 아이템 페이지 조회 실패: {e}")
+        return [], None
+
+
+# 업무 조건 조회 (필터 키는 cosmos_db.query_action_items와 같음)
+_TASK_ASSIGNEE_SQL = (
+    "COALESCE(NULLIF(json_extract(data, '$.finalAssigneeId'), ''), "
+    "json_extract(data, '$.recommendedAssigneeId'))"
+)
+
+
+def _action_item_conditions(filters):
+    """업무 필터를 (WHERE 조건 목록, 파라미터 목록)으로 변환합니다."""
+    filters = normalize_task_filters(filters)
+    conditions = [_ACTION_ITEM_VISIBLE_SQL]
+    parameters = []
+
+    def placeholders(values):
+        values = list(values) if isinstance(values, (list, tuple, set)) else [values]
+        parameters.extend(values)
+        return ", ".join("?" for _ in values)
+
+    if "status" in filters:
+        conditions.append(f"status IN ({placeholders(filters['status'])})")
+    if "exclude_status" in filters:
+        conditions.append(f"status NOT IN ({placeholders(filters['exclude_status'])})")
+    if "assignee" in filters:
+        conditions.append(f"{_TASK_ASSIGNEE_SQL} = ?")
+        parameters.append(filters["assignee"])
+    if filters.get("unassigned"):
+        conditions.append(
+            f"({_TASK_ASSIGNEE_SQL} IS NULL OR lower(trim({_TASK_ASSIGNEE_SQL})) "
+            f"IN ({placeholders(sorted(UNASSIGNED_MARKERS))}))"
+        )
+    if "due_from" in filters or "due_to" in filters:
+        conditions.append("json_extract(data, '$.dueDate') != ''")
+        if "due_from" in filters:
+            conditions.append("json_extract(data, '$.dueDate') >= ?")
+            parameters.append(filters["due_from"])
+        if "due_to" in filters:
+            conditions.append("json_extract(data, '$.dueDate') <= ?")
+            parameters.append(filters["due_to"])
+    if "approved" in filters:
+        conditions.append("json_extract(data, '$.approved') = ?")
+        parameters.append(1 if filters["approved"] else 0)
+    if "meeting_id" in filters:
+        conditions.append("meeting_id = ?")
+        parameters.append(filters["meeting_id"])
+    if "text" in filters:
+        matches = " OR ".join(
+            "instr(lower(json_extract(data, '$.description')), lower(?)) > 0"
+            for _ in filters["text"]
+        )
+        conditions.append(f"({matches})")
+        parameters.extend(filters["text"])
+    return conditions, parameters
+
+
+def query_action_items(filters=None, limit=50, continuation_token=None):
+    """조건에 맞는 업무를 최신순으로 한 페이지씩 조회합니다 (반환: (items, continuation_token))."""
+    conditions, parameters = _action_item_conditions(filters)
+    try:
+        rows, next_token = _keyset_page(
+            "action_items",
+            "data",
+            conditions,
+            parameters,
+            "created_at",
+            limit,
+            continuation_token,
+        )
+        return _documents(rows), next_token
+    except Exception as e:
+        logger.error(f"업무 조건 조회 실패: {e}")
+        return [], None
+
+
+def count_action_items(filters=None):
+    """조건에 맞는 업무 개수를 셉니다."""
+    conditions, parameters = _action_item_conditions(filters)
+    sql = "SELECT COUNT(*) AS total FROM action_items"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    try:
+        return _fetch_one(sql, parameters)["total"]
+    except Exception as e:
+        logger.error(f"업무 개수 조회 실패: {e}")
+        return 0
+
+
+def get_standalone_action_items(months=3, until=None, include_legacy=True):
+    """최근 months개월의 독립 작업을 조회합니다 (cosmos_db와 같은 월·샤드 파티션 키 범위)."""
+    try:
+        partition_keys = standalone_task_partition_keys(months, until)
+        if include_legacy:
+            partition_keys.append(LEGACY_STANDALONE_PARTITION_KEY)
+
+        placeholders = ", ".join("?" for _ in partition_keys)
+        return _documents(
+            _fetch_all(
+                f"SELECT data FROM action_items WHERE meeting_id IN ({placeholders}) "
+                "ORDER BY created_at DESC, id DESC",
+                partition_keys,
+            )
+        )
+    except Exception as e:
+        logger.error(f"독립 작업 조회 실패: {e}")
+        return []
+
+
+def _update_action_item_document(item_id, meeting_id, updates):
+    """트랜잭션 안에서 액션 아이템을 읽고 필드를 갱신합니다 (없으면 None)."""
+    with _transaction() as connection:
+        row = connection.execute(
+            "SELECT data FROM action_items WHERE id = ? AND meeting_id = ?",
+            (item_id, meeting_id),
+        ).fetchone()
+        if row is None:
+            return None
+        item = {**json.loads(row["data"]), **updates}
+        item["updated_at"] = datetime.utcnow().isoformat()
+        _write_document(connection, "action_items", item)
+        return item
+
+
+def update_action_item(item_id, meeting_id, updates, current=None):
+    """액션 아이템을 수정합니다.
+
+    current는 cosmos_db와 인자를 맞추기 위한 것으로, 트랜잭션 안에서 다시 읽어 갱신합니다.
+    """
+    try:
+        result = _update_action_item_document(item_id, meeting_id, updates)
+        if result is None:
+            raise ValueError(f"액션 아이템 ID {item_id}를 찾을 수 없습니다.")
+        return result
+    except Exception as e:
+        logger.error(f"액션 아이템 수정 실패: {e}")
+        raise
+
+
+def approve_action_item(item_id, meeting_id, final_assignee_id, reviewer_name=None, current=None):
+    """액션 아이템을 승인하고 담당자를 할당합니다."""
+    try:
+        update_result = update_action_item(
+            item_id,
+            meeting_id,
+            {
+                "finalAssigneeId": final_assignee_id,
+                "approved": True,
+                "status": "진행중",
+            },
+        )
+
+        if reviewer_name:
+            save_approval_history(
+                meeting_id=meeting_id,
+                action_item_id=item_id,
+                reviewer=reviewer_name,
+                changes={"finalAssigneeId": final_assignee_id, "approved": True},
+            )
+
+        return update_result
+    except Exception as e:
+        logger.error(f"액션 아이템 승인 실패: {e}")
+        raise
+
+
+def delete_action_item(item_id, meeting_id):
+    """액션 아이템을 삭제합니다 (통계는 조회 시 다시 집계되어 따로 갱신하지 않음)."""
+    with _transaction() as connection:
+        row = connection.execute(
+            "SELECT data FROM action_items WHERE id = ? AND meeting_id = ?",
+            (item_id, meeting_id),
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"액션 아이템 ID {item_id}를 찾을 수 없습니다.")
+        connection.execute("DELETE FROM action_items WHERE id = ?", (item_id,))
+    logger.info(f"액션 아이템 삭제: {item_id}")
+    return json.loads(row["data"])
+
+
+def update_action_item_status(item_id, meeting_id, status, current=None):
+    """액션 아이템의 상태를 업데이트합니다."""
+    return update_action_item(item_id, meeting_id, {"status": status})
+
+
+def add_new_action_item(
+    task_description, assignee_name=None, due_date=None, meeting_id=None
+):
+    """새로운 액션 아이템을 추가합니다."""
+    try:
+        created_at = datetime.utcnow().isoformat()
+        if meeting_id:
+            item_id = f"item_{meeting_id}_{uuid.uuid4().hex[:8]}"
+        else:
+            item_id = f"item_{STANDALONE_TASK_PREFIX}_{uuid.uuid4().hex[:8]}"
+            meeting_id = standalone_task_partition_key(item_id, created_at)
+
+        if not assignee_name and task_description:
+            recommended_staff = recommend_assignee_for_task(task_description)
+            assignee_name = (
+                recommended_staff.get("name", "미할당") if recommended_staff else "미할당"
+            )
+
+        if not due_date:
+            due_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+
+        action_item = {
+            "id": item_id,
+            "meetingId": meeting_id,
+            "description": task_description,
+            "recommendedAssigneeId": assignee_name,
+            "dueDate": due_date,
+            "finalAssigneeId": assignee_name,  # 바로 할당
+            "approved": True,  # 직접 추가된 것은 바로 승인
+            "status": "미시작",
+            "created_at": created_at,
+            "priority": "보통",
+            "type": "standalone",  # 독립 작업 표시
+        }
+        with _transaction() as connection:
+            _write_document(connection, "action_items", action_item, create=True)
+
+        log_business_event(
+            logger,
+            "action_item_added",
+            f"새로운 작업 추가: {task_description[:50]} (ID: {item_id})",
+        )
+        print(f"✅ 새로운 액션 아이템 추가 완료: {item_id}")
+        return item_id
+
+    except Exception as e:
+        logger.error(f"새로운 액션 아이템 추가 실패: {e}")
+        print(f"❌ 새로운 액션 아이템 추가 실패: {e}")
+        return None
+
+
+def update_action_item_assignee(
+    item_id: str, meeting_id: str, assignee_name: str
+) -> bool:
+    """액션 아이템의 담당자 업데이트"""
+    try:
+        item = _update_action_item_document(
+            item_id,
+            meeting_id,
+            {
+                "recommendedAssigneeId": assignee_name,
+                "finalAssigneeId": assignee_name,
+                "approved": True,
+            },
+        )
+        if item is None:
+            print(f"❌ 액션 아이템을 찾을 수 없습니다: {item_id}")
+            return False
+
+        log_business_event(
+            logger,
+            "assignee_updated",
+            f"담당자 변경: {item.get('description', 'N/A')[:30]} → {assignee_name} (ID: {item_id})",
+        )
+        print(f"✅ 담당자 업데이트 완료: {item_id} → {assignee_name}")
+        return True
+
+    except Exception as e:
+        logger.error(f"담당자 업데이트 실패: {e}")
+        print(f"❌ 담당자 업데이트 실패: {e}")
+        return False
+
+
+# 대시보드 통계 (통계 문서 대신 인덱스 집계 쿼리로 바로 계산)
+def rebuild_dashboard_stats():
+    """대시보드 통계를 집계합니다 (반환 형식은 cosmos_db의 통계 문서와 같음)."""
+    start_time = time.time()
+    total_meetings = _fetch_one(
+        "SELECT COUNT(*) AS total FROM meetings WHERE type = 'meeting'"
+    )["total"]
+    rows = _fetch_all(
+        "SELECT COALESCE(status, '미시작') AS status, "
+        "COALESCE(json_extract(data, '$.finalAssigneeId'), "
+        "json_extract(data, '$.recommendedAssigneeId')) AS assignee, "
+        f"COUNT(*) AS count FROM action_items WHERE {_ACTION_ITEM_VISIBLE_SQL} GROUP BY 1, 2"
+    )
+
+    action_items_by_status = {status: 0 for status in DASHBOARD_STATUSES}
+    action_items_by_assignee = {}
+    for row in rows:
+        action_items_by_status[row["status"]] = (
+            action_items_by_status.get(row["status"], 0) + row["count"]
+        )
+        if row["assignee"]:
+            assignee = str(row["assignee"])
+            action_items_by_assignee[assignee] = (
+                action_items_by_assignee.get(assignee, 0) + row["count"]
+            )
+
+    log_performance(logger, "compute_dashboard_stats", time.time() - start_time)
+    return build_dashboard_stats_document(
+        {
+            "total_meetings": total_meetings,
+            "action_items_by_status": action_items_by_status,
+            "action_items_by_assignee": action_items_by_assignee,
+        }
+    )
+
+
+def get_dashboard_stats(refresh=False):
+    """대시보드 통계를 반환합니다."""
+    return rebuild_dashboard_stats()
+
+
+# 이력
+def save_approval_history(meeting_id, action_item_id, reviewer, changes):
+    """승인 이력을 저장합니다."""
+    try:
+        timestamp = datetime.utcnow().isoformat()
+        history_id = f"history_{action_item_id}_{timestamp.replace(':', '-')}"
+        with _transaction() as connection:
+            _write_document(
+                connection,
+                "approval_history",
+                {
+                    "id": history_id,
+                    "meetingId": meeting_id,
+                    "actionItemId": action_item_id,
+                    "reviewer": reviewer,
+                    "changes": changes,
+                    "timestamp": timestamp,
+                },
+                create=True,
+            )
+        return history_id
+    except Exception as e:
+        logger.error(f"승인 이력 저장 실패: {e}")
+        raise
+
+
+def save_audit_log(
+    user_id, action_type, resource_id, resource_type, changes, metadata=None
+):
+    """감사 로그를 저장합니다."""
+    try:
+        timestamp = datetime.utcnow().isoformat()
+        log_id = f"audit_{resource_type}_{resource_id}_{timestamp.replace(':', '-')}"
+        with _transaction() as connection:
+            _write_document(
+                connection,
+                "audit_log",
+                {
+                    "id": log_id,
+                    "userId": user_id,
+                    "actionType": action_type,
+                    "resourceId": resource_id,
+                    "resourceType": resource_type,
+                    "changes": changes,
+                    "metadata": metadata or {},
+                    "timestamp": timestamp,
+                },
+                create=True,
+            )
+        return log_id
+    except Exception as e:
+        logger.error(f"감사 로그 저장 실패: {e}")
+        raise
+
+
+def apply_json_modification(
+    action_item_id, meeting_id, original_json, mod_request, reviewer_name=None
+):
+    """액션 아이템을 자연어 요청에 따라 수정합니다."""
+    from services.openai_service import (
+        apply_json_modification as ai_apply_json_modification,
+    )
+
+    try:
+        modified = ai_apply_json_modification(original_json, mod_request)
+        original = (
+            json.loads(original_json)
+            if isinstance(original_json, str)
+            else original_json
+        )
+        changes = {
+            key: value
+            for key, value in modified.items()
+            if key in original and original[key] != value
+        }
+
+        update_action_item(action_item_id, meeting_id, changes)
+        if reviewer_name and changes:
+            save_approval_history(
+                meeting_id=meeting_id,
+                action_item_id=action_item_id,
+                reviewer=reviewer_name,
+                changes=changes,
+            )
+        return modified
+    except Exception as e:
+        logger.error(f"액션 아이템 수정 실패: {e}")
+        raise
+
+
+# 인사정보
+def init_staff_data():
+    """더미 인사정보 초기화"""
+    try:
+        if _fetch_one("SELECT 1 FROM staff LIMIT 1"):
+            print("📋 인사정보가 이미 존재합니다.")
+            return
+
+        now = datetime.now().isoformat()
+        with _transaction() as connection:
+            for staff in DUMMY_STAFF_DATA:
+                _write_document(
+                    connection,
+                    "staff",
+                    {**staff, "created_at": now, "updated_at": now, "type": "staff"},
+                    create=True,
+                )
+        print(f"✅ 더미 인사정보 초기화 완료: {len(DUMMY_STAFF_DATA)}명")
+
+    except Exception as e:
+        print(f"❌ 인사정보 초기화 오류: {str(e)}")
+
+
+def get_all_staff():
+    """모든 인사정보 조회"""
+    try:
+        return _documents(_fetch_all("SELECT data FROM staff ORDER BY name"))
+    except Exception as e:
+        print(f"❌ 인사정보 조회 오류: {str(e)}")
+        return []
+
+
+def get_staff_by_id(staff_id):
+    """ID로 특정 인사정보 조회"""
+    try:
+        return _read_document("staff", staff_id)
+    except Exception as e:
+        print(f"❌ 인사정보 조회 오류: {str(e)}")
+        return None
+
+
+def get_staff_by_user_id(user_id):
+    """user_id로 특정 인사정보 조회"""
+    try:
+        rows = _fetch_all(
+            "SELECT data FROM staff WHERE user_id = ? OR CAST(user_id AS TEXT) = ? LIMIT 1",
+            (user_id, str(user_id)),
+        )
+        return _documents(rows)[0] if rows else None
+    except Exception as e:
+        print(f"❌ 인사정보 조회 오류: {str(e)}")
+        return None
+
+
+def find_staff_by_name(name):
+    """이름으로 직원 찾기"""
+    try:
+        rows = _fetch_all(
+            "SELECT data FROM staff WHERE name_key = ? ORDER BY name LIMIT 1",
+            (normalize_staff_name(name),),
+        )
+        return _documents(rows)[0] if rows else None
+    except Exception as e:
+        print(f"❌ 직원 검색 오류: {str(e)}")
+        return None
+
+
+def update_staff(staff_id, updates):
+    """인사정보 업데이트"""
+    try:
+        with _transaction() as connection:
+            staff = _read_document("staff", staff_id, connection)
+            if not staff:
+                print(f"❌ 인사정보 ID {staff_id}를 찾을 수 없습니다.")
+                return False
+            staff.update(updates)
+            staff["updated_at"] = datetime.now().isoformat()
+            _write_document(connection, "staff", staff)
+
+        print(f"✅ 인사정보 {staff_id} 업데이트 완료")
+        return True
+
+    except Exception as e:
+        print(f"❌ 인사정보 업데이트 오류: {str(e)}")
+        return False
+
+
+def add_staff(staff_data):
+    """새로운 인사정보 추가"""
+    try:
+        with _transaction() as connection:
+            # 트랜잭션 안에서 최대 user_id를 읽어 동시 추가에도 번호가 겹치지 않음
+            max_user_id = connection.execute(
+                "SELECT COALESCE(MAX(user_id), 0) AS max_user_id FROM staff"
+            ).fetchone()["max_user_id"]
+            new_staff = {
+                "id": f"staff_{max_user_id + 1}",
+                "user_id": max_user_id + 1,
+                "name": staff_data.get("name", ""),
+                "department": staff_data.get("department", ""),
+                "position": staff_data.get("position", ""),
+                "email": staff_data.get("email", ""),
+                "skills": staff_data.get("skills", []),
+                "created_at": datetime.now().isoformat(),
+                "updated_at": datetime.now().isoformat(),
+                "type": "staff",
+            }
+            _write_document(connection, "staff", new_staff, create=True)
+
+        print(f"✅ 새로운 인사정보 추가 완료: {new_staff['name']}")
+        return new_staff["id"]
+
+    except Exception as e:
+        print(f"❌ 인사정보 추가 오류: {str(e)}")
+        return None
+
+
+def delete_staff(staff_id):
+    """인사정보 삭제"""
+    try:
+        with _transaction() as connection:
+            deleted = connection.execute(
+                "DELETE FROM staff WHERE id = ?", (staff_id,)
+            ).rowcount
+        if not deleted:
+            print(f"❌ 인사정보 ID {staff_id}를 찾을 수 없습니다.")
+            return False
+
+        print(f"✅ 인사정보 {staff_id} 삭제 완료")
+        return True
+
+    except Exception as e:
+        print(f"❌ 인사정보 삭제 오류: {str(e)}")
+        return False
+
+
+def import_staff(records, chunk_size=STAFF_IMPORT_CHUNK_SIZE, max_concurrency=None, on_progress=None):
+    """직원 레코드를 청크마다 한 트랜잭션으로 upsert합니다 (청크마다 on_progress(진행 현황) 호출).
+
+    max_concurrency는 cosmos_db와 인자를 맞추기 위한 것으로, 쓰기는 연결 하나로 직렬화됩니다.
+    """
+    start_time = time.time()
+    progress = {"processed": 0, "succeeded": 0, "failed": 0, "request_charge": 0.0, "errors": []}
+    records = iter(records)
+
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            break
+
+        now = datetime.now().isoformat()
+        try:
+            with _transaction() as connection:
+                # 트랜잭션 안에서 최대 user_id를 읽어 동시 추가에도 번호가 겹치지 않음
+                next_user_id = connection.execute(
+                    "SELECT COALESCE(MAX(user_id), 0) AS max_user_id FROM staff"
+                ).fetchone()["max_user_id"] + 1
+                next_user_id = max(
+                    [next_user_id] + [s["user_id"] + 1 for s in chunk if s.get("user_id") is not None]
+                )
+                for staff in chunk:
+                    user_id = staff.get("user_id")
+                    if user_id is None:
+                        user_id, next_user_id = next_user_id, next_user_id + 1
+                    _write_document(
+                        connection, "staff", build_staff_document(staff, user_id, now)
+                    )
+            progress["succeeded"] += len(chunk)
+        except Exception as e:
+            logger.error(f"인사정보 가져오기 청크 실패 ({len(chunk)}건): {e}")
+            progress["failed"] += len(chunk)
+            progress["errors"].append(str(e))
+        progress["processed"] += len(chunk)
+        if on_progress:
+            on_progress(dict(progress))
+
+    log_performance(
+        logger,
+        "import_staff",
+        time.time() - start_time,
+        f"{progress['succeeded']} succeeded, {progress['failed']} failed",
+    )
+    log_business_event(
+        logger,
+        "staff_imported",
+        f"{progress['succeeded']} staff imported ({progress['failed']} failed)",
+    )
+    return progress
+
+
+def iter_staff(page_size=STAFF_EXPORT_PAGE_SIZE):
+    """전체 직원을 이름순으로 페이지 단위로 읽어 하나씩 반환합니다 (내보내기용)."""
+    last = None
+    while True:
+        if last is None:
+            rows = _fetch_all(
+                "SELECT data, name, id FROM staff ORDER BY name, id LIMIT ?", (page_size,)
+            )
+        else:
+            rows = _fetch_all(
+                "SELECT data, name, id FROM staff WHERE (name, id) > (?, ?) "
+                "ORDER BY name, id LIMIT ?",
+                (*last, page_size),
+            )
+        if not rows:
+            return
+        for staff in _documents(rows):
+            yield staff
+        last = (rows[-1]["name"], rows[-1]["id"])
+
+
+def recommend_assignee_for_task(task_description, task_skills=None):
+    """작업 내용에 따른 담당자 추천"""
+    try:
+        return rank_assignee_for_task(get_all_staff(), task_description)
+    except Exception as e:
+        print(f"❌ 담당자 추천 오류: {str(e)}")
+        return None
+
+
+# 채팅 히스토리
+# 헤더(chat_<session_id>)는 chat_history 테이블에, 메시지는 chat_messages에 (세션, 순번) 행으로 저장합니다.
+# get_chat_messages_page의 세그먼트 번호는 순번을 segment_size로 나눈 값으로 cosmos_db와 같습니다.
+def _chat_header(connection, session_id):
+    return _read_document("chat_history", chat_id_for_session(session_id), connection)
+
+
+def _append_chat_messages(connection, session_id, header, new_messages, summary=None):
+    """헤더 기준으로 새 메시지 행을 추가하고 헤더를 갱신합니다."""
+    chat_id = chat_id_for_session(session_id)
+    timestamp = datetime.now().isoformat()
+
+    if header is None:
+        header = {
+            "id": chat_id,
+            "type": "chat_history",
+            "session_id": session_id,
+            "summary": summary or _default_chat_summary(new_messages),
+            "created_at": timestamp,
+            "message_count": 0,
+            "segment_size": config.CHAT_SEGMENT_SIZE,
+        }
+        print(f"✅ 새 채팅 히스토리 생성: {chat_id}")
+
+    start = header.get("message_count", 0)
+    connection.executemany(
+        "INSERT OR REPLACE INTO chat_messages (session_id, seq, data) VALUES (?, ?, ?)",
+        [
+            (session_id, start + offset, _dumps(message))
+            for offset, message in enumerate(new_messages)
+        ],
+    )
+    header.update(
+        {
+            "summary": summary or header.get("summary", "새로운 채팅"),
+            "timestamp": timestamp,
+            "updated_at": timestamp,
+            "message_count": start + len(new_messages),
+        }
+    )
+    _write_document(connection, "chat_history", header)
+    return chat_id
+
+
+def append_chat_messages(session_id, new_messages, summary=None):
+    """새 메시지만 채팅에 추가합니다 (기존 메시지는 다시 쓰지 않음)."""
+    try:
+        with _transaction() as connection:
+            header = _chat_header(connection, session_id)
+            return _append_chat_messages(
+                connection, session_id, header, new_messages, summary
+            )
+    except Exception as e:
+        print(f"❌ 채팅 메시지 추가 오류: {str(e)}")
+        return None
+
+
+def save_chat_history(session_id, messages, summary=None):
+    """전체 메시지 목록을 받아 아직 저장되지 않은 뒷부분만 추가합니다. 세션당 하나의 채팅 ID를 사용합니다."""
+    try:
+        with _transaction() as connection:
+            header = _chat_header(connection, session_id)
+            stored_count = header.get("message_count", 0) if header else 0
+            new_messages = messages[stored_count:]
+            if header is not None and not new_messages and (
+                not summary or summary == header.get("summary")
+            ):
+                return header["id"]
+            return _append_chat_messages(
+                connection, session_id, header, new_messages, summary
+            )
+    except Exception as e:
+        print(f"❌ 채팅 히스토리 저장 오류: {str(e)}")
+        return None
+
+
+def get_chat_messages_page(session_id, before_segment=None):
+    """채팅 메시지를 세그먼트 단위로 최신부터 조회합니다 (반환: (메시지 목록, 세그먼트 번호))."""
+    try:
+        header = _read_document("chat_history", chat_id_for_session(session_id))
+        if header is None or not header.get("message_count"):
+            return [], 0
+
+        segment_size = header.get("segment_size", config.CHAT_SEGMENT_SIZE)
+        if before_segment is None:
+            segment_index = (header["message_count"] - 1) // segment_size
+        else:
+            segment_index = before_segment - 1
+            if segment_index < 0:
+                return [], 0
+
+        rows = _fetch_all(
+            "SELECT data FROM chat_messages WHERE session_id = ? AND seq >= ? AND seq < ? "
+            "ORDER BY seq",
+            (session_id, segment_index * segment_size, (segment_index + 1) * segment_size),
+        )
+        return _documents(rows), segment_index
+
+    except Exception as e:
+        print(f"❌ 채팅 메시지 조회 오류: {str(e)}")
+        return [], 0
+
+
+def get_chat_histories_page(session_id=None, limit=20, continuation_token=None):
+    """채팅 목록(id, session_id, 요약, 시각, 메시지 수)을 최신순으로 한 페이지씩 조회합니다."""
+    try:
+        where, parameters = [], []
+        if session_id:
+            where, parameters = ["session_id = ?"], [session_id]
+        rows, next_token = _keyset_page(
+            "chat_history",
+            "id, session_id, json_extract(data, '$.summary') AS summary, timestamp, "
+            "json_extract(data, '$.message_count') AS message_count",
+            where,
+            parameters,
+            "timestamp",
+            limit,
+            continuation_token,
+        )
+        items = [
+            {
+                "id": row["id"],
+                "session_id": row["session_id"],
+                "summary": row["summary"],
+                "timestamp": row["timestamp"],
+                "message_count": row["message_count"],
+            }
+            for row in rows
+        ]
+        print(f"✅ 채팅 히스토리 조회 완료: {len(items)}개")
+        return items, next_token
+
+    except Exception as e:
+        print(f"❌ 채팅 히스토리 조회 오류: {str(e)}")
+        return [], None
+
+
+def get_chat_histories(session_id=None, limit=20):
+    """채팅 목록을 최대 limit개 조회합니다."""
+    items, _ = get_chat_histories_page(session_id, limit)
+    return items
+
+
+def get_chat_history_by_id(chat_id):
+    """특정 채팅 히스토리(헤더)를 조회합니다."""
+    try:
+        chat_history = _read_document("chat_history", chat_id)
+        if chat_history is None:
+            print(f"❌ 채팅 히스토리를 찾을 수 없습니다: {chat_id}")
+        return chat_history
+    except Exception as e:
+        print(f"❌ 채팅 히스토리 조회 오류: {str(e)}")
+        return None
+
+
+def get_chat_history_by_query(chat_id):
+    """cosmos_db와의 호환용 (SQLite는 ID로 바로 조회)."""
+    return get_chat_history_by_id(chat_id)
+
+
+def delete_chat_history(chat_id):
+    """채팅 히스토리(헤더와 메시지)를 삭제합니다."""
+    try:
+        with _transaction() as connection:
+            header = _read_document("chat_history", chat_id, connection)
+            if header is None:
+                print(f"❌ 삭제할 채팅 히스토리를 찾을 수 없습니다: {chat_id}")
+                return False
+            connection.execute(
+                "DELETE FROM chat_messages WHERE session_id = ?", (header["session_id"],)
+            )
+            connection.execute("DELETE FROM chat_history WHERE id = ?", (chat_id,))
+
+        print(f"✅ 채팅 히스토리 삭제 완료: {chat_id}")
+        return True
+
+    except Exception as e:
+        print(f"❌ 채팅 히스토리 삭제 오류: {str(e)}")
+        return False
+
+
+def delete_chat_history_by_query(chat_id):
+    """cosmos_db와의 호환용 (SQLite는 ID로 바로 삭제)."""
+    return delete_chat_history(chat_id)
+
+
+def update_chat_history_summary(chat_id, new_summary):
+    """채팅 히스토리 요약을 업데이트합니다."""
+    try:
+        with _transaction() as connection:
+            chat_history = _read_document("chat_history", chat_id, connection)
+            if chat_history is None:
+                print(f"❌ 채팅 히스토리를 찾을 수 없습니다: {chat_id}")
+                return False
+            chat_history["summary"] = new_summary
+            chat_history["updated_at"] = datetime.now().isoformat()
+            _write_document(connection, "chat_history", chat_history)
+
+        print(f"✅ 채팅 히스토리 요약 업데이트 완료: {chat_id}")
+        return True
+
+    except Exception as e:
+        print(f"❌ 채팅 히스토리 요약 업데이트 오류: {str(e)}")
+        return False
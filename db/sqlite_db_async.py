@@ -0,0 +1,110 @@
+"""
+SQLite 저장소 비동기 래퍼 (FastAPI용)
+
+db/cosmos_db_async.py와 같은 코루틴 이름을 제공하며, 동기 db/sqlite_db 함수를
+asyncio.to_thread로 실행해 로컬 파일 I/O가 이벤트 루프를 막지 않게 합니다.
+"""
+
+import asyncio
+
+from db import sqlite_db
+
+
+async def close_client():
+    """애플리케이션 종료 시 SQLite 연결을 닫습니다."""
+    await asyncio.to_thread(sqlite_db.close_connection)
+
+
+async def save_meeting(meeting_title, raw_text, summary_json, idempotency_key=None, meeting_id=None):
+    """회의 정보를 멱등하게 저장합니다."""
+    return await asyncio.to_thread(
+        sqlite_db.save_meeting,
+        meeting_title,
+        raw_text,
+        summary_json,
+        idempotency_key,
+        meeting_id,
+    )
+
+
+async def save_action_items(meeting_id, action_items, pending=False):
+    """액션 아이템을 저장합니다."""
+    return await asyncio.to_thread(
+        sqlite_db.save_action_items, meeting_id, action_items, pending
+    )
+
+
+async def get_meetings_page(limit=20, continuation_token=None, title_contains=None):
+    """회의 목록을 최신순으로 한 페이지씩 조회합니다."""
+    return await asyncio.to_thread(
+        sqlite_db.get_meetings_page, limit, continuation_token, title_contains
+    )
+
+
+async def get_meeting_summaries_page(limit=20, continuation_token=None, title_contains=None):
+    """회의 요약 목록(액션 아이템 개수 포함)을 한 페이지씩 조회합니다."""
+    return await asyncio.to_thread(
+        sqlite_db.get_meeting_summaries_page, limit, continuation_token, title_contains
+    )
+
+
+async def get_action_item_counts(meeting_ids):
+    """회의별 액션 아이템 개수(전체/완료)를 조회합니다."""
+    return await asyncio.to_thread(sqlite_db.get_action_item_counts, meeting_ids)
+
+
+async def get_recent_meetings(limit=5):
+    """최근 회의 요약 목록을 액션 아이템 개수와 함께 조회합니다."""
+    return await asyncio.to_thread(sqlite_db.get_recent_meetings, limit)
+
+
+async def get_meeting(meeting_id):
+    """특정 회의 정보를 조회합니다."""
+    return await asyncio.to_thread(sqlite_db.get_meeting, meeting_id)
+
+
+async def get_action_items(meeting_id, include_pending=False):
+    """특정 회의의 액션 아이템을 조회합니다."""
+    return await asyncio.to_thread(sqlite_db.get_action_items, meeting_id, include_pending)
+
+
+async def update_action_item(item_id, meeting_id, updates):
+    """액션 아이템을 수정합니다."""
+    return await asyncio.to_thread(
+        sqlite_db.update_action_item, item_id, meeting_id, updates
+    )
+
+
+async def save_approval_history(meeting_id, action_item_id, reviewer, changes):
+    """승인 이력을 저장합니다."""
+    return await asyncio.to_thread(
+        sqlite_db.save_approval_history, meeting_id, action_item_id, reviewer, changes
+    )
+
+
+async def approve_action_item(item_id, meeting_id, final_assignee_id, reviewer_name=None):
+    """액션 아이템을 승인하고 담당자를 할당합니다."""
+    return await asyncio.to_thread(
+        sqlite_db.approve_action_item,
+        item_id,
+        meeting_id,
+        final_assignee_id,
+        reviewer_name,
+    )
+
+
+async def update_action_item_status(item_id, meeting_id, status):
+    """액션 아이템의 상태를 업데이트합니다."""
+    return await asyncio.to_thread(
+        sqlite_db.update_action_item_status, item_id, meeting_id, status
+    )
+
+
+async def rebuild_dashboard_stats():
+    """대시보드 통계를 집계합니다."""
+    return await asyncio.to_thread(sqlite_db.rebuild_dashboard_stats)
+
+
+async def get_dashboard_stats(refresh=False):
+    """대시보드 통계를 반환합니다."""
+    return await asyncio.to_thread(sqlite_db.get_dashboard_stats, refresh)
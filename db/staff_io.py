@@ -0,0 +1,133 @@
+"""
+인사정보 일괄 가져오기/내보내기 형식 (CSV, JSONL)
+
+저장소 백엔드와 무관한 순수 함수만 둡니다. 읽기/쓰기 모두 한 줄씩 처리하는 제너레이터라
+직원 수와 관계없이 메모리 사용량이 일정합니다. 실제 저장은 각 백엔드의 import_staff,
+조회는 iter_staff가 담당합니다.
+
+CSV 열: id, user_id, name, department, position, email, skills (skills는 ';'로 구분)
+JSONL: 줄마다 직원 문서 하나 (skills는 배열 또는 ';'/',' 구분 문자열)
+"""
+
+import csv
+import json
+
+STAFF_FORMATS = ("csv", "jsonl")
+STAFF_EXPORT_FIELDS = ("id", "user_id", "name", "department", "position", "email", "skills")
+SKILL_SEPARATOR = ";"
+
+
+def detect_staff_format(filename, default="jsonl"):
+    """파일 이름 확장자로 형식을 판단합니다."""
+    name = str(filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return default
+
+
+def _parse_skills(value):
+    if isinstance(value, list):
+        return [str(skill).strip() for skill in value if str(skill).strip()]
+    text = str(value or "")
+    separator = SKILL_SEPARATOR if SKILL_SEPARATOR in text else ","
+    return [skill.strip() for skill in text.split(separator) if skill.strip()]
+
+
+def _parse_user_id(value):
+    if value is None or str(value).strip() == "":
+        return None
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        raise ValueError(f"user_id는 정수여야 합니다: {value}")
+
+
+def normalize_staff_record(record):
+    """가져온 레코드를 직원 문서 필드로 정리합니다 (이름이 없으면 ValueError)."""
+    name = str(record.get("name") or "").strip()
+    if not name:
+        raise ValueError("name이 비어 있습니다")
+
+    staff = {
+        "name": name,
+        "department": str(record.get("department") or "").strip(),
+        "position": str(record.get("position") or "").strip(),
+        "email": str(record.get("email") or "").strip(),
+        "skills": _parse_skills(record.get("skills")),
+        "user_id": _parse_user_id(record.get("user_id")),
+    }
+    if str(record.get("id") or "").strip():
+        staff["id"] = str(record["id"]).strip()
+    return staff
+
+
+def iter_staff_records(stream, fmt):
+    """텍스트 스트림에서 (줄 번호, 레코드 또는 None, 오류 메시지 또는 None)을 차례로 읽습니다."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            try:
+                yield reader.line_num, normalize_staff_record(row), None
+            except ValueError as e:
+                yield reader.line_num, None, str(e)
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("JSON 객체가 아닙니다")
+                yield line_number, normalize_staff_record(record), None
+            except (json.JSONDecodeError, ValueError) as e:
+                yield line_number, None, str(e)
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (사용 가능: {', '.join(STAFF_FORMATS)})")
+
+
+def valid_staff_records(stream, fmt, invalid):
+    """형식 오류가 없는 레코드만 차례로 반환하고, 오류 줄은 invalid 목록에 기록합니다."""
+    for line_number, staff, error in iter_staff_records(stream, fmt):
+        if error:
+            invalid.append(f"{line_number}행: {error}")
+        else:
+            yield staff
+
+
+def iter_staff_lines(staff_iterable, fmt):
+    """직원 문서를 형식에 맞는 텍스트 줄로 차례로 변환합니다 (CSV는 헤더 포함)."""
+    if fmt not in STAFF_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (사용 가능: {', '.join(STAFF_FORMATS)})")
+
+    if fmt == "jsonl":
+        for staff in staff_iterable:
+            record = {field: staff.get(field) for field in STAFF_EXPORT_FIELDS}
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+        return
+
+    buffer = _LineBuffer()
+    writer = csv.DictWriter(buffer, fieldnames=STAFF_EXPORT_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    yield buffer.pop()
+    for staff in staff_iterable:
+        record = {field: staff.get(field) for field in STAFF_EXPORT_FIELDS}
+        record["skills"] = SKILL_SEPARATOR.join(_parse_skills(staff.get("skills")))
+        writer.writerow(record)
+        yield buffer.pop()
+
+
+class _LineBuffer:
+    """csv.writer가 쓴 한 줄을 바로 꺼내기 위한 최소 버퍼"""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, text):
+        self._parts.append(text)
+
+    def pop(self):
+        text = "".join(self._parts)
+        self._parts.clear()
+        return text
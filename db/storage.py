@@ -0,0 +1,31 @@
+"""
+저장소 백엔드 선택
+
+config.STORAGE_BACKEND에 따라 db.cosmos_db(기본) 또는 db.sqlite_db의 함수를 그대로 노출합니다.
+두 모듈은 같은 함수 이름/인자/반환 형식을 가지므로 호출 측은 `from db.storage import ...`만 쓰면 됩니다.
+선택된 모듈만 import되므로 SQLite 백엔드에서는 Cosmos 클라이언트가 만들어지지 않습니다.
+"""
+
+import importlib
+
+import config.config as config
+
+BACKEND_MODULES = {
+    "cosmos": "db.cosmos_db",
+    "sqlite": "db.sqlite_db",
+}
+
+
+def get_backend_module():
+    """설정된 저장소 백엔드 모듈을 반환합니다."""
+    module_name = BACKEND_MODULES.get(config.STORAGE_BACKEND)
+    if module_name is None:
+        raise ValueError(
+            f"지원하지 않는 STORAGE_BACKEND: {config.STORAGE_BACKEND} "
+            f"(사용 가능: {', '.join(BACKEND_MODULES)})"
+        )
+    return importlib.import_module(module_name)
+
+
+def __getattr__(name):
+    return getattr(get_backend_module(), name)
@@ -0,0 +1,29 @@
+"""
+비동기 저장소 백엔드 선택 (FastAPI용)
+
+config.STORAGE_BACKEND에 따라 db.cosmos_db_async(기본) 또는 db.sqlite_db_async의 코루틴을 노출합니다.
+"""
+
+import importlib
+
+import config.config as config
+
+BACKEND_MODULES = {
+    "cosmos": "db.cosmos_db_async",
+    "sqlite": "db.sqlite_db_async",
+}
+
+
+def get_backend_module():
+    """설정된 비동기 저장소 백엔드 모듈을 반환합니다."""
+    module_name = BACKEND_MODULES.get(config.STORAGE_BACKEND)
+    if module_name is None:
+        raise ValueError(
+            f"지원하지 않는 STORAGE_BACKEND: {config.STORAGE_BACKEND} "
+            f"(사용 가능: {', '.join(BACKEND_MODULES)})"
+        )
+    return importlib.import_module(module_name)
+
+
+def __getattr__(name):
+    return getattr(get_backend_module(), name)
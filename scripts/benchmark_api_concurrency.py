@@ -0,0 +1,167 @@
+"""
+API 동시성 벤치마크 스크립트
+
+실행 중인 FastAPI 서버에 동시 클라이언트 N개(기본 50)로 읽기 엔드포인트를 반복 호출해
+엔드포인트별 초당 요청 수(req/s)와 지연 시간 분포를 측정합니다.
+동기 Cosmos 호출 버전(변경 전)과 비동기 클라이언트 버전(변경 후) 서버를 각각 측정한 뒤
+--baseline으로 이전 결과 파일을 넘기면 개선 배율을 함께 출력합니다.
+Cosmos 계정 없이는 STORAGE_BACKEND=sqlite로 두 서버를 같은 백엔드에서 비교합니다.
+변경 전 서버는 scripts/serve_api_sync_storage.py(async 엔드포인트에서 db.storage 동기 호출)로,
+변경 후 서버는 uvicorn api.api:app으로 띄웁니다. SQLite 호출은 1ms 미만이라 스레드 전환 비용이
+더 커서 비동기 버전이 느리게 나오며, 개선 효과는 네트워크 왕복을 기다리는 Cosmos에서만 나타납니다.
+
+사용 예:
+    # 변경 전 서버(또는 serve_api_sync_storage.py) 실행 후
+    python scripts/benchmark_api_concurrency.py --output before.json
+    # 변경 후 커밋으로 서버 실행 후
+    python scripts/benchmark_api_concurrency.py --output after.json --baseline before.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import aiohttp
+
+DEFAULT_ENDPOINTS = ["/meetings?limit=20", "/dashboard", "/health"]
+
+
+def percentile(values, ratio):
+    """정렬된 값 목록에서 백분위수를 구합니다."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(ratio * (len(values) - 1))))
+    return values[index]
+
+
+async def run_client(session, url, deadline, latencies, errors):
+    """마감 시각까지 한 클라이언트가 요청을 순차적으로 반복합니다."""
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with session.get(url) as response:
+                await response.read()
+                if response.status >= 400:
+                    errors.append(response.status)
+                    continue
+        except Exception as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+async def benchmark_endpoint(base_url, endpoint, concurrency, duration, warmup):
+    """엔드포인트 하나를 동시 클라이언트로 측정합니다."""
+    url = base_url.rstrip("/") + endpoint
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # 워밍업: 연결 풀과 서버 측 클라이언트/캐시를 미리 채움
+        if warmup > 0:
+            await asyncio.gather(
+                *(
+                    run_client(session, url, time.perf_counter() + warmup, [], [])
+                    for _ in range(concurrency)
+                )
+            )
+
+        latencies, errors = [], []
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(
+                run_client(session, url, deadline, latencies, errors)
+                for _ in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "elapsed_seconds": round(elapsed, 2),
+        "requests_per_second": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies) * 1000, 1) if latencies else 0.0,
+            "p50": round(percentile(latencies, 0.50) * 1000, 1),
+            "p95": round(percentile(latencies, 0.95) * 1000, 1),
+            "p99": round(percentile(latencies, 0.99) * 1000, 1),
+        },
+    }
+
+
+def print_results(results, baseline=None):
+    """측정 결과 표를 출력합니다."""
+    baseline_rps = {
+        row["endpoint"]: row["requests_per_second"] for row in (baseline or [])
+    }
+
+    print(
+        f"{'엔드포인트':<24}{'req/s':>10}{'p50(ms)':>10}{'p95(ms)':>10}"
+        f"{'오류':>8}{'변경 전 대비':>14}"
+    )
+    for row in results:
+        before = baseline_rps.get(row["endpoint"])
+        ratio = (
+            f"x{row['requests_per_second'] / before:.2f}" if before else "-"
+        )
+        print(
+            f"{row['endpoint']:<24}{row['requests_per_second']:>10}"
+            f"{row['latency_ms']['p50']:>10}{row['latency_ms']['p95']:>10}"
+            f"{row['errors']:>8}{ratio:>14}"
+        )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="API 동시성 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--endpoint", action="append", dest="endpoints")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20.0, help="엔드포인트별 측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="측정 전 워밍업 시간(초)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    endpoints = args.endpoints or DEFAULT_ENDPOINTS
+    print(
+        f"🚀 {args.base_url} 대상 동시 클라이언트 {args.concurrency}개, "
+        f"엔드포인트별 {args.duration:.0f}초 측정"
+    )
+
+    results = []
+    for endpoint in endpoints:
+        print(f"⏱️ 측정 중: {endpoint}")
+        results.append(
+            await benchmark_endpoint(
+                args.base_url, endpoint, args.concurrency, args.duration, args.warmup
+            )
+        )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    print()
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"base_url": args.base_url, "results": results},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,203 @@
+"""
+Cosmos DB RU 리포트 스크립트
+
+db/cosmos_telemetry.py가 남긴 구조화 로그(logs/*_cosmos_metrics_*.jsonl)를 읽어
+RU를 가장 많이 쓰는 쿼리, 논리 작업, 요청/세션 범위를 상위 N개씩 출력합니다.
+쿼리는 페이지 레코드를 query_id로 묶어 실행 1회의 RU를 구한 뒤 쿼리 문자열별로 집계합니다.
+
+사용 예:
+    python scripts/cosmos_ru_report.py --top 20
+    python scripts/cosmos_ru_report.py --by operation --date 20250101
+    python scripts/cosmos_ru_report.py --by scope --log-dir logs --json
+"""
+
+import argparse
+import glob
+import json
+import os
+from collections import defaultdict
+
+
+def iter_records(log_dir, date=None):
+    """메트릭 로그 파일의 JSON 레코드를 순서대로 읽습니다 (깨진 줄은 건너뜀)."""
+    pattern = f"*_cosmos_metrics_{date or '*'}.jsonl"
+    for path in sorted(glob.glob(os.path.join(log_dir, "**", pattern), recursive=True)):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+def _mean(total, count):
+    return total / count if count else 0.0
+
+
+def query_executions(records):
+    """페이지 레코드를 query_id별 실행 1회 단위로 합칩니다."""
+    executions = {}
+    for record in records:
+        if record.get("metric_type") != "cosmos_request" or not record.get("query_id"):
+            continue
+        execution = executions.setdefault(
+            record["query_id"],
+            {
+                "query": record.get("query"),
+                "operation": record.get("operation"),
+                "container": record.get("container"),
+                "request_charge": 0.0,
+                "pages": 0,
+                "retrieved_documents": 0.0,
+                "output_documents": 0.0,
+                "execution_ms": 0.0,
+                "throttle_retries": 0,
+            },
+        )
+        metrics = record.get("query_metrics") or {}
+        execution["request_charge"] += record.get("request_charge") or 0.0
+        execution["pages"] += 1
+        execution["retrieved_documents"] += metrics.get("retrievedDocumentCount", 0.0)
+        execution["output_documents"] += metrics.get("outputDocumentCount", 0.0)
+        execution["execution_ms"] += metrics.get("totalExecutionTimeInMs", 0.0)
+        execution["throttle_retries"] += record.get("throttle_retry_count") or 0
+    return list(executions.values())
+
+
+def top_queries(records, top, sort_key):
+    """쿼리 문자열별 실행 횟수와 RU를 집계해 상위 N개를 반환합니다."""
+    groups = defaultdict(list)
+    for execution in query_executions(records):
+        groups[(execution["container"], execution["query"])].append(execution)
+
+    rows = []
+    for (container, query), executions in groups.items():
+        count = len(executions)
+        total = sum(e["request_charge"] for e in executions)
+        retrieved = sum(e["retrieved_documents"] for e in executions)
+        output = sum(e["output_documents"] for e in executions)
+        rows.append(
+            {
+                "query": query,
+                "container": container,
+                "operations": sorted({e["operation"] for e in executions}),
+                "executions": count,
+                "total_ru": round(total, 2),
+                "avg_ru": round(_mean(total, count), 2),
+                "max_ru": round(max(e["request_charge"] for e in executions), 2),
+                "avg_pages": round(_mean(sum(e["pages"] for e in executions), count), 1),
+                "avg_execution_ms": round(
+                    _mean(sum(e["execution_ms"] for e in executions), count), 2
+                ),
+                # 읽은 문서 대비 반환 문서 비율이 낮으면 인덱스를 못 타는 필터일 가능성이 큼
+                "retrieved_per_output": round(retrieved / output, 1) if output else None,
+                "throttle_retries": sum(e["throttle_retries"] for e in executions),
+            }
+        )
+    rows.sort(key=lambda row: row[sort_key], reverse=True)
+    return rows[:top]
+
+
+def top_operations(records, top, sort_key):
+    """논리 작업별 호출 수와 RU를 집계해 상위 N개를 반환합니다."""
+    groups = defaultdict(list)
+    for record in records:
+        if record.get("metric_type") == "cosmos_request":
+            groups[record.get("operation")].append(record)
+
+    rows = []
+    for operation, items in groups.items():
+        charges = [r.get("request_charge") or 0.0 for r in items]
+        rows.append(
+            {
+                "operation": operation,
+                "containers": sorted({r.get("container") or "" for r in items}),
+                "calls": len(items),
+                "total_ru": round(sum(charges), 2),
+                "avg_ru": round(_mean(sum(charges), len(charges)), 2),
+                "max_ru": round(max(charges), 2),
+                "throttle_retries": sum(r.get("throttle_retry_count") or 0 for r in items),
+                "errors": sum(1 for r in items if (r.get("status_code") or 0) >= 400),
+            }
+        )
+    rows.sort(key=lambda row: row[sort_key], reverse=True)
+    return rows[:top]
+
+
+def top_scopes(records, top, sort_key):
+    """요청/세션 범위 요약을 (범위 유형, 라벨)별로 집계해 상위 N개를 반환합니다."""
+    groups = defaultdict(list)
+    for record in records:
+        if record.get("metric_type") == "cosmos_scope":
+            key = (record.get("scope_type"), record.get("label") or "-")
+            groups[key].append(record)
+
+    rows = []
+    for (scope_type, label), items in groups.items():
+        charges = [r.get("request_charge") or 0.0 for r in items]
+        rows.append(
+            {
+                "scope": f"{scope_type}:{label}",
+                "scopes": len(items),
+                "total_ru": round(sum(charges), 2),
+                "avg_ru": round(_mean(sum(charges), len(charges)), 2),
+                "max_ru": round(max(charges), 2),
+                "avg_calls": round(_mean(sum(r.get("calls", 0) for r in items), len(items)), 1),
+            }
+        )
+    rows.sort(key=lambda row: row[sort_key], reverse=True)
+    return rows[:top]
+
+
+def print_table(rows, columns, label_key, label_width=60):
+    """집계 결과를 표로 출력합니다 (라벨 열은 잘라서 표시)."""
+    widths = [max(12, len(column) + 2) for column in columns]
+    header = f"{'#':>3} " + "".join(f"{c:>{w}}" for c, w in zip(columns, widths))
+    print(header + f"  {label_key}")
+    for rank, row in enumerate(rows, 1):
+        values = "".join(f"{str(row[c]):>{w}}" for c, w in zip(columns, widths))
+        label = str(row[label_key])
+        if len(label) > label_width:
+            label = label[: label_width - 3] + "..."
+        print(f"{rank:>3} {values}  {label}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cosmos DB RU 상위 N 리포트")
+    parser.add_argument("--log-dir", default="logs", help="메트릭 로그 디렉터리")
+    parser.add_argument("--date", help="특정 날짜(YYYYMMDD) 로그만 읽기")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument(
+        "--by", choices=["query", "operation", "scope"], default="query", help="집계 기준"
+    )
+    parser.add_argument(
+        "--sort", choices=["total_ru", "avg_ru", "max_ru"], default="total_ru"
+    )
+    parser.add_argument("--json", action="store_true", help="표 대신 JSON으로 출력")
+    args = parser.parse_args()
+
+    records = list(iter_records(args.log_dir, args.date))
+    if not records:
+        print(f"⚠️ {args.log_dir}에서 Cosmos 메트릭 로그를 찾지 못했습니다")
+        return
+
+    if args.by == "query":
+        rows = top_queries(records, args.top, args.sort)
+        columns, label_key = ["executions", "total_ru", "avg_ru", "max_ru", "avg_pages"], "query"
+    elif args.by == "operation":
+        rows = top_operations(records, args.top, args.sort)
+        columns, label_key = ["calls", "total_ru", "avg_ru", "max_ru", "throttle_retries"], "operation"
+    else:
+        rows = top_scopes(records, args.top, args.sort)
+        columns, label_key = ["scopes", "total_ru", "avg_ru", "max_ru", "avg_calls"], "scope"
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+
+    print(f"📊 Cosmos DB RU 상위 {args.top}개 ({args.by}, {args.sort} 기준, 레코드 {len(records)}개)")
+    print_table(rows, columns, label_key)
+
+
+if __name__ == "__main__":
+    main()
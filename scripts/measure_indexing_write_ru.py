@@ -0,0 +1,192 @@
+"""
+인덱싱 정책별 쓰기 RU 비교 스크립트
+
+기본 정책(모든 경로 인덱싱) 컨테이너와 db/indexing_policies.py에 선언된 정책 컨테이너를
+벤치마크용으로 각각 만들고, 같은 합성 워크로드(회의 생성, 액션 아이템 생성/상태 변경,
+채팅 세그먼트 추가)를 실행해 쓰기 RU 합계를 비교합니다. 운영 컨테이너는 건드리지 않습니다.
+
+사용 예:
+    python scripts/measure_indexing_write_ru.py --meetings 100 --cleanup
+"""
+
+import argparse
+import json
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from azure.cosmos import PartitionKey
+
+import config.config as config
+from db.cosmos_db import get_database
+from db.indexing_policies import get_indexing_policies
+
+# (워크로드 이름, 원본 컨테이너, 파티션 키 경로)
+WORKLOADS = [
+    ("meetings", config.COSMOS_MEETINGS_CONTAINER, "/id"),
+    ("action-items", config.COSMOS_ACTION_ITEMS_CONTAINER, "/meetingId"),
+    ("chat-history", config.COSMOS_CHAT_HISTORY_CONTAINER, "/session_id"),
+]
+
+
+def build_meeting(index, transcript_chars):
+    """인라인 원문이 있는 이전 형식과 같은 크기의 합성 회의 문서를 생성합니다."""
+    summary = {
+        "summary": f"{index}번째 주간 회의 요약입니다. " * 10,
+        "participants": ["김민수", "이영희", "박지훈"],
+        "actionItems": [
+            {"description": f"후속 작업 {n}", "dueDate": "2025-12-31"} for n in range(5)
+        ],
+    }
+    return {
+        "id": f"meeting_bench_{uuid.uuid4().hex[:8]}",
+        "title": f"벤치마크 회의 {index}",
+        "raw_text": ("회의 발언 내용입니다. " * 1000)[:transcript_chars],
+        "summary": json.dumps(summary, ensure_ascii=False),
+        "created_at": (datetime.utcnow() - timedelta(minutes=index)).isoformat(),
+        "type": "meeting",
+        "participants": summary["participants"],
+        "summary_preview": summary["summary"][:100],
+    }
+
+
+def build_action_items(meeting_id, count):
+    """회의 하나의 합성 액션 아이템 문서를 생성합니다."""
+    return [
+        {
+            "id": f"item_{meeting_id}_{n}",
+            "meetingId": meeting_id,
+            "description": f"후속 작업 {n}: 자료 정리 및 공유",
+            "recommendedAssigneeId": "김민수",
+            "dueDate": "2025-12-31",
+            "finalAssigneeId": None,
+            "approved": False,
+            "status": "미시작",
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        for n in range(count)
+    ]
+
+
+def build_chat_segment(session_id, index, messages_per_segment):
+    """합성 채팅 세그먼트 문서를 생성합니다."""
+    return {
+        "id": f"chat_{session_id}_seg_{index:05d}",
+        "type": "chat_segment",
+        "session_id": session_id,
+        "chat_id": f"chat_{session_id}",
+        "segment_index": index,
+        "messages": [
+            {
+                "role": "user" if n % 2 == 0 else "assistant",
+                "content": "이번 주 회의에서 나온 작업을 정리해줘. " * 20,
+            }
+            for n in range(messages_per_segment)
+        ],
+    }
+
+
+class ChargeMeter:
+    """컨테이너 쓰기 호출의 RU를 합산합니다."""
+
+    def __init__(self, container):
+        self.container = container
+        self.request_charge = 0.0
+        self.writes = 0
+
+    def _record(self):
+        headers = self.container.client_connection.last_response_headers
+        self.request_charge += float(headers.get("x-ms-request-charge", 0))
+        self.writes += 1
+
+    def create(self, body):
+        self.container.create_item(body=body)
+        self._record()
+
+    def replace(self, body):
+        self.container.replace_item(item=body["id"], body=body)
+        self._record()
+
+
+def run_workload(name, container, args):
+    """워크로드 하나를 실행하고 쓰기 RU를 반환합니다."""
+    meter = ChargeMeter(container)
+
+    if name == "meetings":
+        for index in range(args.meetings):
+            meter.create(build_meeting(index, args.transcript_chars))
+    elif name == "action-items":
+        for index in range(args.meetings):
+            for item in build_action_items(f"meeting_bench_{index}", args.items_per_meeting):
+                meter.create(item)
+                item["status"] = "진행중"
+                meter.replace(item)
+    elif name == "chat-history":
+        session_id = str(uuid.uuid4())
+        for index in range(args.meetings):
+            meter.create(build_chat_segment(session_id, index, args.messages_per_segment))
+
+    return meter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인덱싱 정책별 쓰기 RU 비교")
+    parser.add_argument("--meetings", type=int, default=100, help="워크로드 반복 수")
+    parser.add_argument("--transcript-chars", type=int, default=20000)
+    parser.add_argument("--items-per-meeting", type=int, default=5)
+    parser.add_argument("--messages-per-segment", type=int, default=20)
+    parser.add_argument(
+        "--cleanup", action="store_true", help="측정 후 벤치마크 컨테이너 삭제"
+    )
+    args = parser.parse_args()
+
+    db = get_database()
+    policies = get_indexing_policies()
+    rows = []
+
+    for name, source_container, partition_key in WORKLOADS:
+        results = {}
+        for variant, policy in (("default", None), ("declared", policies[source_container])):
+            container_name = f"{name}-index-bench-{variant}"
+            try:
+                db.delete_container(container_name)
+            except Exception:
+                pass
+            container = db.create_container(
+                id=container_name,
+                partition_key=PartitionKey(path=partition_key),
+                indexing_policy=policy,
+            )
+            print(f"⏱️ {name} / {variant} 측정 중")
+            results[variant] = run_workload(name, container, args)
+
+            if args.cleanup:
+                db.delete_container(container_name)
+
+        rows.append((name, results["default"], results["declared"]))
+
+    print(f"\n📊 쓰기 RU 비교 (반복 {args.meetings}회)")
+    print(f"{'워크로드':<16}{'쓰기 수':>8}{'기본 RU':>12}{'선언 RU':>12}{'절감':>9}")
+    total_default = total_declared = 0.0
+    for name, default, declared in rows:
+        total_default += default.request_charge
+        total_declared += declared.request_charge
+        saving = 1 - declared.request_charge / max(default.request_charge, 0.01)
+        print(
+            f"{name:<16}{default.writes:>8}{default.request_charge:>12.1f}"
+            f"{declared.request_charge:>12.1f}{saving:>9.1%}"
+        )
+    print(
+        f"{'합계':<16}{'':>8}{total_default:>12.1f}{total_declared:>12.1f}"
+        f"{1 - total_declared / max(total_default, 0.01):>9.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+회의 목록 조회 페이로드 측정 스크립트
+
+SELECT * 전체 문서 조회와 목록용 투영 조회(get_meeting_summaries와 같은 필드)의
+응답 바이트와 RU를 비교합니다. 운영 컨테이너를 건드리지 않도록 별도 벤치마크
+컨테이너에 합성 회의 문서를 생성해 측정합니다.
+합성 문서는 save_meeting이 저장하는 형태(원문은 Blob 참조 transcript, 커밋 시각 포함)를
+따르며, --inline-transcript를 주면 원문을 raw_text로 인라인한 이전 문서 형태로 만듭니다.
+--offline은 Cosmos 연결 없이 같은 합성 문서를 두 쿼리의 결과 형태로 직렬화해
+응답 바이트만 계산합니다 (RU는 서버에서만 측정 가능).
+
+사용 예:
+    python scripts/measure_meeting_list_payload.py --count 1000 --cleanup
+    python scripts/measure_meeting_list_payload.py --count 1000 --offline
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from azure.cosmos import PartitionKey
+
+from db.cosmos_db import (
+    MEETING_SUMMARY_PROJECTION,
+    bulk_write_items,
+    get_container,
+    get_database,
+)
+from services.transcript_service import TRANSCRIPT_ENCODING, transcript_blob_name
+
+BENCH_CONTAINER = "meetings-bench"
+# Cosmos가 SELECT * 결과에 붙이는 시스템 속성 (오프라인 계산용 자리값)
+SYSTEM_PROPERTIES = {
+    "_rid": "AAAAAAAAAAAAAAAAAAAAAA==",
+    "_self": "dbs/AAAAAA==/colls/AAAAAAAAAAA=/docs/AAAAAAAAAAAAAAAAAAAAAA==/",
+    "_etag": '"00000000-0000-0000-0000-000000000000"',
+    "_attachments": "attachments/",
+    "_ts": 1700000000,
+}
+
+FULL_QUERY = "SELECT * FROM c WHERE c.type = 'meeting' ORDER BY c.created_at DESC"
+PROJECTED_QUERY = (
+    f"SELECT {MEETING_SUMMARY_PROJECTION} FROM c "
+    "WHERE c.type = 'meeting' ORDER BY c.created_at DESC"
+)
+
+
+def transcript_reference(text):
+    """store_transcript와 같은 원문 참조를 Blob 업로드 없이 만듭니다."""
+    data = text.encode("utf-8")
+    sha256 = hashlib.sha256(data).hexdigest()
+    return {
+        "blob": transcript_blob_name(sha256),
+        "sha256": sha256,
+        "encoding": TRANSCRIPT_ENCODING,
+        "bytes": len(data),
+        "compressed_bytes": len(gzip.compress(data, compresslevel=6)),
+    }
+
+
+def build_meeting(index, transcript_chars, inline_transcript=False):
+    """측정용 합성 회의 문서를 생성합니다 (기본은 원문을 Blob 참조로 둔 현재 문서 형태)."""
+    created_at = (datetime.utcnow() - timedelta(minutes=index)).isoformat()
+    participants = ["김민수", "이영희", "박지훈"]
+    summary = {
+        "summary": f"{index}번째 주간 회의 요약입니다. " * 5,
+        "participants": participants,
+        "actionItems": [
+            {"description": f"후속 작업 {n}", "dueDate": "2025-12-31"}
+            for n in range(3)
+        ],
+    }
+    text = (f"{index}번째 회의\n참석자: 김민수, 이영희, 박지훈\n" + "회의 발언 내용입니다. " * 400)[
+        :transcript_chars
+    ]
+    return {
+        "id": f"meeting_bench_{uuid.uuid4().hex[:8]}",
+        "title": f"벤치마크 회의 {index}",
+        **(
+            {"raw_text": text}
+            if inline_transcript
+            else {"transcript": transcript_reference(text)}
+        ),
+        "summary": json.dumps(summary, ensure_ascii=False),
+        "created_at": created_at,
+        "type": "meeting",
+        "participants": participants,
+        "summary_preview": summary["summary"][:100],
+        "committed_at": created_at,
+    }
+
+
+def seed_meetings(container_name, count, transcript_chars, inline_transcript=False):
+    """벤치마크 컨테이너에 합성 회의 문서를 생성합니다."""
+    meetings = [
+        build_meeting(i, transcript_chars, inline_transcript) for i in range(count)
+    ]
+    result = bulk_write_items(
+        container_name, [("upsert", m) for m in meetings], "id"
+    )
+    print(
+        f"🌱 합성 회의 {result['succeeded']}개 생성 "
+        f"(실패 {result['failed']}개, {result['request_charge']:.1f} RU)"
+    )
+
+
+def measure_query(container, query):
+    """쿼리를 끝까지 읽으며 응답 바이트, RU, 페이지 수를 측정합니다."""
+    stats = {"items": 0, "bytes": 0, "request_charge": 0.0, "pages": 0}
+
+    def response_hook(headers, _):
+        stats["request_charge"] += float(headers.get("x-ms-request-charge", 0))
+
+    pages = container.query_items(
+        query=query,
+        enable_cross_partition_query=True,
+        max_item_count=100,
+        response_hook=response_hook,
+    ).by_page()
+    for page in pages:
+        items = list(page)
+        stats["pages"] += 1
+        stats["items"] += len(items)
+        stats["bytes"] += len(json.dumps(items, ensure_ascii=False).encode("utf-8"))
+
+    return stats
+
+
+def measure_offline(meetings, fields=None, page_size=100):
+    """합성 문서를 쿼리 결과 형태로 직렬화해 응답 바이트를 계산합니다 (RU 제외)."""
+    stats = {"items": 0, "bytes": 0, "request_charge": None, "pages": 0}
+    for start in range(0, len(meetings), page_size):
+        page = meetings[start : start + page_size]
+        if fields is None:
+            # SELECT *는 시스템 속성도 함께 반환
+            items = [{**m, **SYSTEM_PROPERTIES} for m in page]
+        else:
+            items = [{field: m[field] for field in fields if field in m} for m in page]
+        stats["pages"] += 1
+        stats["items"] += len(items)
+        stats["bytes"] += len(json.dumps(items, ensure_ascii=False).encode("utf-8"))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="회의 목록 조회 페이로드 측정")
+    parser.add_argument("--count", type=int, default=1000, help="합성 회의 수")
+    parser.add_argument(
+        "--transcript-chars", type=int, default=5000, help="회의 원문 길이(문자)"
+    )
+    parser.add_argument(
+        "--inline-transcript",
+        action="store_true",
+        help="원문을 raw_text로 인라인한 이전 문서 형태로 생성",
+    )
+    parser.add_argument("--container", default=BENCH_CONTAINER)
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="기존 벤치마크 데이터를 재사용"
+    )
+    parser.add_argument(
+        "--cleanup", action="store_true", help="측정 후 벤치마크 컨테이너 삭제"
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="Cosmos 없이 응답 바이트만 계산"
+    )
+    args = parser.parse_args()
+
+    if args.offline:
+        meetings = [
+            build_meeting(i, args.transcript_chars, args.inline_transcript)
+            for i in range(args.count)
+        ]
+        fields = [f.strip()[2:] for f in MEETING_SUMMARY_PROJECTION.split(",")]
+        before = measure_offline(meetings)
+        after = measure_offline(meetings, fields)
+    else:
+        db = get_database()
+        db.create_container_if_not_exists(
+            id=args.container, partition_key=PartitionKey(path="/id")
+        )
+
+        if not args.skip_seed:
+            seed_meetings(
+                args.container, args.count, args.transcript_chars, args.inline_transcript
+            )
+
+        container = get_container(args.container)
+        before = measure_query(container, FULL_QUERY)
+        after = measure_query(container, PROJECTED_QUERY)
+
+    print(f"\n📊 회의 목록 조회 비교 ({before['items']}개 회의)")
+    print(f"{'':<12}{'bytes':>14}{'RU':>12}{'pages':>8}")
+    for label, stats in (("SELECT *", before), ("projection", after)):
+        charge = stats["request_charge"]
+        ru = "-" if charge is None else f"{charge:.1f}"
+        print(f"{label:<12}{stats['bytes']:>14,}{ru:>12}{stats['pages']:>8}")
+    if before["bytes"] and args.offline:
+        print(f"\n✅ 응답 크기 {after['bytes'] / before['bytes']:.1%} (SELECT * 대비, RU 미측정)")
+    elif before["bytes"]:
+        print(
+            f"\n✅ 응답 크기 {after['bytes'] / before['bytes']:.1%}, "
+            f"RU {after['request_charge'] / max(before['request_charge'], 0.01):.1%} "
+            "(SELECT * 대비)"
+        )
+
+    if args.cleanup and not args.offline:
+        db.delete_container(args.container)
+        print(f"🗑️ 벤치마크 컨테이너 '{args.container}' 삭제")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+독립 작업 파티션 재분배 스크립트
+
+샤딩 이전에 meetingId = "standalone_task" 단일 파티션에 저장된 독립 작업을
+standalone_task#<yyyymm>#<shard> 파티션으로 배치 단위로 옮깁니다.
+각 배치는 새 파티션에 upsert한 뒤 성공한 항목만 기존 파티션에서 삭제하므로,
+중간에 중단되어도 다시 실행하면 남은 항목부터 이어서 처리합니다(같은 ID로 upsert되어 중복 없음).
+진행 상황과 옮기지 못한 ID는 상태 파일에 기록되며, 실패한 ID는 --retry-failed를 주기 전까지 건너뜁니다.
+
+사용 예:
+    python scripts/migrate_standalone_tasks.py --dry-run
+    python scripts/migrate_standalone_tasks.py --batch-size 100
+    python scripts/migrate_standalone_tasks.py --retry-failed
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import config.config as config
+from db.cosmos_db import (
+    BATCH_MAX_OPERATIONS,
+    LEGACY_STANDALONE_PARTITION_KEY,
+    bulk_write_items,
+    get_container,
+    standalone_task_partition_key,
+)
+
+DEFAULT_STATE_FILE = "standalone_task_migration.json"
+SYSTEM_PROPERTIES = ("_rid", "_self", "_etag", "_attachments", "_ts", "_lsn")
+
+
+def load_state(path):
+    """이전 실행의 진행 상태를 불러옵니다."""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {
+        "started_at": datetime.utcnow().isoformat(),
+        "batches": 0,
+        "migrated": 0,
+        "failed_ids": [],
+    }
+
+
+def save_state(path, state):
+    """진행 상태를 임시 파일에 쓴 뒤 교체해 원자적으로 저장합니다."""
+    state["updated_at"] = datetime.utcnow().isoformat()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def fetch_legacy_batch(container, batch_size, skip_ids):
+    """기존 단일 파티션에서 아직 옮기지 않은 독립 작업을 batch_size개 조회합니다."""
+    query = (
+        "SELECT TOP @top * FROM c WHERE c.meetingId = @legacy "
+        "AND NOT ARRAY_CONTAINS(@skip_ids, c.id)"
+    )
+    parameters = [
+        {"name": "@top", "value": batch_size},
+        {"name": "@legacy", "value": LEGACY_STANDALONE_PARTITION_KEY},
+        {"name": "@skip_ids", "value": skip_ids},
+    ]
+    return list(
+        container.query_items(
+            query=query,
+            parameters=parameters,
+            partition_key=LEGACY_STANDALONE_PARTITION_KEY,
+        )
+    )
+
+
+def to_sharded_document(item):
+    """기존 문서를 샤드 파티션 키를 가진 새 문서로 변환합니다."""
+    document = {k: v for k, v in item.items() if k not in SYSTEM_PROPERTIES}
+    document["meetingId"] = standalone_task_partition_key(
+        item["id"], item.get("created_at")
+    )
+    return document
+
+
+def migrate_batch(items):
+    """한 배치를 새 파티션에 쓰고, 성공한 항목만 기존 파티션에서 삭제합니다."""
+    documents = [to_sharded_document(item) for item in items]
+    write_result = bulk_write_items(
+        config.COSMOS_ACTION_ITEMS_CONTAINER,
+        [("upsert", document) for document in documents],
+        "meetingId",
+    )
+
+    written_ids = [r["id"] for r in write_result["results"] if r["success"]]
+    failed_ids = [r["id"] for r in write_result["results"] if not r["success"]]
+
+    delete_result = bulk_write_items(
+        config.COSMOS_ACTION_ITEMS_CONTAINER,
+        [
+            ("delete", {"id": item_id, "meetingId": LEGACY_STANDALONE_PARTITION_KEY})
+            for item_id in written_ids
+        ],
+        "meetingId",
+    )
+    # 삭제에 실패한 항목은 양쪽 파티션에 모두 남으므로 --retry-failed 재실행 시 다시 upsert 후 삭제됨
+    failed_ids.extend(r["id"] for r in delete_result["results"] if not r["success"])
+
+    migrated = sum(1 for r in delete_result["results"] if r["success"])
+    return migrated, failed_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="독립 작업 파티션 재분배")
+    parser.add_argument(
+        "--batch-size", type=int, default=BATCH_MAX_OPERATIONS, help="배치당 항목 수"
+    )
+    parser.add_argument("--max-batches", type=int, help="이번 실행에서 처리할 최대 배치 수")
+    parser.add_argument("--state-file", default=DEFAULT_STATE_FILE)
+    parser.add_argument("--retry-failed", action="store_true", help="이전에 실패한 ID도 다시 시도")
+    parser.add_argument("--dry-run", action="store_true", help="옮길 대상만 출력")
+    args = parser.parse_args()
+
+    container = get_container(config.COSMOS_ACTION_ITEMS_CONTAINER)
+    state = load_state(args.state_file)
+    if args.retry_failed:
+        state["failed_ids"] = []
+
+    if args.dry_run:
+        items = fetch_legacy_batch(container, args.batch_size, state["failed_ids"])
+        print(f"🔍 다음 배치 대상 {len(items)}개 (최대 {args.batch_size}개 표시)")
+        for item in items:
+            print(f"  {item['id']} → {to_sharded_document(item)['meetingId']}")
+        return
+
+    print(
+        f"🚀 독립 작업 재분배 시작 (이전 진행: {state['migrated']}개, "
+        f"건너뛸 실패 ID: {len(state['failed_ids'])}개)"
+    )
+
+    batches_this_run = 0
+    while args.max_batches is None or batches_this_run < args.max_batches:
+        items = fetch_legacy_batch(container, args.batch_size, state["failed_ids"])
+        if not items:
+            print(f"✅ 재분배 완료: 총 {state['migrated']}개 이동")
+            break
+
+        migrated, failed_ids = migrate_batch(items)
+        batches_this_run += 1
+        state["batches"] += 1
+        state["migrated"] += migrated
+        state["failed_ids"].extend(failed_ids)
+        state["last_item_id"] = items[-1]["id"]
+        save_state(args.state_file, state)
+
+        print(
+            f"📦 배치 {state['batches']}: {migrated}/{len(items)}개 이동"
+            + (f", 실패 {len(failed_ids)}개" if failed_ids else "")
+        )
+    else:
+        print(f"⏸️ 최대 배치 수 도달, 다시 실행하면 이어서 진행합니다 ({args.state_file})")
+
+    if state["failed_ids"]:
+        print(f"⚠️ 옮기지 못한 ID {len(state['failed_ids'])}개: --retry-failed로 재시도하세요")
+
+
+if __name__ == "__main__":
+    main()
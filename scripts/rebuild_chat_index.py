@@ -0,0 +1,32 @@
+"""
+채팅 사이드바 인덱스 재구성 스크립트
+
+인덱스 레코드가 도입되기 전에 저장된 채팅을 사이드바 목록에 표시하거나,
+인덱스가 헤더와 어긋났을 때(삭제 실패 등) 한 번 실행해 인덱스 파티션을 다시 만듭니다.
+
+사용 예:
+    python scripts/rebuild_chat_index.py
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from db.cosmos_db import rebuild_chat_index
+
+
+def main():
+    print("🔄 채팅 인덱스 재구성 시작")
+    result = rebuild_chat_index()
+    print(
+        f"✅ 채팅 인덱스 재구성 완료: {result['indexed']}개 등록, "
+        f"{result['failed']}개 실패, {result['removed']}개 정리"
+    )
+
+
+if __name__ == "__main__":
+    main()
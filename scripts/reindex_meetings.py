@@ -0,0 +1,142 @@
+"""
+회의 문서 AI Search 일괄 재인덱싱 스크립트
+
+저장소의 회의를 페이지 단위로 읽어 원문을 불러온 뒤 배치 인덱서(services/search_indexer.py)
+대기열에 넣습니다. 인덱서가 최대 1000건씩 merge_or_upload 배치로 올리고 실패한 키만
+재시도하며, 대기열이 가득 차면 읽기를 잠시 멈춥니다(백프레셔).
+
+--vectors-only는 AI Search 없이 로컬 벡터 인덱스(services/vector_service.py)만 회의/청크/직원으로
+다시 만들고 VECTOR_INDEX_DIR에 저장합니다.
+
+사용 예:
+    python scripts/reindex_meetings.py
+    python scripts/reindex_meetings.py --page-size 200 --limit 1000
+    python scripts/reindex_meetings.py --vectors-only
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from db.storage import get_all_staff, get_meetings_page, parse_summary
+from services.search_indexer import get_search_indexer
+from services.search_service import build_search_documents, chunk_counts
+from services.transcript_service import load_transcript
+from services.vector_service import (
+    get_vector_stats,
+    index_search_documents,
+    remove_stale_chunk_vectors,
+    sync_staff_vectors,
+)
+
+
+def meeting_search_documents(meeting):
+    """/upload와 같은 형식으로 회의 검색 문서(부모 + 원문 청크)를 만듭니다."""
+    summary = parse_summary(meeting.get("summary")) or {}
+    metadata = {
+        "meeting_id": meeting["id"],
+        "meeting_title": meeting.get("title", "제목 없음"),
+        "summary": summary.get("summary", ""),
+        "action_items_count": len(summary.get("actionItems") or []),
+        "created_at": meeting.get("created_at", ""),
+        "document_type": "meeting",
+    }
+    return build_search_documents(
+        f"meeting_{meeting['id']}",
+        load_transcript(meeting),
+        metadata,
+    )
+
+
+def rebuild_vectors(args):
+    """AI Search 없이 로컬 벡터 인덱스만 다시 만들어 저장합니다."""
+    started = time.time()
+    meetings_done = documents = failed = 0
+    token = None
+
+    print("🔄 로컬 벡터 인덱스 재구성 시작")
+    while True:
+        meetings, token = get_meetings_page(args.page_size, token)
+        batch = []
+        for meeting in meetings:
+            try:
+                batch.extend(meeting_search_documents(meeting))
+                meetings_done += 1
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ {meeting.get('id')} 문서 준비 실패: {e}")
+            if args.limit and meetings_done >= args.limit:
+                token = None
+                break
+        # 페이지 단위로 반영 (컬렉션별로 한 번씩 잠금/저장)
+        documents += index_search_documents(batch)
+        remove_stale_chunk_vectors(chunk_counts(batch))
+        if not token:
+            break
+
+    staff_count = sync_staff_vectors(get_all_staff() or [], replace=True)
+    print(
+        f"✅ 벡터 인덱스 재구성 완료: 회의 {meetings_done}개, 문서 {documents}건, "
+        f"직원 {staff_count}명, 준비 실패 {failed}건 ({time.time() - started:.1f}초)"
+    )
+    print(f"   {get_vector_stats()}")
+    if failed:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="회의 문서 AI Search 일괄 재인덱싱")
+    parser.add_argument("--page-size", type=int, default=100, help="회의 조회 페이지 크기")
+    parser.add_argument("--limit", type=int, help="최대 회의 수 (기본: 전체)")
+    parser.add_argument(
+        "--vectors-only", action="store_true", help="로컬 벡터 인덱스만 다시 만들기"
+    )
+    args = parser.parse_args()
+
+    if args.vectors_only:
+        rebuild_vectors(args)
+        return
+
+    indexer = get_search_indexer()
+    started = time.time()
+    submitted = failed = 0
+    token = None
+
+    print("🔄 회의 문서 재인덱싱 시작")
+    while True:
+        meetings, token = get_meetings_page(args.page_size, token)
+        for meeting in meetings:
+            try:
+                indexer.submit_documents(meeting_search_documents(meeting))
+                submitted += 1
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ {meeting.get('id')} 문서 준비 실패: {e}")
+            if args.limit and submitted >= args.limit:
+                token = None
+                break
+        elapsed = max(time.time() - started, 0.001)
+        print(f"⏳ 회의 {submitted}개 대기열 등록 ({submitted / elapsed:.0f}개/초), 인덱서 {indexer.stats()}")
+        if not token:
+            break
+
+    indexer.flush()
+    stats = indexer.stats()
+    elapsed = max(time.time() - started, 0.001)
+    print(
+        f"✅ 재인덱싱 완료: 회의 {submitted}개, 문서 {stats['indexed']}건 성공, {stats['failed']}건 실패, "
+        f"준비 실패 {failed}건, 배치 {stats['batches']}회 ({stats['indexed'] / elapsed:.0f}건/초)"
+    )
+    indexer.stop()
+    if stats["failed"] or failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
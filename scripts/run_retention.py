@@ -0,0 +1,66 @@
+"""
+감사 로그/승인 이력 보관 일일 작업
+
+db/retention.py의 run_retention을 실행해, RETENTION_COMPACT_AFTER_DAYS일이 지난 이벤트를
+Blob에 JSONL.gz로 보관하고 리소스별 요약 문서로 압축한 뒤 컨테이너 TTL을 적용합니다.
+스케줄러(cron, Container Apps 작업 등)에서 하루 한 번, 한 인스턴스만 실행하세요.
+
+사용 예:
+    python scripts/run_retention.py
+    python scripts/run_retention.py --target audit --dry-run
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import config.config as config
+from db.retention import get_retention_targets, run_retention
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감사 로그/승인 이력 보관 및 압축")
+    parser.add_argument(
+        "--target",
+        action="append",
+        choices=sorted(get_retention_targets()),
+        help="대상 컨테이너 (여러 번 지정 가능, 기본: 전체)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="보관/요약/TTL 변경 없이 대상 이벤트 수만 확인"
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    if config.STORAGE_BACKEND != "cosmos":
+        print(f"⚠️ 저장소 백엔드가 {config.STORAGE_BACKEND}라 보관 작업을 건너뜁니다")
+        return
+
+    results = run_retention(args.target, dry_run=args.dry_run)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        mode = " (dry-run)" if args.dry_run else ""
+        print(f"🗄️ 보관 작업 결과{mode} - {config.RETENTION_COMPACT_AFTER_DAYS}일 이전 이벤트")
+        for result in results:
+            if "error" in result:
+                print(f"❌ {result['container']}: {result['error']}")
+                continue
+            print(
+                f"✅ {result['container']}: 이벤트 {result['events']}개, "
+                f"요약 {result['summaries']}개, 보관 {result['archive_blob'] or '-'}, "
+                f"TTL 갱신 {'예' if result.get('ttl_updated') else '아니오'}"
+            )
+
+    if any("error" in result for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+동기 저장소 호출 API 서버 (벤치마크 기준선)
+
+api.api 앱의 저장소 함수(db.storage_async에서 가져온 이름)를 db.storage의 동기 함수를
+그대로 호출하는 코루틴으로 바꿔 띄웁니다. 비동기 저장소 도입 전처럼 async 엔드포인트
+안에서 저장소 호출이 이벤트 루프를 막는 상태를 재현하므로, 같은 백엔드(예: STORAGE_BACKEND=sqlite)로
+띄운 현재 서버와 benchmark_api_concurrency.py 결과를 비교할 수 있습니다.
+
+사용 예:
+    STORAGE_BACKEND=sqlite python scripts/serve_api_sync_storage.py --port 8000
+    python scripts/benchmark_api_concurrency.py --output before.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import uvicorn
+
+import api.api as api
+import db.storage as storage
+
+STORAGE_FUNCTIONS = [
+    "save_meeting",
+    "get_meeting_summaries_page",
+    "get_meeting",
+    "get_action_items",
+    "approve_action_item",
+    "update_action_item_status",
+    "get_dashboard_stats",
+    "get_recent_meetings",
+]
+
+
+def blocking(function):
+    """동기 함수를 이벤트 루프에서 바로 실행하는 코루틴 함수로 감쌉니다."""
+
+    async def call(*args, **kwargs):
+        return function(*args, **kwargs)
+
+    return call
+
+
+def use_sync_storage():
+    """api.api의 저장소 함수를 db.storage 동기 함수로 바꿉니다."""
+    for name in STORAGE_FUNCTIONS:
+        setattr(api, name, blocking(getattr(storage, name)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기 저장소 호출 API 서버 (벤치마크 기준선)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    use_sync_storage()
+    uvicorn.run(api.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+인사정보 일괄 가져오기/내보내기 스크립트
+
+CSV 또는 JSONL 파일을 한 줄씩 읽어 청크 단위로 upsert하고(Cosmos는 파티션별 배치를 동시 실행),
+청크마다 진행 현황을 출력합니다. 내보내기는 직원을 페이지 단위로 읽어 바로 파일에 씁니다.
+형식은 확장자로 판단하며(.csv, .jsonl) --format으로 지정할 수 있습니다.
+
+사용 예:
+    python scripts/staff_transfer.py import staff.csv
+    python scripts/staff_transfer.py import staff.jsonl --chunk-size 1000 --concurrency 16
+    python scripts/staff_transfer.py export staff_backup.jsonl
+    python scripts/staff_transfer.py export - --format csv
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from db.staff_io import STAFF_FORMATS, detect_staff_format, iter_staff_lines, valid_staff_records
+from db.storage import import_staff, iter_staff
+
+
+def run_import(args, fmt):
+    """파일을 읽어 직원을 가져오고 진행 현황을 출력합니다."""
+    started = time.time()
+    invalid = []
+
+    def on_progress(progress):
+        rate = progress["processed"] / max(time.time() - started, 0.001)
+        print(
+            f"⏳ {progress['processed']}건 처리 (성공 {progress['succeeded']}, "
+            f"실패 {progress['failed']}, {progress['request_charge']:.1f} RU, {rate:.0f}건/초)",
+            file=sys.stderr,
+        )
+
+    with open(args.path, "r", encoding="utf-8-sig", newline="") as stream:
+        result = import_staff(
+            valid_staff_records(stream, fmt, invalid),
+            chunk_size=args.chunk_size,
+            max_concurrency=args.concurrency,
+            on_progress=on_progress,
+        )
+
+    print(
+        f"✅ 가져오기 완료: 성공 {result['succeeded']}명, 실패 {result['failed']}명, "
+        f"형식 오류 {len(invalid)}줄 ({time.time() - started:.1f}초)"
+    )
+    for message in (invalid + result["errors"])[: args.show_errors]:
+        print(f"  ❌ {message}")
+    return not invalid and not result["failed"]
+
+
+def run_export(args, fmt):
+    """직원을 페이지 단위로 읽어 파일(또는 표준 출력)에 씁니다."""
+    count = 0
+    stream = sys.stdout if args.path == "-" else open(args.path, "w", encoding="utf-8", newline="")
+    try:
+        for line in iter_staff_lines(iter_staff(), fmt):
+            stream.write(line)
+            count += 1
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    # CSV는 헤더 줄 제외
+    exported = count - 1 if fmt == "csv" else count
+    print(f"✅ 내보내기 완료: {exported}명 → {args.path}", file=sys.stderr)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인사정보 일괄 가져오기/내보내기")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("path", help="CSV/JSONL 파일 경로 (내보내기는 '-'면 표준 출력)")
+    parser.add_argument("--format", choices=STAFF_FORMATS, help="파일 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="가져오기 청크 크기")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 배치 실행 수 (Cosmos)")
+    parser.add_argument("--show-errors", type=int, default=20, help="출력할 오류 수")
+    args = parser.parse_args()
+
+    fmt = args.format or detect_staff_format(args.path)
+    ok = run_import(args, fmt) if args.command == "import" else run_export(args, fmt)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
-from azure.storage.blob import BlobServiceClient
-from azure.core.exceptions import AzureError
+from azure.storage.blob import BlobServiceClient, ContentSettings
+from azure.core.exceptions import AzureError, ResourceExistsError
 import os
+import threading
 import time
 import logging
 from config.logging_config import log_error_with_context, log_performance, log_azure_service_call
@@ -8,6 +9,63 @@ from config.logging_config import log_error_with_context, log_performance, log_a
 # 로깅 설정
 logger = logging.getLogger("blob_service")
 
+# 프로세스 전역 컨테이너 클라이언트 (연결 재사용)
+_container_client = None
+_container_client_lock = threading.Lock()
+
+
+def get_container_client():
+    """공유 Blob 컨테이너 클라이언트를 반환합니다."""
+    global _container_client
+    with _container_client_lock:
+        if _container_client is None:
+            from config.config import AZURE_BLOB_CONNECTION_STRING, AZURE_BLOB_CONTAINER
+
+            blob_service_client = BlobServiceClient.from_connection_string(AZURE_BLOB_CONNECTION_STRING)
+            _container_client = blob_service_client.get_container_client(AZURE_BLOB_CONTAINER)
+        return _container_client
+
+
+def upload_bytes_if_absent(blob_name, data, content_type=None):
+    """바이트 데이터를 업로드합니다. 같은 이름의 Blob이 이미 있으면 건너뛰고 False를 반환합니다."""
+    start_time = time.time()
+    try:
+        get_container_client().upload_blob(
+            name=blob_name,
+            data=data,
+            overwrite=False,
+            content_settings=ContentSettings(content_type=content_type) if content_type else None,
+        )
+        uploaded = True
+    except ResourceExistsError:
+        uploaded = False
+    except Exception as e:
+        log_azure_service_call(logger, "Azure Blob Storage", "upload_blob",
+                             time.time() - start_time, False, None, f"File: {blob_name}, Error: {str(e)}")
+        logger.error(f"❌ Blob 업로드 실패: {blob_name} - {e}")
+        raise
+
+    log_azure_service_call(logger, "Azure Blob Storage", "upload_blob",
+                         time.time() - start_time, True, None,
+                         f"File: {blob_name}, Size: {len(data)} bytes, Uploaded: {uploaded}")
+    return uploaded
+
+
+def download_bytes(blob_name):
+    """Blob 내용을 바이트로 내려받습니다."""
+    start_time = time.time()
+    try:
+        data = get_container_client().download_blob(blob_name).readall()
+        log_azure_service_call(logger, "Azure Blob Storage", "download_blob",
+                             time.time() - start_time, True, None, f"File: {blob_name}, Size: {len(data)} bytes")
+        return data
+    except Exception as e:
+        log_azure_service_call(logger, "Azure Blob Storage", "download_blob",
+                             time.time() - start_time, False, None, f"File: {blob_name}, Error: {str(e)}")
+        logger.error(f"❌ Blob 다운로드 실패: {blob_name} - {e}")
+        raise
+
+
 def upload_to_blob(file_path, blob_name):
     """파일을 Azure Blob Storage에 업로드합니다."""
     start_time = time.time()
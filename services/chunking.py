@@ -0,0 +1,149 @@
+"""
+회의 원문 청크 분할 (RAG 인덱싱용)
+
+원문을 문장 단위로 나눈 뒤 SEARCH_CHUNK_MAX_CHARS 이하의 청크로 묶습니다.
+- 줄 앞의 화자 표기("김민수: ...", "[화자1] ...", "Speaker 1: ...")를 인식해 청크 안에서
+  화자별로 줄을 나누고, 청크가 절반 이상 찼을 때 화자가 바뀌면 그 자리에서 청크를 끊습니다.
+- 문장 경계는 문장부호(. ? ! … 등)와 문장부호 없는 STT 결과를 위한 한국어 종결 어미
+  (~니다, ~어요, ~죠 등) 뒤의 공백입니다.
+- 다음 청크는 이전 청크 끝 문장들(SEARCH_CHUNK_OVERLAP_CHARS 이내)로 시작해 경계에 걸친
+  맥락이 끊기지 않게 합니다.
+- 최대 길이보다 긴 문장은 공백 기준으로(공백이 없으면 글자 수로) 자릅니다.
+
+저장소/검색 서비스와 무관한 순수 함수만 둡니다.
+"""
+
+import re
+
+import config.config as config
+
+# 줄 앞 화자 표기: [이름] 또는 이름: (이름은 최대 20자, 3단어 이하)
+SPEAKER_PATTERN = re.compile(
+    r"^\s*(?:\[(?P<bracket>[^\]\n]{1,20})\]\s*[:：]?"
+    r"|(?P<name>(?!\d)[^\s:：\[\]][^:：\n]{0,19}?)\s*[:：](?=\s|$))\s*"
+)
+# 문장부호 또는 한국어 종결 어미 뒤 공백에서 문장을 나눔
+SENTENCE_BOUNDARY = re.compile(
+    r"(?<=[.!?。！？…])\s+|(?<=[.!?。！？…][\"'”’)\]])\s+"
+    r"|(?<=니다|어요|아요|에요|예요|해요|세요|네요|군요)\s+|(?<=죠)\s+"
+)
+
+
+def _split_speaker(line):
+    """줄 앞 화자 표기를 분리합니다 (화자 또는 None, 본문)."""
+    match = SPEAKER_PATTERN.match(line)
+    if not match:
+        return None, line.strip()
+    speaker = (match.group("bracket") or match.group("name") or "").strip()
+    if not speaker or len(speaker.split()) > 3:
+        return None, line.strip()
+    return speaker, line[match.end() :].strip()
+
+
+def split_sentences(text):
+    """문장 경계에서 텍스트를 나눕니다 (빈 문장 제외)."""
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+def _split_long(sentence, max_chars):
+    """max_chars보다 긴 문장을 공백 기준으로 자릅니다."""
+    if len(sentence) <= max_chars:
+        return [sentence]
+    pieces, current = [], ""
+    for word in sentence.split():
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def iter_units(text, max_chars):
+    """원문을 (화자, 문장) 단위로 차례로 반환합니다 (화자 표기가 없는 줄은 직전 화자를 이어감)."""
+    speaker = None
+    for line in (text or "").splitlines():
+        if not line.strip():
+            continue
+        line_speaker, body = _split_speaker(line)
+        if line_speaker:
+            speaker = line_speaker
+        for sentence in split_sentences(body):
+            for piece in _split_long(sentence, max_chars):
+                yield speaker, piece
+
+
+def _unit_size(units, index):
+    """청크 안에서 index번째 단위가 차지하는 글자 수 (화자가 바뀌면 화자 표기 포함)."""
+    speaker, sentence = units[index]
+    size = len(sentence) + 1
+    if speaker and (index == 0 or units[index - 1][0] != speaker):
+        size += len(speaker) + 2
+    return size
+
+
+def render_chunk(units):
+    """(화자, 문장) 목록을 화자별 줄로 합칩니다."""
+    lines = []
+    previous = object()
+    for speaker, sentence in units:
+        if lines and speaker == previous:
+            lines[-1] = f"{lines[-1]} {sentence}"
+        else:
+            lines.append(f"{speaker}: {sentence}" if speaker else sentence)
+        previous = speaker
+    return "\n".join(lines)
+
+
+def _make_chunk(position, units):
+    speakers = []
+    for speaker, _ in units:
+        if speaker and speaker not in speakers:
+            speakers.append(speaker)
+    return {"position": position, "content": render_chunk(units), "speakers": speakers}
+
+
+def chunk_transcript(text, max_chars=None, overlap_chars=None):
+    """원문을 문장/화자 경계를 지키는 청크 목록으로 나눕니다 ({position, content, speakers})."""
+    max_chars = max_chars or config.SEARCH_CHUNK_MAX_CHARS
+    overlap_chars = config.SEARCH_CHUNK_OVERLAP_CHARS if overlap_chars is None else overlap_chars
+    overlap_chars = min(overlap_chars, max_chars // 2)
+
+    chunks = []
+    current = []
+    size = 0
+    for unit in iter_units(text, max_chars):
+        speaker_changed = bool(current) and current[-1][0] != unit[0]
+        current.append(unit)
+        added = _unit_size(current, len(current) - 1)
+        full = size + added > max_chars
+        turn_break = speaker_changed and size >= max_chars // 2
+        if len(current) > 1 and (full or turn_break):
+            current.pop()
+            chunks.append(_make_chunk(len(chunks), current))
+
+            # 이전 청크 끝 문장들로 다음 청크를 시작 (화자가 바뀐 자리에서는 겹치지 않음)
+            carried = []
+            if not turn_break:
+                budget = overlap_chars
+                for previous in reversed(current[1:]):
+                    if len(previous[1]) + 1 > budget:
+                        break
+                    carried.insert(0, previous)
+                    budget -= len(previous[1]) + 1
+            current = carried + [unit]
+            size = sum(_unit_size(current, i) for i in range(len(current)))
+        else:
+            size += added
+
+    if current:
+        chunks.append(_make_chunk(len(chunks), current))
+    return chunks
@@ -0,0 +1,317 @@
+"""
+AI Search 버퍼링 배치 인덱서
+
+요청 경로에서 문서마다 upload_documents([doc])를 기다리지 않도록, 문서를 대기열에 넣고
+백그라운드 스레드가 모아서 merge_or_upload_documents 배치로 올립니다.
+
+- 배치는 SEARCH_INDEX_BATCH_SIZE개(최대 1000) 또는 SEARCH_INDEX_BATCH_MAX_BYTES에 도달하거나,
+  첫 문서가 들어온 뒤 SEARCH_INDEX_FLUSH_SECONDS가 지나면 전송합니다.
+- 응답의 문서별 결과를 보고 실패한 키 중 재시도 가능한 상태 코드(409/422/429/5xx)만
+  지수 백오프로 다시 보냅니다. 배치 전체가 413이면 반으로 나눠 보냅니다.
+- 대기열(SEARCH_INDEX_QUEUE_SIZE)이 가득 차면 submit이 빈자리가 날 때까지 기다립니다(백프레셔).
+- 같은 배치 안에서 같은 키의 문서는 마지막 문서로 합칩니다.
+- submit_documents로 넣은 회의는 배치 전송 전에 새 청크 수 이후의 이전 청크를 지웁니다.
+
+프로세스당 하나의 인덱서를 get_search_indexer()로 공유하며, 종료 시 남은 문서를 전송합니다.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+
+from azure.core.exceptions import HttpResponseError
+
+import config.config as config
+from config.logging_config import (
+    log_azure_service_call,
+    log_error_with_context,
+    log_performance,
+)
+from services.search_service import (
+    build_search_documents,
+    chunk_counts,
+    delete_stale_chunks,
+    ensure_search_infrastructure,
+    get_search_client,
+)
+from services.vector_service import index_search_documents, remove_stale_chunk_vectors
+
+logger = logging.getLogger("search_indexer")
+
+MAX_BATCH_DOCUMENTS = 1000  # AI Search 인덱싱 요청 1회당 최대 문서 수
+RETRYABLE_STATUS_CODES = {409, 422, 429, 500, 502, 503, 504}
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 30.0
+
+_STOP = object()
+
+
+class BufferedSearchIndexer:
+    """대기열에 쌓인 문서를 크기/시간 기준으로 모아 배치 인덱싱하는 처리기"""
+
+    def __init__(
+        self,
+        index_name=None,
+        batch_size=None,
+        flush_seconds=None,
+        max_batch_bytes=None,
+        queue_size=None,
+        max_retries=None,
+        client=None,
+    ):
+        self.index_name = index_name or config.AZURE_SEARCH_INDEX
+        self.batch_size = min(batch_size or config.SEARCH_INDEX_BATCH_SIZE, MAX_BATCH_DOCUMENTS)
+        self.flush_seconds = flush_seconds or config.SEARCH_INDEX_FLUSH_SECONDS
+        self.max_batch_bytes = max_batch_bytes or config.SEARCH_INDEX_BATCH_MAX_BYTES
+        self.max_retries = (
+            config.SEARCH_INDEX_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self._client = client
+        self._queue = queue.Queue(maxsize=queue_size or config.SEARCH_INDEX_QUEUE_SIZE)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._chunk_counts = {}  # 다음 배치에서 이전 청크를 정리할 {부모 ID: 청크 수}
+        self._stats = {
+            "submitted": 0,
+            "indexed": 0,
+            "failed": 0,
+            "retried": 0,
+            "batches": 0,
+            "backpressure_waits": 0,
+        }
+
+    @property
+    def client(self):
+        return self._client or get_search_client(self.index_name)
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def stats(self):
+        """대기열 길이와 누적 처리 현황을 반환합니다."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        stats["running"] = bool(self._thread and self._thread.is_alive())
+        return stats
+
+    # 대기열
+    def submit(self, document, timeout=None):
+        """문서를 대기열에 넣습니다 (가득 차면 timeout초까지 대기, 시간 초과 시 False)."""
+        self.start()
+        try:
+            self._queue.put_nowait(document)
+        except queue.Full:
+            self._count("backpressure_waits")
+            try:
+                self._queue.put(document, timeout=timeout)
+            except queue.Full:
+                logger.warning(f"인덱싱 대기열이 가득 차 문서를 넣지 못했습니다: {document.get('id')}")
+                return False
+        self._count("submitted")
+        return True
+
+    def submit_documents(self, documents, timeout=None):
+        """회의 문서(부모 + 청크)를 대기열에 넣고, 다음 배치 전송 때 줄어든 이전 청크를 지우도록 기록합니다."""
+        with self._lock:
+            self._chunk_counts.update(chunk_counts(documents))
+        return all(self.submit(document, timeout=timeout) for document in documents)
+
+    def flush(self, timeout=None):
+        """지금까지 넣은 문서가 모두 전송될 때까지 기다립니다."""
+        if not (self._thread and self._thread.is_alive()):
+            return self._queue.unfinished_tasks == 0
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    # 배치 수집/전송
+    def _collect_batch(self, first):
+        """첫 항목부터 크기/바이트/시간 기준에 닿을 때까지 문서를 모읍니다 (문서, 꺼낸 항목 목록)."""
+        documents = {}
+        taken = []
+        size = 0
+        deadline = time.monotonic() + self.flush_seconds
+        item = first
+        while True:
+            taken.append(item)
+            # 종료/flush 요청이면 지금까지 모은 배치를 바로 전송
+            if item is _STOP or isinstance(item, threading.Event):
+                break
+            size += len(json.dumps(item, ensure_ascii=False, default=str).encode("utf-8"))
+            documents.pop(item["id"], None)
+            documents[item["id"]] = item
+            if len(documents) >= self.batch_size or size >= self.max_batch_bytes:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+        return list(documents.values()), taken
+
+    def _send(self, documents):
+        """배치를 전송하고 재시도 가능한 실패 문서만 다시 보냅니다 (최종 실패 수 반환)."""
+        pending = documents
+        dropped_total = 0
+        for attempt in range(self.max_retries + 1):
+            if not pending:
+                return dropped_total
+            if attempt:
+                self._count("retried", len(pending))
+                time.sleep(min(RETRY_BASE_SECONDS * (2 ** (attempt - 1)), RETRY_MAX_SECONDS))
+
+            start_time = time.time()
+            try:
+                results = self.client.merge_or_upload_documents(documents=pending)
+            except HttpResponseError as e:
+                if e.status_code == 413 and len(pending) > 1:
+                    middle = len(pending) // 2
+                    return (
+                        dropped_total
+                        + self._send(pending[:middle])
+                        + self._send(pending[middle:])
+                    )
+                if e.status_code not in RETRYABLE_STATUS_CODES:
+                    log_error_with_context(logger, e, f"Search batch indexing failed: {len(pending)} docs")
+                    self._count("failed", len(pending))
+                    return dropped_total + len(pending)
+                logger.warning(f"인덱싱 배치 오류({e.status_code}), 재시도합니다: {len(pending)}건")
+                continue
+            except Exception as e:
+                logger.warning(f"인덱싱 배치 전송 실패, 재시도합니다: {e}")
+                continue
+
+            by_key = {document["id"]: document for document in pending}
+            succeeded = [r for r in results if r.succeeded]
+            retry, dropped = [], []
+            for result in results:
+                if result.succeeded:
+                    continue
+                if result.status_code in RETRYABLE_STATUS_CODES:
+                    retry.append(by_key[result.key])
+                else:
+                    dropped.append(result)
+
+            self._count("indexed", len(succeeded))
+            log_azure_service_call(
+                logger,
+                "Azure AI Search",
+                "merge_or_upload_documents",
+                time.time() - start_time,
+                not retry and not dropped,
+                None,
+                f"Index: {self.index_name}, Docs: {len(pending)}, "
+                f"Failed: {len(retry) + len(dropped)}",
+            )
+            for result in dropped:
+                logger.error(
+                    f"❌ 문서 인덱싱 실패 ({result.status_code}): {result.key} - {result.error_message}"
+                )
+            self._count("failed", len(dropped))
+            dropped_total += len(dropped)
+            pending = retry
+
+        if pending:
+            logger.error(f"❌ 재시도 후에도 인덱싱 실패: {[d['id'] for d in pending]}")
+            self._count("failed", len(pending))
+        return dropped_total + len(pending)
+
+    def _flush_batch(self, documents):
+        if not documents:
+            return
+        start_time = time.time()
+        with self._lock:
+            counts, self._chunk_counts = self._chunk_counts, {}
+        # 로컬 벡터 인덱스는 AI Search 연결과 무관하게 반영
+        index_search_documents(documents)
+        remove_stale_chunk_vectors(counts)
+        if not ensure_search_infrastructure():
+            logger.error(f"❌ AI Search 인프라 설정 실패로 {len(documents)}건을 인덱싱하지 못했습니다")
+            self._count("failed", len(documents))
+            return
+        try:
+            delete_stale_chunks(counts, self.client)
+        except Exception as e:
+            log_error_with_context(logger, e, "Failed to delete stale chunks")
+            logger.warning(f"⚠️ 이전 청크 삭제 실패: {e}")
+        failed = self._send(documents)
+        self._count("batches")
+        log_performance(
+            logger,
+            "search_batch_indexing",
+            time.time() - start_time,
+            f"Docs: {len(documents)}, Failed: {failed}",
+        )
+
+    def _run(self):
+        while True:
+            documents, taken = self._collect_batch(self._queue.get())
+            try:
+                self._flush_batch(documents)
+            except Exception as e:
+                log_error_with_context(logger, e, "Buffered search indexing failed")
+                logger.error(f"인덱싱 배치 처리 실패: {e}")
+                self._count("failed", len(documents))
+            finally:
+                for item in taken:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                    self._queue.task_done()
+            if any(item is _STOP for item in taken):
+                return
+
+    def start(self):
+        """백그라운드 전송 스레드를 시작합니다 (이미 실행 중이면 무시)."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="search-indexer"
+            )
+            self._thread.start()
+
+    def stop(self, timeout=30):
+        """남은 문서를 전송하고 스레드를 종료합니다."""
+        if self._thread and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout=timeout)
+
+
+_indexer = None
+_indexer_lock = threading.Lock()
+
+
+def get_search_indexer():
+    """프로세스당 하나의 회의 문서 인덱서를 반환합니다."""
+    global _indexer
+
+    with _indexer_lock:
+        if _indexer is None:
+            _indexer = BufferedSearchIndexer()
+            _indexer.start()
+            atexit.register(_indexer.stop)
+        return _indexer
+
+
+def enqueue_document(doc_id, content, metadata, blob_path=None, timeout=None):
+    """index_document와 같은 문서(부모 + 원문 청크)를 만들어 배치 인덱서 대기열에 넣습니다."""
+    return get_search_indexer().submit_documents(
+        build_search_documents(doc_id, content, metadata, blob_path), timeout=timeout
+    )
+
+
+def stop_search_indexer(timeout=30):
+    """대기 중인 문서를 전송하고 인덱서를 종료합니다 (애플리케이션 종료 시)."""
+    global _indexer
+
+    with _indexer_lock:
+        indexer, _indexer = _indexer, None
+    if indexer is not None:
+        indexer.stop(timeout)
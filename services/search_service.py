@@ -11,6 +11,18 @@ from azure.search.documents.indexes.models import (
 from azure.core.credentials import AzureKeyCredential
 from azure.core.exceptions import AzureError, ResourceNotFoundError
 import config.config as config
+from services.chunking import chunk_transcript
+from services.vector_service import (
+    index_search_documents,
+    reciprocal_rank_fusion,
+    remove_stale_chunk_vectors,
+    remove_vector,
+    sync_staff_vectors,
+    vector_search,
+)
+import hashlib
+import json
+import threading
 import time
 import logging
 from config.logging_config import (
@@ -22,16 +34,108 @@ from config.logging_config import (
 # 로깅 설정
 logger = logging.getLogger("search_service")
 
+# Search 클라이언트 풀
+# SearchClient(인덱스별)와 SearchIndexClient를 프로세스에서 공유해 HTTP 연결을 재사용합니다.
+_pool_lock = threading.RLock()
+_index_client = None
+_search_clients = {}
+_pool_stats = {
+    "client_creations": 0,
+    "client_reuses": 0,
+}
+
+# 인프라(인덱스/데이터 소스/인덱서) 확인 결과 캐시
+# 프로세스당 한 번 확인한 뒤 SEARCH_BOOTSTRAP_REVALIDATE_SECONDS마다 백그라운드에서 다시 확인하고,
+# 실패는 SEARCH_BOOTSTRAP_RETRY_SECONDS 동안만 기억해 매 호출마다 관리 API를 두드리지 않습니다.
+_bootstrap_lock = threading.Lock()
+_bootstrap_setup_lock = threading.Lock()
+_bootstrap_state = {
+    "ready": False,
+    "checked_at": 0.0,
+    "revalidating": False,
+    "checks": 0,
+    "cache_hits": 0,
+}
+
+
+def _credential():
+    return AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY)
+
+
+def get_index_client():
+    """프로세스 전역에서 공유되는 SearchIndexClient를 반환합니다."""
+    global _index_client
+
+    with _pool_lock:
+        if _index_client is None:
+            _index_client = SearchIndexClient(
+                endpoint=config.AZURE_SEARCH_ENDPOINT, credential=_credential()
+            )
+            _pool_stats["client_creations"] += 1
+        else:
+            _pool_stats["client_reuses"] += 1
+        return _index_client
+
+
+def get_search_client(index_name=None):
+    """인덱스별로 캐시된 SearchClient를 반환합니다 (기본: 회의 문서 인덱스)."""
+    index_name = index_name or config.AZURE_SEARCH_INDEX
+
+    with _pool_lock:
+        client = _search_clients.get(index_name)
+        if client is not None:
+            _pool_stats["client_reuses"] += 1
+            return client
+
+        client = SearchClient(
+            endpoint=config.AZURE_SEARCH_ENDPOINT,
+            index_name=index_name,
+            credential=_credential(),
+        )
+        _search_clients[index_name] = client
+        _pool_stats["client_creations"] += 1
+        return client
+
+
+def reset_search_clients():
+    """캐시된 클라이언트를 닫고 폐기합니다 (키 교체, 종료 시)."""
+    global _index_client
+
+    with _pool_lock:
+        clients = list(_search_clients.values()) + [_index_client]
+        _search_clients.clear()
+        _index_client = None
+    for client in clients:
+        if client is not None:
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Search 클라이언트 종료 실패: {e}")
+
+
+def get_search_client_stats():
+    """Search 클라이언트 풀과 인프라 확인 캐시 현황을 반환합니다."""
+    with _pool_lock:
+        stats = dict(_pool_stats)
+        stats["cached_search_clients"] = len(_search_clients)
+    with _bootstrap_lock:
+        stats["bootstrap_ready"] = _bootstrap_state["ready"]
+        stats["bootstrap_checks"] = _bootstrap_state["checks"]
+        stats["bootstrap_cache_hits"] = _bootstrap_state["cache_hits"]
+        stats["bootstrap_age_seconds"] = (
+            round(time.time() - _bootstrap_state["checked_at"], 1)
+            if _bootstrap_state["checked_at"]
+            else None
+        )
+    return stats
+
 
 def create_search_index():
     """AI Search 인덱스가 없는 경우 생성합니다."""
     try:
         logger.info("AI Search 인덱스 생성/확인 시작")
 
-        index_client = SearchIndexClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-        )
+        index_client = get_index_client()
 
         # 회의 문서용 인덱스 확인/생성
         meeting_index_exists = create_meetings_index(index_client)
@@ -46,6 +150,23 @@ def create_search_index():
         return False
 
 
+def _meeting_chunk_fields():
+    """회의 원문 청크(자식 문서)용 필드: 부모 문서 ID, 청크 순서, 화자"""
+    return [
+        SimpleField(
+            name="parent_id", type="Edm.String", searchable=False, filterable=True
+        ),
+        SimpleField(
+            name="chunk_position",
+            type="Edm.Int32",
+            searchable=False,
+            filterable=True,
+            sortable=True,
+        ),
+        SearchableField(name="speakers", type="Edm.String", searchable=True),
+    ]
+
+
 def create_meetings_index(index_client):
     """회의 문서용 인덱스를 생성합니다."""
     try:
@@ -55,13 +176,24 @@ def create_meetings_index(index_client):
             logger.info(
                 f"✅ 회의 문서 인덱스가 이미 존재합니다: {config.AZURE_SEARCH_INDEX}"
             )
+            # 청크 문서용 필드가 없는 이전 인덱스에는 필드만 추가
+            existing_names = {field.name for field in existing_index.fields}
+            missing = [
+                field for field in _meeting_chunk_fields() if field.name not in existing_names
+            ]
+            if missing:
+                existing_index.fields.extend(missing)
+                index_client.create_or_update_index(existing_index)
+                logger.info(
+                    f"✅ 회의 문서 인덱스에 청크 필드 추가 완료: {[f.name for f in missing]}"
+                )
             return True
         except ResourceNotFoundError:
             logger.info(
                 f"회의 문서 인덱스가 존재하지 않아 새로 생성합니다: {config.AZURE_SEARCH_INDEX}"
             )
 
-            # 11개 필드 인덱스 정의 (improve_index.py와 동일)
+            # 11개 필드 인덱스 정의 (improve_index.py와 동일) + 청크 필드 3개
             fields = [
                 SimpleField(name="id", type="Edm.String", key=True),
                 SearchableField(name="content", type="Edm.String", searchable=True),
@@ -98,6 +230,7 @@ def create_meetings_index(index_client):
                     filterable=True,
                 ),
                 SimpleField(name="document_type", type="Edm.String", filterable=True),
+                *_meeting_chunk_fields(),
             ]
 
             index = SearchIndex(name=config.AZURE_SEARCH_INDEX, fields=fields)
@@ -105,7 +238,7 @@ def create_meetings_index(index_client):
             # 인덱스 생성
             result = index_client.create_index(index)
             logger.info(
-                f"✅ 회의 문서 인덱스 생성 완료 (11필드): {config.AZURE_SEARCH_INDEX}"
+                f"✅ 회의 문서 인덱스 생성 완료 (14필드): {config.AZURE_SEARCH_INDEX}"
             )
 
             return True
@@ -115,6 +248,11 @@ def create_meetings_index(index_client):
         return False
 
 
+def _staff_content_hash_field():
+    """직원 문서의 색인 필드 해시 (증분 동기화 비교용)"""
+    return SimpleField(name="content_hash", type="Edm.String", searchable=False)
+
+
 def create_staff_index(index_client):
     """직원 전용 인덱스를 생성합니다."""
     try:
@@ -124,6 +262,11 @@ def create_staff_index(index_client):
             logger.info(
                 f"✅ 직원 인덱스가 이미 존재합니다: {config.AZURE_SEARCH_STAFF_INDEX}"
             )
+            # 증분 동기화용 content_hash 필드가 없는 이전 인덱스에는 필드만 추가
+            if not any(field.name == "content_hash" for field in existing_index.fields):
+                existing_index.fields.append(_staff_content_hash_field())
+                index_client.create_or_update_index(existing_index)
+                logger.info("✅ 직원 인덱스에 content_hash 필드 추가 완료")
             return True
         except ResourceNotFoundError:
             logger.info(
@@ -153,6 +296,7 @@ def create_staff_index(index_client):
             ),  # 스킬을 텍스트로 저장
             SimpleField(name="created_at", type="Edm.String", searchable=False),
             SimpleField(name="updated_at", type="Edm.String", searchable=False),
+            _staff_content_hash_field(),
         ]
 
         index = SearchIndex(name=config.AZURE_SEARCH_STAFF_INDEX, fields=fields)
@@ -173,10 +317,7 @@ def recreate_staff_index():
     try:
         logger.info("직원 인덱스 강제 재생성 시작")
 
-        index_client = SearchIndexClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-        )
+        index_client = get_index_client()
 
         # 기존 인덱스 삭제
         try:
@@ -209,10 +350,7 @@ def create_blob_indexer():
     try:
         logger.info("Blob Storage Indexer 생성/확인 시작")
 
-        index_client = SearchIndexClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-        )
+        index_client = get_index_client()
 
         # Data Source 생성
         datasource_name = f"{config.AZURE_SEARCH_INDEX}-datasource"
@@ -284,42 +422,198 @@ def setup_search_infrastructure():
         return False
 
 
+def _revalidate_search_infrastructure():
+    """백그라운드에서 인프라를 다시 확인합니다 (일시 오류면 마지막 성공 결과 유지)."""
+    try:
+        ready = setup_search_infrastructure()
+        with _bootstrap_lock:
+            _bootstrap_state["checks"] += 1
+            if ready:
+                _bootstrap_state["checked_at"] = time.time()
+            else:
+                logger.warning("AI Search 인프라 재확인 실패, 기존 확인 결과를 유지합니다")
+    finally:
+        with _bootstrap_lock:
+            _bootstrap_state["revalidating"] = False
+
+
+def ensure_search_infrastructure():
+    """인프라 확인 결과를 프로세스 단위로 캐시해 반환합니다 (첫 호출만 관리 API 호출)."""
+    now = time.time()
+    with _bootstrap_lock:
+        age = now - _bootstrap_state["checked_at"]
+        if _bootstrap_state["ready"]:
+            _bootstrap_state["cache_hits"] += 1
+            if (
+                age >= config.SEARCH_BOOTSTRAP_REVALIDATE_SECONDS
+                and not _bootstrap_state["revalidating"]
+            ):
+                _bootstrap_state["revalidating"] = True
+                threading.Thread(
+                    target=_revalidate_search_infrastructure,
+                    name="search-bootstrap-revalidate",
+                    daemon=True,
+                ).start()
+            return True
+        if _bootstrap_state["checked_at"] and age < config.SEARCH_BOOTSTRAP_RETRY_SECONDS:
+            # 최근 실패 결과 재사용
+            _bootstrap_state["cache_hits"] += 1
+            return False
+
+    # 동시에 들어온 첫 호출들은 한 번만 확인하고 나머지는 그 결과를 사용
+    with _bootstrap_setup_lock:
+        with _bootstrap_lock:
+            if _bootstrap_state["ready"] or _bootstrap_state["checked_at"] > now:
+                return _bootstrap_state["ready"]
+        ready = setup_search_infrastructure()
+        with _bootstrap_lock:
+            _bootstrap_state.update(
+                ready=ready,
+                checked_at=time.time(),
+                checks=_bootstrap_state["checks"] + 1,
+            )
+        return ready
+
+
+def invalidate_search_bootstrap():
+    """인덱스가 사라진 경우 등 다음 호출에서 인프라를 다시 확인하게 합니다."""
+    with _bootstrap_lock:
+        _bootstrap_state["ready"] = False
+        _bootstrap_state["checked_at"] = 0.0
+
+
+# 회의 원문 청크 자식 문서
+# 부모 문서(회의 단위)는 회의 목록 검색에, 청크 문서는 RAG 컨텍스트 검색에 사용합니다.
+CHUNK_DOCUMENT_TYPE = "meeting_chunk"
+PARENT_FILTER = f"document_type ne '{CHUNK_DOCUMENT_TYPE}'"
+
+
+def prefer_chunk_results(results):
+    """필터 없이 한 번에 받은 결과에서 원문 청크만 고르고, 청크가 없으면(이전 인덱스) 회의 단위 문서를 반환합니다.
+
+    청크 필터 조회 후 결과가 없을 때 부모 필터로 다시 조회하면 Search 요청이 두 번 나가므로,
+    document_type 필터 없이 한 번만 조회해 후처리로 청크를 우선합니다.
+    """
+    results = list(results)
+    chunks = [r for r in results if r.get("document_type") == CHUNK_DOCUMENT_TYPE]
+    return chunks or results
+
+
+def build_search_document(doc_id, content, metadata, blob_path=None):
+    """회의 문서 인덱스에 올릴 검색 문서를 만듭니다."""
+    doc = {
+        "id": doc_id,
+        "content": content,
+        # 호출 측마다 meeting_title 또는 title로 넘기므로 둘 다 허용
+        "meeting_title": (
+            metadata.get("meeting_title") or metadata.get("title", "") if metadata else ""
+        ),
+        "summary": metadata.get("summary", "") if metadata else "",
+        "meeting_id": metadata.get("meeting_id", "") if metadata else "",
+        "action_items_count": (
+            metadata.get("action_items_count", 0) if metadata else 0
+        ),
+        "created_at": metadata.get("created_at", "") if metadata else "",
+        "participants": metadata.get("participants", "") if metadata else "",
+        "keywords": metadata.get("keywords", "") if metadata else "",
+        "document_type": metadata.get("document_type", "") if metadata else "",
+    }
+
+    # Blob 경로가 제공된 경우 추가
+    if blob_path:
+        doc["blob_path"] = blob_path
+    return doc
+
+
+def build_chunk_documents(parent):
+    """부모 검색 문서의 원문을 청크 자식 문서로 나눕니다 (meeting_id, 청크 순서 포함)."""
+    documents = []
+    for chunk in chunk_transcript(parent.get("content") or ""):
+        doc = {
+            "id": f"{parent['id']}_chunk_{chunk['position']:04d}",
+            "parent_id": parent["id"],
+            "chunk_position": chunk["position"],
+            "content": chunk["content"],
+            "speakers": ", ".join(chunk["speakers"]),
+            "meeting_title": parent.get("meeting_title", ""),
+            "meeting_id": parent.get("meeting_id", ""),
+            "created_at": parent.get("created_at", ""),
+            "document_type": CHUNK_DOCUMENT_TYPE,
+        }
+        if parent.get("blob_path"):
+            doc["blob_path"] = parent["blob_path"]
+        documents.append(doc)
+    return documents
+
+
+def build_search_documents(doc_id, content, metadata, blob_path=None):
+    """부모 검색 문서와 원문 청크 자식 문서 목록을 만듭니다 (부모가 첫 번째)."""
+    parent = build_search_document(doc_id, content, metadata, blob_path)
+    return [parent] + build_chunk_documents(parent)
+
+
+def chunk_counts(documents):
+    """문서 목록에 든 부모 문서별 청크 수를 반환합니다 ({부모 ID: 청크 수})."""
+    counts = {doc["id"]: 0 for doc in documents if not doc.get("parent_id")}
+    for doc in documents:
+        if doc.get("parent_id") in counts:
+            counts[doc["parent_id"]] += 1
+    return counts
+
+
+def delete_stale_chunks(counts, search_client=None):
+    """부모 문서별로 새 청크 수 이후 순서의 청크를 AI Search 인덱스에서 지웁니다 (지운 수 반환).
+
+    청크 ID는 순서로 정해지고 업로드는 merge_or_upload라, 원문이 짧아져 청크 수가 줄면
+    이전 청크가 그대로 남아 검색 결과에 섞이기 때문입니다.
+    """
+    search_client = search_client or get_search_client(config.AZURE_SEARCH_INDEX)
+    stale = []
+    for parent_id, count in counts.items():
+        escaped = parent_id.replace("'", "''")
+        stale.extend(
+            {"id": result["id"]}
+            for result in search_client.search(
+                "*",
+                filter=f"parent_id eq '{escaped}' and chunk_position ge {count}",
+                select=["id"],
+            )
+        )
+    if stale:
+        search_client.delete_documents(documents=stale)
+        logger.info(f"🧹 이전 청크 {len(stale)}건 삭제")
+    return len(stale)
+
+
+def delete_meeting_documents(doc_id):
+    """회의 검색 문서(부모 + 모든 청크)를 AI Search와 로컬 벡터 인덱스에서 지웁니다."""
+    remove_vector("meetings", doc_id)
+    remove_stale_chunk_vectors({doc_id: 0})
+    search_client = get_search_client(config.AZURE_SEARCH_INDEX)
+    removed = delete_stale_chunks({doc_id: 0}, search_client)
+    search_client.delete_documents(documents=[{"id": doc_id}])
+    return removed + 1
+
+
 def index_document(doc_id, content, metadata, blob_path=None):
     """문서를 Azure AI Search 인덱스에 추가합니다."""
     start_time = time.time()
     try:
         logger.info(f"AI Search 인덱싱 시작: {doc_id}")
 
+        # 로컬 벡터 인덱스는 AI Search 연결과 무관하게 먼저 반영
+        docs = build_search_documents(doc_id, content, metadata, blob_path)
+        counts = chunk_counts(docs)
+        index_search_documents(docs)
+        remove_stale_chunk_vectors(counts)
+
         # 인덱스 존재 확인 및 생성
-        if not setup_search_infrastructure():
+        if not ensure_search_infrastructure():
             raise Exception("AI Search 인프라 설정에 실패했습니다.")
 
-        search_client = SearchClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            index_name=config.AZURE_SEARCH_INDEX,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-        )
-
-        doc = {
-            "id": doc_id,
-            "content": content,
-            "meeting_title": metadata.get("title", "") if metadata else "",
-            "summary": metadata.get("summary", "") if metadata else "",
-            "meeting_id": metadata.get("meeting_id", "") if metadata else "",
-            "action_items_count": (
-                metadata.get("action_items_count", 0) if metadata else 0
-            ),
-            "created_at": metadata.get("created_at", "") if metadata else "",
-            "participants": metadata.get("participants", "") if metadata else "",
-            "keywords": metadata.get("keywords", "") if metadata else "",
-            "document_type": metadata.get("document_type", "") if metadata else "",
-        }
-
-        # Blob 경로가 제공된 경우 추가
-        if blob_path:
-            doc["blob_path"] = blob_path
-
-        result = search_client.upload_documents(documents=[doc])
+        search_client = get_search_client(config.AZURE_SEARCH_INDEX)
+        delete_stale_chunks(counts, search_client)
+        result = search_client.merge_or_upload_documents(documents=docs)
 
         duration = time.time() - start_time
         log_azure_service_call(
@@ -329,7 +623,7 @@ def index_document(doc_id, content, metadata, blob_path=None):
             duration,
             True,
             None,
-            f"Document ID: {doc_id}",
+            f"Document ID: {doc_id}, Chunks: {len(docs) - 1}",
         )
         log_performance(
             logger,
@@ -354,6 +648,8 @@ def index_document(doc_id, content, metadata, blob_path=None):
             None,
             f"Azure Error: {str(e)}",
         )
+        if isinstance(e, ResourceNotFoundError):
+            invalidate_search_bootstrap()
         logger.error(f"❌ AI Search 인덱싱 실패 (Azure 오류): {doc_id} - {e}")
         raise
 
@@ -375,33 +671,80 @@ def index_document(doc_id, content, metadata, blob_path=None):
         raise
 
 
+def _vector_chunk_documents(query, top):
+    """로컬 벡터 인덱스에서 원문 청크를 search_documents 결과 형식으로 찾습니다."""
+    return [
+        {
+            "id": key,
+            "content": payload.get("content", ""),
+            "metadata": {
+                "meeting_id": payload.get("meeting_id"),
+                "meeting_title": payload.get("meeting_title"),
+                "chunk_position": payload.get("chunk_position"),
+            },
+        }
+        for key, score, payload in vector_search("chunks", query, top)
+    ]
+
+
+def fuse_results(lexical, vector, top):
+    """BM25 결과와 벡터 결과를 문서 id 기준 RRF로 합칩니다 (같은 문서는 BM25 결과를 사용)."""
+    if not vector:
+        return lexical[:top]
+    by_key = {item["id"]: item for item in vector}
+    by_key.update({item["id"]: item for item in lexical})
+    fused = reciprocal_rank_fusion(
+        [[item["id"] for item in lexical], [item["id"] for item in vector]]
+    )
+    return [by_key[item_key] for item_key, _ in fused[:top]]
+
+
 def search_documents(query: str, top: int = 3):
-    """Azure AI Search에서 문서를 검색합니다."""
+    """Azure AI Search(BM25)와 로컬 벡터 인덱스에서 문서를 검색해 합칩니다."""
     start_time = time.time()
+    vector_docs = []
     try:
         logger.info(f"AI Search 쿼리 실행: '{query}' (top {top})")
 
+        # 로컬 벡터 검색 (AI Search에 연결할 수 없을 때도 이 결과로 응답)
+        vector_docs = _vector_chunk_documents(query, top)
+
         # 인덱스 존재 확인 및 생성
-        if not setup_search_infrastructure():
+        if not ensure_search_infrastructure():
             raise Exception("AI Search 인프라 설정에 실패했습니다.")
 
-        search_client = SearchClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            index_name=config.AZURE_SEARCH_INDEX,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
+        search_client = get_search_client(config.AZURE_SEARCH_INDEX)
+
+        # 청크와 회의 단위 문서를 한 번에 조회해 청크를 우선 (부모 문서가 자리를 차지할 수 있어 2배 조회)
+        results = prefer_chunk_results(
+            search_client.search(
+                query,
+                top=top * 2,
+                select=[
+                    "id",
+                    "content",
+                    "meeting_id",
+                    "meeting_title",
+                    "chunk_position",
+                    "document_type",
+                ],
+            )
         )
-
-        results = search_client.search(query, top=top)
         docs = []
 
-        for r in results:
+        for r in results[:top]:
             docs.append(
                 {
                     "id": r["id"],
                     "content": r["content"],
-                    "metadata": r.get("metadata", {}),
+                    "metadata": {
+                        "meeting_id": r.get("meeting_id"),
+                        "meeting_title": r.get("meeting_title"),
+                        "chunk_position": r.get("chunk_position"),
+                    },
                 }
             )
+        docs = fuse_results(docs, vector_docs, top)
 
         duration = time.time() - start_time
         log_azure_service_call(
@@ -435,7 +778,12 @@ def search_documents(query: str, top: int = 3):
             None,
             f"Azure Error: {str(e)}",
         )
+        if isinstance(e, ResourceNotFoundError):
+            invalidate_search_bootstrap()
         logger.error(f"❌ AI Search 검색 실패 (Azure 오류): {query} - {e}")
+        if vector_docs:
+            logger.warning(f"⚠️ AI Search 대신 벡터 검색 결과 {len(vector_docs)}개 반환")
+            return vector_docs
         raise
 
     except Exception as e:
@@ -451,81 +799,124 @@ def search_documents(query: str, top: int = 3):
             f"Unexpected error: {str(e)}",
         )
         logger.error(f"❌ AI Search 검색 중 예상치 못한 오류: {query} - {e}")
+        if vector_docs:
+            logger.warning(f"⚠️ AI Search 대신 벡터 검색 결과 {len(vector_docs)}개 반환")
+            return vector_docs
         raise
 
 
+# 직원 인덱스 증분 동기화
+# 문서마다 색인 필드의 content_hash를 함께 저장해 두고, 동기화 때는 인덱스의 (id, content_hash)만
+# 읽어 비교한 뒤 바뀐 직원만 merge_or_upload, 없어진 직원만 delete합니다.
+STAFF_SYNC_BATCH_SIZE = 1000  # AI Search 인덱싱 요청 1회당 최대 문서 수
+
+
+def build_staff_search_document(staff):
+    """직원 정보를 직원 인덱스 문서로 변환합니다 (content_hash 포함)."""
+    doc = {
+        "id": staff["id"],
+        "user_id": staff.get("user_id"),
+        "name": staff.get("name", ""),
+        "department": staff.get("department", ""),
+        "position": staff.get("position", ""),
+        "email": staff.get("email", ""),
+        # 스킬을 문자열로 변환 (검색용)
+        "skills_text": ", ".join(staff.get("skills", [])),
+        "created_at": str(staff.get("created_at", "")),
+        "updated_at": str(staff.get("updated_at", "")),
+    }
+    doc["content_hash"] = hashlib.sha256(
+        json.dumps(doc, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return doc
+
+
+def get_indexed_staff_hashes(search_client=None):
+    """직원 인덱스에 저장된 {id: content_hash}를 반환합니다."""
+    search_client = search_client or get_search_client(config.AZURE_SEARCH_STAFF_INDEX)
+    return {
+        result["id"]: result.get("content_hash")
+        for result in search_client.search("*", select=["id", "content_hash"])
+    }
+
+
+def _send_staff_batches(search_client, action, documents):
+    """문서를 최대 STAFF_SYNC_BATCH_SIZE개씩 보내고 실패한 문서 수를 반환합니다."""
+    send = (
+        search_client.merge_or_upload_documents
+        if action == "upload"
+        else search_client.delete_documents
+    )
+    failed = 0
+    for offset in range(0, len(documents), STAFF_SYNC_BATCH_SIZE):
+        results = send(documents=documents[offset : offset + STAFF_SYNC_BATCH_SIZE])
+        for result in results:
+            if not result.succeeded:
+                failed += 1
+                logger.error(
+                    f"❌ 직원 문서 {action} 실패 ({result.status_code}): "
+                    f"{result.key} - {result.error_message}"
+                )
+    return failed
+
+
 def index_staff_data_to_search(staff_list):
-    """직원 정보를 직원 전용 인덱스에 저장합니다 (업데이트 방식)."""
+    """직원 정보를 직원 전용 인덱스에 증분 동기화합니다 (바뀐 직원만 업로드, 없어진 직원만 삭제)."""
     start_time = time.time()
 
     try:
-        search_client = SearchClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            index_name=config.AZURE_SEARCH_STAFF_INDEX,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-        )
-
-        # 기존 직원 데이터 삭제 (완전 새로고침)
-        try:
-            # 모든 기존 직원 데이터 조회
-            search_results = search_client.search("*", select="id")
-            existing_ids = [result["id"] for result in search_results]
-
-            # 기존 데이터 삭제
-            if existing_ids:
-                delete_docs = [
-                    {"@search.action": "delete", "id": doc_id}
-                    for doc_id in existing_ids
-                ]
-                search_client.upload_documents(documents=delete_docs)
-                logger.info(f"🗑️ 기존 직원 데이터 {len(existing_ids)}개 삭제 완료")
-        except Exception as delete_error:
-            logger.warning(
-                f"⚠️ 기존 직원 데이터 삭제 중 오류 (계속 진행): {delete_error}"
-            )
+        if not staff_list:
+            # 조회 실패로 빈 목록이 넘어와도 인덱스를 비우지 않도록 동기화하지 않음
+            logger.warning("⚠️ 인덱싱할 직원 정보가 없습니다")
+            return None
 
-        # 새로운 직원 데이터 추가
-        staff_docs = []
-        for staff in staff_list:
-            # 스킬을 문자열로 변환 (검색용)
-            skills_text = ", ".join(staff.get("skills", []))
-
-            doc = {
-                "@search.action": "upload",
-                "id": staff["id"],
-                "user_id": staff.get("user_id"),
-                "name": staff.get("name", ""),
-                "department": staff.get("department", ""),
-                "position": staff.get("position", ""),
-                "email": staff.get("email", ""),
-                "skills_text": skills_text,
-                "created_at": str(staff.get("created_at", "")),
-                "updated_at": str(staff.get("updated_at", "")),
-            }
-            staff_docs.append(doc)
+        # 로컬 벡터 인덱스는 AI Search 연결과 무관하게 먼저 반영
+        sync_staff_vectors(staff_list, replace=True)
 
-        if staff_docs:
-            result = search_client.upload_documents(documents=staff_docs)
+        search_client = get_search_client(config.AZURE_SEARCH_STAFF_INDEX)
+        indexed_hashes = get_indexed_staff_hashes(search_client)
 
-            duration = time.time() - start_time
-            log_azure_service_call(
-                logger,
-                "Azure AI Search",
-                "index_staff_data",
-                duration,
-                True,
-                None,
-                f"Indexed {len(staff_docs)} staff records",
-            )
-            log_performance(
-                logger, "staff_indexing", duration, f"Staff count: {len(staff_docs)}"
-            )
+        changed = []
+        current_ids = set()
+        for staff in staff_list:
+            doc = build_staff_search_document(staff)
+            current_ids.add(doc["id"])
+            if indexed_hashes.get(doc["id"]) != doc["content_hash"]:
+                changed.append(doc)
+        removed = [{"id": doc_id} for doc_id in indexed_hashes if doc_id not in current_ids]
+
+        failed = 0
+        if changed:
+            failed += _send_staff_batches(search_client, "upload", changed)
+        if removed:
+            failed += _send_staff_batches(search_client, "delete", removed)
+
+        result = {
+            "uploaded": len(changed),
+            "deleted": len(removed),
+            "unchanged": len(current_ids) - len(changed),
+            "failed": failed,
+        }
+        duration = time.time() - start_time
+        log_azure_service_call(
+            logger,
+            "Azure AI Search",
+            "index_staff_data",
+            duration,
+            failed == 0,
+            None,
+            f"Uploaded {result['uploaded']}, Deleted {result['deleted']}, "
+            f"Unchanged {result['unchanged']}, Failed {failed}",
+        )
+        log_performance(
+            logger, "staff_indexing", duration, f"Staff count: {len(current_ids)}"
+        )
 
-            logger.info(f"✅ 직원 정보 인덱싱 완료: {len(staff_docs)}명")
-            return True
-        else:
-            logger.warning("⚠️ 인덱싱할 직원 정보가 없습니다")
-            return False
+        logger.info(
+            f"✅ 직원 정보 인덱스 동기화 완료: 업로드 {result['uploaded']}명, "
+            f"삭제 {result['deleted']}명, 변경 없음 {result['unchanged']}명"
+        )
+        return result
 
     except AzureError as e:
         duration = time.time() - start_time
@@ -552,6 +943,39 @@ def index_staff_data_to_search(staff_list):
         raise
 
 
+def sync_staff_search_document(staff_id, staff=None):
+    """직원 한 명의 인덱스 문서를 반영합니다 (staff가 없으면 삭제, 실패해도 예외를 올리지 않음)."""
+    start_time = time.time()
+    if staff:
+        sync_staff_vectors([staff])
+    else:
+        remove_vector("staff", staff_id)
+    try:
+        search_client = get_search_client(config.AZURE_SEARCH_STAFF_INDEX)
+        if staff:
+            failed = _send_staff_batches(
+                search_client, "upload", [build_staff_search_document(staff)]
+            )
+        else:
+            failed = _send_staff_batches(search_client, "delete", [{"id": staff_id}])
+
+        log_azure_service_call(
+            logger,
+            "Azure AI Search",
+            "sync_staff_document",
+            time.time() - start_time,
+            failed == 0,
+            None,
+            f"Staff: {staff_id}, Action: {'upload' if staff else 'delete'}",
+        )
+        return failed == 0
+
+    except Exception as e:
+        log_error_with_context(logger, e, f"Failed to sync staff document: {staff_id}")
+        logger.warning(f"⚠️ 직원 {staff_id} 인덱스 반영 실패 (다음 전체 동기화 때 반영): {e}")
+        return False
+
+
 def expand_task_keywords(task_description):
     """업무 설명을 검색 친화적인 키워드로 확장합니다."""
     keywords = set([task_description])  # 원본도 포함
@@ -631,15 +1055,18 @@ def expand_task_keywords(task_description):
 
 
 def search_staff_for_task(task_description, top_k=5):
-    """작업 설명을 기반으로 직원 전용 인덱스에서 적합한 직원을 검색합니다."""
+    """작업 설명을 기반으로 직원 전용 인덱스(BM25)와 로컬 벡터 인덱스에서 적합한 직원을 검색합니다."""
     start_time = time.time()
+    vector_staff = []
 
     try:
-        search_client = SearchClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            index_name=config.AZURE_SEARCH_STAFF_INDEX,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-        )
+        # 로컬 벡터 검색 (키워드 매핑에 없는 표현도 찾고, AI Search 장애 시 이 결과로 응답)
+        vector_staff = [
+            {**payload, "search_score": round(score, 4)}
+            for key, score, payload in vector_search("staff", task_description, top_k)
+        ]
+
+        search_client = get_search_client(config.AZURE_SEARCH_STAFF_INDEX)
 
         # 직원 검색용 특별 키워드 매핑 (간단하고 직접적)
         staff_keyword_map = {
@@ -771,6 +1198,7 @@ def search_staff_for_task(task_description, top_k=5):
                 "search_score": result.get("@search.score", 0),
             }
             staff_results.append(staff_data)
+        staff_results = fuse_results(staff_results, vector_staff, top_k)
 
         duration = time.time() - start_time
         log_azure_service_call(
@@ -807,7 +1235,7 @@ def search_staff_for_task(task_description, top_k=5):
             f"Azure Error: {str(e)}",
         )
         logger.error(f"❌ 직원 검색 실패 (Azure 오류): {e}")
-        return []
+        return vector_staff
 
     except Exception as e:
         duration = time.time() - start_time
@@ -816,7 +1244,7 @@ def search_staff_for_task(task_description, top_k=5):
             logger, "Azure AI Search", "search_staff", duration, False, None, str(e)
         )
         logger.error(f"❌ 직원 검색 실패: {e}")
-        return []
+        return vector_staff
 
 
 def clean_legacy_staff_data_from_meetings_index():
@@ -824,11 +1252,7 @@ def clean_legacy_staff_data_from_meetings_index():
     start_time = time.time()
 
     try:
-        search_client = SearchClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            index_name=config.AZURE_SEARCH_INDEX,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-        )
+        search_client = get_search_client(config.AZURE_SEARCH_INDEX)
 
         # 직원 데이터 검색 (staff_로 시작하는 ID)
         search_results = search_client.search(
@@ -939,13 +1363,10 @@ async def ask_question_with_search(question: str, max_results: int = 3) -> str:
         logger.info(f"확장된 검색 쿼리: {expanded_query}")
 
         # 3. 질문 유형에 따라 적절한 인덱스 선택
+        chunk_results = []
         if is_staff_question:
             # 직원 인덱스에서 검색
-            search_client = SearchClient(
-                endpoint=config.AZURE_SEARCH_ENDPOINT,
-                index_name=config.AZURE_SEARCH_STAFF_INDEX,
-                credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-            )
+            search_client = get_search_client(config.AZURE_SEARCH_STAFF_INDEX)
 
             # 직원 검색 실행
             search_results = search_client.search(
@@ -980,39 +1401,49 @@ async def ask_question_with_search(question: str, max_results: int = 3) -> str:
 
         else:
             # 회의록 인덱스에서 검색
-            search_client = SearchClient(
-                endpoint=config.AZURE_SEARCH_ENDPOINT,
-                index_name=config.AZURE_SEARCH_INDEX,
-                credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-            )
-
-            # 먼저 확장된 쿼리로 검색 시도
-            search_results = search_client.search(
-                search_text=expanded_query,
-                top=max_results,
-                select=["content", "meeting_title", "summary", "meeting_id"],
-                search_mode="any",
-            )
-
-            # 결과가 없으면 원본 질문으로 다시 검색
-            results_list = list(search_results)
-            if not results_list:
-                logger.info("확장된 쿼리로 결과 없음, 원본 질문으로 재검색")
-                search_results = search_client.search(
-                    search_text=question,
-                    top=max_results,
-                    select=["content", "meeting_title", "summary", "meeting_id"],
+            search_client = get_search_client(config.AZURE_SEARCH_INDEX)
+
+            # 여러 회의에 걸쳐 질문과 가장 관련 있는 원문 청크를 우선 (청크가 없는 이전 인덱스는 회의 단위 문서)
+            # 확장 쿼리는 원본 질문을 OR 조건으로 포함하므로 원본 질문 재검색은 생략
+            top_chunks = max(max_results, config.SEARCH_RAG_TOP_CHUNKS)
+            results_list = prefer_chunk_results(
+                search_client.search(
+                    search_text=expanded_query,
+                    top=top_chunks * 2,
+                    select=[
+                        "content",
+                        "meeting_title",
+                        "summary",
+                        "meeting_id",
+                        "chunk_position",
+                        "document_type",
+                    ],
                     search_mode="any",
                 )
-                results_list = list(search_results)
-
-            # 여전히 결과가 없으면 전체 문서 검색
+            )
+            chunk_results = [
+                r for r in results_list if r.get("document_type") == CHUNK_DOCUMENT_TYPE
+            ][:top_chunks]
+            if chunk_results:
+                contexts = []
+                for result in chunk_results:
+                    header = f"회의: {result.get('meeting_title') or '제목 없음'}"
+                    if result.get("chunk_position") is not None:
+                        header += f" (구간 {result['chunk_position'] + 1})"
+                    contexts.append(f"{header}\n내용: {result['content']}")
+
+        if not is_staff_question and not chunk_results:
+            # 청크가 없는 이전 인덱스는 회의 단위 문서 결과 사용
+            results_list = results_list[:max_results]
+
+            # 결과가 없으면 전체 문서 검색
             if not results_list:
-                logger.info("원본 질문으로도 결과 없음, 전체 문서에서 검색")
+                logger.info("확장된 쿼리로 결과 없음, 전체 문서에서 검색")
                 search_results = search_client.search(
                     search_text="*",
                     top=1,
                     select=["content", "meeting_title", "summary", "meeting_id"],
+                    filter=PARENT_FILTER,
                 )
                 results_list = list(search_results)
 
@@ -1031,7 +1462,7 @@ async def ask_question_with_search(question: str, max_results: int = 3) -> str:
                 if summary:
                     context_parts.append(f"요약: {summary}")
 
-                # 전체 내용 (일부만)
+                # 전체 내용 (일부만, 청크가 없는 회의 단위 문서)
                 if result.get("content"):
                     content = result["content"][:1000]
                     context_parts.append(f"내용: {content}")
@@ -1132,30 +1563,42 @@ def search_meetings(query: str, max_results: int = 5) -> list:
     Returns:
         검색 결과 리스트
     """
+    vector_meetings = []
     try:
         start_time = time.time()
         logger.info(f"회의록 검색: {query}")
 
+        # 로컬 벡터 검색 (회의 단위)
+        vector_meetings = [
+            {
+                "id": key,
+                "meeting_id": payload.get("meeting_id"),
+                "meeting_title": payload.get("meeting_title"),
+                "summary": payload.get("summary"),
+                "created_at": payload.get("created_at"),
+                "score": round(score, 4),
+            }
+            for key, score, payload in vector_search("meetings", query, max_results)
+        ]
+
         # 키워드 확장
         expanded_query = expand_task_keywords(query)
 
-        search_client = SearchClient(
-            endpoint=config.AZURE_SEARCH_ENDPOINT,
-            index_name=config.AZURE_SEARCH_INDEX,
-            credential=AzureKeyCredential(config.AZURE_SEARCH_ADMIN_KEY),
-        )
+        search_client = get_search_client(config.AZURE_SEARCH_INDEX)
 
         search_results = search_client.search(
             search_text=expanded_query,
             top=max_results,
-            select=["meeting_id", "meeting_title", "summary", "created_at"],
+            select=["id", "meeting_id", "meeting_title", "summary", "created_at"],
             search_mode="all",
+            filter=PARENT_FILTER,
         )
 
         results = []
         for result in search_results:
             results.append(
                 {
+                    "id": result["id"],
                     "meeting_id": result.get("meeting_id"),
                     "meeting_title": result.get("meeting_title"),
                     "summary": result.get("summary"),
@@ -1163,6 +1606,8 @@ def search_meetings(query: str, max_results: int = 5) -> list:
                     "score": result.get("@search.score", 0),
                 }
             )
+        # 회의 ID가 비어 있는 문서도 있으므로 검색 문서 id로 합침
+        results = fuse_results(results, vector_meetings, max_results)
 
         duration = time.time() - start_time
         logger.info(f"✅ 회의록 검색 완료 ({duration:.2f}초): {len(results)}개 결과")
@@ -1173,4 +1618,4 @@ def search_meetings(query: str, max_results: int = 5) -> list:
         duration = time.time() - start_time
         log_error_with_context(logger, e, f"Meeting search failed for: {query}")
         logger.error(f"❌ 회의록 검색 실패 ({duration:.2f}초): {e}")
-        return []
+        return vector_meetings
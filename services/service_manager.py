@@ -19,8 +19,8 @@ from services.blob_service import upload_to_blob
 # Search 서비스 함수들
 from services.search_service import index_document, search_documents
 
-# Cosmos DB 함수들
-from db.cosmos_db import (
+# 저장소 함수들 (STORAGE_BACKEND에 따라 Cosmos DB 또는 SQLite)
+from db.storage import (
     init_cosmos,
     save_meeting,
     save_action_items,
@@ -54,7 +54,9 @@ class ServiceManager:
     """서비스 매니저 - 모든 함수를 쉽게 접근할 수 있게 해주는 클래스"""
 
     def __init__(self):
-        # Cosmos DB 초기화
+        import config.config as config
+
+        # 저장소 초기화
         try:
             init_cosmos()
             self.cosmos_initialized = True
@@ -62,6 +64,21 @@ class ServiceManager:
             print(f"Warning: Cosmos DB initialization failed: {e}")
             self.cosmos_initialized = False
 
+        # 구체화 뷰 change feed 처리기 (CHANGE_FEED_ENABLED=true일 때 프로세스당 1개, Cosmos 백엔드 전용)
+        if self.cosmos_initialized and config.STORAGE_BACKEND == "cosmos":
+            try:
+                from db.change_feed import start_change_feed_processor
+
+                start_change_feed_processor()
+            except Exception as e:
+                print(f"Warning: change feed processor failed to start: {e}")
+
+        # staff 벡터 인덱스가 비어 있으면 시작 시 한 번만 채움 (검색 경로에서는 다시 시도하지 않음)
+        if self.cosmos_initialized:
+            from services.vector_service import warm_staff_vectors
+
+            warm_staff_vectors()
+
     # OpenAI 서비스
     def transcribe_audio(self, file_path: str) -> str:
         return transcribe_audio(file_path)
@@ -88,34 +105,138 @@ class ServiceManager:
     ) -> None:
         return index_document(doc_id, content, metadata, blob_path)
 
+    def enqueue_document(
+        self, doc_id: str, content: str, metadata: dict, blob_path: str = None
+    ) -> bool:
+        """문서를 배치 인덱서 대기열에 넣습니다 (인덱싱 완료를 기다리지 않음)"""
+        from services.search_indexer import enqueue_document
+
+        return enqueue_document(doc_id, content, metadata, blob_path)
+
     def search_documents(self, query: str, top: int = 3) -> list:
         return search_documents(query, top)
 
     # Cosmos DB 서비스
-    def save_meeting(self, meeting_title: str, raw_text: str, summary_json: str) -> str:
-        return save_meeting(meeting_title, raw_text, summary_json)
+    def save_meeting(
+        self,
+        meeting_title: str,
+        raw_text: str,
+        summary_json: str,
+        idempotency_key: str = None,
+        meeting_id: str = None,
+    ) -> str:
+        return save_meeting(
+            meeting_title, raw_text, summary_json, idempotency_key, meeting_id=meeting_id
+        )
 
-    def save_action_items(self, meeting_id: str, action_items: list) -> None:
+    def save_action_items(self, meeting_id: str, action_items: list) -> dict:
         return save_action_items(meeting_id, action_items)
 
     def get_meetings(self, top: int = 100) -> list:
         return get_meetings(top)
 
+    def get_meetings_page(
+        self, limit: int = 20, continuation_token: str = None, title_contains: str = None
+    ) -> tuple:
+        """회의 목록 페이지 조회 (items, continuation_token)"""
+        from db.storage import get_meetings_page
+
+        return get_meetings_page(limit, continuation_token, title_contains)
+
+    def get_meeting_summaries(self, top: int = 100, with_counts: bool = False) -> list:
+        """회의 요약 목록 조회 (원문/전체 요약 제외)"""
+        from db.storage import get_meeting_summaries
+
+        return get_meeting_summaries(top, with_counts)
+
+    def ingestion_meeting_id(self, raw_text, idempotency_key: str = None) -> str:
+        """원문(또는 업로드 파일 바이트)과 멱등 키로 정해지는 회의 ID"""
+        from db.storage import ingestion_meeting_id
+
+        return ingestion_meeting_id(raw_text, idempotency_key)
+
+    def get_meeting_titles(self, meeting_ids) -> dict:
+        """회의 ID 목록의 제목 조회 ({회의 ID: 제목})"""
+        from db.storage import get_meeting_titles
+
+        return get_meeting_titles(meeting_ids)
+
+    def get_meeting_summaries_page(
+        self, limit: int = 20, continuation_token: str = None, title_contains: str = None
+    ) -> tuple:
+        """회의 요약 목록 페이지 조회 (items, continuation_token)"""
+        from db.storage import get_meeting_summaries_page
+
+        return get_meeting_summaries_page(limit, continuation_token, title_contains)
+
     def get_meeting(self, meeting_id: str) -> dict:
         return get_meeting(meeting_id)
 
+    def get_meeting_transcript(self, meeting: dict) -> str:
+        """회의 원문 조회 (Blob 참조는 필요할 때 로컬 캐시/Blob에서 로드)"""
+        from services.transcript_service import load_transcript
+
+        return load_transcript(meeting)
+
     def get_action_items(self, meeting_id: str) -> list:
         return get_action_items(meeting_id)
 
+    def query_action_items(
+        self, filters: dict = None, limit: int = 50, continuation_token: str = None
+    ) -> tuple:
+        """조건(상태, 담당자, 마감일, 승인 여부, 회의, 설명)에 맞는 업무 페이지 조회 (items, continuation_token)"""
+        from db.storage import query_action_items
+
+        return query_action_items(filters, limit, continuation_token)
+
+    def count_action_items(self, filters: dict = None) -> int:
+        """조건에 맞는 업무 개수 조회"""
+        from db.storage import count_action_items
+
+        return count_action_items(filters)
+
     def get_all_action_items(self) -> list:
-        from db.cosmos_db import get_all_action_items
+        from db.storage import get_all_action_items
 
         return get_all_action_items()
 
+    def get_action_items_page(
+        self, limit: int = 50, continuation_token: str = None
+    ) -> tuple:
+        """액션 아이템 페이지 조회 (items, continuation_token)"""
+        from db.storage import get_action_items_page
+
+        return get_action_items_page(limit, continuation_token)
+
+    def get_standalone_action_items(self, months: int = 3) -> list:
+        """최근 months개월의 독립 작업 조회 (해당 월 샤드만 조회)"""
+        from db.storage import get_standalone_action_items
+
+        return get_standalone_action_items(months)
+
+    def is_standalone_task(self, meeting_id: str) -> bool:
+        """meetingId가 독립 작업(채팅 등으로 직접 추가한 작업) 파티션인지 확인"""
+        from db.storage import is_standalone_partition_key
+
+        return is_standalone_partition_key(meeting_id)
+
+    def update_action_item(
+        self, item_id: str, meeting_id: str, updates: dict, current: dict = None
+    ) -> dict:
+        """current: 화면이 이미 읽은 업무 문서 (있으면 ETag를 그대로 써서 조건부 patch 한 번으로 갱신)"""
+        from db.storage import update_action_item
+
+        return update_action_item(item_id, meeting_id, updates, current=current)
+
     def update_action_item_status(
-        self, item_id: str, meeting_id: str, status: str
+        self, item_id: str, meeting_id: str, status: str, current: dict = None
     ) -> None:
-        return update_action_item_status(item_id, meeting_id, status)
+        return update_action_item_status(item_id, meeting_id, status, current=current)
+
+    def delete_action_item(self, item_id: str, meeting_id: str) -> dict:
+        from db.storage import delete_action_item
+
+        return delete_action_item(item_id, meeting_id)
 
     def approve_action_item(
         self,
@@ -123,16 +244,50 @@ class ServiceManager:
         meeting_id: str,
         final_assignee_id: str,
         reviewer_name: str = None,
+        current: dict = None,
     ) -> None:
         return approve_action_item(
-            item_id, meeting_id, final_assignee_id, reviewer_name
+            item_id, meeting_id, final_assignee_id, reviewer_name, current=current
         )
 
     def update_meeting(self, meeting_id: str, updates: dict) -> dict:
-        from db.cosmos_db import update_meeting
+        from db.storage import update_meeting
 
         return update_meeting(meeting_id, updates)
 
+    def get_unassigned_tasks(self) -> list:
+        """미할당 업무 뷰 조회 (뷰가 없으면 None)"""
+        import config.config as config
+        from db.change_feed import get_unassigned_tasks
+
+        if not config.CHANGE_FEED_ENABLED or config.STORAGE_BACKEND != "cosmos":
+            return None
+        return get_unassigned_tasks()
+
+    def get_assignee_open_tasks(self, assignee: str) -> list:
+        """담당자별 미완료 업무 뷰 조회 (뷰가 없으면 None)"""
+        import config.config as config
+        from db.change_feed import get_assignee_open_tasks
+
+        if not config.CHANGE_FEED_ENABLED or config.STORAGE_BACKEND != "cosmos":
+            return None
+        return get_assignee_open_tasks(assignee)
+
+    def get_task_status_counters(self) -> dict:
+        """상태별 업무 수 뷰 조회 (뷰가 없으면 None)"""
+        import config.config as config
+        from db.change_feed import get_task_status_counters
+
+        if not config.CHANGE_FEED_ENABLED or config.STORAGE_BACKEND != "cosmos":
+            return None
+        return get_task_status_counters()
+
+    def get_dashboard_stats(self, refresh: bool = False) -> dict:
+        """대시보드 통계 조회 (통계 문서 포인트 읽기)"""
+        from db.storage import get_dashboard_stats
+
+        return get_dashboard_stats(refresh)
+
     # 인사정보 관리 서비스
     def init_staff_data(self) -> None:
         """더미 인사정보 초기화"""
@@ -147,16 +302,57 @@ class ServiceManager:
         return get_staff_by_id(staff_id)
 
     def update_staff(self, staff_id: str, updates: dict) -> bool:
-        """인사정보 업데이트"""
-        return update_staff(staff_id, updates)
+        """인사정보 업데이트 (직원 인덱스에도 반영)"""
+        result = update_staff(staff_id, updates)
+        if result:
+            self._sync_staff_search(staff_id)
+        return result
 
     def add_staff(self, staff_data: dict) -> str:
-        """새로운 인사정보 추가"""
-        return add_staff(staff_data)
+        """새로운 인사정보 추가 (직원 인덱스에도 반영)"""
+        staff_id = add_staff(staff_data)
+        if staff_id:
+            self._sync_staff_search(staff_id)
+        return staff_id
 
     def delete_staff(self, staff_id: str) -> bool:
-        """인사정보 삭제"""
-        return delete_staff(staff_id)
+        """인사정보 삭제 (직원 인덱스에서도 삭제)"""
+        result = delete_staff(staff_id)
+        if result:
+            self._sync_staff_search(staff_id)
+        return result
+
+    def _sync_staff_search(self, staff_id: str) -> bool:
+        """직원 한 명의 현재 상태를 직원 인덱스에 반영 (없으면 삭제)"""
+        try:
+            from services.search_service import sync_staff_search_document
+
+            return sync_staff_search_document(staff_id, get_staff_by_id(staff_id))
+        except Exception as e:
+            print(f"⚠️ 직원 인덱스 반영 실패: {e}")
+            return False
+
+    def import_staff(self, stream, fmt: str, on_progress=None) -> dict:
+        """CSV/JSONL 인사정보 일괄 가져오기 (형식 오류 줄은 건너뛰고 invalid에 기록)"""
+        from db.staff_io import valid_staff_records
+        from db.storage import import_staff
+
+        invalid = []
+        result = import_staff(
+            valid_staff_records(stream, fmt, invalid), on_progress=on_progress
+        )
+        result["invalid"] = invalid
+        # 가져온 직원은 증분 동기화로 바뀐 문서만 인덱스에 반영
+        if result["succeeded"]:
+            self.index_staff_data_for_search()
+        return result
+
+    def export_staff(self, fmt: str):
+        """인사정보를 CSV/JSONL 텍스트 줄로 차례로 반환"""
+        from db.staff_io import iter_staff_lines
+        from db.storage import iter_staff
+
+        return iter_staff_lines(iter_staff(), fmt)
 
     def recommend_assignee_for_task(
         self, task_description: str, task_skills=None
@@ -169,31 +365,55 @@ class ServiceManager:
         self, session_id: str, messages: list, summary: str = None
     ) -> str:
         """채팅 히스토리 저장"""
-        from db.cosmos_db import save_chat_history
+        from db.storage import save_chat_history
 
         return save_chat_history(session_id, messages, summary)
 
+    def append_chat_messages(
+        self, session_id: str, new_messages: list, summary: str = None
+    ) -> str:
+        """새 채팅 메시지만 추가 저장"""
+        from db.storage import append_chat_messages
+
+        return append_chat_messages(session_id, new_messages, summary)
+
+    def get_chat_messages_page(
+        self, session_id: str, before_segment: int = None
+    ) -> tuple:
+        """채팅 메시지 세그먼트 조회 (messages, segment_index)"""
+        from db.storage import get_chat_messages_page
+
+        return get_chat_messages_page(session_id, before_segment)
+
     def get_chat_histories(self, session_id: str = None, limit: int = 20) -> list:
         """채팅 히스토리 목록 조회"""
-        from db.cosmos_db import get_chat_histories
+        from db.storage import get_chat_histories
 
         return get_chat_histories(session_id, limit)
 
+    def get_chat_histories_page(
+        self, session_id: str = None, limit: int = 20, continuation_token: str = None
+    ) -> tuple:
+        """채팅 히스토리 페이지 조회 (items, continuation_token)"""
+        from db.storage import get_chat_histories_page
+
+        return get_chat_histories_page(session_id, limit, continuation_token)
+
     def get_chat_history_by_id(self, chat_id: str) -> dict:
         """특정 채팅 히스토리 조회"""
-        from db.cosmos_db import get_chat_history_by_id
+        from db.storage import get_chat_history_by_id
 
         return get_chat_history_by_id(chat_id)
 
     def delete_chat_history(self, chat_id: str) -> bool:
         """채팅 히스토리 삭제"""
-        from db.cosmos_db import delete_chat_history
+        from db.storage import delete_chat_history
 
         return delete_chat_history(chat_id)
 
     def update_chat_history_summary(self, chat_id: str, new_summary: str) -> bool:
         """채팅 히스토리 요약 업데이트"""
-        from db.cosmos_db import update_chat_history_summary
+        from db.storage import update_chat_history_summary
 
         return update_chat_history_summary(chat_id, new_summary)
 
@@ -219,7 +439,7 @@ class ServiceManager:
     ) -> bool:
         """액션 아이템의 담당자 업데이트"""
         try:
-            from db.cosmos_db import update_action_item_assignee
+            from db.storage import update_action_item_assignee
 
             return update_action_item_assignee(item_id, meeting_id, assignee_name)
         except Exception as e:
@@ -228,7 +448,7 @@ class ServiceManager:
 
     # RAG 기반 담당자 추천
     def index_staff_data_for_search(self) -> bool:
-        """직원 정보를 직원 전용 AI Search 인덱스에 업데이트"""
+        """직원 정보를 직원 전용 AI Search 인덱스에 증분 동기화"""
         try:
             from services.search_service import index_staff_data_to_search
 
@@ -238,11 +458,14 @@ class ServiceManager:
                 print("⚠️ 인덱싱할 직원 정보가 없습니다")
                 return False
 
-            # 직원 전용 인덱스에 업데이트 (기존 데이터 덮어쓰기)
+            # 바뀐 직원만 업로드하고 없어진 직원만 삭제
             result = index_staff_data_to_search(staff_list)
 
-            if result:
-                print(f"✅ 직원 정보 인덱싱 완료: {len(staff_list)}명")
+            if result and not result["failed"]:
+                print(
+                    f"✅ 직원 정보 인덱스 동기화 완료: 업로드 {result['uploaded']}명, "
+                    f"삭제 {result['deleted']}명, 변경 없음 {result['unchanged']}명"
+                )
                 return True
             else:
                 print("❌ 직원 정보 인덱싱 실패")
@@ -0,0 +1,130 @@
+"""
+회의 원문(전사 텍스트) 저장소
+
+원문은 회의 문서에 넣지 않고 gzip으로 압축해 SHA-256 콘텐츠 해시 이름으로 Blob에 저장합니다.
+회의 문서에는 참조(transcript)와 바이트 길이만 남기므로 조회/수정 RU가 원문 크기와 무관해지고,
+같은 원문은 한 번만 저장됩니다. 상세 화면 등에서 필요할 때만 내려받으며,
+압축을 푼 원문은 프로세스 로컬 LRU 캐시(바이트 한도)에 보관합니다.
+"""
+
+import gzip
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+import config.config as config
+from services.blob_service import download_bytes, upload_bytes_if_absent
+
+# 로깅 설정
+logger = logging.getLogger("transcript_service")
+
+TRANSCRIPT_BLOB_PREFIX = "transcripts/sha256"
+TRANSCRIPT_ENCODING = "gzip"
+
+# 해시 → 원문 LRU 캐시 (콘텐츠 주소라 무효화가 필요 없음)
+_cache_lock = threading.Lock()
+_cache = OrderedDict()
+_cache_bytes = 0
+_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def transcript_blob_name(sha256):
+    """콘텐츠 해시로 Blob 경로를 만듭니다."""
+    return f"{TRANSCRIPT_BLOB_PREFIX}/{sha256[:2]}/{sha256}.txt.gz"
+
+
+def _cache_put(sha256, text, size):
+    global _cache_bytes
+    if size > config.TRANSCRIPT_CACHE_MAX_BYTES:
+        return
+    with _cache_lock:
+        if sha256 in _cache:
+            _cache.move_to_end(sha256)
+            return
+        _cache[sha256] = (text, size)
+        _cache_bytes += size
+        while _cache_bytes > config.TRANSCRIPT_CACHE_MAX_BYTES:
+            _, (_, evicted_size) = _cache.popitem(last=False)
+            _cache_bytes -= evicted_size
+            _cache_stats["evictions"] += 1
+
+
+def _cache_get(sha256):
+    with _cache_lock:
+        entry = _cache.get(sha256)
+        if entry is None:
+            _cache_stats["misses"] += 1
+            return None
+        _cache.move_to_end(sha256)
+        _cache_stats["hits"] += 1
+        return entry[0]
+
+
+def get_transcript_cache_stats():
+    """원문 캐시 상태를 반환합니다."""
+    with _cache_lock:
+        return {
+            **_cache_stats,
+            "entries": len(_cache),
+            "bytes": _cache_bytes,
+            "max_bytes": config.TRANSCRIPT_CACHE_MAX_BYTES,
+        }
+
+
+def store_transcript(text):
+    """원문을 압축해 Blob에 저장하고 회의 문서에 넣을 참조를 반환합니다."""
+    data = text.encode("utf-8")
+    sha256 = hashlib.sha256(data).hexdigest()
+    compressed = gzip.compress(data, compresslevel=6)
+    blob_name = transcript_blob_name(sha256)
+
+    uploaded = upload_bytes_if_absent(blob_name, compressed, "application/gzip")
+    if not uploaded:
+        logger.info(f"동일한 원문이 이미 저장되어 있어 재사용합니다: {sha256[:12]}")
+    _cache_put(sha256, text, len(data))
+
+    return {
+        "blob": blob_name,
+        "sha256": sha256,
+        "encoding": TRANSCRIPT_ENCODING,
+        "bytes": len(data),
+        "compressed_bytes": len(compressed),
+    }
+
+
+def transcript_fields(text):
+    """회의 문서에 저장할 원문 필드를 반환합니다 (Blob 저장 실패 시 인라인으로 폴백)."""
+    if not text:
+        return {"raw_text": text or ""}
+    try:
+        return {"transcript": store_transcript(text)}
+    except Exception as e:
+        logger.warning(f"원문 Blob 저장 실패, 회의 문서에 인라인으로 저장합니다: {e}")
+        return {"raw_text": text}
+
+
+def load_transcript(meeting):
+    """회의 문서의 원문을 반환합니다 (참조면 캐시 또는 Blob에서 로드, 이전 문서는 인라인 raw_text)."""
+    if not meeting:
+        return ""
+    reference = meeting.get("transcript")
+    if not reference:
+        return meeting.get("raw_text", "")
+
+    sha256 = reference["sha256"]
+    text = _cache_get(sha256)
+    if text is not None:
+        return text
+
+    try:
+        data = gzip.decompress(download_bytes(reference["blob"]))
+        if hashlib.sha256(data).hexdigest() != sha256:
+            raise ValueError(f"원문 해시 불일치: {reference['blob']}")
+        text = data.decode("utf-8")
+        _cache_put(sha256, text, len(data))
+        return text
+    except Exception as e:
+        logger.error(f"원문 로드 실패: {e}")
+        print(f"❌ 원문 로드 실패: {str(e)}")
+        return ""
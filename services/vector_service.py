@@ -0,0 +1,509 @@
+"""
+오프라인 벡터 검색 계층
+
+GPU나 네트워크 없이 동작하는 로컬 벡터 인덱스입니다. Azure AI Search의 BM25 결과와
+Reciprocal Rank Fusion(RRF)으로 합쳐 키워드가 정확히 일치하지 않는 질문도 찾고,
+AI Search에 연결할 수 없을 때는 벡터 결과만으로 검색합니다.
+
+- 임베딩: 텍스트의 문자 2/3-gram을 crc32로 VECTOR_DIM개 버킷에 해싱(부호 해싱)하고
+  sublinear TF(1 + log tf) 가중치를 준 뒤 L2 정규화합니다. 같은 텍스트는 언제나 같은 벡터가
+  되며, 띄어쓰기/조사가 달라도 한국어 어절 일부가 겹치면 유사도가 생깁니다.
+- 인덱스: 컬렉션(meetings, chunks, staff)마다 연속된 float32 행렬 하나에 단위 벡터를 쌓고,
+  행렬-벡터 곱 한 번으로 전체 코사인 유사도를 구한 뒤 argpartition으로 top-k를 뽑습니다.
+  삭제는 마지막 행을 빈자리로 옮겨 행렬을 항상 연속으로 유지합니다.
+- 저장: VECTOR_INDEX_DIR에 컬렉션별 .npy(행렬)와 .json(키/페이로드)으로 저장합니다.
+  쓰기는 배치마다 파일 잠금 안에서 최신 저장본을 다시 읽어 반영한 뒤 바로 저장하고,
+  읽기는 저장 파일이 바뀌었으면 다시 불러와 여러 프로세스가 같은 인덱스를 봅니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+import numpy as np
+
+import config.config as config
+from config.logging_config import log_error_with_context, log_performance
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger("vector_service")
+
+NGRAM_SIZES = (2, 3)
+RRF_K = 60  # RRF 순위 완화 상수 (순위 r의 점수 = 1 / (RRF_K + r))
+VECTOR_COLLECTIONS = ("meetings", "chunks", "staff")
+MEETING_TEXT_CHARS = 4000  # 회의 단위 벡터에 쓰는 원문 앞부분 길이
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_text(text):
+    return _WHITESPACE.sub(" ", str(text or "")).strip().casefold()
+
+
+def embed_text(text, dim=None):
+    """텍스트를 해싱한 문자 n-gram 단위 벡터(float32)로 변환합니다 (빈 텍스트는 영벡터)."""
+    dim = dim or config.VECTOR_DIM
+    vector = np.zeros(dim, dtype=np.float32)
+    normalized = _normalize_text(text)
+    if not normalized:
+        return vector
+
+    padded = f" {normalized} "
+    counts = {}
+    for size in NGRAM_SIZES:
+        for start in range(len(padded) - size + 1):
+            gram = padded[start : start + size]
+            if gram.strip():
+                counts[gram] = counts.get(gram, 0) + 1
+    if not counts:
+        return vector
+
+    hashes = np.fromiter(
+        (zlib.crc32(gram.encode("utf-8")) for gram in counts), dtype=np.uint32, count=len(counts)
+    )
+    weights = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+    # 상위 비트로 부호를 정해 해시 충돌이 한쪽으로 쌓이지 않게 함
+    signs = np.where(hashes >> 31, -1.0, 1.0).astype(np.float32)
+    np.add.at(vector, (hashes % dim).astype(np.intp), signs * weights)
+
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+class VectorIndex:
+    """키별 단위 벡터를 연속된 float32 행렬에 보관하는 코사인 유사도 인덱스"""
+
+    def __init__(self, name, dim=None, capacity=1024):
+        self.name = name
+        self.dim = dim or config.VECTOR_DIM
+        self._matrix = np.zeros((max(capacity, 1), self.dim), dtype=np.float32)
+        self._keys = []
+        self._rows = {}
+        self._payloads = []
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        with self._lock:
+            return list(self._keys)
+
+    def _reserve(self, count):
+        """행렬에 count개 행이 더 들어갈 자리를 확보합니다 (두 배씩 확장)."""
+        needed = len(self._keys) + count
+        capacity = self._matrix.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+        matrix[: len(self._keys)] = self._matrix[: len(self._keys)]
+        self._matrix = matrix
+
+    def upsert_vectors(self, keys, vectors, payloads=None):
+        """키별 벡터(행 단위 정규화됨)와 페이로드를 추가하거나 교체합니다."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(keys), self.dim)
+        payloads = payloads if payloads is not None else [None] * len(keys)
+        with self._lock:
+            self._reserve(len(keys))
+            for key, vector, payload in zip(keys, vectors, payloads):
+                row = self._rows.get(key)
+                if row is None:
+                    row = len(self._keys)
+                    self._rows[key] = row
+                    self._keys.append(key)
+                    self._payloads.append(payload)
+                else:
+                    self._payloads[row] = payload
+                self._matrix[row] = vector
+
+    def upsert(self, key, text, payload=None):
+        """텍스트를 임베딩해 키의 벡터를 추가하거나 교체합니다."""
+        self.upsert_vectors([key], embed_text(text, self.dim)[np.newaxis, :], [payload])
+
+    def remove(self, key):
+        """키의 벡터를 지웁니다 (마지막 행을 빈자리로 옮겨 행렬을 연속으로 유지)."""
+        with self._lock:
+            row = self._rows.pop(key, None)
+            if row is None:
+                return False
+            last = len(self._keys) - 1
+            if row != last:
+                moved = self._keys[last]
+                self._matrix[row] = self._matrix[last]
+                self._keys[row] = moved
+                self._payloads[row] = self._payloads[last]
+                self._rows[moved] = row
+            self._matrix[last] = 0.0
+            self._keys.pop()
+            self._payloads.pop()
+            return True
+
+    def search(self, query, top_k=5, min_score=0.0):
+        """질의(텍스트 또는 벡터)와 코사인 유사도가 높은 순으로 (키, 점수, 페이로드)를 반환합니다."""
+        query_vector = (
+            embed_text(query, self.dim)
+            if isinstance(query, str)
+            else np.asarray(query, dtype=np.float32)
+        )
+        with self._lock:
+            count = len(self._keys)
+            if not count or top_k <= 0 or not query_vector.any():
+                return []
+            scores = self._matrix[:count] @ query_vector
+            k = min(top_k, count)
+            top = np.argpartition(-scores, k - 1)[:k] if k < count else np.arange(count)
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [
+                (self._keys[row], float(scores[row]), self._payloads[row])
+                for row in top
+                if scores[row] > min_score
+            ]
+
+    def save(self, directory):
+        """행렬과 키/페이로드를 directory에 저장합니다 (임시 파일에 쓴 뒤 교체)."""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, self.name)
+        with self._lock:
+            count = len(self._keys)
+            with open(f"{base}.npy.tmp", "wb") as f:
+                np.save(f, self._matrix[:count])
+            with open(f"{base}.json.tmp", "w", encoding="utf-8") as f:
+                json.dump(
+                    {"dim": self.dim, "keys": self._keys, "payloads": self._payloads},
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(f"{base}.npy.tmp", f"{base}.npy")
+            os.replace(f"{base}.json.tmp", f"{base}.json")
+
+    @classmethod
+    def load(cls, name, directory, dim=None):
+        """저장된 인덱스를 불러옵니다 (없거나 차원이 다르면 빈 인덱스)."""
+        index = cls(name, dim)
+        base = os.path.join(directory, name)
+        if not (os.path.exists(f"{base}.npy") and os.path.exists(f"{base}.json")):
+            return index
+        with open(f"{base}.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("dim") != index.dim:
+            logger.warning(
+                f"⚠️ 벡터 인덱스 {name}의 차원({meta.get('dim')})이 설정({index.dim})과 달라 새로 만듭니다"
+            )
+            return index
+        matrix = np.load(f"{base}.npy")
+        if len(matrix):
+            index._matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+            index._keys = list(meta["keys"])
+            index._rows = {key: row for row, key in enumerate(index._keys)}
+            index._payloads = list(meta["payloads"])
+        return index
+
+    def stats(self):
+        with self._lock:
+            return {
+                "vectors": len(self._keys),
+                "capacity": int(self._matrix.shape[0]),
+                "dim": self.dim,
+                "memory_mb": round(self._matrix.nbytes / (1024 * 1024), 1),
+            }
+
+
+_indexes = {}
+_versions = {}  # 컬렉션별로 마지막에 읽거나 쓴 저장 파일 버전 (mtime_ns, 크기)
+_indexes_lock = threading.Lock()
+_staff_warm_lock = threading.Lock()
+_staff_warm_attempted = False  # 프로세스당 한 번만 저장소에서 staff 벡터를 채움
+
+
+def _index_path(name, suffix):
+    return os.path.join(config.VECTOR_INDEX_DIR, f"{name}{suffix}")
+
+
+@contextmanager
+def _file_lock(name):
+    """컬렉션 저장 파일에 대한 프로세스 간 배타 잠금 (API와 Streamlit 프로세스가 같은 파일을 공유)"""
+    os.makedirs(config.VECTOR_INDEX_DIR, exist_ok=True)
+    with open(_index_path(name, ".lock"), "a+b") as handle:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _stored_version(name):
+    try:
+        stat = os.stat(_index_path(name, ".json"))
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _refresh(name):
+    """저장 파일이 마지막으로 읽은 뒤 바뀌었으면 다시 불러옵니다 (파일 잠금 안에서 호출)."""
+    version = _stored_version(name)
+    with _indexes_lock:
+        index = _indexes.get(name)
+        if index is not None and version == _versions.get(name):
+            return index
+    try:
+        loaded = VectorIndex.load(name, config.VECTOR_INDEX_DIR)
+    except Exception as e:
+        log_error_with_context(logger, e, f"Failed to load vector index: {name}")
+        loaded = index or VectorIndex(name)
+    with _indexes_lock:
+        _indexes[name] = loaded
+        _versions[name] = version
+    return loaded
+
+
+def get_vector_index(name):
+    """컬렉션의 벡터 인덱스를 반환합니다 (다른 프로세스가 저장 파일을 바꿨으면 다시 불러옴)."""
+    with _indexes_lock:
+        index = _indexes.get(name)
+        if index is not None and _stored_version(name) == _versions.get(name):
+            return index
+    # 다른 프로세스가 저장하는 도중의 파일을 읽지 않도록 잠금 안에서 불러옴
+    with _file_lock(name):
+        return _refresh(name)
+
+
+def update_vector_index(name, apply):
+    """잠금 안에서 최신 저장본에 apply(index)를 적용하고 바로 저장합니다.
+
+    프로세스마다 메모리 인덱스를 따로 두므로, 쓰기 전에 다른 프로세스의 저장본을 다시 읽어
+    갱신 유실을 막고, 배치마다 저장해 프로세스가 비정상 종료되어도 반영분이 남게 합니다.
+    """
+    with _file_lock(name):
+        index = _refresh(name)
+        result = apply(index)
+        index.save(config.VECTOR_INDEX_DIR)
+        with _indexes_lock:
+            _versions[name] = _stored_version(name)
+        return result
+
+
+def get_vector_stats():
+    """불러온 벡터 인덱스별 현황을 반환합니다."""
+    with _indexes_lock:
+        indexes = dict(_indexes)
+    return {name: index.stats() for name, index in indexes.items()}
+
+
+# 컬렉션별 임베딩 텍스트/페이로드
+def staff_vector_text(staff):
+    skills = staff.get("skills") or staff.get("skills_text") or []
+    if isinstance(skills, list):
+        skills = ", ".join(skills)
+    return " ".join(
+        str(part)
+        for part in (staff.get("name"), staff.get("department"), staff.get("position"), skills)
+        if part
+    )
+
+
+def staff_vector_payload(staff):
+    return {
+        "id": staff["id"],
+        "user_id": staff.get("user_id"),
+        "name": staff.get("name", ""),
+        "department": staff.get("department", ""),
+        "position": staff.get("position", ""),
+        "skills": list(staff.get("skills") or []),
+    }
+
+
+def index_search_documents(documents):
+    """회의 검색 문서(부모/청크)를 meetings/chunks 벡터 인덱스에 반영합니다 (실패해도 예외 없음)."""
+    if not config.VECTOR_SEARCH_ENABLED or not documents:
+        return 0
+    start_time = time.time()
+    try:
+        grouped = {"meetings": ([], [], []), "chunks": ([], [], [])}
+        for doc in documents:
+            if doc.get("parent_id"):
+                keys, texts, payloads = grouped["chunks"]
+                texts.append(f"{doc.get('meeting_title', '')} {doc.get('content', '')}")
+                payloads.append(
+                    {
+                        "meeting_id": doc.get("meeting_id"),
+                        "meeting_title": doc.get("meeting_title"),
+                        "chunk_position": doc.get("chunk_position"),
+                        "content": doc.get("content", ""),
+                    }
+                )
+            else:
+                keys, texts, payloads = grouped["meetings"]
+                texts.append(
+                    f"{doc.get('meeting_title', '')} {doc.get('summary', '')} "
+                    f"{(doc.get('content') or '')[:MEETING_TEXT_CHARS]}"
+                )
+                payloads.append(
+                    {
+                        "meeting_id": doc.get("meeting_id"),
+                        "meeting_title": doc.get("meeting_title"),
+                        "summary": doc.get("summary"),
+                        "created_at": doc.get("created_at"),
+                    }
+                )
+            keys.append(doc["id"])
+
+        for name, (keys, texts, payloads) in grouped.items():
+            if keys:
+                vectors = np.stack([embed_text(text) for text in texts])
+                update_vector_index(
+                    name, lambda index: index.upsert_vectors(keys, vectors, payloads)
+                )
+
+        log_performance(
+            logger, "vector_indexing", time.time() - start_time, f"Docs: {len(documents)}"
+        )
+        return len(documents)
+    except Exception as e:
+        log_error_with_context(logger, e, "Failed to index vectors")
+        logger.warning(f"⚠️ 벡터 인덱스 반영 실패: {e}")
+        return 0
+
+
+def sync_staff_vectors(staff_list, replace=False):
+    """직원 정보를 staff 벡터 인덱스에 반영합니다 (replace면 목록에 없는 직원 삭제)."""
+    if not config.VECTOR_SEARCH_ENABLED:
+        return 0
+    try:
+        vectors = (
+            np.stack([embed_text(staff_vector_text(s)) for s in staff_list])
+            if staff_list
+            else None
+        )
+
+        def apply(index):
+            if staff_list:
+                index.upsert_vectors(
+                    [s["id"] for s in staff_list],
+                    vectors,
+                    [staff_vector_payload(s) for s in staff_list],
+                )
+            if replace:
+                current = {s["id"] for s in staff_list}
+                for key in [key for key in index.keys() if key not in current]:
+                    index.remove(key)
+
+        update_vector_index("staff", apply)
+        return len(staff_list)
+    except Exception as e:
+        log_error_with_context(logger, e, "Failed to sync staff vectors")
+        logger.warning(f"⚠️ 직원 벡터 반영 실패: {e}")
+        return 0
+
+
+def remove_vector(name, key):
+    """컬렉션에서 키의 벡터를 지웁니다."""
+    if config.VECTOR_SEARCH_ENABLED:
+        update_vector_index(name, lambda index: index.remove(key))
+
+
+def remove_stale_chunk_vectors(chunk_counts):
+    """chunks 인덱스에서 부모 문서별로 새 청크 수 이후 순서의 청크 벡터를 지웁니다 ({부모 ID: 청크 수})."""
+    if not config.VECTOR_SEARCH_ENABLED or not chunk_counts:
+        return 0
+
+    def apply(index):
+        stale = []
+        for key in index.keys():
+            parent_id, separator, position = key.rpartition("_chunk_")
+            if (
+                separator
+                and parent_id in chunk_counts
+                and int(position) >= chunk_counts[parent_id]
+            ):
+                stale.append(key)
+        for key in stale:
+            index.remove(key)
+        return len(stale)
+
+    try:
+        return update_vector_index("chunks", apply)
+    except Exception as e:
+        log_error_with_context(logger, e, "Failed to remove stale chunk vectors")
+        logger.warning(f"⚠️ 남은 청크 벡터 삭제 실패: {e}")
+        return 0
+
+
+def warm_staff_vectors():
+    """staff 벡터 인덱스가 비어 있으면 저장소의 직원으로 채웁니다 (프로세스당 한 번만 시도).
+
+    시작 시 ServiceManager가 호출하며, 직원이 없거나 실패해도 시도한 것으로 기록해
+    이후 검색마다 전체 직원 조회와 임베딩을 반복하지 않습니다.
+    """
+    global _staff_warm_attempted
+
+    if not config.VECTOR_SEARCH_ENABLED:
+        return 0
+    with _staff_warm_lock:
+        if _staff_warm_attempted:
+            return 0
+        _staff_warm_attempted = True
+        try:
+            if len(get_vector_index("staff")):
+                return 0
+            from db.storage import get_all_staff
+
+            return sync_staff_vectors(get_all_staff() or [])
+        except Exception as e:
+            log_error_with_context(logger, e, "Failed to warm staff vectors")
+            logger.warning(f"⚠️ 직원 벡터 초기화 실패: {e}")
+            return 0
+
+
+def vector_search(name, query, top_k=5):
+    """컬렉션에서 질의와 유사한 (키, 점수, 페이로드) 목록을 반환합니다 (꺼져 있거나 실패하면 빈 목록)."""
+    if not config.VECTOR_SEARCH_ENABLED or not query:
+        return []
+    start_time = time.time()
+    try:
+        if name == "staff":
+            warm_staff_vectors()
+        index = get_vector_index(name)
+        hits = index.search(query, top_k)
+        log_performance(
+            logger,
+            "vector_search",
+            time.time() - start_time,
+            f"Collection: {name}, Vectors: {len(index)}, Results: {len(hits)}",
+        )
+        return hits
+    except Exception as e:
+        log_error_with_context(logger, e, f"Vector search failed: {name}")
+        logger.warning(f"⚠️ 벡터 검색 실패 ({name}): {e}")
+        return []
+
+
+def reciprocal_rank_fusion(rankings, k=RRF_K):
+    """여러 순위 목록(키 목록)을 RRF 점수 순으로 합칩니다 ([(키, 점수)])."""
+    scores = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, 1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)